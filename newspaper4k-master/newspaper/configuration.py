@@ -84,6 +84,11 @@ class Configuration:
             :any:`Article.download()` and will be skipped in
             :any:`Source.build()`. This will override the defaults
             in :any:`ignored_content_types_defaults` if these match binary files.
+        trust_html_domains (bool): if True, urls of a domain that already
+            answered with an html content type are not probed for binary
+            content before the download. The content type of the download
+            is checked instead. Saves up to three requests per article.
+            default False.
         use_cached_categories (bool): if set to False, the cached categories
             will be ignored and a the :any:`Source` will recompute the category
              list every time you build it.
@@ -185,6 +190,9 @@ def __init__(self):
 
         self.allow_binary_content = False
 
+        # Skip the binary content probe for domains known to serve html
+        self.trust_html_domains = False
+
         self.ignored_content_types_defaults = {}
 
     def update(self, **kwargs):
@@ -2,9 +2,13 @@
 Helper functions for http requests and remote data fetching.
 """
 
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, List, Optional, Tuple, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging
+import threading
+import time
 import requests
 
 from requests import RequestException
@@ -19,6 +23,17 @@
 
 FAIL_ENCODING = "ISO-8859-1"
 
+# Connections kept per host, and hosts kept alive, by each pooled session
+DEFAULT_POOL_SIZE = 10
+# Idle sessions kept for reuse; raised to the thread count of large fetches
+DEFAULT_MAX_IDLE_SESSIONS = 16
+
+# Domains whose probe results are remembered, and for how long (seconds)
+DEFAULT_DOMAIN_CACHE_SIZE = 4096
+DEFAULT_DOMAIN_CACHE_TTL = 6 * 60 * 60
+
+_MISSING = object()
+
 
 def get_session() -> requests.Session:
     """
@@ -52,27 +67,253 @@ def get_session() -> requests.Session:
     return sess
 
 
+def _resize_pools(sess: requests.Session, pool_size: int):
+    """Resize the connection pools of every adapter mounted on a session.
+
+    The adapters are resized in place rather than replaced, so adapters
+    with custom TLS settings (cloudscraper) keep them.
+    """
+    for adapter in sess.adapters.values():
+        if not hasattr(adapter, "init_poolmanager"):
+            continue
+        adapter._pool_connections = pool_size  # pylint: disable=protected-access
+        adapter._pool_maxsize = pool_size  # pylint: disable=protected-access
+        adapter.init_poolmanager(
+            pool_size,
+            pool_size,
+            block=getattr(adapter, "_pool_block", False),
+        )
+
+
+class SessionPool:
+    """
+    A thread-safe pool of HTTP sessions.
+
+    Every request leases a session for its own duration, so concurrent
+    requests never share a session, its headers or its connection pool.
+    Leased sessions go back to the pool afterwards and are reused, so
+    keep-alive connections survive from one request (or batch of requests)
+    to the next. At most `max_idle` sessions are kept idle; extra ones
+    are closed when returned.
+
+    Args:
+        pool_size (int): connections kept per host, and hosts kept alive,
+            by each session.
+        max_idle (int): maximum number of idle sessions kept for reuse.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_idle: int = DEFAULT_MAX_IDLE_SESSIONS,
+    ):
+        self.pool_size = pool_size
+        self.max_idle = max_idle
+        self.created = 0
+        self._idle: List[requests.Session] = []
+        self._leased = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _create(self) -> requests.Session:
+        sess = get_session()
+        _resize_pools(sess, self.pool_size)
+        with self._lock:
+            self.created += 1
+        return sess
+
+    @contextmanager
+    def lease(self) -> Iterator[requests.Session]:
+        """Lease a session for the duration of a `with` block.
+
+        Yields:
+            requests.Session: A session no other thread uses until it is
+            returned.
+        """
+        with self._lock:
+            sess = self._idle.pop() if self._idle else None
+            generation = self._generation
+            self._leased += 1
+        if sess is None:
+            sess = self._create()
+        try:
+            yield sess
+        finally:
+            with self._lock:
+                self._leased -= 1
+                keep = (
+                    generation == self._generation
+                    and len(self._idle) < self.max_idle
+                )
+                if keep:
+                    self._idle.append(sess)
+            if not keep:
+                sess.close()
+
+    def ensure_capacity(self, concurrency: int):
+        """Keep enough idle sessions for `concurrency` parallel requests."""
+        with self._lock:
+            self.max_idle = max(self.max_idle, concurrency)
+
+    def configure(
+        self, pool_size: Optional[int] = None, max_idle: Optional[int] = None
+    ):
+        """Change the pool settings. Sessions created before are discarded.
+
+        Args:
+            pool_size (int, optional): connections kept per host, and hosts
+                kept alive, by each session.
+            max_idle (int, optional): maximum number of idle sessions kept.
+        """
+        if pool_size is not None:
+            self.pool_size = pool_size
+        if max_idle is not None:
+            self.max_idle = max_idle
+        self.reset()
+
+    def reset(self):
+        """Close all idle sessions. Leased sessions are closed when returned.
+        Destroys any cookies and other session data."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._generation += 1
+        for sess in idle:
+            sess.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Number of idle, leased and created sessions."""
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "leased": self._leased,
+                "created": self.created,
+                "pool_size": self.pool_size,
+                "max_idle": self.max_idle,
+            }
+
+
+sessions = SessionPool()
+
+# Kept for code that uses the session directly. Requests made by this
+# module lease their own session from `sessions` instead.
 session = get_session()
 
 
 def reset_session() -> requests.Session:
     """
-    Resets the session variable to a new requests.Session object. Destroys any
-    cookies and other session data that may have been stored in the previous
-    object.
+    Resets the session variable to a new requests.Session object and
+    discards the pooled sessions. Destroys any cookies and other session
+    data that may have been stored in the previous objects.
 
     Returns:
         requests.Session: The newly created session object.
     """
     global session  # pylint: disable=global-statement
+    sessions.reset()
     session = get_session()
     return session
 
 
+def registered_domain(url: str) -> Optional[str]:
+    """Returns the registered domain of an url, e.g. ``news.bbc.co.uk``
+    -> ``bbc.co.uk``. Returns None if the url has no domain."""
+    ext = tldextract.extract(url)
+    if not ext.domain:
+        return None
+    return ext.domain + "." + ext.suffix if ext.suffix else ext.domain
+
+
+class DomainCapabilityCache:
+    """
+    A thread-safe, bounded cache of what a domain's server supports.
+
+    Probing an url for binary content or range support costs one to three
+    extra requests, and the answers rarely change between urls of the same
+    site. The cache keeps them per registered domain. Entries expire after
+    `ttl` seconds, and the least recently used domains are dropped once
+    `maxsize` domains are cached.
+
+    Capabilities recorded by this module:
+        * ``has_get_ranges``: the server answers HTTP Range requests
+        * ``html``: the server answered with an html content type
+
+    Args:
+        maxsize (int): maximum number of domains kept.
+        ttl (float): seconds a capability is remembered.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_DOMAIN_CACHE_SIZE,
+        ttl: float = DEFAULT_DOMAIN_CACHE_TTL,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Dict[str, Tuple[Any, float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, domain: str, capability: str, default: Any = None) -> Any:
+        """Returns a remembered capability of a domain, or `default` if it
+        is unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is not None and capability in entry:
+                value, expires = entry[capability]
+                if expires >= time.monotonic():
+                    self._entries.move_to_end(domain)
+                    self.hits += 1
+                    return value
+                del entry[capability]
+            self.misses += 1
+            return default
+
+    def set(self, domain: str, capability: str, value: Any):
+        """Remembers a capability of a domain."""
+        with self._lock:
+            entry = self._entries.setdefault(domain, {})
+            entry[capability] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def configure(self, maxsize: Optional[int] = None, ttl: Optional[float] = None):
+        """Change the cache limits. Remembered capabilities are kept, up to
+        the new `maxsize`."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if ttl is not None:
+                self.ttl = ttl
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget all domains."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Number of cached domains, hits and misses."""
+        with self._lock:
+            return {
+                "domains": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+capabilities = DomainCapabilityCache()
+
+
 def do_cache(func: Callable):
     """A decorator that caches the result of a function based on its arguments.
     expects url as one argument and caches the result based on the domain
-    of the url.
+    of the url. Results are kept in :any:`capabilities` under the name of
+    the function.
     Args:
         func (Callable): The function to be cached.
     Returns:
@@ -80,116 +321,135 @@ def do_cache(func: Callable):
     """
 
     def wrapper(*args, **kwargs):
-        if not hasattr(func, "cache"):
-            func.cache = {}
         if kwargs.get("url"):
             url = kwargs["url"]
         else:
             url = args[0] if len(args) > 0 else None
-        if url:
-            tld = tldextract.extract(url).domain + "." + tldextract.extract(url).suffix
-        else:
+        domain = registered_domain(url) if url else None
+        if not domain:
             return func(*args, **kwargs)
 
-        if tld not in func.cache:
-            func.cache[tld] = func(*args, **kwargs)
-        return func.cache[tld]
+        result = capabilities.get(domain, func.__name__, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            capabilities.set(domain, func.__name__, result)
+        return result
 
     return wrapper
 
 
+def _is_binary_content_type(content_type: str) -> bool:
+    """Does this Content-Type header denote binary data?"""
+    if content_type.startswith("application"):
+        return "json" not in content_type and "xml" not in content_type
+    return content_type.startswith(("image", "video", "audio", "font"))
+
+
+def _is_html_content_type(content_type: str) -> bool:
+    return content_type.startswith(("text/html", "application/xhtml+xml"))
+
+
 @do_cache
-def has_get_ranges(url: str) -> bool:
+def has_get_ranges(url: str, headers: Optional[Dict[str, str]] = None) -> bool:
     """Does this url support HTTP Range requests?"""
+    headers = headers or {}
     try:
-        resp = session.head(url, timeout=3, allow_redirects=False)
-        if resp.status_code in [301, 302, 303, 307, 308]:
-            new_url = resp.headers.get("Location")
-            if new_url:
-                resp = session.head(url, timeout=3, allow_redirects=True)
-                url = new_url
-
-        if "Accept-Ranges" in resp.headers:
-            return True
-
-        resp = session.get(
-            url, headers={"Range": "bytes=0-100"}, timeout=3, stream=True
-        )
-        if resp.status_code == 206:
-            return True
+        with sessions.lease() as sess:
+            resp = sess.head(url, headers=headers, timeout=3, allow_redirects=False)
+            if resp.status_code in [301, 302, 303, 307, 308]:
+                new_url = resp.headers.get("Location")
+                if new_url:
+                    resp = sess.head(
+                        url, headers=headers, timeout=3, allow_redirects=True
+                    )
+                    url = new_url
+
+            if "Accept-Ranges" in resp.headers:
+                return True
+
+            resp = sess.get(
+                url,
+                headers={**headers, "Range": "bytes=0-100"},
+                timeout=3,
+                stream=True,
+            )
+            if resp.status_code == 206:
+                return True
 
     except RequestException as e:
         log.debug("has_get_ranges() error. %s on URL: %s", e, url)
     return False
 
 
-def is_binary_url(url: str) -> bool:
+def is_binary_url(url: str, headers: Optional[Dict[str, str]] = None) -> bool:
     """Does this url point to a binary file?"""
+    headers = headers or {}
     try:
-        resp = session.head(url, timeout=3, allow_redirects=True)
-        if "Content-Type" in resp.headers:
-            if resp.headers["Content-Type"].startswith("application"):
-                if (
-                    "json" not in resp.headers["Content-Type"]
-                    and "xml" not in resp.headers["Content-Type"]
-                ):
-                    return True
-            if resp.headers["Content-Type"].startswith("image"):
-                return True
-            if resp.headers["Content-Type"].startswith("video"):
+        with sessions.lease() as sess:
+            resp = sess.head(url, headers=headers, timeout=3, allow_redirects=True)
+            content_type = resp.headers.get("Content-Type", "")
+            if _is_binary_content_type(content_type):
                 return True
-            if resp.headers["Content-Type"].startswith("audio"):
-                return True
-            if resp.headers["Content-Type"].startswith("font"):
+
+            if "Content-Disposition" in resp.headers:
                 return True
 
-        if "Content-Disposition" in resp.headers:
-            return True
+            if resp.status_code < 300 and _is_html_content_type(content_type):
+                # The server says html; no need to sniff the content
+                domain = registered_domain(url)
+                if domain:
+                    capabilities.set(domain, "html", True)
+                return False
 
-        if not has_get_ranges(url):
-            resp = session.get(url, timeout=3, allow_redirects=True, stream=True)
-            content: Union[str, bytes, None] = next(resp.iter_content(1000), None)
-        else:
-            resp = session.get(
-                url, headers={"Range": "bytes=0-1000"}, timeout=3, allow_redirects=False
+            if not has_get_ranges(url, headers=headers):
+                resp = sess.get(
+                    url, headers=headers, timeout=3, allow_redirects=True, stream=True
+                )
+                content: Union[str, bytes, None] = next(resp.iter_content(1000), None)
+            else:
+                resp = sess.get(
+                    url,
+                    headers={**headers, "Range": "bytes=0-1000"},
+                    timeout=3,
+                    allow_redirects=False,
+                )
+                if resp.status_code in [301, 302, 303, 307, 308]:
+                    new_url = resp.headers.get("Location")
+                    if new_url:
+                        resp = sess.get(
+                            new_url,
+                            headers={**headers, "Range": "bytes=0-1000"},
+                            timeout=3,
+                            allow_redirects=True,
+                        )
+                content = resp.content
+
+            if resp.status_code > 299 or content is None:
+                return False  # We cannot test if we get an error
+
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", errors="replace")
+
+            content = content[:1000]
+
+            if len(content) == 0:
+                return False
+
+            if "<html" in content:
+                return False
+
+            chars = len(
+                [
+                    char
+                    for char in [ord(c) if isinstance(c, str) else c for c in content]
+                    if 31 < char < 128 or char in [9, 10, 13]
+                ]
             )
-            if resp.status_code in [301, 302, 303, 307, 308]:
-                new_url = resp.headers.get("Location")
-                if new_url:
-                    resp = session.get(
-                        new_url,
-                        headers={"Range": "bytes=0-1000"},
-                        timeout=3,
-                        allow_redirects=True,
-                    )
-            content = resp.content
-
-        if resp.status_code > 299 or content is None:
-            return False  # We cannot test if we get an error
-
-        if isinstance(content, bytes):
-            content = content.decode("utf-8", errors="replace")
-
-        content = content[:1000]
-
-        if len(content) == 0:
-            return False
+            if chars / len(content) < 0.6:  # 40% of the content is binary
+                return True
 
-        if "<html" in content:
             return False
 
-        chars = len(
-            [
-                char
-                for char in [ord(c) if isinstance(c, str) else c for c in content]
-                if 31 < char < 128 or char in [9, 10, 13]
-            ]
-        )
-        if chars / len(content) < 0.6:  # 40% of the content is binary
-            return True
-
-        return False
-
     except RequestException as e:
         log.debug("is_binary_url() error. %s on URL: %s", e, url)
     return False
@@ -205,16 +465,31 @@ def do_request(url: str, config: Configuration) -> Response:
         requests.Response: The response object containing the server's response
             to the request.
     """
-    session.headers.update(config.requests_params["headers"])
-
+    check_response = False
     if not config.allow_binary_content:
-        if is_binary_url(url):
+        domain = registered_domain(url)
+        if (
+            config.trust_html_domains
+            and domain
+            and capabilities.get(domain, "html", False)
+        ):
+            # Known html site: check the content type of the response instead
+            check_response = True
+        elif is_binary_url(url, headers=config.requests_params.get("headers")):
             raise ArticleBinaryDataException(f"Article is binary data: {url}")
 
-    response = session.get(
-        url=url,
-        **config.requests_params,
-    )
+    # Headers are sent with the request; the leased session is never modified
+    with sessions.lease() as sess:
+        response = sess.get(
+            url=url,
+            **config.requests_params,
+        )
+
+    if check_response and (
+        _is_binary_content_type(response.headers.get("Content-Type", ""))
+        or "Content-Disposition" in response.headers
+    ):
+        raise ArticleBinaryDataException(f"Article is binary data: {url}")
 
     return response
 
@@ -333,6 +608,7 @@ def multithread_request(
             requests_timeout,
         )
     results: List[Optional[Response]] = []
+    sessions.ensure_capacity(config.number_threads)
     with ThreadPoolExecutor(max_workers=config.number_threads) as tpe:
         result_futures = [
             tpe.submit(do_request, url=url, config=config) for url in urls
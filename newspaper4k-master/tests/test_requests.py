@@ -1,5 +1,7 @@
 import pytest
 import os
+import requests
+import newspaper
 import newspaper.network as network
 from newspaper import article, ArticleException
 
@@ -42,3 +44,139 @@ def test_detect_binary(self, binary_url):
 
         url = "https://aol.com"  # does not have Ranges
         assert not network.has_get_ranges(url), "detect range requests failed"
+
+
+class TestSessionPool:
+    def test_reuses_returned_session(self):
+        pool = network.SessionPool()
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            assert second is first
+        assert pool.stats()["created"] == 1
+
+    def test_concurrent_leases_get_distinct_sessions(self):
+        pool = network.SessionPool(max_idle=1)
+        with pool.lease() as first, pool.lease() as second:
+            assert first is not second
+            assert pool.stats()["leased"] == 2
+        # Only max_idle sessions are kept for reuse
+        assert pool.stats()["idle"] == 1
+
+    def test_reset_discards_sessions(self):
+        pool = network.SessionPool()
+        with pool.lease() as first:
+            pool.reset()
+        assert pool.stats()["idle"] == 0
+        with pool.lease() as second:
+            assert second is not first
+
+    def test_pool_size_applied_to_adapters(self):
+        pool = network.SessionPool(pool_size=25)
+        with pool.lease() as sess:
+            adapter = sess.get_adapter("https://example.com")
+            assert adapter.poolmanager.connection_pool_kw["maxsize"] == 25
+
+    def test_do_request_sends_headers_per_request(self, monkeypatch):
+        config = newspaper.Config()
+        config.allow_binary_content = True
+        config.headers = {"X-Test": "1"}
+        sent = {}
+
+        def fake_get(self, url, **kwargs):
+            sent.update(kwargs.get("headers") or {})
+            return "response"
+
+        pool = network.SessionPool()
+        monkeypatch.setattr(network, "sessions", pool)
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+
+        assert network.do_request("https://example.com", config) == "response"
+        assert sent["X-Test"] == "1"
+        with pool.lease() as sess:
+            assert "X-Test" not in sess.headers
+
+
+class TestDomainCapabilityCache:
+    def test_registered_domain(self):
+        assert network.registered_domain("https://news.bbc.co.uk/a") == "bbc.co.uk"
+        assert network.registered_domain("https://vnexpress.net/x.html") == "vnexpress.net"
+
+    def test_expired_entries_are_missing(self, monkeypatch):
+        cache = network.DomainCapabilityCache(ttl=10)
+        now = [100.0]
+        monkeypatch.setattr(network.time, "monotonic", lambda: now[0])
+        cache.set("example.com", "html", True)
+        assert cache.get("example.com", "html") is True
+        now[0] = 111.0
+        assert cache.get("example.com", "html") is None
+
+    def test_least_recently_used_domain_is_evicted(self):
+        cache = network.DomainCapabilityCache(maxsize=2)
+        cache.set("a.com", "html", True)
+        cache.set("b.com", "html", True)
+        cache.get("a.com", "html")
+        cache.set("c.com", "html", True)
+        assert cache.get("b.com", "html") is None
+        assert cache.get("a.com", "html") is True
+        assert cache.stats()["domains"] == 2
+
+    def test_do_cache_probes_each_domain_once(self, monkeypatch):
+        monkeypatch.setattr(network, "capabilities", network.DomainCapabilityCache())
+        calls = []
+
+        @network.do_cache
+        def probe(url):
+            calls.append(url)
+            return True
+
+        assert probe("https://a.example.com/1")
+        assert probe("https://b.example.com/2")
+        assert calls == ["https://a.example.com/1"]
+
+    def test_trusted_html_domain_skips_probe(self, monkeypatch):
+        cache = network.DomainCapabilityCache()
+        cache.set("example.com", "html", True)
+        monkeypatch.setattr(network, "capabilities", cache)
+        monkeypatch.setattr(network, "sessions", network.SessionPool())
+
+        def fail_probe(url, headers=None):
+            raise AssertionError("probed a trusted domain")
+
+        def fake_get(self, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = (
+                "image/jpeg" if url.endswith(".jpg") else "text/html"
+            )
+            return response
+
+        monkeypatch.setattr(network, "is_binary_url", fail_probe)
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+
+        config = newspaper.Config()
+        config.trust_html_domains = True
+        assert network.do_request("https://www.example.com/a.html", config).ok
+        # The download itself is still checked
+        with pytest.raises(network.ArticleBinaryDataException):
+            network.do_request("https://www.example.com/a.jpg", config)
+
+    def test_html_content_type_is_remembered(self, monkeypatch):
+        cache = network.DomainCapabilityCache()
+        monkeypatch.setattr(network, "capabilities", cache)
+        monkeypatch.setattr(network, "sessions", network.SessionPool())
+
+        def fake_head(self, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+            return response
+
+        def fail_get(self, url, **kwargs):
+            raise AssertionError("sniffed content of an html page")
+
+        monkeypatch.setattr(requests.Session, "head", fake_head)
+        monkeypatch.setattr(requests.Session, "get", fail_get)
+
+        assert not network.is_binary_url("https://www.example.com/a.html")
+        assert cache.get("example.com", "html") is True
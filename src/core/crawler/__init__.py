@@ -38,6 +38,7 @@ Configuration:
     - NEWSPAPER_KEEP_ARTICLE_HTML: Keep HTML in memory (default: True)
     - NEWSPAPER_FETCH_IMAGES: Fetch article images (default: True)
     - NEWSPAPER_HTTP_SUCCESS_ONLY: Only process successful HTTP responses (default: True)
+    - NEWSPAPER_TRUST_HTML_DOMAINS: Skip binary probing for known HTML domains (default: True)
 """
 
 from .extractor import ArticleExtractor
@@ -0,0 +1,316 @@
+"""Async fetcher for publisher article pages.
+
+newspaper's ``fetch_news`` gives each article a thread that blocks on
+``Article.download()``, so a worker with 5 extraction threads has at most 5
+downloads in flight, and each one first probes the URL with extra HEAD/GET
+requests to rule out binary content. This fetcher downloads the pages on the
+worker's event loop instead:
+
+- one keep-alive ``httpx.AsyncClient`` per worker process
+- a global concurrency limit plus per-host politeness (see
+  ``host_scheduler``): batches are interleaved by host, each host gets a
+  limited number of downloads and a crawl delay, and a host answering
+  429/503 is paused for its ``Retry-After`` and the page retried once
+- bodies are streamed and capped at ``max_bytes``; non-HTML responses are
+  dropped from their headers, without extra probing requests
+- one deadline per page covering connect, headers and body
+
+Only the network wait runs here. The HTML is handed to newspaper with
+``Article.download(input_html=...)`` and parsed by the caller.
+
+Example:
+    ```python
+    from src.core.crawler.article_fetcher import get_article_fetcher
+
+    fetcher = get_article_fetcher(settings)
+    for page in fetcher.fetch_batch(urls):
+        if page.ok:
+            article = Article(page.url)
+            article.download(input_html=page.text)
+    ```
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from bs4 import UnicodeDammit
+
+from src.core.crawler.browser_pool import DEFAULT_USER_AGENT, BrowserPool, get_browser_pool
+from src.core.crawler.host_scheduler import (
+    HostScheduler,
+    HostSchedulerConfig,
+    host_of,
+    interleave_by_host,
+)
+
+logger = logging.getLogger(__name__)
+
+# Content types newspaper can extract an article from
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain", "")
+
+
+@dataclass
+class FetchedPage:
+    """A downloaded article page, or the reason it could not be downloaded."""
+    url: str
+    status: int = 0
+    content: bytes = b""
+    encoding: Optional[str] = None
+    final_url: Optional[str] = None
+    truncated: bool = False
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    retry_after: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and 200 <= self.status < 300 and bool(self.content)
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the charset from the headers, or detected from the markup."""
+        if self.encoding:
+            try:
+                return self.content.decode(self.encoding, errors="replace")
+            except LookupError:
+                pass
+        return UnicodeDammit(self.content, is_html=True).unicode_markup or ""
+
+
+@dataclass
+class ArticleFetcherConfig:
+    """Configuration for the article fetcher."""
+    concurrency: int = 32               # Pages in flight per worker process
+    per_host_limit: int = 4             # Pages in flight per publisher host
+    timeout: float = 15.0               # Seconds per page, body included
+    max_bytes: int = 5 * 1024 * 1024    # Larger bodies are truncated
+    crawl_delay: float = 0.5            # Seconds between request starts to one host
+    max_retry_after: float = 120.0      # Longest Retry-After pause honoured
+    throttle_retries: int = 1           # Retries of a page after its host throttled it
+    user_agent: str = DEFAULT_USER_AGENT
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ArticleFetcherConfig":
+        """Build fetcher configuration from application settings."""
+        return cls(
+            concurrency=settings.ARTICLE_FETCH_CONCURRENCY,
+            per_host_limit=settings.ARTICLE_FETCH_PER_HOST_LIMIT,
+            timeout=settings.ARTICLE_FETCH_TIMEOUT,
+            max_bytes=settings.ARTICLE_FETCH_MAX_BYTES,
+            crawl_delay=settings.ARTICLE_FETCH_CRAWL_DELAY,
+            max_retry_after=settings.ARTICLE_FETCH_MAX_RETRY_AFTER,
+        )
+
+
+@dataclass
+class ArticleFetcherMetrics:
+    """Counters tracked by the article fetcher."""
+    requests: int = 0
+    failures: int = 0
+    non_html: int = 0
+    truncated: int = 0
+    throttled: int = 0
+    bytes_received: int = 0
+    total_time: float = 0.0
+
+
+class AsyncArticleFetcher:
+    """Download article pages concurrently on the worker's event loop."""
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        config: Optional[ArticleFetcherConfig] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.pool = pool
+        self.config = config or ArticleFetcherConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = ArticleFetcherMetrics()
+        self._client = None
+        self._limit = asyncio.Semaphore(max(1, self.config.concurrency))
+        self.scheduler = HostScheduler(HostSchedulerConfig(
+            per_host_limit=self.config.per_host_limit,
+            crawl_delay=self.config.crawl_delay,
+            max_retry_after=self.config.max_retry_after,
+        ))
+
+    def _get_client(self) -> Any:
+        """Create the shared client on first use, on the loop that will drive it."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.concurrency,
+                    max_keepalive_connections=self.config.concurrency
+                ),
+                headers={
+                    'User-Agent': self.config.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Encoding': 'gzip, deflate',
+                },
+                follow_redirects=True,
+            )
+        return self._client
+
+    def fetch_batch(self, urls: List[str]) -> List[FetchedPage]:
+        """Download a batch from sync code.
+
+        Returns:
+            One FetchedPage per URL, in input order
+        """
+        if not urls:
+            return []
+        if httpx is None:
+            self.logger.warning("httpx not available - cannot fetch articles asynchronously")
+            return [FetchedPage(url=url, error="httpx not available") for url in urls]
+        # Every page is bounded by its own deadline and crawl delay; worst case
+        # all pages queue on one host, which also throttles its retries
+        rounds = -(-len(urls) // max(1, min(self.config.concurrency, self.config.per_host_limit)))
+        deadline = (
+            rounds * self.config.timeout
+            + len(urls) * self.config.crawl_delay
+            + self.config.throttle_retries * self.config.max_retry_after
+        )
+        # The batch enforces its own deadline; the pool timeout only guards a stuck loop
+        return self.pool.run(self.fetch_batch_async(urls, deadline=deadline), timeout=deadline + 10)
+
+    async def fetch_batch_async(self, urls: List[str], deadline: Optional[float] = None) -> List[FetchedPage]:
+        """Download a batch concurrently within the global and per-host limits.
+
+        Downloads start round-robin across hosts; results are in input order.
+        Pages still downloading after ``deadline`` seconds are cancelled and
+        reported as timed out, while the finished pages are returned as usual.
+        """
+        order = interleave_by_host(list(dict.fromkeys(urls)))
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in order]
+        _, pending = await asyncio.wait(tasks, timeout=deadline)
+        if pending:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self.metrics.failures += len(pending)
+            self.logger.warning(f"Article fetch batch deadline of {deadline:.0f}s hit, {len(pending)}/{len(order)} pages unfinished")
+
+        by_url = {
+            url: FetchedPage(url=url, error=f"batch timed out after {deadline:.0f}s") if task in pending else task.result()
+            for url, task in zip(order, tasks)
+        }
+        return [by_url[url] for url in urls]
+
+    async def fetch(self, url: str) -> FetchedPage:
+        """Download one page; failures are reported in the result, never raised."""
+        host = host_of(url)
+        for attempt in range(self.config.throttle_retries + 1):
+            page = await self._fetch_once(host, url)
+            pause = self.scheduler.record_response(host, page.status, page.elapsed, page.retry_after)
+            if pause is None:
+                break
+            self.metrics.throttled += 1
+            if attempt == self.config.throttle_retries or pause >= self.config.max_retry_after:
+                break
+            # The retry waits in the host's queue until the pause is over
+
+        if not page.ok:
+            self.metrics.failures += 1
+            self.logger.debug(f"Article fetch failed for {url}: {page.error or f'HTTP {page.status}'}")
+        return page
+
+    async def _fetch_once(self, host: str, url: str) -> FetchedPage:
+        client = self._get_client()
+        # Wait for the host before taking a global slot, so hosts that are
+        # busy or paused leave the global slots to other hosts
+        async with self.scheduler.slot(host), self._limit:
+            start = time.monotonic()
+            try:
+                page = await asyncio.wait_for(self._download(client, url), self.config.timeout)
+            except asyncio.TimeoutError:
+                page = FetchedPage(url=url, error=f"timed out after {self.config.timeout}s")
+            except Exception as e:
+                page = FetchedPage(url=url, error=f"{type(e).__name__}: {e}")
+            page.elapsed = time.monotonic() - start
+
+        self.metrics.requests += 1
+        self.metrics.total_time += page.elapsed
+        self.metrics.bytes_received += len(page.content)
+        return page
+
+    async def _download(self, client: Any, url: str) -> FetchedPage:
+        async with client.stream("GET", url) as response:
+            page = FetchedPage(
+                url=url,
+                status=response.status_code,
+                encoding=response.charset_encoding,
+                final_url=str(response.url),
+            )
+            if response.status_code >= 400:
+                page.error = f"HTTP {response.status_code}"
+                page.retry_after = response.headers.get("Retry-After")
+                return page
+
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if content_type not in HTML_CONTENT_TYPES:
+                self.metrics.non_html += 1
+                page.error = f"not HTML ({content_type})"
+                return page
+
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= self.config.max_bytes:
+                    page.truncated = True
+                    self.metrics.truncated += 1
+                    break
+            page.content = b"".join(chunks)[:self.config.max_bytes]
+            return page
+
+    async def aclose(self):
+        """Close the shared client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get fetcher metrics for monitoring."""
+        requests = self.metrics.requests
+        return {
+            "requests": requests,
+            "failures": self.metrics.failures,
+            "non_html": self.metrics.non_html,
+            "truncated": self.metrics.truncated,
+            "throttled": self.metrics.throttled,
+            "bytes_received": self.metrics.bytes_received,
+            "avg_fetch_time": self.metrics.total_time / requests if requests else 0.0,
+            "hosts": self.scheduler.get_stats(),
+        }
+
+
+# Global article fetcher instance (one per worker process)
+_article_fetcher: Optional[AsyncArticleFetcher] = None
+_article_fetcher_pid: Optional[int] = None
+_article_fetcher_lock = threading.Lock()
+
+
+def get_article_fetcher(settings: Any, logger: Optional[logging.Logger] = None) -> AsyncArticleFetcher:
+    """Get the article fetcher for the current worker process."""
+    global _article_fetcher, _article_fetcher_pid
+
+    pool = get_browser_pool(settings, logger)
+    with _article_fetcher_lock:
+        # Connections inherited through fork belong to the parent's event loop
+        if _article_fetcher is None or _article_fetcher_pid != os.getpid() or _article_fetcher.pool is not pool:
+            _article_fetcher = AsyncArticleFetcher(pool, ArticleFetcherConfig.from_settings(settings), logger)
+            _article_fetcher_pid = os.getpid()
+        return _article_fetcher
@@ -0,0 +1,450 @@
+"""Persistent Playwright browser pool for Google News URL resolution.
+
+Launching Chromium is the dominant cost of resolving a batch of Google News
+URLs. This module keeps browsers - and their browser contexts - alive across
+batches and across Celery tasks executed by the same worker process, and
+recycles them when they become unhealthy, too old or too large.
+
+The pool is built on Playwright's async API. Every Playwright object lives on
+an event loop that runs in a background thread owned by the worker process, so
+synchronous Celery code submits coroutines to it with ``BrowserPool.run``
+while tabs within a batch are driven concurrently.
+
+Example:
+    ```python
+    from src.core.crawler.browser_pool import get_browser_pool
+
+    pool = get_browser_pool(settings)
+
+    async def open_tab(url):
+        async with pool.acquire() as context:
+            page = await context.new_page()
+            await page.goto(url, wait_until="domcontentloaded")
+            return page.url
+
+    final_url = pool.run(open_tab(url), timeout=60)
+    ```
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Set, TypeVar
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from src.shared.exceptions import CrawlerError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_LAUNCH_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+)
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+BLOCKED_RESOURCES_PATTERN = "**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2,ttf,eot,ico}"
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Configuration for browser pool behavior."""
+    size: int = 1                       # Browsers kept warm per worker
+    persistent: bool = True             # False closes browsers after every lease
+    max_age_seconds: int = 1800         # Recycle browsers older than this
+    max_pages_per_browser: int = 500    # Recycle after serving this many tabs
+    max_memory_mb: int = 1024           # Recycle when browser RSS exceeds this
+    headless: bool = True
+    launch_args: tuple = DEFAULT_LAUNCH_ARGS
+    user_agent: str = DEFAULT_USER_AGENT
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "BrowserPoolConfig":
+        """Build pool configuration from application settings."""
+        return cls(
+            size=settings.BROWSER_POOL_SIZE,
+            persistent=settings.BROWSER_POOL_ENABLED,
+            max_age_seconds=settings.BROWSER_POOL_MAX_AGE,
+            max_pages_per_browser=settings.BROWSER_POOL_MAX_PAGES,
+            max_memory_mb=settings.BROWSER_POOL_MAX_MEMORY_MB,
+            headless=settings.PLAYWRIGHT_HEADLESS,
+        )
+
+
+@dataclass
+class BrowserPoolMetrics:
+    """Metrics tracked by the browser pool."""
+    launches: int = 0
+    leases: int = 0
+    reuses: int = 0
+    pages_served: int = 0
+    launch_time_total: float = 0.0
+    recycles: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class PooledBrowser:
+    """A launched browser together with its long-lived context."""
+    browser: Any
+    context: Any
+    launched_at: float = field(default_factory=time.time)
+    pages_served: int = 0
+    leases: int = 0
+    active_leases: int = 0
+    pid: Optional[int] = None
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.launched_at
+
+
+class BrowserPool:
+    """Pool of warm Chromium browsers reused across resolution batches.
+
+    Coroutines that use the pool must run on the pool's event loop; sync
+    callers go through run().
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None, logger: Optional[logging.Logger] = None):
+        self.config = config or BrowserPoolConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = BrowserPoolMetrics()
+        self._playwright = None
+        self._browsers: List[PooledBrowser] = []
+        self._next_index = 0
+        self._owner_pid = os.getpid()
+        self._checkout_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    @property
+    def browsers(self) -> List[PooledBrowser]:
+        return list(self._browsers)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop that owns all Playwright objects."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="browser-pool-loop",
+                    daemon=True
+                )
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+            return self._loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the pool's event loop and wait for its result.
+
+        Raises:
+            CrawlerError: If called from another process or the timeout expires
+        """
+        if os.getpid() != self._owner_pid:
+            coro.close()
+            raise CrawlerError("BrowserPool used outside the process that created it")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise CrawlerError(f"Browser pool operation timed out after {timeout}s")
+
+    async def _ensure_started(self):
+        """Start the Playwright driver once for the lifetime of the pool."""
+        if self._playwright is not None:
+            return
+        if not async_playwright:
+            raise CrawlerError("Playwright not available for URL resolution")
+        self._playwright = await async_playwright().start()
+
+    async def _launch(self) -> PooledBrowser:
+        """Launch a new browser and its shared context."""
+        await self._ensure_started()
+        known_pids = _child_pids()
+        start = time.time()
+
+        browser = await self._playwright.chromium.launch(
+            headless=self.config.headless,
+            args=list(self.config.launch_args)
+        )
+        context = await browser.new_context(user_agent=self.config.user_agent)
+
+        # Block resources for speed once per context instead of once per tab
+        await context.route(BLOCKED_RESOURCES_PATTERN, _abort_route)
+
+        pooled = PooledBrowser(browser=browser, context=context)
+        pooled.pid = _find_browser_pid(known_pids)
+
+        def _count_page(_page):
+            pooled.pages_served += 1
+            self.metrics.pages_served += 1
+
+        context.on("page", _count_page)
+
+        elapsed = time.time() - start
+        self.metrics.launches += 1
+        self.metrics.launch_time_total += elapsed
+        self.logger.info(f"Browser pool launched browser (pid={pooled.pid}) in {elapsed:.2f}s")
+        return pooled
+
+    def _memory_mb(self, pooled: PooledBrowser) -> Optional[float]:
+        """Resident memory of the browser process tree in MB, if measurable."""
+        if not psutil or not pooled.pid:
+            return None
+        try:
+            root = psutil.Process(pooled.pid)
+            processes = [root] + root.children(recursive=True)
+            rss = 0
+            for process in processes:
+                try:
+                    rss += process.memory_info().rss
+                except psutil.Error:
+                    continue
+            return rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    def check_health(self, pooled: PooledBrowser) -> Optional[str]:
+        """Return the reason a browser must be recycled, or None if healthy."""
+        try:
+            if not pooled.browser.is_connected():
+                return "disconnected"
+        except Exception:
+            return "disconnected"
+
+        if pooled.age > self.config.max_age_seconds:
+            return "max_age"
+
+        if pooled.pages_served >= self.config.max_pages_per_browser:
+            return "max_pages"
+
+        memory_mb = self._memory_mb(pooled)
+        if memory_mb is not None and memory_mb > self.config.max_memory_mb:
+            return "max_memory"
+
+        return None
+
+    async def _close_browser(self, pooled: PooledBrowser):
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass
+
+    async def recycle(self, pooled: PooledBrowser, reason: str):
+        """Close a browser and drop it from the pool."""
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        await self._close_browser(pooled)
+        self.metrics.recycles[reason] = self.metrics.recycles.get(reason, 0) + 1
+        self.logger.info(
+            f"Browser pool recycled browser (pid={pooled.pid}, reason={reason}, "
+            f"age={pooled.age:.0f}s, pages={pooled.pages_served})"
+        )
+
+    async def _checkout(self) -> PooledBrowser:
+        """Pick a healthy browser, launching or replacing as required."""
+        async with self._checkout_lock:
+            # Browsers still serving another lease are left alone until it ends
+            for pooled in list(self._browsers):
+                if pooled.active_leases:
+                    continue
+                reason = self.check_health(pooled)
+                if reason:
+                    await self.recycle(pooled, reason)
+
+            if len(self._browsers) < self.config.size:
+                pooled = await self._launch()
+                self._browsers.append(pooled)
+                return pooled
+
+            # Round-robin over idle browsers so concurrent batches spread out,
+            # and share the least busy browser once all of them are leased
+            idle = [pooled for pooled in self._browsers if not pooled.active_leases]
+            if idle:
+                pooled = idle[self._next_index % len(idle)]
+            else:
+                pooled = min(self._browsers, key=lambda candidate: candidate.active_leases)
+            self._next_index += 1
+            self.metrics.reuses += 1
+            return pooled
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """Lease a warm browser context for one batch of tabs.
+
+        Tabs left open by the caller are closed when the last concurrent lease
+        on the browser ends, so the context is handed to the next batch in a
+        clean state.
+        """
+        if os.getpid() != self._owner_pid:
+            raise CrawlerError("BrowserPool used outside the process that created it")
+
+        pooled = await self._checkout()
+        pooled.leases += 1
+        pooled.active_leases += 1
+        self.metrics.leases += 1
+        try:
+            yield pooled.context
+        except Exception:
+            # A failing batch may have left the browser in a bad state
+            if self.check_health(pooled) == "disconnected":
+                await self.recycle(pooled, "disconnected")
+            raise
+        finally:
+            pooled.active_leases -= 1
+            if pooled in self._browsers and not pooled.active_leases:
+                for page in list(pooled.context.pages):
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+                if not self.config.persistent:
+                    await self.recycle(pooled, "non_persistent")
+
+    async def aclose(self):
+        """Close every browser and stop the Playwright driver."""
+        for pooled in list(self._browsers):
+            await self._close_browser(pooled)
+        self._browsers = []
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def close(self):
+        """Close the pool from sync code and stop its event loop thread."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result(30)
+        except Exception as e:
+            self.logger.warning(f"Browser pool shutdown failed: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            if not thread.is_alive():
+                loop.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get pool metrics for monitoring."""
+        launches = self.metrics.launches
+        return {
+            "size": len(self._browsers),
+            "launches": launches,
+            "leases": self.metrics.leases,
+            "reuses": self.metrics.reuses,
+            "pages_served": self.metrics.pages_served,
+            "avg_launch_time": self.metrics.launch_time_total / launches if launches else 0.0,
+            "recycles": dict(self.metrics.recycles),
+            "browsers": [
+                {
+                    "pid": pooled.pid,
+                    "age": pooled.age,
+                    "pages_served": pooled.pages_served,
+                    "leases": pooled.leases,
+                    "memory_mb": self._memory_mb(pooled),
+                }
+                for pooled in self._browsers
+            ],
+        }
+
+
+async def _abort_route(route):
+    await route.abort()
+
+
+def _child_pids() -> Set[int]:
+    """PIDs of all descendants of the current process."""
+    if not psutil:
+        return set()
+    try:
+        return {child.pid for child in psutil.Process().children(recursive=True)}
+    except psutil.Error:
+        return set()
+
+
+def _find_browser_pid(known_pids: Set[int]) -> Optional[int]:
+    """Find the root process of a freshly launched browser.
+
+    Playwright does not expose the browser PID, so it is derived from the
+    descendant processes that appeared during the launch.
+    """
+    if not psutil:
+        return None
+    try:
+        new_processes = [
+            child for child in psutil.Process().children(recursive=True)
+            if child.pid not in known_pids
+        ]
+        new_pids = {process.pid for process in new_processes}
+        for process in new_processes:
+            if 'chrom' in process.name().lower() and process.ppid() not in new_pids:
+                return process.pid
+    except psutil.Error:
+        pass
+    return None
+
+
+# Global browser pool instance (one per worker process)
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
+
+
+def get_browser_pool(settings: Any, logger: Optional[logging.Logger] = None) -> BrowserPool:
+    """Get the browser pool for the current worker process."""
+    global _browser_pool
+
+    with _browser_pool_lock:
+        # A pool inherited through fork belongs to the parent process
+        if _browser_pool is None or _browser_pool._owner_pid != os.getpid():
+            _browser_pool = BrowserPool(BrowserPoolConfig.from_settings(settings), logger)
+        return _browser_pool
+
+
+def shutdown_browser_pool():
+    """Close the current process's browser pool, if any."""
+    global _browser_pool
+
+    with _browser_pool_lock:
+        pool, _browser_pool = _browser_pool, None
+    if pool is not None and pool._owner_pid == os.getpid():
+        pool.close()
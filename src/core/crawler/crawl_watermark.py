@@ -0,0 +1,161 @@
+"""Per-category high-water marks for incremental scheduled crawls.
+
+A scheduled category with a 5-minute schedule and a ``1d`` crawl period
+used to re-fetch, re-resolve and re-extract nearly the same day of articles
+on every run. In incremental mode each category keeps a high-water mark:
+the newest publish time it has processed plus the Google News article IDs it
+has seen. A run passes on only items that are
+
+- not among the seen IDs, and
+- published after the mark minus an overlap window (Google indexes some
+  articles late; the seen IDs keep the overlap from producing duplicates)
+
+before any of them is resolved. Items without a readable publish date are
+judged by their ID alone.
+
+The mark is advanced only after the crawl that consumed the items finished,
+so a failed run never hides items from the next one, and only past the items
+it extracted or found stored. Items it passed on but could not process (cut
+by the URL cap, unresolved, or failed to download) stay unseen, and the
+publish time of the mark is held at the oldest of them. Marks live in Redis so
+all workers share them, with a process-local fallback when Redis is
+unavailable.
+
+Example:
+    ```python
+    from src.core.crawler.crawl_watermark import CrawlWatermark, get_watermark_store
+
+    store = get_watermark_store(settings)
+    mark = store.get(category_id) or CrawlWatermark()
+    new_items = [item for item in items if mark.is_new(item, overlap=3600)]
+    ...
+    store.put(category_id, mark.advance(processed, overlap=3600, max_ids=5000, pending=unprocessed))
+    ```
+"""
+
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional
+
+import redis
+
+from src.core.crawler.feed_cache import item_id
+from src.shared.redis_client import RedisJsonStore, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "gns:watermark:"
+
+
+def item_published_at(item: Dict[str, Any]) -> Optional[float]:
+    """Publish time of a feed item as a UNIX timestamp, or None if missing or unreadable."""
+    published = item.get("published date")
+    if not published:
+        return None
+    try:
+        return parsedate_to_datetime(published).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+@dataclass
+class CrawlWatermark:
+    """Newest processed publish time and the article IDs seen by a category."""
+    published_at: Optional[float] = None
+    # article ID -> publish time (or the time it was seen, if the item had no date)
+    seen: Dict[str, float] = field(default_factory=dict)
+
+    def is_new(self, item: Dict[str, Any], overlap: float) -> bool:
+        """Whether an item still needs processing."""
+        if item_id(item) in self.seen:
+            return False
+        published = item_published_at(item)
+        if published is None or self.published_at is None:
+            return True
+        return published >= self.published_at - overlap
+
+    def advance(
+        self,
+        items: Iterable[Dict[str, Any]],
+        overlap: float,
+        max_ids: int,
+        pending: Iterable[Dict[str, Any]] = ()
+    ) -> "CrawlWatermark":
+        """Mark with the given processed items added.
+
+        IDs older than the overlap window are dropped, since the publish
+        time check already filters them, and at most ``max_ids`` of the
+        newest IDs are kept. The publish time does not pass the oldest
+        ``pending`` item, so items that still need processing stay new.
+        """
+        now = time.time()
+        seen = dict(self.seen)
+        published_at = self.published_at
+        for item in items:
+            published = item_published_at(item)
+            seen[item_id(item)] = published if published is not None else now
+            if published is not None and (published_at is None or published > published_at):
+                published_at = published
+        for item in pending:
+            published = item_published_at(item)
+            if published is not None and published_at is not None and published < published_at:
+                published_at = published
+
+        if published_at is not None:
+            floor = published_at - overlap
+            seen = {identity: stamp for identity, stamp in seen.items() if stamp >= floor}
+        if len(seen) > max_ids:
+            seen = dict(sorted(seen.items(), key=lambda entry: entry[1], reverse=True)[:max_ids])
+        return CrawlWatermark(published_at=published_at, seen=seen)
+
+
+class WatermarkStore:
+    """High-water marks of incremental categories, shared by all workers."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis],
+        ttl: int = 604800,
+        fallback_size: int = 1024,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.store = RedisJsonStore(
+            client, REDIS_KEY_PREFIX, ttl, fallback_size=fallback_size, name="Watermark store", logger=logger
+        )
+
+    @property
+    def backend(self) -> str:
+        return self.store.backend
+
+    def get(self, category_id: str) -> Optional[CrawlWatermark]:
+        """Get a category's mark, or None if it has not completed an incremental run."""
+        return self.store.get(str(category_id), lambda data: CrawlWatermark(**data))
+
+    def put(self, category_id: str, mark: CrawlWatermark):
+        """Store a category's mark."""
+        self.store.put(str(category_id), asdict(mark))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics for monitoring."""
+        return self.store.get_stats()
+
+
+# Global watermark store instance
+_watermark_store: Optional[WatermarkStore] = None
+_watermark_store_lock = threading.Lock()
+
+
+def get_watermark_store(settings: Any, logger: Optional[logging.Logger] = None) -> WatermarkStore:
+    """Get the global watermark store instance."""
+    global _watermark_store
+
+    with _watermark_store_lock:
+        if _watermark_store is None:
+            client = get_redis_client(settings)
+            _watermark_store = WatermarkStore(client=client, ttl=settings.INCREMENTAL_CRAWL_TTL, logger=logger)
+            if not is_redis_available(client):
+                _watermark_store.store.failover.mark_down()
+        return _watermark_store
@@ -782,50 +782,50 @@ class CrawlerEngine:
         """
         try:
             from bs4 import BeautifulSoup
-            import re
 
             soup = BeautifulSoup(html_content, 'html.parser')
             articles = []
 
-            # Look for article links in Google News HTML structure
-            # Google News uses various selectors, so we try multiple approaches
-            selectors = [
-                'article a[href]',
-                'a[href*="/articles/"]',
-                'a[href*="./articles/"]',
-                '.JtKRv a[href]',
-                '.ipQwMb a[href]',
-                '.WwrzSb a[href]'
-            ]
+            # Look for article links in Google News HTML structure in one pass over
+            # the anchors: links to articles, or links inside article containers
+            # (Google News uses various container classes)
+            container_classes = {'JtKRv', 'ipQwMb', 'WwrzSb'}
 
-            all_links = []
-            for selector in selectors:
-                links = soup.select(selector)
-                all_links.extend(links)
+            def _in_container(link) -> bool:
+                for parent in link.parents:
+                    if parent.name == 'article' or container_classes.intersection(parent.get('class') or ()):
+                        return True
+                return False
 
             # Process links and extract article URLs
+            seen_hrefs = set()
             seen_urls = set()
-            for link in all_links:
+            for link in soup.find_all('a', href=True):
                 href = link.get('href')
-                if href and not href in seen_urls:
-                    # Convert relative URLs to absolute
-                    if href.startswith('./'):
-                        href = 'https://news.google.com/' + href[2:]
-                    elif href.startswith('/'):
-                        href = 'https://news.google.com' + href
+                if not href or href in seen_hrefs:
+                    continue
+                if '/articles/' not in href and not _in_container(link):
+                    continue
+                seen_hrefs.add(href)
+
+                # Convert relative URLs to absolute
+                if href.startswith('./'):
+                    href = 'https://news.google.com/' + href[2:]
+                elif href.startswith('/'):
+                    href = 'https://news.google.com' + href
 
-                    # Extract the actual article URL from Google News redirect
-                    actual_url = self._extract_actual_url(href)
-                    if actual_url and actual_url not in seen_urls:
-                        seen_urls.add(actual_url)
-                        articles.append({
-                            'url': actual_url,
-                            'link': actual_url,
-                            'title': link.get_text(strip=True) or 'No title'
-                        })
+                # Extract the actual article URL from Google News redirect
+                actual_url = self._extract_actual_url(href)
+                if actual_url and actual_url not in seen_urls:
+                    seen_urls.add(actual_url)
+                    articles.append({
+                        'url': actual_url,
+                        'link': actual_url,
+                        'title': link.get_text(strip=True) or 'No title'
+                    })
 
-                        if len(articles) >= max_results:
-                            break
+                    if len(articles) >= max_results:
+                        break
 
             self.logger.info(f"CloudScraper extracted {len(articles)} article URLs")
             return articles
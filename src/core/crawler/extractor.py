@@ -165,6 +165,7 @@ class ArticleExtractor:
         config.memoize_articles = False  # Disable caching for fresh data
         config.fetch_images = self.settings.NEWSPAPER_FETCH_IMAGES
         config.http_success_only = self.settings.NEWSPAPER_HTTP_SUCCESS_ONLY
+        config.trust_html_domains = self.settings.NEWSPAPER_TRUST_HTML_DOMAINS
         
         # Set timeout configurations
         config.request_timeout = self.settings.EXTRACTION_TIMEOUT
@@ -0,0 +1,140 @@
+"""Cache of Google News RSS search responses for scheduled crawls.
+
+Scheduled categories re-issue the same period search every few minutes and
+the feed has usually not changed in between. For each search (normalized
+query, language, country, period and the category searching) this cache
+keeps the ETag and Last-Modified validators of the last processed response
+together with its parsed items. The next search is a conditional GET:
+
+- ``304 Not Modified``: nothing new, the crawl short-circuits
+- ``200``: only items whose article ID was not in the cached response are
+  passed on, as a delta
+
+Entries are written only after the crawl that consumed them finished and
+hold only the items it processed, so neither a failed job nor an item it
+could not resolve or extract is hidden from the next run. Entries live in
+Redis so all workers share them, with a process-local fallback when Redis is
+unavailable.
+
+Example:
+    ```python
+    from src.core.crawler.feed_cache import FeedCacheEntry, feed_cache_key, get_feed_cache
+
+    cache = get_feed_cache(settings)
+    key = feed_cache_key("AI OR blockchain", "vi", "VN", "1h", category_id)
+    entry = cache.get(key)
+    ...
+    cache.put(key, FeedCacheEntry(etag=etag, last_modified=None, items=items))
+    ```
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import redis
+
+from src.core.crawler.url_decoder import extract_article_id
+from src.shared.redis_client import RedisJsonStore, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "gns:feed:"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so equivalent keyword sets share a cache entry.
+
+    Case, whitespace and the order of OR terms and exclusions are ignored.
+    """
+    tokens = query.lower().split()
+    exclusions = sorted({token for token in tokens if token.startswith("-")})
+    terms = " ".join(token for token in tokens if not token.startswith("-"))
+    included = sorted({term.strip() for term in terms.split(" or ") if term.strip()})
+    return " OR ".join(included) + "".join(f" {token}" for token in exclusions)
+
+
+def feed_cache_key(
+    query: str,
+    language: str,
+    country: str,
+    period: Optional[str],
+    category_id: Optional[str] = None
+) -> str:
+    """Cache key for a search, per category when the search runs for one.
+
+    Categories searching the same query each process the feed themselves, so
+    each keeps its own delta.
+    """
+    identity = f"{normalize_query(query)}|{language.lower()}|{country.upper()}|{period or ''}|{category_id or ''}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def item_id(item: Dict[str, Any]) -> str:
+    """Stable identity of a feed item: its Google News article ID, else its URL."""
+    url = item.get("url") or ""
+    return extract_article_id(url) or url
+
+
+@dataclass
+class FeedCacheEntry:
+    """Validators and items of the last processed response for a search."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    stored_at: float = field(default_factory=time.time)
+
+    def item_ids(self) -> Set[str]:
+        return {item_id(item) for item in self.items}
+
+
+class FeedCache:
+    """Feed response cache shared by all workers."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis],
+        ttl: int = 86400,
+        fallback_size: int = 512,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.store = RedisJsonStore(
+            client, REDIS_KEY_PREFIX, ttl, fallback_size=fallback_size, name="Feed cache", logger=logger
+        )
+
+    @property
+    def backend(self) -> str:
+        return self.store.backend
+
+    def get(self, key: str) -> Optional[FeedCacheEntry]:
+        """Get the entry for a search, or None."""
+        return self.store.get(key, lambda data: FeedCacheEntry(**data))
+
+    def put(self, key: str, entry: FeedCacheEntry):
+        """Store the entry for a search."""
+        self.store.put(key, asdict(entry))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        return self.store.get_stats()
+
+
+# Global feed cache instance
+_feed_cache: Optional[FeedCache] = None
+_feed_cache_lock = threading.Lock()
+
+
+def get_feed_cache(settings: Any, logger: Optional[logging.Logger] = None) -> FeedCache:
+    """Get the global feed cache instance."""
+    global _feed_cache
+
+    with _feed_cache_lock:
+        if _feed_cache is None:
+            client = get_redis_client(settings)
+            _feed_cache = FeedCache(client=client, ttl=settings.FEED_CACHE_TTL, logger=logger)
+            if not is_redis_available(client):
+                _feed_cache.store.failover.mark_down()
+        return _feed_cache
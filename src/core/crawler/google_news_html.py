@@ -0,0 +1,51 @@
+"""Single-pass extraction of article links from Google News HTML pages.
+
+The CloudScraper fallback downloads the Google News search page and pulls
+the article links out of it. Pages can hold thousands of links, so
+extraction is one lazy scan with a single compiled pattern, deduplicated
+with an insertion-ordered dict, and it stops as soon as ``max_results``
+unique links have been found.
+
+Example:
+    ```python
+    from src.core.crawler.google_news_html import extract_article_links
+
+    urls = extract_article_links(response.text, max_results=100)
+    ```
+"""
+
+import re
+from typing import Dict, Iterator, List
+
+GOOGLE_NEWS_BASE_URL = "https://news.google.com"
+
+# href / data-url attributes pointing at a Google News article, in document order
+_ARTICLE_LINK_RE = re.compile(r'(?:href|data-url)="(?P<url>[^"]*articles/[^"]*)"')
+
+
+def normalize_article_link(link: str) -> str:
+    """Make a link found in the page absolute."""
+    if link.startswith('./'):
+        return f"{GOOGLE_NEWS_BASE_URL}{link[1:]}"
+    if link.startswith('https://'):
+        return link
+    return f"{GOOGLE_NEWS_BASE_URL}{link}"
+
+
+def iter_article_links(html_content: str) -> Iterator[str]:
+    """Yield absolute article links in document order, duplicates included."""
+    for match in _ARTICLE_LINK_RE.finditer(html_content):
+        yield normalize_article_link(match.group('url'))
+
+
+def extract_article_links(html_content: str, max_results: int = 100) -> List[str]:
+    """Unique article links in document order, at most ``max_results`` of them."""
+    if max_results <= 0:
+        return []
+    seen: Dict[str, None] = {}
+    for url in iter_article_links(html_content):
+        if url not in seen:
+            seen[url] = None
+            if len(seen) >= max_results:
+                break
+    return list(seen)
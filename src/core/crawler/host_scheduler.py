@@ -0,0 +1,198 @@
+"""Per-publisher politeness scheduling for article downloads.
+
+Resolved article URLs cluster on a few publishers. Downloaded in input
+order, a batch opens every slot on the first publisher while the others
+wait, and the publisher answers with 429s. The host scheduler keeps
+downloads polite per host without lowering the worker's total throughput:
+
+- ``interleave_by_host`` orders a batch round-robin across hosts, so the
+  global slots are shared between publishers from the start
+- at most ``per_host_limit`` downloads are in flight per host
+- request starts to one host are spaced at least ``crawl_delay`` apart
+- a 429/503 response pauses its host for the ``Retry-After`` it sent
+  (capped at ``max_retry_after``)
+
+A download waiting for its host holds no global slot, so other hosts keep
+the worker's global concurrency busy. Per-host queue depth, in-flight
+count, throttling and latency are exposed through ``get_stats`` for
+tuning the limits.
+
+Example:
+    ```python
+    from src.core.crawler.host_scheduler import (
+        HostScheduler, HostSchedulerConfig, host_of, interleave_by_host
+    )
+
+    scheduler = HostScheduler(HostSchedulerConfig(per_host_limit=4, crawl_delay=0.5))
+    for url in interleave_by_host(urls):
+        async with scheduler.slot(host_of(url)):
+            response = await client.get(url)
+        scheduler.record_response(host_of(url), response.status_code, elapsed,
+                                  response.headers.get("Retry-After"))
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Responses asking the client to slow down
+THROTTLE_STATUSES = (429, 503)
+
+
+def host_of(url: str) -> str:
+    """Host a URL is downloaded from, used as the politeness key."""
+    return urlparse(url).netloc.lower()
+
+
+def interleave_by_host(urls: List[str]) -> List[str]:
+    """Order URLs round-robin across hosts, keeping each host's own order.
+
+    ``[a1, a2, a3, b1, c1]`` becomes ``[a1, b1, c1, a2, a3]``.
+    """
+    queues: "OrderedDict[str, List[str]]" = OrderedDict()
+    for url in urls:
+        queues.setdefault(host_of(url), []).append(url)
+
+    interleaved = []
+    depth = 0
+    while len(interleaved) < len(urls):
+        for queue in queues.values():
+            if depth < len(queue):
+                interleaved.append(queue[depth])
+        depth += 1
+    return interleaved
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date).
+
+    Returns:
+        The delay in seconds, or None when the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+@dataclass
+class HostSchedulerConfig:
+    """Configuration for the host scheduler."""
+    per_host_limit: int = 4             # Downloads in flight per host
+    crawl_delay: float = 0.5            # Minimum seconds between request starts to one host
+    throttle_delay: float = 30.0        # Pause after a 429/503 without Retry-After
+    max_retry_after: float = 120.0      # Longest pause honoured from Retry-After
+
+
+class HostState:
+    """Politeness state and counters of one host."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(max(1, limit))
+        self.next_start = 0.0           # time.monotonic() before which no request may start
+        self.queued = 0
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "avg_latency": self.total_latency / self.requests if self.requests else 0.0,
+            "max_latency": self.max_latency,
+            "paused_for": max(0.0, self.next_start - now),
+        }
+
+
+class HostScheduler:
+    """Per-host concurrency limits and crawl delays for one event loop."""
+
+    def __init__(self, config: Optional[HostSchedulerConfig] = None):
+        self.config = config or HostSchedulerConfig()
+        self._hosts: Dict[str, HostState] = {}
+
+    def _state(self, host: str) -> HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = HostState(self.config.per_host_limit)
+        return state
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Wait for a download slot on a host and its crawl delay."""
+        state = self._state(host)
+        state.queued += 1
+        try:
+            await state.semaphore.acquire()
+        finally:
+            state.queued -= 1
+
+        try:
+            # A throttled response may push next_start while we sleep
+            while (wait := state.next_start - time.monotonic()) > 0:
+                await asyncio.sleep(wait)
+            state.next_start = time.monotonic() + self.config.crawl_delay
+            state.in_flight += 1
+            try:
+                yield
+            finally:
+                state.in_flight -= 1
+        finally:
+            state.semaphore.release()
+
+    def record_response(
+        self,
+        host: str,
+        status: int,
+        latency: float,
+        retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Record a finished download; pause the host if it asked to slow down.
+
+        Returns:
+            Seconds the host is paused for, or None if it was not throttled
+        """
+        state = self._state(host)
+        state.requests += 1
+        state.total_latency += latency
+        state.max_latency = max(state.max_latency, latency)
+
+        if status not in THROTTLE_STATUSES:
+            return None
+
+        delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.config.throttle_delay
+        delay = min(delay, self.config.max_retry_after)
+        state.throttled += 1
+        state.next_start = max(state.next_start, time.monotonic() + delay)
+        logger.info(f"Host {host} throttled downloads (HTTP {status}), pausing {delay:.1f}s")
+        return delay
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host queue depth, in-flight downloads, throttling and latency."""
+        now = time.monotonic()
+        return {host: state.to_dict(now) for host, state in self._hosts.items()}
@@ -0,0 +1,243 @@
+"""Pooled HTTP tier for resolving Google News URLs without a browser.
+
+Some Google News links answer with a server-side redirect to the publisher,
+and the interstitial pages served for others name their target in a
+``data-n-au`` attribute or a meta refresh. Both can be read with a plain
+HTTP client at a fraction of the cost of a Chromium tab. This tier sits
+between the offline decoder and the browser:
+
+    offline decode -> resolution cache -> HTTP tier -> headless browser
+
+Requests share one keep-alive ``httpx.AsyncClient`` per worker process
+(HTTP/2 when the ``h2`` package is installed) and run with bounded
+concurrency on the browser pool's event loop. Redirects are followed by hand
+and resolution stops at the first publisher URL, so publisher pages are never
+downloaded.
+
+Example:
+    ```python
+    from src.core.crawler.http_resolver import get_http_redirect_resolver
+
+    resolver = get_http_redirect_resolver(settings)
+    results = resolver.resolve_batch(google_news_urls)  # {google_url: url or None}
+
+    # Take one resolve token per URL as it is requested; URLs left out of the
+    # result were never requested because the budget ran out within max_wait
+    limiter = get_resolve_rate_limiter(settings)
+    results = resolver.resolve_batch(google_news_urls, limiter=limiter, max_wait=120.0)
+    ```
+"""
+
+import asyncio
+import html
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+from src.core.crawler.browser_pool import DEFAULT_USER_AGENT, BrowserPool, get_browser_pool
+from src.core.crawler.rate_limiter import TokenBucket
+from src.core.crawler.url_decoder import is_publisher_url
+
+logger = logging.getLogger(__name__)
+
+# Target URL embedded by Google News interstitial pages
+_DATA_N_AU_RE = re.compile(r'data-n-au\s*=\s*"(?P<url>[^"]+)"', re.IGNORECASE)
+_META_REFRESH_RE = re.compile(
+    r'<meta[^>]+http-equiv\s*=\s*["\']?refresh["\']?[^>]*content\s*=\s*["\'][^"\']*?url\s*=\s*'
+    r'["\']?(?P<url>[^"\'>\s]+)',
+    re.IGNORECASE
+)
+
+
+def extract_redirect_target(page_html: str) -> Optional[str]:
+    """Find the publisher URL named by a Google News interstitial page.
+
+    Args:
+        page_html: HTML of the Google News page
+
+    Returns:
+        Publisher URL from ``data-n-au`` or a meta refresh, or None
+    """
+    for pattern in (_DATA_N_AU_RE, _META_REFRESH_RE):
+        for match in pattern.finditer(page_html):
+            url = html.unescape(match.group("url")).strip()
+            if is_publisher_url(url):
+                return url
+    return None
+
+
+@dataclass
+class HttpResolverConfig:
+    """Configuration for the HTTP resolution tier."""
+    concurrency: int = 20       # Requests in flight at once
+    timeout: float = 5.0        # Seconds per request
+    max_redirects: int = 5
+    http2: bool = True          # Used only when the h2 package is installed
+    user_agent: str = DEFAULT_USER_AGENT
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "HttpResolverConfig":
+        """Build HTTP tier configuration from application settings."""
+        return cls(
+            concurrency=settings.HTTP_RESOLVER_CONCURRENCY,
+            timeout=settings.HTTP_RESOLVER_TIMEOUT,
+            http2=settings.HTTP_RESOLVER_HTTP2,
+        )
+
+
+class HttpRedirectResolver:
+    """Resolve Google News URLs with pooled HTTP requests."""
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        config: Optional[HttpResolverConfig] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.pool = pool
+        self.config = config or HttpResolverConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self._client = None
+
+    def _get_client(self) -> Any:
+        """Create the shared client on first use, on the loop that will drive it."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.config.http2 and h2 is not None,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.concurrency,
+                    max_keepalive_connections=self.config.concurrency
+                ),
+                headers={
+                    'User-Agent': self.config.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.5',
+                },
+                follow_redirects=False,
+            )
+        return self._client
+
+    def resolve_batch(
+        self,
+        google_urls: List[str],
+        limiter: Optional[TokenBucket] = None,
+        max_wait: Optional[float] = None
+    ) -> Dict[str, Optional[str]]:
+        """Resolve a batch from sync code.
+
+        Args:
+            google_urls: Google News URLs to resolve
+            limiter: Rate limiter charged one token per URL right before it is requested
+            max_wait: Seconds the whole batch may wait for the limiter
+
+        Returns:
+            Mapping of each requested Google News URL to its publisher URL, or None if this
+            tier could not resolve it. URLs the limiter had no budget for are left out.
+        """
+        if not google_urls:
+            return {}
+        if httpx is None:
+            self.logger.warning("httpx not available - skipping HTTP resolution tier")
+            return {url: None for url in google_urls}
+        # Every request is bounded by the per-request timeout and the redirect limit
+        batches = -(-len(google_urls) // max(1, self.config.concurrency))
+        timeout = batches * self.config.timeout * (self.config.max_redirects + 1) + (max_wait or 0.0) + 10
+        return self.pool.run(self.resolve_batch_async(google_urls, limiter, max_wait), timeout=timeout)
+
+    async def resolve_batch_async(
+        self,
+        google_urls: List[str],
+        limiter: Optional[TokenBucket] = None,
+        max_wait: Optional[float] = None
+    ) -> Dict[str, Optional[str]]:
+        """Resolve a batch concurrently with at most ``concurrency`` requests in flight."""
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        results: Dict[str, Optional[str]] = {}
+        out_of_budget = False
+
+        async def _bounded(google_url: str):
+            nonlocal out_of_budget
+            async with semaphore:
+                if limiter is not None:
+                    timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                    if out_of_budget or not await limiter.acquire_async(timeout=timeout):
+                        out_of_budget = True
+                        return
+                results[google_url] = await self._resolve_one(client, google_url)
+
+        await asyncio.gather(*(_bounded(url) for url in google_urls))
+        if out_of_budget:
+            self.logger.warning(
+                f"HTTP tier ran out of resolve budget after {len(results)}/{len(google_urls)} URLs"
+            )
+        # Keep the input order
+        return {url: results[url] for url in google_urls if url in results}
+
+    async def _resolve_one(self, client: Any, google_url: str) -> Optional[str]:
+        """Follow redirects by hand until a publisher URL shows up."""
+        current_url = google_url
+        try:
+            for _ in range(self.config.max_redirects + 1):
+                response = await client.get(current_url)
+
+                if response.is_redirect:
+                    location = response.headers.get('Location')
+                    if not location:
+                        return None
+                    current_url = urljoin(current_url, location)
+                    # Stop before downloading the publisher page
+                    if is_publisher_url(current_url):
+                        return current_url
+                    continue
+
+                if response.status_code == 200:
+                    return extract_redirect_target(response.text)
+                return None
+
+            self.logger.debug(f"HTTP tier hit the redirect limit for {google_url}")
+        except Exception as e:
+            self.logger.debug(f"HTTP tier failed for {google_url}: {e}")
+        return None
+
+    async def aclose(self):
+        """Close the shared client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global HTTP resolver instance (one per worker process)
+_http_resolver: Optional[HttpRedirectResolver] = None
+_http_resolver_pid: Optional[int] = None
+_http_resolver_lock = threading.Lock()
+
+
+def get_http_redirect_resolver(settings: Any, logger: Optional[logging.Logger] = None) -> HttpRedirectResolver:
+    """Get the HTTP resolution tier for the current worker process."""
+    global _http_resolver, _http_resolver_pid
+
+    pool = get_browser_pool(settings, logger)
+    with _http_resolver_lock:
+        # Connections inherited through fork belong to the parent's event loop
+        if _http_resolver is None or _http_resolver_pid != os.getpid() or _http_resolver.pool is not pool:
+            _http_resolver = HttpRedirectResolver(pool, HttpResolverConfig.from_settings(settings), logger)
+            _http_resolver_pid = os.getpid()
+        return _http_resolver
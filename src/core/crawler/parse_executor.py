@@ -0,0 +1,264 @@
+"""Process pool for the CPU-bound article parse stage.
+
+``Article.parse()`` (lxml parsing, ``DocumentCleaner.clean``, body node
+scoring, output formatting) is pure Python CPU work. Run in the extraction
+threads it is serialized by the GIL, so a worker parsing a large batch sits
+at 100% of one core while the others idle. The parse executor moves it to a
+pool of worker processes:
+
+    async fetcher (network, event loop) -> raw HTML
+        -> parse_article_html in a process pool -> ParsedArticle
+
+Only the URL and HTML go to the child process and only a compact, picklable
+``ParsedArticle`` comes back; newspaper's ``Article`` object and its lxml
+trees never cross the process boundary.
+
+When the pool cannot be started (e.g. inside a daemonic process) or breaks,
+the executor parses in threads instead, as extraction did before.
+
+Example:
+    ```python
+    from src.core.crawler.parse_executor import get_parse_executor
+
+    executor = get_parse_executor(settings)
+    for parsed in executor.parse_many([(page.url, page.text) for page in pages]):
+        if parsed.ok:
+            print(parsed.title, len(parsed.text))
+    ```
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParsedArticle:
+    """Fields extracted from an article page.
+
+    Attribute names match newspaper's ``Article`` so callers can read either.
+    """
+    url: str
+    title: str = ""
+    text: str = ""
+    summary: str = ""
+    authors: List[str] = field(default_factory=list)
+    publish_date: Optional[datetime] = None
+    top_image: str = ""
+    meta_keywords: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_article_html(url: str, html: str) -> ParsedArticle:
+    """Parse downloaded HTML with newspaper. Runs in a parse process.
+
+    Errors are returned in the result so one bad page cannot break the pool.
+    """
+    try:
+        from newspaper import Article
+
+        article = Article(url)
+        article.download(input_html=html)
+        article.parse()
+        return ParsedArticle(
+            url=url,
+            title=article.title or "",
+            text=article.text or "",
+            summary=article.summary or "",
+            authors=list(article.authors or []),
+            publish_date=article.publish_date,
+            top_image=article.top_image or "",
+            meta_keywords=list(article.meta_keywords or []),
+        )
+    except Exception as e:
+        return ParsedArticle(url=url, error=f"{type(e).__name__}: {e}")
+
+
+@dataclass
+class ParseExecutorConfig:
+    """Configuration for the parse executor."""
+    processes: int = 2          # Parse processes per worker process; 0 parses in threads
+    threads: int = 5            # Parse threads when no process pool is available
+    timeout: float = 60.0       # Seconds of parse time allowed per page
+    start_method: str = "spawn"
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ParseExecutorConfig":
+        """Build executor configuration from application settings."""
+        return cls(
+            processes=settings.PARSE_PROCESS_WORKERS,
+            threads=getattr(settings, 'EXTRACTION_THREADS', 5),
+            timeout=settings.PARSE_TIMEOUT,
+        )
+
+
+@dataclass
+class ParseExecutorMetrics:
+    """Counters tracked by the parse executor."""
+    parsed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    pool_restarts: int = 0
+    parse_time: float = 0.0
+
+
+class ParseExecutor:
+    """Parse article HTML on a process pool, falling back to threads."""
+
+    def __init__(self, config: Optional[ParseExecutorConfig] = None, logger: Optional[logging.Logger] = None):
+        self.config = config or ParseExecutorConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = ParseExecutorMetrics()
+        self._pool: Optional[Executor] = None
+        self._uses_processes = False
+        self._backlog = 0               # Pages submitted by all threads and not finished yet
+        self._lock = threading.Lock()
+
+    @property
+    def mode(self) -> str:
+        return "processes" if self._uses_processes else "threads"
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is not None:
+                return self._pool
+
+            if self.config.processes > 0:
+                pool = None
+                try:
+                    pool = ProcessPoolExecutor(
+                        max_workers=self.config.processes,
+                        mp_context=multiprocessing.get_context(self.config.start_method)
+                    )
+                    # Start the processes now so an unsupported environment fails here
+                    pool.submit(os.getpid).result(timeout=self.config.timeout)
+                    self._pool, self._uses_processes = pool, True
+                    self.logger.info(f"Parsing articles on {self.config.processes} processes")
+                    return pool
+                except Exception as e:
+                    self.logger.warning(f"Parse process pool unavailable, parsing in threads: {e}")
+                    if pool is not None:
+                        pool.shutdown(wait=False, cancel_futures=True)
+
+            self._pool = ThreadPoolExecutor(max_workers=max(1, self.config.threads), thread_name_prefix="article-parse")
+            self._uses_processes = False
+            return self._pool
+
+    def _discard_pool(self, pool: Executor):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+                self.metrics.pool_restarts += 1
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _page_done(self, future):
+        with self._lock:
+            self._backlog -= 1
+
+    def parse_many(self, pages: List[Tuple[str, str]]) -> List[ParsedArticle]:
+        """Parse (url, html) pairs.
+
+        The batch shares one deadline covering the pages queued ahead of it
+        by other threads, so a busy pool does not turn queueing time into
+        parse timeouts.
+
+        Returns:
+            One ParsedArticle per page, in input order
+        """
+        if not pages:
+            return []
+
+        pool = self._get_pool()
+        start = time.monotonic()
+        workers = max(1, self.config.processes if self._uses_processes else self.config.threads)
+        with self._lock:
+            self._backlog += len(pages)
+            # Per-page allowance for every round of workers needed to drain the backlog
+            timeout = self.config.timeout * -(-self._backlog // workers)
+        futures = []
+        for url, html in pages:
+            try:
+                future = pool.submit(parse_article_html, url, html)
+            except Exception:
+                with self._lock:
+                    self._backlog -= len(pages) - len(futures)
+                raise
+            future.add_done_callback(self._page_done)
+            futures.append(future)
+        wait(futures, timeout=timeout)
+
+        results = []
+        timed_out = 0
+        for (url, _), future in zip(pages, futures):
+            if not future.done():
+                future.cancel()
+                timed_out += 1
+                results.append(ParsedArticle(url=url, error=f"parse timed out after {timeout:.0f}s"))
+                continue
+            try:
+                results.append(future.result())
+            except BrokenProcessPool as e:
+                # A parse process died (e.g. OOM); the next batch starts a fresh pool
+                self._discard_pool(pool)
+                results.append(ParsedArticle(url=url, error=f"parse process died: {e}"))
+
+        parsed = sum(1 for result in results if result.ok)
+        with self._lock:
+            self.metrics.parse_time += time.monotonic() - start
+            self.metrics.timed_out += timed_out
+            self.metrics.parsed += parsed
+            self.metrics.failed += len(results) - parsed
+        return results
+
+    def shutdown(self):
+        """Stop the pool's processes or threads."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get executor metrics for monitoring."""
+        with self._lock:
+            return {"mode": self.mode, **asdict(self.metrics)}
+
+
+# Global parse executor instance (one per worker process)
+_parse_executor: Optional[ParseExecutor] = None
+_parse_executor_pid: Optional[int] = None
+_parse_executor_lock = threading.Lock()
+
+
+def get_parse_executor(settings: Any, logger: Optional[logging.Logger] = None) -> ParseExecutor:
+    """Get the parse executor for the current worker process."""
+    global _parse_executor, _parse_executor_pid
+
+    with _parse_executor_lock:
+        # Pool processes and threads do not survive a fork
+        if _parse_executor is None or _parse_executor_pid != os.getpid():
+            _parse_executor = ParseExecutor(ParseExecutorConfig.from_settings(settings), logger)
+            _parse_executor_pid = os.getpid()
+        return _parse_executor
+
+
+def shutdown_parse_executor():
+    """Stop the current process's parse executor, if any."""
+    global _parse_executor
+
+    with _parse_executor_lock:
+        executor, _parse_executor = _parse_executor, None
+    if executor is not None and _parse_executor_pid == os.getpid():
+        executor.shutdown()
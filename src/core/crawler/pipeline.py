@@ -0,0 +1,320 @@
+"""Streaming search -> resolve -> extract -> save pipeline for category crawls.
+
+Instead of resolving every URL, then extracting every article, then saving
+everything, the stages run concurrently and are connected by bounded queues:
+
+    url batches (search + resolution, producer thread)
+        -> url_queue -> extraction workers
+        -> article_queue -> micro-batch saves (calling thread)
+
+Resolved URLs start extracting while later batches are still being resolved,
+and articles are saved in micro-batches as they arrive. The first article
+reaches the database after the first resolution batch instead of the slowest
+one, and only a few batches of downloaded pages are held in memory at once.
+Batches saved before a timeout or failure are kept, and on an early stop the
+stages are joined (for at most ``shutdown_timeout`` seconds) so articles
+they finish extracting are saved instead of dropped. The URL producer can
+share the pipeline's stop event and check it between batches, so it stops
+searching and resolving once the pipeline no longer wants its URLs.
+
+Example:
+    ```python
+    from src.core.crawler.pipeline import PipelineConfig, StreamingCrawlPipeline
+
+    pipeline = StreamingCrawlPipeline(
+        extract=lambda urls: engine.extract_articles_with_threading(urls, threads=5),
+        save=lambda articles: repo.save_articles_with_deduplication(articles, category_id),
+        config=PipelineConfig(extract_workers=2, save_batch_size=20),
+    )
+    result = pipeline.run(engine.iter_search_google_news(keywords))
+    ```
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's output
+_DONE = object()
+
+# How often blocked stages re-check the stop flag
+_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class PipelineConfig:
+    """Configuration for the streaming crawl pipeline."""
+    extract_workers: int = 2            # Concurrent extraction batches
+    extract_batch_size: int = 10        # URLs handed to one extraction call
+    save_batch_size: int = 20           # Articles per database write
+    queue_size: int = 20                # Bound on queued URL chunks and article lists
+    time_budget: Optional[float] = None  # Seconds before the pipeline stops early
+    shutdown_timeout: float = 20.0      # Seconds to wait for stages to finish after a stop
+
+    @classmethod
+    def from_settings(cls, settings: Any, time_budget: Optional[float] = None) -> "PipelineConfig":
+        """Build pipeline configuration from application settings."""
+        return cls(
+            extract_workers=settings.PIPELINE_EXTRACT_WORKERS,
+            extract_batch_size=settings.ARTICLE_EXTRACTION_BATCH_SIZE,
+            save_batch_size=settings.PIPELINE_SAVE_BATCH_SIZE,
+            queue_size=settings.PIPELINE_QUEUE_SIZE,
+            time_budget=time_budget,
+        )
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of a pipeline run."""
+    urls_received: int = 0
+    articles_extracted: int = 0
+    articles_saved: int = 0
+    save_batches: int = 0
+    extract_errors: int = 0
+    time_to_first_save: Optional[float] = None
+    elapsed: float = 0.0
+    partial: bool = False
+    error: Optional[BaseException] = None
+    extracted_articles: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class StreamingCrawlPipeline:
+    """Run URL production, extraction and saving as concurrent stages."""
+
+    def __init__(
+        self,
+        extract: Callable[[List[str]], List[Dict[str, Any]]],
+        save: Callable[[List[Dict[str, Any]]], int],
+        config: Optional[PipelineConfig] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.extract = extract
+        self.save = save
+        self.config = config or PipelineConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        # Guards result counters updated from the producer and extraction threads
+        self._lock = threading.Lock()
+
+    def run(self, url_batches: Iterable[List[str]], stop: Optional[threading.Event] = None) -> PipelineResult:
+        """Consume URL batches until exhausted or the time budget runs out.
+
+        Args:
+            url_batches: Iterable yielding lists of resolved article URLs
+            stop: Event set when the pipeline stops, for url_batches to check between batches
+
+        Returns:
+            PipelineResult with counts for everything extracted and saved
+
+        Raises:
+            Exception: The URL producer's error, if it failed before yielding any URL
+        """
+        result = PipelineResult()
+        start = time.monotonic()
+        deadline = start + self.config.time_budget if self.config.time_budget else None
+        stop = stop or threading.Event()
+        url_queue: queue.Queue = queue.Queue(maxsize=self.config.queue_size)
+        article_queue: queue.Queue = queue.Queue(maxsize=self.config.queue_size)
+        workers = max(1, self.config.extract_workers)
+
+        producer = threading.Thread(
+            target=self._produce,
+            args=(url_batches, url_queue, stop, result, workers),
+            name="crawl-pipeline-producer",
+            daemon=True
+        )
+        extractors = [
+            threading.Thread(
+                target=self._extract_worker,
+                args=(url_queue, article_queue, stop, result),
+                name=f"crawl-pipeline-extract-{i}",
+                daemon=True
+            )
+            for i in range(workers)
+        ]
+        producer.start()
+        for thread in extractors:
+            thread.start()
+
+        buffer: List[Dict[str, Any]] = []
+        finished_workers = 0
+        try:
+            while finished_workers < workers:
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.logger.warning(
+                        f"Crawl pipeline time budget of {self.config.time_budget:.0f}s exhausted, "
+                        f"keeping partial results"
+                    )
+                    result.partial = True
+                    break
+
+                try:
+                    item = article_queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+
+                if item is _DONE:
+                    finished_workers += 1
+                    continue
+
+                buffer.extend(item)
+                while len(buffer) >= self.config.save_batch_size:
+                    batch = buffer[:self.config.save_batch_size]
+                    buffer = buffer[self.config.save_batch_size:]
+                    self._save_batch(batch, result, start)
+        finally:
+            stop.set()
+            self._join_stages([producer, *extractors], url_queue, article_queue, buffer)
+            # Whatever was extracted is saved, even when the job is being torn down
+            if buffer:
+                self._save_batch(buffer, result, start)
+
+        result.elapsed = time.monotonic() - start
+        if result.error is not None:
+            if result.urls_received == 0:
+                raise result.error
+            result.partial = True
+
+        self.logger.info(
+            f"Crawl pipeline finished in {result.elapsed:.1f}s: {result.urls_received} URLs, "
+            f"{result.articles_extracted} extracted, {result.articles_saved} saved in "
+            f"{result.save_batches} batches"
+            + (f", first save after {result.time_to_first_save:.1f}s" if result.time_to_first_save else "")
+            + (" (partial)" if result.partial else "")
+        )
+        return result
+
+    def _produce(
+        self,
+        url_batches: Iterable[List[str]],
+        url_queue: queue.Queue,
+        stop: threading.Event,
+        result: PipelineResult,
+        workers: int
+    ):
+        """Feed deduplicated URL chunks to the extraction workers."""
+        seen = set()
+        chunk_size = max(1, self.config.extract_batch_size)
+        try:
+            for batch in url_batches:
+                new_urls = [url for url in dict.fromkeys(batch) if url not in seen]
+                seen.update(new_urls)
+                with self._lock:
+                    result.urls_received += len(new_urls)
+                for i in range(0, len(new_urls), chunk_size):
+                    if not _put(url_queue, new_urls[i:i + chunk_size], stop):
+                        return
+                if stop.is_set():
+                    return
+        except Exception as e:
+            self.logger.error(f"Crawl pipeline URL producer failed: {e}")
+            with self._lock:
+                result.error = e
+        finally:
+            # Run the producer's cleanup now (e.g. cancel queued searches) rather than at garbage collection
+            close = getattr(url_batches, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    self.logger.warning(f"Crawl pipeline URL producer failed to close: {e}")
+            for _ in range(workers):
+                _put(url_queue, _DONE, stop)
+
+    def _extract_worker(
+        self,
+        url_queue: queue.Queue,
+        article_queue: queue.Queue,
+        stop: threading.Event,
+        result: PipelineResult
+    ):
+        """Extract URL chunks until the producer is done."""
+        try:
+            while not stop.is_set():
+                try:
+                    urls = url_queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if urls is _DONE:
+                    return
+
+                try:
+                    articles = self.extract(urls)
+                except Exception as e:
+                    with self._lock:
+                        result.extract_errors += 1
+                    self.logger.warning(f"Crawl pipeline extraction failed for {len(urls)} URLs: {e}")
+                    continue
+
+                if articles and not _put(article_queue, articles, stop):
+                    return
+        finally:
+            _put(article_queue, _DONE, stop)
+
+    def _join_stages(
+        self,
+        threads: List[threading.Thread],
+        url_queue: queue.Queue,
+        article_queue: queue.Queue,
+        buffer: List[Dict[str, Any]]
+    ):
+        """Wait for stopped stages to exit, collecting the articles they still hand over.
+
+        Pending URL chunks are discarded and both queues are drained so no stage
+        stays blocked on a full queue. Threads still running after
+        ``shutdown_timeout`` (e.g. stuck in a slow download) are logged and left behind.
+        """
+        deadline = time.monotonic() + max(0.0, self.config.shutdown_timeout)
+        for thread in threads:
+            while thread.is_alive() and time.monotonic() < deadline:
+                _drain(url_queue)
+                buffer.extend(_drain(article_queue))
+                thread.join(timeout=min(_POLL_INTERVAL, max(0.0, deadline - time.monotonic())))
+        buffer.extend(_drain(article_queue))
+
+        alive = [thread.name for thread in threads if thread.is_alive()]
+        if alive:
+            self.logger.warning(
+                f"Crawl pipeline stages still running after {self.config.shutdown_timeout:.0f}s "
+                f"shutdown timeout: {', '.join(alive)}"
+            )
+
+    def _save_batch(self, batch: List[Dict[str, Any]], result: PipelineResult, start: float):
+        result.articles_extracted += len(batch)
+        result.extracted_articles.extend(batch)
+        saved = self.save(batch)
+        result.articles_saved += saved
+        result.save_batches += 1
+        if result.time_to_first_save is None:
+            result.time_to_first_save = time.monotonic() - start
+        self.logger.info(
+            f"Crawl pipeline saved batch {result.save_batches}: {saved}/{len(batch)} articles "
+            f"({result.articles_saved} total)"
+        )
+
+
+def _drain(source: queue.Queue) -> List[Dict[str, Any]]:
+    """Empty a queue without blocking, returning the article lists it held."""
+    articles: List[Dict[str, Any]] = []
+    while True:
+        try:
+            item = source.get_nowait()
+        except queue.Empty:
+            return articles
+        if item is not _DONE:
+            articles.extend(item)
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put into a bounded queue, giving up once the pipeline is stopping."""
+    while True:
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                return False
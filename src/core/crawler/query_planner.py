@@ -0,0 +1,129 @@
+"""Split a category's keywords into search queries Google can answer in full.
+
+A category with dozens of keywords used to become one long ``a OR b OR ...``
+query. Google News truncates long queries and returns at most about 100
+items per search, so most keywords of a large category never surfaced. The
+planner packs the keywords into shards that each stay within a query length
+and keyword budget; every shard carries the category's exclusions. The
+engine searches the shards concurrently under the shared search rate
+limiter and merges their results by article ID.
+
+Each shard's yield is recorded: a shard whose search returned as many items
+as it asked for is saturated, meaning Google probably had more to give and
+the shard should be split further (lower QUERY_SHARD_MAX_KEYWORDS).
+
+Example:
+    ```python
+    from src.core.crawler.query_planner import QueryPlanner
+
+    planner = QueryPlanner(max_query_length=256, max_keywords_per_shard=8)
+    for shard in planner.plan(category.keywords, category.exclude_keywords):
+        print(shard.query)
+    ```
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def build_query(keywords: List[str], exclude_keywords: Optional[List[str]] = None) -> str:
+    """Build a Google News query with OR logic for keywords and ``-`` exclusions."""
+    query = " OR ".join(keywords)
+    if exclude_keywords:
+        exclusions = " ".join(f'-{keyword}' for keyword in exclude_keywords)
+        query = f"{query} {exclusions}"
+    return query
+
+
+@dataclass
+class QueryShard:
+    """One search query covering part of a category's keywords."""
+    index: int
+    keywords: List[str]
+    exclude_keywords: List[str] = field(default_factory=list)
+
+    @property
+    def query(self) -> str:
+        return build_query(self.keywords, self.exclude_keywords)
+
+
+@dataclass
+class ShardYield:
+    """What one shard's search returned."""
+    shard: QueryShard
+    results: int = 0            # Items in the feed for this shard
+    max_results: int = 100
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def saturated(self) -> bool:
+        """The search hit its result cap, so some matching articles were likely cut off."""
+        return self.error is None and self.results >= self.max_results
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "shard": self.shard.index,
+            "keywords": len(self.shard.keywords),
+            "query_length": len(self.shard.query),
+            "results": self.results,
+            "saturated": self.saturated,
+            "elapsed": round(self.elapsed, 3),
+            "error": self.error,
+        }
+
+
+class QueryPlanner:
+    """Pack keywords into query shards within a length and keyword budget."""
+
+    def __init__(self, max_query_length: int = 256, max_keywords_per_shard: int = 8):
+        self.max_query_length = max_query_length
+        self.max_keywords_per_shard = max(1, max_keywords_per_shard)
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "QueryPlanner":
+        """Build a planner from application settings."""
+        return cls(
+            max_query_length=settings.QUERY_SHARD_MAX_LENGTH,
+            max_keywords_per_shard=settings.QUERY_SHARD_MAX_KEYWORDS,
+        )
+
+    def plan(self, keywords: List[str], exclude_keywords: Optional[List[str]] = None) -> List[QueryShard]:
+        """Split keywords into shards, keeping their order.
+
+        Duplicate keywords (ignoring case) are dropped. A single keyword
+        longer than the budget still gets a shard of its own.
+
+        Args:
+            keywords: Keywords to search for (OR logic)
+            exclude_keywords: Keywords excluded from every shard
+
+        Returns:
+            Shards covering every keyword exactly once
+        """
+        exclusions = list(exclude_keywords or [])
+        seen = set()
+        unique = []
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if keyword and keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                unique.append(keyword)
+
+        shards: List[QueryShard] = []
+        current: List[str] = []
+        for keyword in unique:
+            candidate = current + [keyword]
+            if current and (
+                len(candidate) > self.max_keywords_per_shard
+                or len(build_query(candidate, exclusions)) > self.max_query_length
+            ):
+                shards.append(QueryShard(len(shards), current, exclusions))
+                candidate = [keyword]
+            current = candidate
+        if current:
+            shards.append(QueryShard(len(shards), current, exclusions))
+        return shards
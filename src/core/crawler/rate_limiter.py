@@ -0,0 +1,367 @@
+"""Token-bucket rate limiting for Google News calls.
+
+Concurrent searches (parallel sliding-window days, query shards, ...) share
+one bucket per endpoint, so fanning work out over threads never raises the
+request rate Google sees above the configured budget.
+
+With DISTRIBUTED_RATE_LIMIT_ENABLED the buckets live in Redis and every
+worker process on every host draws from the same budget. Refill and take
+run atomically in a Lua script using the Redis server clock, so hosts with
+skewed clocks still agree. If Redis becomes unavailable a bucket falls back
+to a process-local one for REDIS_RETRY_INTERVAL seconds before trying Redis
+again. Every worker process then limits itself, so the local bucket gets its
+share of the budget (rate and burst divided by CELERY_WORKER_CONCURRENCY).
+
+Each endpoint has its own budget:
+
+- ``google_news_search``: RSS/gnews searches (GOOGLE_NEWS_SEARCH_RATE/BURST)
+- ``google_news_resolve``: Google News article URLs opened by the HTTP tier
+  or a browser tab (GOOGLE_NEWS_RESOLVE_RATE/BURST)
+
+Example:
+    ```python
+    from src.core.crawler.rate_limiter import get_search_rate_limiter
+
+    limiter = get_search_rate_limiter(settings)
+    if limiter.acquire(timeout=60):
+        results = gn.get_news(query)
+    ```
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+
+from src.shared.redis_client import (
+    REDIS_RETRY_INTERVAL, RedisFailover, get_redis_client, is_redis_available
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_ENDPOINT = "google_news_search"
+RESOLVE_ENDPOINT = "google_news_resolve"
+
+REDIS_KEY_PREFIX = "gns:ratelimit:"
+
+# Settings holding the (rate, burst) budget of each endpoint
+ENDPOINT_BUDGETS = {
+    SEARCH_ENDPOINT: ("GOOGLE_NEWS_SEARCH_RATE", "GOOGLE_NEWS_SEARCH_BURST"),
+    RESOLVE_ENDPOINT: ("GOOGLE_NEWS_RESOLVE_RATE", "GOOGLE_NEWS_RESOLVE_BURST"),
+}
+
+# Refill and take atomically; returns the seconds to wait as a string ("0" when taken)
+_TAKE_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local updated = tonumber(state[2])
+if tokens == nil or updated == nil then
+    tokens = capacity
+    updated = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return tostring(wait)
+"""
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Counters tracked by a rate limiter."""
+    acquired: int = 0
+    waited: int = 0
+    timeouts: int = 0
+    total_wait_time: float = 0.0
+    waiting: int = 0        # Callers of this process currently queued for tokens
+    max_waiting: int = 0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at a fixed rate.
+
+    Args:
+        rate: Tokens added per second
+        capacity: Maximum tokens held, i.e. the allowed burst
+        name: Name used in logs and metrics
+    """
+
+    def __init__(self, rate: float, capacity: int, name: str = "default"):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self.metrics = RateLimiterMetrics()
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Take tokens if available.
+
+        Returns:
+            0.0 if the tokens were taken, otherwise the seconds until they will be available
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available.
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if the tokens were taken, False if the timeout expired first
+        """
+        start = time.monotonic()
+        waited = False
+        try:
+            while True:
+                taken, wait = self._poll(tokens, timeout, start, waited)
+                if taken is not None:
+                    return taken
+                if not waited:
+                    waited = True
+                    self._enter_queue()
+                time.sleep(wait)
+        finally:
+            if waited:
+                self._leave_queue()
+
+    async def acquire_async(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Wait for tokens without blocking the event loop; see acquire()."""
+        start = time.monotonic()
+        waited = False
+        try:
+            while True:
+                taken, wait = self._poll(tokens, timeout, start, waited)
+                if taken is not None:
+                    return taken
+                if not waited:
+                    waited = True
+                    self._enter_queue()
+                await asyncio.sleep(wait)
+        finally:
+            if waited:
+                self._leave_queue()
+
+    def _poll(self, tokens: int, timeout: Optional[float], start: float, waited: bool) -> Tuple[Optional[bool], float]:
+        """One attempt of an acquire started at start.
+
+        Returns:
+            (True, 0) once the tokens are taken, (False, 0) when the timeout
+            would expire first, otherwise (None, seconds to wait before retrying)
+        """
+        wait = self.try_acquire(tokens)
+        if wait == 0.0:
+            with self._lock:
+                self.metrics.acquired += 1
+                if waited:
+                    self.metrics.waited += 1
+                    self.metrics.total_wait_time += time.monotonic() - start
+            return True, 0.0
+
+        if timeout is not None and time.monotonic() - start + wait > timeout:
+            with self._lock:
+                self.metrics.timeouts += 1
+            logger.warning(f"Rate limiter '{self.name}' timed out after {timeout}s")
+            return False, 0.0
+        return None, wait
+
+    def _enter_queue(self):
+        with self._lock:
+            self.metrics.waiting += 1
+            self.metrics.max_waiting = max(self.metrics.max_waiting, self.metrics.waiting)
+
+    def _leave_queue(self):
+        with self._lock:
+            self.metrics.waiting -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter metrics for monitoring."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "name": self.name,
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "tokens": self._tokens,
+                "acquired": self.metrics.acquired,
+                "waited": self.metrics.waited,
+                "timeouts": self.metrics.timeouts,
+                "avg_wait_time": (
+                    self.metrics.total_wait_time / self.metrics.waited if self.metrics.waited else 0.0
+                ),
+                "waiting": self.metrics.waiting,
+                "max_waiting": self.metrics.max_waiting,
+                "backend": "memory",
+            }
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token bucket shared by every process through Redis.
+
+    Falls back to a process-local bucket holding ``1 / local_share`` of the
+    budget while Redis is failing, and tries Redis again after the retry
+    interval. The number of callers queued for tokens across all processes is
+    kept in a Redis counter for monitoring.
+
+    Args:
+        client: Redis client
+        rate: Tokens added per second, for all processes together
+        capacity: Maximum tokens held, i.e. the allowed burst
+        name: Endpoint name, used in the Redis key
+        local_share: Processes expected to share the budget while on the local bucket
+        redis_retry_interval: Seconds to use the local bucket after a Redis error
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis],
+        rate: float,
+        capacity: int,
+        name: str = "default",
+        local_share: int = 1,
+        redis_retry_interval: float = REDIS_RETRY_INTERVAL
+    ):
+        super().__init__(rate, capacity, name)
+        self.client = client
+        self.key = f"{REDIS_KEY_PREFIX}{name}"
+        self.queue_key = f"{self.key}:waiting"
+        # Idle buckets are full again after capacity / rate seconds and can expire
+        self._ttl = int(math.ceil(capacity / rate)) + 60
+        self._script = client.register_script(_TAKE_SCRIPT) if client is not None else None
+        local_share = max(1, local_share)
+        self.fallback = TokenBucket(rate / local_share, max(1, capacity // local_share), name)
+        self.failover = RedisFailover(
+            f"Rate limiter '{name}'", fallback="a per-process bucket",
+            retry_interval=redis_retry_interval, logger=logger
+        )
+        # Whether the calling thread counts in the Redis wait queue
+        self._queued = threading.local()
+
+    def _redis_usable(self) -> bool:
+        return self.client is not None and self.failover.up
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._redis_usable() else "memory"
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        if self._redis_usable():
+            try:
+                return float(self._script(keys=[self.key], args=[self.rate, self.capacity, tokens, self._ttl]))
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        return self.fallback.try_acquire(tokens)
+
+    def _enter_queue(self):
+        super()._enter_queue()
+        if self._redis_usable():
+            try:
+                pipe = self.client.pipeline()
+                pipe.incr(self.queue_key)
+                pipe.expire(self.queue_key, self._ttl)
+                pipe.execute()
+                self._queued.redis = True
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+
+    def _leave_queue(self):
+        super()._leave_queue()
+        # Undo our increment even if the bucket fell back while waiting
+        if getattr(self._queued, "redis", False):
+            self._queued.redis = False
+            try:
+                self.client.decr(self.queue_key)
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter metrics, including the queue across all processes."""
+        metrics = super().get_metrics()
+        metrics["backend"] = self.backend
+        if self._redis_usable():
+            try:
+                tokens, waiting = self.client.hget(self.key, "tokens"), self.client.get(self.queue_key)
+                metrics["shared_tokens"] = float(tokens) if tokens is not None else float(self.capacity)
+                metrics["shared_waiting"] = max(0, int(waiting or 0))
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        else:
+            metrics["tokens"] = self.fallback.get_metrics()["tokens"]
+        metrics["redis_errors"] = self.failover.errors
+        return metrics
+
+
+# Global rate limiter instances by endpoint (shared by all threads of a worker process)
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(settings: Any, endpoint: str) -> TokenBucket:
+    """Get the rate limiter for a Google News endpoint.
+
+    Args:
+        settings: Application settings
+        endpoint: One of ENDPOINT_BUDGETS
+
+    Returns:
+        A Redis-backed bucket shared by all workers when DISTRIBUTED_RATE_LIMIT_ENABLED
+        (starting on its local fallback if Redis is unreachable), otherwise a per-process bucket
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(endpoint)
+        if limiter is None:
+            rate_setting, burst_setting = ENDPOINT_BUDGETS[endpoint]
+            rate, capacity = getattr(settings, rate_setting), getattr(settings, burst_setting)
+            if settings.DISTRIBUTED_RATE_LIMIT_ENABLED:
+                client = get_redis_client(settings)
+                limiter = RedisTokenBucket(
+                    client, rate=rate, capacity=capacity, name=endpoint,
+                    local_share=settings.CELERY_WORKER_CONCURRENCY
+                )
+                if not is_redis_available(client):
+                    limiter.failover.mark_down()
+            else:
+                limiter = TokenBucket(rate=rate, capacity=capacity, name=endpoint)
+            _rate_limiters[endpoint] = limiter
+        return limiter
+
+
+def get_search_rate_limiter(settings: Any) -> TokenBucket:
+    """Get the global rate limiter for Google News search calls."""
+    return get_rate_limiter(settings, SEARCH_ENDPOINT)
+
+
+def get_resolve_rate_limiter(settings: Any) -> TokenBucket:
+    """Get the global rate limiter for opening Google News article URLs."""
+    return get_rate_limiter(settings, RESOLVE_ENDPOINT)
@@ -0,0 +1,194 @@
+"""Event-driven resolution of Google News redirects in browser tabs.
+
+Google News article pages forward the browser to the publisher with a
+JavaScript redirect. Instead of polling ``page.url`` on every tab, each tab
+listens for Playwright's ``request`` and ``framenavigated`` events and
+completes the moment its main frame heads to a non-Google URL. Tabs run
+concurrently on the browser pool's event loop, so a batch takes about as long
+as its slowest redirect and one stuck tab never delays the others.
+
+With ``intercept`` enabled, each tab also routes its requests through
+``page.route``. The first top-level navigation leaving Google is recorded and
+aborted, so no publisher HTML, scripts or ads are ever loaded by the resolver.
+
+Example:
+    ```python
+    from src.core.crawler.browser_pool import get_browser_pool
+    from src.core.crawler.redirect_resolver import RedirectResolver
+
+    resolver = RedirectResolver(get_browser_pool(settings))
+    for outcome in resolver.resolve_batch(google_news_urls, max_wait=10.0):
+        print(outcome.google_url, outcome.resolved_url, outcome.elapsed)
+    ```
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Union
+
+from src.core.crawler.browser_pool import BrowserPool
+from src.core.crawler.url_decoder import is_publisher_url
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TabResolution:
+    """Outcome of resolving one Google News URL in a browser tab."""
+    google_url: str
+    resolved_url: Optional[str] = None
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+
+    @property
+    def resolved(self) -> bool:
+        return self.resolved_url is not None
+
+
+class RedirectResolver:
+    """Resolve batches of Google News URLs with one tab per URL."""
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        logger: Optional[logging.Logger] = None,
+        navigation_timeout: float = 30.0,
+        tab_stagger: float = 0.1,
+        intercept: bool = True
+    ):
+        self.pool = pool
+        self.logger = logger or logging.getLogger(__name__)
+        self.navigation_timeout = navigation_timeout
+        self.tab_stagger = tab_stagger
+        self.intercept = intercept
+
+    def resolve_batch(
+        self,
+        google_urls: List[str],
+        max_wait: Union[float, Sequence[float]]
+    ) -> List[TabResolution]:
+        """Resolve a batch from sync code on the browser pool's event loop.
+
+        Args:
+            google_urls: Google News URLs, one tab each
+            max_wait: Seconds each tab may take to redirect, or one deadline per URL
+
+        Returns:
+            One TabResolution per URL, in input order
+        """
+        if not google_urls:
+            return []
+        deadlines = _deadlines(google_urls, max_wait)
+        # Leave room for staggered tab openings and the lease cleanup
+        timeout = max(deadlines) + self.navigation_timeout + len(google_urls) * self.tab_stagger + 10
+        return self.pool.run(self.resolve_batch_async(google_urls, deadlines), timeout=timeout)
+
+    async def resolve_batch_async(
+        self,
+        google_urls: List[str],
+        max_wait: Union[float, Sequence[float]]
+    ) -> List[TabResolution]:
+        """Resolve a batch concurrently in one leased browser context."""
+        deadlines = _deadlines(google_urls, max_wait)
+        async with self.pool.acquire() as context:
+            return list(await asyncio.gather(*(
+                self._resolve_tab(context, google_url, index, deadline)
+                for index, (google_url, deadline) in enumerate(zip(google_urls, deadlines))
+            )))
+
+    async def _resolve_tab(self, context: Any, google_url: str, index: int, max_wait: float) -> TabResolution:
+        """Open one tab and wait for its first navigation away from Google."""
+        # Spread tab openings slightly so Google does not see a burst
+        if index and self.tab_stagger:
+            await asyncio.sleep(index * self.tab_stagger)
+
+        start = time.monotonic()
+        page = None
+        navigation = None
+        redirect: asyncio.Future = asyncio.get_running_loop().create_future()
+
+        def _found(url: str):
+            if not redirect.done() and is_publisher_url(url):
+                redirect.set_result(url)
+
+        def _on_request(request):
+            # The publisher request is seen before its response arrives
+            try:
+                if request.is_navigation_request() and request.frame == page.main_frame:
+                    _found(request.url)
+            except Exception:
+                pass
+
+        def _on_frame_navigated(frame):
+            if frame == page.main_frame:
+                _found(frame.url)
+
+        async def _intercept(route, request):
+            # Record the publisher URL and stop the navigation before any byte loads
+            if request.is_navigation_request() and request.frame == page.main_frame \
+                    and is_publisher_url(request.url):
+                _found(request.url)
+                await route.abort()
+            else:
+                # Defer to the context routes that block images, fonts and CSS
+                await route.fallback()
+
+        try:
+            page = await context.new_page()
+            page.on("request", _on_request)
+            page.on("framenavigated", _on_frame_navigated)
+            if self.intercept:
+                await page.route("**/*", _intercept)
+
+            navigation = asyncio.ensure_future(
+                page.goto(google_url, wait_until="commit", timeout=self.navigation_timeout * 1000)
+            )
+            done, _ = await asyncio.wait(
+                {redirect, navigation}, timeout=max_wait, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if not redirect.done() and navigation in done:
+                if navigation.exception() is not None:
+                    return TabResolution(
+                        google_url,
+                        elapsed=time.monotonic() - start,
+                        error=f"navigation failed: {navigation.exception()}"
+                    )
+                # Google's page has committed; its JavaScript redirect follows
+                remaining = max_wait - (time.monotonic() - start)
+                if remaining > 0:
+                    await asyncio.wait({redirect}, timeout=remaining)
+
+            elapsed = time.monotonic() - start
+            if redirect.done():
+                return TabResolution(google_url, resolved_url=redirect.result(), elapsed=elapsed)
+            return TabResolution(
+                google_url, elapsed=elapsed, error=f"no redirect within {max_wait:.1f}s", timed_out=True
+            )
+
+        except Exception as e:
+            return TabResolution(google_url, elapsed=time.monotonic() - start, error=str(e))
+
+        finally:
+            if navigation is not None and not navigation.done():
+                navigation.cancel()
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            if navigation is not None:
+                # Retrieve the outcome so an aborted goto is not reported as unhandled
+                await asyncio.gather(navigation, return_exceptions=True)
+
+
+def _deadlines(google_urls: List[str], max_wait: Union[float, Sequence[float]]) -> List[float]:
+    """Expand a shared deadline into one deadline per URL."""
+    if isinstance(max_wait, (int, float)):
+        return [float(max_wait)] * len(google_urls)
+    if len(max_wait) != len(google_urls):
+        raise ValueError("One redirect deadline is needed per URL")
+    return list(max_wait)
@@ -0,0 +1,307 @@
+"""Per-publisher redirect timing model for the browser resolver.
+
+Google News redirects to some publishers in well under a second and to
+others only after several seconds of consent pages and scripts. A single
+global wait either gives up on slow publishers or holds every tab open for
+the slowest one. This model keeps a sliding window of redirect times per
+publisher domain and turns it into a per-tab deadline:
+
+    deadline = clamp(p95(domain) * margin, min_wait, max_wait)
+
+Domains with too few samples use the global window, and the configured
+default until that has enough samples too. A tab that misses a deadline
+tighter than max_wait is retried once with max_wait, so tight deadlines cut
+tail latency without losing resolutions.
+
+Samples live in Redis so every worker and every task learns from the same
+history; the model falls back to process memory when Redis is unavailable
+and tries Redis again after REDIS_RETRY_INTERVAL.
+
+Example:
+    ```python
+    from src.core.crawler.redirect_timing import get_redirect_timing_model
+
+    model = get_redirect_timing_model(settings)
+    deadlines = model.deadlines(["vnexpress.net", None])
+    model.record([("vnexpress.net", 1.2, True), (None, deadlines[1], False)])
+    print(model.get_stats())
+    ```
+"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import redis
+
+from src.shared.redis_client import REDIS_RETRY_INTERVAL, RedisFailover, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-domain holding samples from every publisher
+GLOBAL_DOMAIN = "*"
+
+REDIS_KEY_PREFIX = "gns:timing:"
+REDIS_DOMAINS_KEY = "gns:timing:domains"
+
+# (domain, elapsed seconds, resolved) for one tab
+TimingSample = Tuple[Optional[str], float, bool]
+
+
+def publisher_domain(url: Optional[str]) -> Optional[str]:
+    """Normalize a publisher URL or host to the domain the model is keyed on."""
+    if not url:
+        return None
+    host = urlparse(url if "//" in url else f"//{url}").netloc.lower().split(":")[0]
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def percentile(samples: Sequence[float], q: float) -> Optional[float]:
+    """Linear-interpolated percentile of samples, q in [0, 100]."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class DomainTiming:
+    """Redirect history of one publisher domain."""
+    domain: str
+    samples: List[float] = field(default_factory=list)
+    resolved: int = 0
+    timeouts: int = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        return percentile(self.samples, q)
+
+
+class RedisTimingStore:
+    """Timing windows stored as capped Redis lists with outcome counters."""
+
+    name = "redis"
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+
+    def load(self, domains: List[str]) -> Dict[str, DomainTiming]:
+        pipe = self.client.pipeline(transaction=False)
+        for domain in domains:
+            pipe.lrange(f"{REDIS_KEY_PREFIX}{domain}:samples", 0, -1)
+            pipe.hgetall(f"{REDIS_KEY_PREFIX}{domain}:outcomes")
+        replies = pipe.execute()
+
+        timings = {}
+        for index, domain in enumerate(domains):
+            samples, outcomes = replies[2 * index], replies[2 * index + 1] or {}
+            timings[domain] = DomainTiming(
+                domain=domain,
+                samples=[float(value) for value in samples or []],
+                resolved=int(outcomes.get("resolved", 0)),
+                timeouts=int(outcomes.get("timeouts", 0)),
+            )
+        return timings
+
+    def record(self, timings: Dict[str, DomainTiming], window: int, ttl: int):
+        pipe = self.client.pipeline(transaction=False)
+        for domain, timing in timings.items():
+            samples_key = f"{REDIS_KEY_PREFIX}{domain}:samples"
+            outcomes_key = f"{REDIS_KEY_PREFIX}{domain}:outcomes"
+            if timing.samples:
+                pipe.lpush(samples_key, *(f"{value:.3f}" for value in timing.samples))
+                pipe.ltrim(samples_key, 0, window - 1)
+                pipe.expire(samples_key, ttl)
+            if timing.resolved:
+                pipe.hincrby(outcomes_key, "resolved", timing.resolved)
+            if timing.timeouts:
+                pipe.hincrby(outcomes_key, "timeouts", timing.timeouts)
+            pipe.expire(outcomes_key, ttl)
+            pipe.sadd(REDIS_DOMAINS_KEY, domain)
+        pipe.execute()
+
+    def domains(self) -> List[str]:
+        return sorted(self.client.smembers(REDIS_DOMAINS_KEY))
+
+
+class MemoryTimingStore:
+    """Process-local fallback used when Redis is unreachable."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._samples: Dict[str, Deque[float]] = {}
+        self._outcomes: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, domains: List[str]) -> Dict[str, DomainTiming]:
+        with self._lock:
+            return {
+                domain: DomainTiming(
+                    domain=domain,
+                    # Newest first, matching the Redis list order
+                    samples=list(reversed(self._samples.get(domain, ()))),
+                    resolved=self._outcomes.get(domain, {}).get("resolved", 0),
+                    timeouts=self._outcomes.get(domain, {}).get("timeouts", 0),
+                )
+                for domain in domains
+            }
+
+    def record(self, timings: Dict[str, DomainTiming], window: int, ttl: int):
+        with self._lock:
+            for domain, timing in timings.items():
+                samples = self._samples.setdefault(domain, deque(maxlen=window))
+                samples.extend(timing.samples)
+                outcomes = self._outcomes.setdefault(domain, {"resolved": 0, "timeouts": 0})
+                outcomes["resolved"] += timing.resolved
+                outcomes["timeouts"] += timing.timeouts
+
+    def domains(self) -> List[str]:
+        with self._lock:
+            return sorted(set(self._samples) | set(self._outcomes))
+
+
+class RedirectTimingModel:
+    """Learns redirect latency per publisher domain and sets per-tab deadlines."""
+
+    def __init__(
+        self,
+        primary: Optional[RedisTimingStore],
+        fallback: MemoryTimingStore,
+        default_wait: float = 10.0,
+        min_wait: float = 3.0,
+        max_wait: float = 15.0,
+        margin: float = 1.5,
+        min_samples: int = 5,
+        window: int = 200,
+        ttl: int = 604800,
+        logger: Optional[logging.Logger] = None,
+        redis_retry_interval: float = REDIS_RETRY_INTERVAL
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.default_wait = default_wait
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self.margin = margin
+        self.min_samples = min_samples
+        self.window = window
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger(__name__)
+        self.failover = RedisFailover("Redirect timing", retry_interval=redis_retry_interval, logger=self.logger)
+
+    @property
+    def backend(self) -> str:
+        return (self.primary if self._primary_usable() else self.fallback).name
+
+    @property
+    def errors(self) -> int:
+        return self.failover.errors
+
+    def _primary_usable(self) -> bool:
+        return self.primary is not None and self.failover.up
+
+    def _call(self, operation: str, *args) -> Any:
+        """Run a store operation on Redis, using memory while Redis is failing."""
+        if self._primary_usable():
+            try:
+                return getattr(self.primary, operation)(*args)
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        return getattr(self.fallback, operation)(*args)
+
+    def _deadline(self, timing: Optional[DomainTiming], global_timing: DomainTiming) -> float:
+        for candidate in (timing, global_timing):
+            if candidate is not None and len(candidate.samples) >= self.min_samples:
+                wait = candidate.percentile(95) * self.margin
+                return min(self.max_wait, max(self.min_wait, wait))
+        return self.default_wait
+
+    def deadlines(self, domains: Sequence[Optional[str]]) -> List[float]:
+        """Get the redirect deadline in seconds for each tab's expected publisher domain."""
+        known = [domain for domain in dict.fromkeys(domains) if domain]
+        timings = self._call("load", [GLOBAL_DOMAIN, *known])
+        global_timing = timings[GLOBAL_DOMAIN]
+        return [self._deadline(timings.get(domain) if domain else None, global_timing) for domain in domains]
+
+    def should_retry(self, deadline: float) -> bool:
+        """Whether a tab that missed this deadline deserves a second, longer attempt."""
+        return deadline < self.max_wait
+
+    def record(self, samples: Iterable[TimingSample]):
+        """Record tab outcomes.
+
+        Resolved tabs add their redirect time to the domain's window; tabs
+        that missed their deadline only count as timeouts, since their real
+        redirect time is unknown.
+        """
+        timings: Dict[str, DomainTiming] = {}
+        for domain, elapsed, resolved in samples:
+            for key in filter(None, (domain, GLOBAL_DOMAIN)):
+                timing = timings.setdefault(key, DomainTiming(domain=key))
+                if resolved:
+                    timing.samples.append(elapsed)
+                    timing.resolved += 1
+                else:
+                    timing.timeouts += 1
+        if timings:
+            self._call("record", timings, self.window, self.ttl)
+
+    def get_stats(self, domains: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Get percentile metrics per domain for monitoring."""
+        domains = list(domains) if domains is not None else self._call("domains")
+        timings = self._call("load", list(dict.fromkeys([GLOBAL_DOMAIN, *domains])))
+        global_timing = timings[GLOBAL_DOMAIN]
+
+        stats = {}
+        for domain, timing in timings.items():
+            attempts = timing.resolved + timing.timeouts
+            stats[domain] = {
+                "samples": len(timing.samples),
+                "p50": timing.percentile(50),
+                "p90": timing.percentile(90),
+                "p95": timing.percentile(95),
+                "p99": timing.percentile(99),
+                "resolved": timing.resolved,
+                "timeouts": timing.timeouts,
+                "timeout_rate": timing.timeouts / attempts if attempts else 0.0,
+                "deadline": self._deadline(timing, global_timing),
+            }
+        return {"backend": self.backend, "errors": self.errors, "domains": stats}
+
+
+# Global redirect timing model instance
+_redirect_timing_model: Optional[RedirectTimingModel] = None
+_redirect_timing_model_lock = threading.Lock()
+
+
+def get_redirect_timing_model(settings: Any, logger: Optional[logging.Logger] = None) -> RedirectTimingModel:
+    """Get the global redirect timing model instance."""
+    global _redirect_timing_model
+
+    with _redirect_timing_model_lock:
+        if _redirect_timing_model is None:
+            client = get_redis_client(settings)
+            _redirect_timing_model = RedirectTimingModel(
+                primary=RedisTimingStore(client),
+                fallback=MemoryTimingStore(),
+                default_wait=settings.REDIRECT_TIMING_DEFAULT_WAIT,
+                min_wait=settings.REDIRECT_TIMING_MIN_WAIT,
+                max_wait=settings.REDIRECT_TIMING_MAX_WAIT,
+                margin=settings.REDIRECT_TIMING_MARGIN,
+                min_samples=settings.REDIRECT_TIMING_MIN_SAMPLES,
+                window=settings.REDIRECT_TIMING_WINDOW,
+                logger=logger
+            )
+            # Start on memory if Redis is down; it is tried again after the retry interval
+            if not is_redis_available(client):
+                _redirect_timing_model.failover.mark_down()
+
+        return _redirect_timing_model
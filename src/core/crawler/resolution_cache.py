@@ -0,0 +1,281 @@
+"""Shared cache of resolved Google News URLs.
+
+The same Google News article IDs come back across scheduled runs of a
+category and across overlapping categories. This cache maps an article ID to
+the publisher URL it resolved to, so repeat IDs never reach the browser.
+
+Entries live in Redis so every worker shares them. When Redis is unavailable
+the cache falls back to a local SQLite file and tries Redis again after
+the shared REDIS_RETRY_INTERVAL; IDs missing from Redis are also looked up in
+SQLite, which holds what was cached during an outage. IDs that failed to
+resolve are cached too (negative caching), with a shorter TTL so they are
+retried later.
+
+Example:
+    ```python
+    from src.core.crawler.resolution_cache import get_resolution_cache
+
+    cache = get_resolution_cache(settings)
+    lookup = cache.get_many(["CBMi...", "CAIi..."])
+    cache.set_resolved({"CAIi...": "https://vnexpress.net/..."})
+    cache.set_failed(["CBMi..."])
+    ```
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import redis
+
+from src.shared.redis_client import REDIS_RETRY_INTERVAL, RedisFailover, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+# Stored value marking an ID that failed to resolve
+NEGATIVE_ENTRY = ""
+
+REDIS_KEY_PREFIX = "gns:resolved:"
+REDIS_STATS_KEY = "gns:resolved:stats"
+
+
+@dataclass
+class ResolutionCacheStats:
+    """Hit/miss counters for the resolution cache."""
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    negative_writes: int = 0
+    errors: int = 0                     # SQLite errors; Redis errors are counted by the failover
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+class RedisResolutionStore:
+    """Resolution entries stored as Redis strings with per-key expiry."""
+
+    name = "redis"
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+
+    def get_many(self, article_ids: List[str]) -> Dict[str, Optional[str]]:
+        values = self.client.mget([REDIS_KEY_PREFIX + article_id for article_id in article_ids])
+        return dict(zip(article_ids, values))
+
+    def set_many(self, entries: Dict[str, str], ttl: int):
+        pipe = self.client.pipeline(transaction=False)
+        for article_id, value in entries.items():
+            pipe.set(REDIS_KEY_PREFIX + article_id, value, ex=ttl)
+        pipe.execute()
+
+    def record_stats(self, counters: Dict[str, int]):
+        pipe = self.client.pipeline(transaction=False)
+        for name, value in counters.items():
+            if value:
+                pipe.hincrby(REDIS_STATS_KEY, name, value)
+        pipe.execute()
+
+
+class SqliteResolutionStore:
+    """Local SQLite fallback used when Redis is unreachable."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS resolved_urls ("
+                "article_id TEXT PRIMARY KEY, url TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation keeps the store safe across threads and forks
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get_many(self, article_ids: List[str]) -> Dict[str, Optional[str]]:
+        found: Dict[str, Optional[str]] = {}
+        now = time.time()
+        with self._connect() as conn:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(article_ids), 500):
+                chunk = article_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT article_id, url FROM resolved_urls "
+                    f"WHERE article_id IN ({placeholders}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+                found.update(dict(rows))
+        return {article_id: found.get(article_id) for article_id in article_ids}
+
+    def set_many(self, entries: Dict[str, str], ttl: int):
+        expires_at = time.time() + ttl
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO resolved_urls (article_id, url, expires_at) VALUES (?, ?, ?)",
+                [(article_id, value, expires_at) for article_id, value in entries.items()]
+            )
+            conn.execute("DELETE FROM resolved_urls WHERE expires_at <= ?", (time.time(),))
+
+    def record_stats(self, counters: Dict[str, int]):
+        # Counters are only shared through Redis
+        pass
+
+
+class ResolutionCache:
+    """Article ID -> publisher URL cache with negative caching and counters."""
+
+    def __init__(
+        self,
+        primary: Optional[RedisResolutionStore],
+        fallback: Optional[SqliteResolutionStore],
+        ttl: int = 604800,
+        negative_ttl: int = 1800,
+        logger: Optional[logging.Logger] = None,
+        redis_retry_interval: float = REDIS_RETRY_INTERVAL
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.logger = logger or logging.getLogger(__name__)
+        self.failover = RedisFailover(
+            "Resolution cache", fallback="SQLite", retry_interval=redis_retry_interval, logger=self.logger
+        )
+        self.stats = ResolutionCacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> Optional[str]:
+        store = self.primary if self._primary_usable() else self.fallback
+        return store.name if store else None
+
+    def _primary_usable(self) -> bool:
+        return self.primary is not None and self.failover.up
+
+    def _call_fallback(self, operation: str, *args) -> Any:
+        if self.fallback is not None:
+            try:
+                return getattr(self.fallback, operation)(*args)
+            except sqlite3.Error as e:
+                with self._lock:
+                    self.stats.errors += 1
+                self.logger.warning(f"Resolution cache SQLite error: {e}")
+        return None
+
+    def _call(self, operation: str, *args) -> Any:
+        """Run a store operation on Redis, using SQLite while Redis is failing."""
+        if self._primary_usable():
+            try:
+                return getattr(self.primary, operation)(*args)
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        return self._call_fallback(operation, *args)
+
+    def get_many(self, article_ids: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Look up article IDs.
+
+        Returns:
+            Mapping of article ID to publisher URL for hits, to NEGATIVE_ENTRY
+            for IDs known to fail, and to None for misses.
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        if not article_ids:
+            return {}
+
+        served_by_redis = self._primary_usable()
+        results = self._call("get_many", article_ids) or {}
+        missing = [article_id for article_id in article_ids if results.get(article_id) is None]
+        if missing and served_by_redis and self._primary_usable():
+            # IDs cached while Redis was down only exist in SQLite
+            found = self._call_fallback("get_many", missing) or {}
+            results = {**results, **{article_id: value for article_id, value in found.items() if value is not None}}
+        lookup = {article_id: results.get(article_id) for article_id in article_ids}
+
+        hits = sum(1 for value in lookup.values() if value)
+        negative_hits = sum(1 for value in lookup.values() if value == NEGATIVE_ENTRY)
+        misses = len(lookup) - hits - negative_hits
+        with self._lock:
+            self.stats.hits += hits
+            self.stats.negative_hits += negative_hits
+            self.stats.misses += misses
+        self._call("record_stats", {"hits": hits, "negative_hits": negative_hits, "misses": misses})
+
+        return lookup
+
+    def set_resolved(self, resolved: Dict[str, str]):
+        """Cache successfully resolved article IDs."""
+        entries = {article_id: url for article_id, url in resolved.items() if article_id and url}
+        if not entries:
+            return
+        self._call("set_many", entries, self.ttl)
+        with self._lock:
+            self.stats.writes += len(entries)
+
+    def set_failed(self, article_ids: Iterable[str]):
+        """Negatively cache article IDs that could not be resolved."""
+        entries = {article_id: NEGATIVE_ENTRY for article_id in article_ids if article_id}
+        if not entries:
+            return
+        self._call("set_many", entries, self.negative_ttl)
+        with self._lock:
+            self.stats.negative_writes += len(entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for monitoring."""
+        return {
+            "backend": self.backend,
+            "hits": self.stats.hits,
+            "negative_hits": self.stats.negative_hits,
+            "misses": self.stats.misses,
+            "writes": self.stats.writes,
+            "negative_writes": self.stats.negative_writes,
+            "errors": self.stats.errors + self.failover.errors,
+            "hit_rate": self.stats.hit_rate,
+        }
+
+
+# Global resolution cache instance
+_resolution_cache: Optional[ResolutionCache] = None
+_resolution_cache_lock = threading.Lock()
+
+
+def get_resolution_cache(settings: Any, logger: Optional[logging.Logger] = None) -> ResolutionCache:
+    """Get the global resolution cache instance."""
+    global _resolution_cache
+
+    with _resolution_cache_lock:
+        if _resolution_cache is None:
+            client = get_redis_client(settings)
+
+            fallback = None
+            try:
+                fallback = SqliteResolutionStore(settings.RESOLUTION_CACHE_SQLITE_PATH)
+            except (OSError, sqlite3.Error) as e:
+                (logger or logging.getLogger(__name__)).warning(f"SQLite resolution cache unavailable: {e}")
+
+            _resolution_cache = ResolutionCache(
+                primary=RedisResolutionStore(client),
+                fallback=fallback,
+                ttl=settings.RESOLUTION_CACHE_TTL,
+                negative_ttl=settings.RESOLUTION_CACHE_NEGATIVE_TTL,
+                logger=logger
+            )
+            # Start on SQLite if Redis is down; it is tried again after the retry interval
+            if not is_redis_available(client):
+                _resolution_cache.failover.mark_down()
+
+        return _resolution_cache
@@ -0,0 +1,155 @@
+"""Concurrent resolution of Google News URL batches across pooled browsers.
+
+A single browser resolving one batch at a time leaves most cores idle while
+tabs wait on redirects. The executor splits the URLs awaiting resolution into
+batches of ``tabs_per_browser`` and runs up to ``browsers`` batches at once;
+each batch leases its own browser process from the worker's browser pool, so
+batches no longer queue behind one another. Results are yielded per batch as
+soon as it completes.
+
+The number of browsers is bounded by BROWSER_POOL_SIZE and by what this
+worker process can afford: its share of the CPU cores and of the available
+memory, given every Celery worker process runs its own pool.
+
+Example:
+    ```python
+    from src.core.crawler.resolution_executor import ResolutionExecutor, ResolutionExecutorConfig
+
+    executor = ResolutionExecutor(
+        resolve_batch=engine._resolve_batch_with_single_browser,
+        config=ResolutionExecutorConfig.from_settings(settings),
+    )
+    for batch_results in executor.iter_resolve(google_news_urls):
+        print(batch_results)
+    ```
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+def plan_browser_count(
+    requested: int,
+    cpu_count: Optional[int],
+    available_mb: Optional[float],
+    worker_processes: int = 1,
+    cpus_per_browser: float = 1.0,
+    memory_per_browser_mb: float = 1024,
+    memory_reserve_mb: float = 1024
+) -> int:
+    """Number of browsers one worker process may run concurrently.
+
+    Args:
+        requested: Upper bound from configuration
+        cpu_count: Cores on the machine, or None if unknown
+        available_mb: Available memory in MB, or None if unknown
+        worker_processes: Worker processes sharing the machine, each with its own browsers
+        cpus_per_browser: Cores budgeted for one busy browser
+        memory_per_browser_mb: Memory budgeted for one browser
+        memory_reserve_mb: Memory left for everything that is not a browser
+
+    Returns:
+        Browser count, at least 1
+    """
+    limits = [requested]
+    processes = max(1, worker_processes)
+    if cpu_count:
+        limits.append(int(cpu_count / processes / cpus_per_browser))
+    if available_mb is not None:
+        limits.append(int((available_mb - memory_reserve_mb) / processes / memory_per_browser_mb))
+    return max(1, min(limits))
+
+
+@dataclass
+class ResolutionExecutorConfig:
+    """Configuration for concurrent batch resolution."""
+    browsers: int = 1               # Batches resolved at once, one browser each
+    tabs_per_browser: int = 10      # URLs per batch
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ResolutionExecutorConfig":
+        """Build executor configuration from settings and current machine resources."""
+        available_mb = psutil.virtual_memory().available / (1024 * 1024) if psutil else None
+        return cls(
+            browsers=plan_browser_count(
+                requested=settings.BROWSER_POOL_SIZE,
+                cpu_count=os.cpu_count(),
+                available_mb=available_mb,
+                worker_processes=settings.CELERY_WORKER_CONCURRENCY,
+                cpus_per_browser=settings.RESOLUTION_CPUS_PER_BROWSER,
+                memory_per_browser_mb=settings.BROWSER_POOL_MAX_MEMORY_MB,
+                memory_reserve_mb=settings.RESOLUTION_MEMORY_RESERVE_MB,
+            ),
+            tabs_per_browser=settings.MAX_TABS_PER_BROWSER,
+        )
+
+
+class ResolutionExecutor:
+    """Resolve URL batches concurrently, one browser per batch."""
+
+    def __init__(
+        self,
+        resolve_batch: Callable[[List[str]], Dict[str, Optional[str]]],
+        config: Optional[ResolutionExecutorConfig] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.resolve_batch = resolve_batch
+        self.config = config or ResolutionExecutorConfig()
+        self.logger = logger or logging.getLogger(__name__)
+
+    def iter_resolve(
+        self,
+        google_urls: List[str],
+        stop: Optional[threading.Event] = None
+    ) -> Iterator[Dict[str, Optional[str]]]:
+        """Resolve URLs in concurrent batches, yielding each batch's results as it completes.
+
+        A failed batch is logged and skipped; the other batches keep running.
+        Once ``stop`` is set, or the generator is closed, batches not started
+        yet are cancelled and running ones are left to finish on their own.
+
+        Yields:
+            Mapping of each Google News URL in a batch to its resolved URL, or None
+        """
+        size = max(1, self.config.tabs_per_browser)
+        batches = [google_urls[i:i + size] for i in range(0, len(google_urls), size)]
+        if not batches:
+            return
+
+        workers = max(1, min(self.config.browsers, len(batches)))
+        self.logger.info(
+            f"Resolving {len(google_urls)} URLs in {len(batches)} batches "
+            f"across {workers} browsers ({size} tabs each)"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resolution")
+        try:
+            futures = {executor.submit(self.resolve_batch, batch): index for index, batch in enumerate(batches)}
+            for future in as_completed(futures):
+                if stop is not None and stop.is_set():
+                    self.logger.info("URL resolution stopped, cancelling the remaining batches")
+                    return
+                index = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    self.logger.error(f"Batch URL resolution failed for batch {index + 1}: {e}")
+                    continue
+                self.logger.info(
+                    f"Batch {index + 1}/{len(batches)} done: "
+                    f"{sum(1 for url in results.values() if url)}/{len(results)} resolved"
+                )
+                yield results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
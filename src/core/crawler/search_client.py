@@ -0,0 +1,355 @@
+"""Async client for the Google News RSS search endpoint.
+
+``gnews.GNews`` opens a fresh connection for every search and only runs one
+search at a time per caller. This client talks to the RSS endpoint directly:
+
+- one keep-alive ``httpx.AsyncClient`` per worker process, with gzip
+- a per-host concurrency limit, so many concurrent searches share a few
+  connections instead of opening a burst of them
+- conditional GETs: ETag/Last-Modified validators are sent with repeat
+  queries and a ``304 Not Modified`` reuses the previously parsed items
+- items are parsed straight from the feed into the same dicts gnews returns
+  (``title``, ``description``, ``published date``, ``url``, ``publisher``)
+
+Requests run on the browser pool's event loop, which is the worker's event
+loop for crawler I/O, so sync callers from several threads share it.
+
+Example:
+    ```python
+    from src.core.crawler.search_client import get_search_client
+
+    client = get_search_client(settings)
+    response = client.search("AI OR blockchain", language="vi", country="VN", period="1d")
+    for item in response.items:
+        print(item["title"], item["url"])
+    ```
+"""
+
+import asyncio
+import html
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import feedparser
+except ImportError:
+    feedparser = None
+
+from src.core.crawler.browser_pool import DEFAULT_USER_AGENT, BrowserPool, get_browser_pool
+from src.shared.exceptions import GoogleNewsUnavailableError, RateLimitExceededError
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_NEWS_RSS_SEARCH_URL = "https://news.google.com/rss/search"
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def build_search_url(
+    query: str,
+    language: str,
+    country: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    period: Optional[str] = None
+) -> str:
+    """Build the RSS search URL for a query.
+
+    A period (``when:1d``) takes precedence over dates, matching how the
+    engine configures gnews for scheduled crawls.
+    """
+    if period:
+        query = f"{query} when:{period}"
+    else:
+        if end_date:
+            query = f"{query} before:{end_date.strftime('%Y-%m-%d')}"
+        if start_date:
+            query = f"{query} after:{start_date.strftime('%Y-%m-%d')}"
+    return (
+        f"{GOOGLE_NEWS_RSS_SEARCH_URL}?q={quote(query, safe='')}"
+        f"&hl={language}&gl={country}&ceid={country}:{language}"
+    )
+
+
+def parse_feed(content: bytes, max_results: int = 100) -> List[Dict[str, Any]]:
+    """Parse an RSS feed into gnews-style item dicts."""
+    items = []
+    for entry in feedparser.parse(content).entries[:max_results]:
+        url = entry.get("link")
+        if not url:
+            continue
+        items.append({
+            "title": entry.get("title", ""),
+            "description": html.unescape(_TAG_RE.sub(" ", entry.get("description", ""))).strip(),
+            "published date": entry.get("published", ""),
+            "url": url,
+            "publisher": entry.get("source", " "),
+        })
+    return items
+
+
+@dataclass
+class FeedResponse:
+    """A fetched RSS feed."""
+    url: str
+    status: int
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+    elapsed: float = 0.0
+
+
+@dataclass
+class SearchClientConfig:
+    """Configuration for the Google News RSS client."""
+    max_connections: int = 10       # Connections kept open per worker process
+    per_host_limit: int = 4         # Requests in flight per host
+    timeout: float = 15.0           # Seconds per request
+    validator_cache_size: int = 256  # Feeds whose ETag/Last-Modified are remembered
+    user_agent: str = DEFAULT_USER_AGENT
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "SearchClientConfig":
+        """Build client configuration from application settings."""
+        return cls(
+            per_host_limit=settings.GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT,
+            max_connections=max(settings.GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT, 10),
+            timeout=settings.GOOGLE_NEWS_SEARCH_TIMEOUT,
+        )
+
+
+@dataclass
+class SearchClientMetrics:
+    """Counters tracked by the search client."""
+    requests: int = 0
+    not_modified: int = 0
+    rate_limited: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+
+
+class GoogleNewsSearchClient:
+    """Pooled async client for Google News RSS searches."""
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        config: Optional[SearchClientConfig] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.pool = pool
+        self.config = config or SearchClientConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.metrics = SearchClientMetrics()
+        self._client = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        # url -> (etag, last_modified, items) of the last 200 response
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str], List[Dict[str, Any]]]] = OrderedDict()
+
+    def _get_client(self) -> Any:
+        """Create the shared client on first use, on the loop that will drive it."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections
+                ),
+                headers={
+                    "User-Agent": self.config.user_agent,
+                    "Accept": "application/rss+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Encoding": "gzip, deflate",
+                },
+                follow_redirects=True,
+            )
+        return self._client
+
+    def search(
+        self,
+        query: str,
+        language: str = "en",
+        country: str = "US",
+        max_results: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        conditional: bool = True
+    ) -> FeedResponse:
+        """Run a search from sync code.
+
+        ``etag`` and ``last_modified`` override the validators remembered by
+        this client, for callers that keep their own feed cache. Such callers
+        pass ``conditional=False`` when they hold no validators, so the feed
+        is fetched in full rather than revalidated with the client's own.
+
+        Raises:
+            RateLimitExceededError: If Google answers 429
+            GoogleNewsUnavailableError: If the feed cannot be fetched or parsed
+        """
+        url = build_search_url(query, language, country, start_date, end_date, period)
+        return self.pool.run(
+            self.fetch_feed(url, max_results, etag, last_modified, conditional), timeout=self.config.timeout * 2 + 10
+        )
+
+    async def search_async(
+        self,
+        query: str,
+        language: str = "en",
+        country: str = "US",
+        max_results: int = 100,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        conditional: bool = True
+    ) -> FeedResponse:
+        """Run a search on the pool's event loop."""
+        url = build_search_url(query, language, country, start_date, end_date, period)
+        return await self.fetch_feed(url, max_results, etag, last_modified, conditional)
+
+    async def fetch_feed(
+        self,
+        url: str,
+        max_results: int = 100,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        conditional: bool = True
+    ) -> FeedResponse:
+        """Fetch and parse a feed with a conditional GET.
+
+        Args:
+            url: RSS feed URL
+            max_results: Maximum items to parse
+            etag: Validator to send instead of the remembered one
+            last_modified: Validator to send instead of the remembered one
+            conditional: False to send a plain GET, ignoring every validator
+
+        Returns:
+            FeedResponse; on 304 the items are those of the remembered response, if any
+        """
+        if httpx is None or feedparser is None:
+            raise GoogleNewsUnavailableError("httpx and feedparser are required for the RSS search client")
+
+        remembered = self._validators.get(url) if conditional else None
+        if not conditional:
+            etag = last_modified = None
+        elif etag is None and last_modified is None and remembered:
+            etag, last_modified = remembered[0], remembered[1]
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        host = urlparse(url).netloc
+        limit = self._host_limits.setdefault(host, asyncio.Semaphore(max(1, self.config.per_host_limit)))
+
+        start = time.monotonic()
+        try:
+            async with limit:
+                response = await self._get_client().get(url, headers=headers)
+        except httpx.HTTPError as e:
+            self.metrics.errors += 1
+            raise GoogleNewsUnavailableError(f"Google News RSS request failed: {e}", details={"url": url}) from e
+        finally:
+            elapsed = time.monotonic() - start
+            self.metrics.requests += 1
+            self.metrics.total_time += elapsed
+
+        if response.status_code == 304:
+            self.metrics.not_modified += 1
+            return FeedResponse(
+                url=url,
+                status=304,
+                items=list(remembered[2]) if remembered else [],
+                etag=etag,
+                last_modified=last_modified,
+                not_modified=True,
+                elapsed=elapsed,
+            )
+
+        if response.status_code == 429:
+            self.metrics.rate_limited += 1
+            retry_after = response.headers.get("Retry-After", "")
+            raise RateLimitExceededError(
+                message="Google News RSS search rate limited (429)",
+                retry_after=int(retry_after) if retry_after.isdigit() else 300,
+                details={"url": url}
+            )
+
+        if response.status_code != 200:
+            self.metrics.errors += 1
+            raise GoogleNewsUnavailableError(
+                f"Google News RSS search returned HTTP {response.status_code}", details={"url": url}
+            )
+
+        # Parsing is CPU work - keep it off the shared event loop
+        items = await asyncio.get_running_loop().run_in_executor(None, parse_feed, response.content, max_results)
+        response_etag = response.headers.get("ETag")
+        response_last_modified = response.headers.get("Last-Modified")
+        if response_etag or response_last_modified:
+            self._remember(url, response_etag, response_last_modified, items)
+
+        return FeedResponse(
+            url=url,
+            status=200,
+            items=items,
+            etag=response_etag,
+            last_modified=response_last_modified,
+            elapsed=elapsed,
+        )
+
+    def _remember(self, url: str, etag: Optional[str], last_modified: Optional[str], items: List[Dict[str, Any]]):
+        self._validators[url] = (etag, last_modified, items)
+        self._validators.move_to_end(url)
+        while len(self._validators) > self.config.validator_cache_size:
+            self._validators.popitem(last=False)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get client metrics for monitoring."""
+        requests = self.metrics.requests
+        return {
+            "requests": requests,
+            "not_modified": self.metrics.not_modified,
+            "rate_limited": self.metrics.rate_limited,
+            "errors": self.metrics.errors,
+            "avg_request_time": self.metrics.total_time / requests if requests else 0.0,
+            "remembered_feeds": len(self._validators),
+        }
+
+
+# Global search client instance (one per worker process)
+_search_client: Optional[GoogleNewsSearchClient] = None
+_search_client_pid: Optional[int] = None
+_search_client_lock = threading.Lock()
+
+
+def get_search_client(settings: Any, logger: Optional[logging.Logger] = None) -> GoogleNewsSearchClient:
+    """Get the Google News RSS client for the current worker process."""
+    global _search_client, _search_client_pid
+
+    pool = get_browser_pool(settings, logger)
+    with _search_client_lock:
+        # Connections inherited through fork belong to the parent's event loop
+        if _search_client is None or _search_client_pid != os.getpid() or _search_client.pool is not pool:
+            _search_client = GoogleNewsSearchClient(pool, SearchClientConfig.from_settings(settings), logger)
+            _search_client_pid = os.getpid()
+        return _search_client
@@ -0,0 +1,196 @@
+"""Coalesce the Google News searches of categories scheduled together.
+
+When the schedule scanner fires many categories in the same minute, those
+with the same language, country and crawl period often share keywords, and
+each used to send its own searches. The coalescer groups such categories,
+plans query shards over the union of their keywords (so every distinct
+keyword is searched once), and fans the shard results back out:
+
+- a category receives the items of every shard containing one of its keywords
+- items from a shard that also carries other categories' keywords are kept
+  only if their title or description mentions one of the category's keywords
+- items mentioning one of the category's exclusions are dropped
+- a category relying on a shard whose search failed gets no results, so it
+  searches on its own instead of crawling an incomplete list
+
+Exclusions are applied here rather than in the query because they differ
+between the categories sharing a shard.
+
+Each category's items are handed to its crawl task through
+``CoalescedResults`` (Redis, keyed by the crawl job ID) rather than in the
+task message, so the broker only carries the key.
+
+Example:
+    ```python
+    from src.core.crawler.query_planner import QueryPlanner
+    from src.core.crawler.search_coalescer import fan_out, group_categories
+
+    for search in group_categories(due_categories, QueryPlanner.from_settings(settings)):
+        items_by_shard = {shard.index: search_shard(shard) for shard in search.shards}
+        results = fan_out(search, items_by_shard)  # {category_id: [items]}
+
+    results_store = get_coalesced_results(settings)
+    results_store.put(job_id, results[category_id])
+    ...
+    items = results_store.get(job_id)  # None if expired or lost: search on its own
+    ```
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import redis
+
+from src.core.crawler.feed_cache import item_id
+from src.core.crawler.query_planner import QueryPlanner, QueryShard
+from src.shared.redis_client import RedisJsonStore, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "gns:coalesced:"
+
+# Long enough for crawl tasks queued behind others to pick their items up
+RESULTS_TTL = 3600
+
+
+def category_search_key(category: Any) -> Tuple[str, str, Optional[str]]:
+    """Searches of categories with the same key can be shared."""
+    language = getattr(category, 'language', None) or 'vi'
+    country = getattr(category, 'country', None) or 'VN'
+    return language.lower(), country.upper(), getattr(category, 'crawl_period', None)
+
+
+def item_mentions(item: Dict[str, Any], keywords: List[str]) -> bool:
+    """Whether an item's title or description mentions any of the keywords."""
+    text = f"{item.get('title') or ''} {item.get('description') or ''}".lower()
+    return any(keyword.lower() in text for keyword in keywords if keyword)
+
+
+@dataclass
+class CoalescedSearch:
+    """Shared searches for categories with the same language, country and period."""
+    language: str
+    country: str
+    period: Optional[str]
+    categories: List[Any] = field(default_factory=list)
+    shards: List[QueryShard] = field(default_factory=list)
+    separate_searches: int = 0      # Searches the categories would send on their own
+
+    @property
+    def searches_saved(self) -> int:
+        return self.separate_searches - len(self.shards)
+
+
+def group_categories(categories: List[Any], planner: QueryPlanner) -> List[CoalescedSearch]:
+    """Group categories whose searches can be shared and plan the shared shards.
+
+    Only groups of two or more categories are returned; a category alone
+    gains nothing from coalescing and keeps searching on its own.
+    """
+    groups: Dict[Tuple[str, str, Optional[str]], List[Any]] = {}
+    for category in categories:
+        if category.keywords:
+            groups.setdefault(category_search_key(category), []).append(category)
+
+    searches = []
+    for (language, country, period), members in groups.items():
+        if len(members) < 2:
+            continue
+        keywords = [keyword for category in members for keyword in category.keywords]
+        search = CoalescedSearch(
+            language=language,
+            country=country,
+            period=period,
+            categories=members,
+            shards=planner.plan(keywords),
+            separate_searches=sum(
+                len(planner.plan(category.keywords, category.exclude_keywords or [])) for category in members
+            ),
+        )
+        searches.append(search)
+    return searches
+
+
+def fan_out(search: CoalescedSearch, items_by_shard: Dict[int, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Hand each category the shared results relevant to it.
+
+    Args:
+        search: The coalesced search
+        items_by_shard: Feed items returned by each searched shard, by shard index;
+            shards whose search failed are missing
+
+    Returns:
+        Mapping of category ID (as a string) to its items, deduplicated by article ID.
+        Categories with a keyword in a failed shard are left out.
+    """
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for category in search.categories:
+        keywords = {keyword.strip().lower() for keyword in category.keywords}
+        exclusions = category.exclude_keywords or []
+        relevant = [
+            shard for shard in search.shards
+            if {keyword.lower() for keyword in shard.keywords} & keywords
+        ]
+        if any(shard.index not in items_by_shard for shard in relevant):
+            continue
+
+        seen = set()
+        items = []
+        for shard in relevant:
+            shard_keywords = {keyword.lower() for keyword in shard.keywords}
+            # Other categories' keywords may have matched these items
+            shared = not shard_keywords <= keywords
+            for item in items_by_shard[shard.index]:
+                if shared and not item_mentions(item, category.keywords):
+                    continue
+                if exclusions and item_mentions(item, exclusions):
+                    continue
+                identity = item_id(item)
+                if identity not in seen:
+                    seen.add(identity)
+                    items.append(item)
+        results[str(category.id)] = items
+    return results
+
+
+class CoalescedResults:
+    """Search items of coalesced searches, waiting for each category's crawl task."""
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis],
+        ttl: int = RESULTS_TTL,
+        fallback_size: int = 256,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.store = RedisJsonStore(
+            client, REDIS_KEY_PREFIX, ttl, fallback_size=fallback_size, name="Coalesced results", logger=logger
+        )
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Get the items stored under a key, or None if missing or expired."""
+        return self.store.get(key, lambda data: data["items"])
+
+    def put(self, key: str, items: List[Dict[str, Any]]):
+        """Store a category's items under a key (e.g. its crawl job ID)."""
+        self.store.put(key, {"items": items})
+
+
+# Global coalesced results store
+_coalesced_results: Optional[CoalescedResults] = None
+_coalesced_results_lock = threading.Lock()
+
+
+def get_coalesced_results(settings: Any, logger: Optional[logging.Logger] = None) -> CoalescedResults:
+    """Get the global store of coalesced search results."""
+    global _coalesced_results
+
+    with _coalesced_results_lock:
+        if _coalesced_results is None:
+            client = get_redis_client(settings)
+            _coalesced_results = CoalescedResults(client=client, logger=logger)
+            if not is_redis_available(client):
+                _coalesced_results.store.failover.mark_down()
+        return _coalesced_results
@@ -8,9 +8,11 @@ import asyncio
 import logging
 import sys
 import os
+import threading
 import requests
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Collection, List, Dict, Any, Iterator, Optional, Set, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from urllib.parse import urlparse, parse_qs
@@ -45,10 +47,30 @@ except ImportError:
     cloudscraper = None
 
 from src.shared.config import Settings
+from src.core.crawler.article_fetcher import get_article_fetcher
+from src.core.crawler.browser_pool import get_browser_pool
+from src.core.crawler.crawl_watermark import CrawlWatermark, get_watermark_store
+from src.core.crawler.feed_cache import FeedCache, FeedCacheEntry, feed_cache_key, get_feed_cache, item_id
+from src.core.crawler.google_news_html import extract_article_links
+from src.core.crawler.host_scheduler import interleave_by_host
+from src.core.crawler.http_resolver import get_http_redirect_resolver
+from src.core.crawler.parse_executor import get_parse_executor
+from src.core.crawler.pipeline import PipelineConfig, StreamingCrawlPipeline
+from src.core.crawler.query_planner import QueryPlanner, QueryShard, ShardYield
+from src.core.crawler.rate_limiter import get_resolve_rate_limiter, get_search_rate_limiter
+from src.core.crawler.search_client import get_search_client
+from src.core.crawler.search_coalescer import CoalescedSearch, fan_out
+from src.core.crawler.resolution_executor import ResolutionExecutor, ResolutionExecutorConfig
+from src.core.crawler.redirect_resolver import RedirectResolver
+from src.core.crawler.redirect_timing import RedirectTimingModel, get_redirect_timing_model, publisher_domain
+from src.core.crawler.url_decoder import decode_google_news_url, extract_article_id, partition_decodable
+from src.core.crawler.resolution_cache import NEGATIVE_ENTRY, ResolutionCache, get_resolution_cache
+from src.core.crawler.url_index import KnownUrlIndex, get_known_url_index
 from src.shared.exceptions import (
     CrawlerError,
     GoogleNewsUnavailableError,
-    ExtractionError
+    ExtractionError,
+    RateLimitExceededError
 )
 
 logger = logging.getLogger(__name__)
@@ -65,13 +87,35 @@ class SyncCrawlerEngine:
         self.settings = settings
         self.logger = logger
 
-        # Adaptive timing statistics for performance learning
-        self._timing_stats = {
-            "avg_redirect_time": 4.0,  # Start with proven 4s baseline
-            "max_wait": 10.0,
-            "success_history": [],  # Track success patterns
-            "last_update": time.time()
-        }
+        # Publisher domain reported by Google News for each URL awaiting resolution
+        self._publisher_hints: Dict[str, str] = {}
+
+        # Feed cache entries written once the crawl that consumed them has finished
+        self._pending_feed_entries: Dict[str, FeedCacheEntry] = {}
+
+        # Category whose crawl is searching, so scheduled categories keep separate feed deltas
+        self._crawl_category_id: Optional[str] = None
+
+        # Set by the crawl pipeline when it stops; URL generators check it between batches
+        self._crawl_stop = threading.Event()
+
+        # Feed item ID behind each Google News URL passed on and each URL it resolved to,
+        # to tell which items a crawl actually extracted or found stored
+        self._result_item_ids: Dict[str, str] = {}
+
+        # Google News URLs already charged to the resolve budget by the HTTP tier
+        self._charged_resolve_urls: Set[str] = set()
+        self._charged_resolve_lock = threading.Lock()
+
+        # URLs resolved by each resolution tier, to show how much browser work is avoided
+        self._resolution_stats = {"offline": 0, "cache": 0, "http": 0, "browser": 0, "unresolved": 0}
+
+        # Results of each query shard searched, to spot saturated shards
+        self._shard_yields: List[ShardYield] = []
+
+        # High-water mark of the category crawled incrementally, and the items passed on under it
+        self._watermark: Optional[Tuple[str, CrawlWatermark]] = None
+        self._watermark_items: Dict[str, Dict[str, Any]] = {}
 
         # Validate dependencies
         if not GoogleNewsSource:
@@ -95,7 +139,7 @@ class SyncCrawlerEngine:
             self.logger.warning("CloudScraper not available - install with: pip install cloudscraper")
 
     def resolve_google_news_urls(self, google_news_urls: List[str]) -> List[str]:
-        """Resolve Google News URLs using 1 browser with 10 tabs (exact pattern from financial_news_extractor.py).
+        """Resolve Google News URLs with concurrent multi-tab batches across pooled browsers.
 
         This is the critical fix for the 0% success rate issue.
         Google News returns redirect URLs that newspaper4k cannot process.
@@ -105,340 +149,322 @@ class SyncCrawlerEngine:
 
         Returns:
             List of resolved actual article URLs
-
-        Raises:
-            CrawlerError: If URL resolution fails completely
         """
-        if not google_news_urls:
-            return []
+        return [url for batch in self.iter_resolved_google_news_urls(google_news_urls) for url in batch]
 
-        # CRITICAL FIX: Process in batches with 1 browser + configurable tabs
-        MAX_URLS_TO_PROCESS = self.settings.MAX_URLS_TO_PROCESS
+    def iter_resolved_google_news_urls(
+        self,
+        google_news_urls: List[str],
+        max_urls: Optional[int] = None
+    ) -> Iterator[List[str]]:
+        """Resolve Google News URLs, yielding each batch of article URLs as soon as it is ready.
 
-        # Limit the number of URLs to process
-        urls_to_process = google_news_urls[:MAX_URLS_TO_PROCESS]
+        Resolution is tiered from cheapest to most expensive: offline
+        decoding, the shared cache, pooled HTTP requests, and headless
+        browsers for whatever is left. Each tier's URLs are yielded as soon
+        as they are ready, so callers can start extracting before the
+        slowest redirect has been resolved.
 
-        self.logger.info(f"Resolving {len(urls_to_process)} Google News URLs using 1 browser with multi-tab strategy")
+        Args:
+            google_news_urls: List of Google News URLs from gnews
+            max_urls: Maximum URLs sent to the browser (defaults to MAX_URLS_TO_PROCESS)
 
-        resolved_urls = []
+        Yields:
+            Lists of resolved actual article URLs
+        """
+        if not google_news_urls:
+            return
 
-        if not sync_playwright:
-            self.logger.error("Playwright not available for URL resolution")
-            return []
+        resolved_count = 0
+
+        # Legacy article IDs embed the publisher URL - decode those without a browser
+        decoded_urls, pending_urls = partition_decodable(google_news_urls)
+        if decoded_urls:
+            undecoded = set(pending_urls)
+            decodable = [url for url in google_news_urls if url not in undecoded]
+            for google_url, decoded_url in zip(decodable, decoded_urls):
+                self._link_resolved(google_url, decoded_url)
+            self.logger.info(f"Decoded {len(decoded_urls)}/{len(google_news_urls)} Google News URLs offline")
+            resolved_count += len(decoded_urls)
+            self._resolution_stats["offline"] += len(decoded_urls)
+            yield decoded_urls
+
+        if not pending_urls:
+            return
 
-        try:
-            # Process URLs in batches (configurable max tabs per browser)
-            batch_size = self.settings.MAX_TABS_PER_BROWSER
-            for i in range(0, len(urls_to_process), batch_size):
-                batch = urls_to_process[i:i+batch_size]
-                self.logger.info(f"Processing batch {i//batch_size + 1}: {len(batch)} URLs with single browser")
+        # Article IDs resolved by earlier jobs come from the shared resolution cache
+        cache = self._get_resolution_cache()
+        if cache:
+            cached_urls = []
+            pending_urls = self._resolve_from_cache(cache, pending_urls, cached_urls)
+            if cached_urls:
+                resolved_count += len(cached_urls)
+                self._resolution_stats["cache"] += len(cached_urls)
+                yield cached_urls
+            if not pending_urls:
+                return
+
+        if self._crawl_stop.is_set():
+            return
 
-                batch_results = self._resolve_batch_with_single_browser(batch)
-                resolved_urls.extend(batch_results)
+        MAX_URLS_TO_PROCESS = max_urls or self.settings.MAX_URLS_TO_PROCESS
 
-        except Exception as e:
-            self.logger.error(f"Batch URL resolution failed: {e}")
+        # Limit the number of URLs to process
+        urls_to_process = pending_urls[:MAX_URLS_TO_PROCESS]
+
+        # Server-side redirects and interstitial pages resolve without a browser
+        if self.settings.HTTP_RESOLVER_ENABLED:
+            http_urls, urls_to_process = self._resolve_with_http_tier(urls_to_process, cache)
+            if http_urls:
+                resolved_count += len(http_urls)
+                yield http_urls
+            if not urls_to_process:
+                self._log_resolution_stats()
+                return
+            if self._crawl_stop.is_set():
+                return
+
+        if not async_playwright:
+            self.logger.error("Playwright not available for URL resolution")
+            self._resolution_stats["unresolved"] += len(urls_to_process)
+            return
 
-        success_rate = (len(resolved_urls) / len(google_news_urls)) * 100 if google_news_urls else 0
-        self.logger.info(f"URL resolution completed: {len(resolved_urls)}/{len(google_news_urls)} URLs resolved ({success_rate:.1f}% success rate)")
+        # Batches of MAX_TABS_PER_BROWSER tabs run concurrently, one pooled browser each
+        executor = ResolutionExecutor(
+            self._resolve_batch_with_single_browser,
+            ResolutionExecutorConfig.from_settings(self.settings),
+            self.logger
+        )
+        for batch_results in executor.iter_resolve(urls_to_process, stop=self._crawl_stop):
+            if cache:
+                self._store_in_cache(cache, batch_results)
+            for google_url, resolved_url in batch_results.items():
+                if resolved_url:
+                    self._link_resolved(google_url, resolved_url)
+
+            batch_urls = [url for url in batch_results.values() if url]
+            self._resolution_stats["browser"] += len(batch_urls)
+            self._resolution_stats["unresolved"] += len(batch_results) - len(batch_urls)
+            if batch_urls:
+                resolved_count += len(batch_urls)
+                yield batch_urls
+
+        success_rate = (resolved_count / len(google_news_urls)) * 100
+        self.logger.info(f"URL resolution completed: {resolved_count}/{len(google_news_urls)} URLs resolved ({success_rate:.1f}% success rate)")
+        self._log_resolution_stats()
 
         if success_rate < 20:  # Less than 20% success rate
             self.logger.error(f"Very low URL resolution success rate: {success_rate:.1f}%")
 
-        return resolved_urls
-
-    def _resolve_batch_with_single_browser(self, urls_batch: List[str]) -> List[str]:
-        """Process URLs with multi-tab strategy and adaptive monitoring (sync version)."""
-        resolved_urls = []
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding'
-                ]
+    def _resolve_with_http_tier(
+        self,
+        google_news_urls: List[str],
+        cache: Optional[ResolutionCache]
+    ) -> Tuple[List[str], List[str]]:
+        """Resolve what pooled HTTP requests can, returning (resolved URLs, URLs still pending)."""
+        try:
+            # Each URL takes its resolve token right before it is requested
+            results = get_http_redirect_resolver(self.settings, self.logger).resolve_batch(
+                google_news_urls,
+                limiter=get_resolve_rate_limiter(self.settings),
+                max_wait=self.settings.GOOGLE_NEWS_RESOLVE_MAX_WAIT
             )
+        except Exception as e:
+            self.logger.warning(f"HTTP resolution tier failed, falling back to browser: {e}")
+            return [], google_news_urls
+
+        resolved = {google_url: url for google_url, url in results.items() if url}
+        for google_url, resolved_url in resolved.items():
+            self._link_resolved(google_url, resolved_url)
+        # URLs requested here but left to the browser tier are not charged a second time
+        with self._charged_resolve_lock:
+            self._charged_resolve_urls.update(url for url in results if url not in resolved)
+        if cache:
+            # Failures are left to the browser tier, so only successes are cached here
+            self._store_in_cache(cache, resolved)
+
+        self._resolution_stats["http"] += len(resolved)
+        self.logger.info(f"HTTP tier resolved {len(resolved)}/{len(google_news_urls)} Google News URLs")
+        return list(resolved.values()), [url for url in google_news_urls if url not in resolved]
+
+    def get_resolution_stats(self) -> Dict[str, Any]:
+        """Get per-tier resolution counters for monitoring."""
+        stats = dict(self._resolution_stats)
+        resolved = stats["offline"] + stats["cache"] + stats["http"] + stats["browser"]
+        stats["browser_avoided_rate"] = (resolved - stats["browser"]) / resolved if resolved else 0.0
+        return stats
+
+    def _log_resolution_stats(self):
+        stats = self.get_resolution_stats()
+        self.logger.info(
+            f"Resolution tiers: offline={stats['offline']}, cache={stats['cache']}, http={stats['http']}, "
+            f"browser={stats['browser']}, unresolved={stats['unresolved']} "
+            f"({stats['browser_avoided_rate']:.1%} resolved without a browser)"
+        )
 
-            try:
-                # Open all tabs first (up to 10)
-                tabs_data = []
-                for i, url in enumerate(urls_batch[:10]):
-                    try:
-                        self.logger.info(f"      Tab {i+1}: Opening {url[:60]}...")
-                        page = browser.new_page()
-
-                        # Block resources for speed
-                        page.route("**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2,ttf,eot,ico}", lambda route: route.abort())
-
-                        # Set realistic headers
-                        page.set_extra_http_headers({
-                            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                        })
-
-                        # Navigate to URL
-                        page.goto(url, wait_until='domcontentloaded', timeout=30000)
-
-                        # Store tab data for monitoring
-                        tabs_data.append((page, url, i, time.time()))
-
-                        # Small delay between tab openings
-                        time.sleep(0.5)
-
-                    except Exception as e:
-                        self.logger.error(f"Tab {i+1} opening failed: {e}")
-                        continue
-
-                # Monitor all tabs simultaneously with sync approach
-                if tabs_data:
-                    self.logger.info(f"    Starting sync monitoring for {len(tabs_data)} tabs...")
-                    resolved_urls = self._monitor_tabs_sync(tabs_data)
-
-                # Close all tabs
-                for page, _, _, _ in tabs_data:
-                    try:
-                        page.close()
-                    except:
-                        pass
-
-            finally:
-                browser.close()
-
-        return resolved_urls
-
-    def _monitor_tabs_sync(self, tabs_data: List) -> List[str]:
-        """Monitor all tabs simultaneously for immediate URL extraction after JS rendering."""
-        resolved_urls = []
-        max_wait_time = self._timing_stats["max_wait"]
-
-        self.logger.info(f"    Monitoring {len(tabs_data)} tabs for JS rendering completion...")
-
-        # Monitor all tabs in a loop with round-robin checking
-        start_time = time.time()
-        resolved_tabs = set()  # Track which tabs are already resolved
-
-        while time.time() - start_time < max_wait_time and len(resolved_tabs) < len(tabs_data):
-            for i, (page, original_url, tab_id, _) in enumerate(tabs_data):
-                if i in resolved_tabs:
-                    continue
-
-                try:
-                    current_url = page.url
-                    elapsed = time.time() - start_time
-
-                    # Check if URL changed and redirected away from Google
-                    if current_url != original_url and 'news.google.com' not in current_url:
-                        resolved_urls.append(current_url)
-                        resolved_tabs.add(i)
-                        self.logger.info(f"      Tab {tab_id+1}: JS redirect found at {elapsed:.1f}s -> {current_url[:60]}...")
-                        continue
-
-                    # Try network idle fallback after 4 seconds
-                    if elapsed > 4 and current_url == original_url:
-                        try:
-                            page.wait_for_load_state('networkidle', timeout=2000)
-                            current_url = page.url
-                            if current_url != original_url and 'news.google.com' not in current_url:
-                                resolved_urls.append(current_url)
-                                resolved_tabs.add(i)
-                                self.logger.info(f"      Tab {tab_id+1}: Fallback redirect at {elapsed:.1f}s -> {current_url[:60]}...")
-                                continue
-                        except:
-                            pass
-
-                except Exception as e:
-                    self.logger.warning(f"      Tab {tab_id+1}: Monitoring error: {e}")
-                    resolved_tabs.add(i)  # Mark as failed to avoid infinite loop
-                    continue
-
-            # Small delay between rounds
-            time.sleep(0.1)
-
-        # Log failed tabs
-        for i, (_, original_url, tab_id, _) in enumerate(tabs_data):
-            if i not in resolved_tabs:
-                self.logger.warning(f"      Tab {tab_id+1}: No redirect found within {max_wait_time}s")
-
-        self.logger.info(f"    Sync monitoring completed: {len(resolved_urls)}/{len(tabs_data)} URLs resolved")
-        return resolved_urls
-
-    async def _monitor_tabs_with_event_detection_async(self, tabs_data: List) -> List[str]:
-        """Monitor all tabs with adaptive event-driven detection for immediate URL extraction."""
-        import concurrent.futures
-
-        resolved_urls = []
-        redirect_times = []  # Track individual redirect times for learning
-
-        # Use adaptive timing based on historical performance
-        max_wait_time = self._timing_stats["max_wait"]
-        avg_time = self._timing_stats["avg_redirect_time"]
-
-        self.logger.info(f"    Starting adaptive monitoring for {len(tabs_data)} tabs (avg: {avg_time:.1f}s, max: {max_wait_time:.1f}s)...")
-
-        # Use async parallel monitoring
-        tasks = []
-        for i, (page, original_url, tab_id, _) in enumerate(tabs_data):
-            task = asyncio.create_task(self._monitor_single_tab_adaptive_async(page, original_url, tab_id, max_wait_time))
-            tasks.append(task)
-
-        # Wait for all tasks to complete with timeout
+    def _get_resolution_cache(self) -> Optional[ResolutionCache]:
+        """Get the shared resolution cache, or None if disabled or unavailable."""
+        if not self.settings.RESOLUTION_CACHE_ENABLED:
+            return None
         try:
-            results = await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=max_wait_time + 2)
-            for result in results:
-                if isinstance(result, Exception):
-                    self.logger.warning(f"Tab monitoring failed: {result}")
-                elif result:
-                    url, redirect_time = result
-                    resolved_urls.append(url)
-                    redirect_times.append(redirect_time)
-        except asyncio.TimeoutError:
-            self.logger.warning(f"Monitoring timed out after {max_wait_time + 2}s")
-
-        # Update adaptive timing statistics
-        if redirect_times:
-            self._update_timing_stats(redirect_times, len(resolved_urls), len(tabs_data))
-
-        self.logger.info(f"    Adaptive monitoring completed: {len(resolved_urls)} URLs resolved")
-        return resolved_urls
-
-    def _monitor_single_tab(self, page, original_url: str, tab_id: int, max_wait: float) -> Optional[str]:
-        """Monitor a single tab for URL changes with sub-second precision."""
-        import time
-
-        start_time = time.time()
-        last_url = original_url
-
-        while time.time() - start_time < max_wait:
-            try:
-                current_url = page.url
-
-                # Check if URL changed and redirected away from Google
-                if current_url != last_url:
-                    elapsed = time.time() - start_time
-                    self.logger.info(f"      Tab {tab_id+1}: URL changed at {elapsed:.1f}s: {current_url[:50]}...")
-
-                    if current_url != original_url and 'news.google.com' not in current_url:
-                        self.logger.info(f"      Tab {tab_id+1}: Resolved in {elapsed:.1f}s -> {current_url[:50]}...")
-                        return current_url
-
-                    last_url = current_url
-
-                # If no redirect after some time, try fallback strategy
-                if time.time() - start_time > 3 and current_url == original_url:
-                    try:
-                        page.wait_for_load_state('networkidle', timeout=2000)
-                        current_url = page.url
-                        if current_url != original_url and 'news.google.com' not in current_url:
-                            elapsed = time.time() - start_time
-                            self.logger.info(f"      Tab {tab_id+1}: Fallback resolved in {elapsed:.1f}s -> {current_url[:50]}...")
-                            return current_url
-                    except:
-                        pass
-
-                time.sleep(0.1)  # Check every 100ms for responsiveness
-
-            except Exception as e:
-                self.logger.warning(f"      Tab {tab_id+1}: Monitoring error: {e}")
-                break
-
-        self.logger.warning(f"      Tab {tab_id+1}: No redirect found within {max_wait}s")
-        return None
-
-    async def _monitor_single_tab_adaptive_async(self, page, original_url: str, tab_id: int, max_wait: float) -> Optional[tuple]:
-        """Monitor a single tab with adaptive timing and return URL + redirect time."""
-        import time
-
-        start_time = time.time()
-        last_url = original_url
-
-        while time.time() - start_time < max_wait:
-            try:
-                current_url = page.url
-
-                # Check if URL changed and redirected away from Google
-                if current_url != last_url:
-                    elapsed = time.time() - start_time
-                    self.logger.info(f"      Tab {tab_id+1}: URL changed at {elapsed:.1f}s: {current_url[:50]}...")
-
-                    if current_url != original_url and 'news.google.com' not in current_url:
-                        self.logger.info(f"      Tab {tab_id+1}: Resolved in {elapsed:.1f}s -> {current_url[:50]}...")
-                        return (current_url, elapsed)  # Return URL and timing
-
-                    last_url = current_url
-
-                # Use adaptive fallback timing based on learned patterns
-                avg_time = self._timing_stats["avg_redirect_time"]
-                if time.time() - start_time > avg_time and current_url == original_url:
-                    try:
-                        await page.wait_for_load_state('networkidle', timeout=2000)
-                        current_url = page.url
-                        if current_url != original_url and 'news.google.com' not in current_url:
-                            elapsed = time.time() - start_time
-                            self.logger.info(f"      Tab {tab_id+1}: Adaptive fallback resolved in {elapsed:.1f}s -> {current_url[:50]}...")
-                            return (current_url, elapsed)
-                    except:
-                        pass
+            return get_resolution_cache(self.settings, self.logger)
+        except Exception as e:
+            self.logger.warning(f"Resolution cache unavailable: {e}")
+            return None
 
-                await asyncio.sleep(0.1)  # Check every 100ms for responsiveness
+    def _get_known_url_index(self) -> Optional[KnownUrlIndex]:
+        """Get the known-URL index, or None if disabled or not built yet.
 
-            except Exception as e:
-                self.logger.warning(f"      Tab {tab_id+1}: Monitoring error: {e}")
-                break
+        Starts a background rebuild when the index is stale.
+        """
+        if not self.settings.KNOWN_URL_INDEX_ENABLED:
+            return None
+        try:
+            index = get_known_url_index(self.settings, self.logger)
+            index.refresh()
+        except Exception as e:
+            self.logger.warning(f"Known-URL index unavailable: {e}")
+            return None
+        return index if index.ready else None
 
-        self.logger.warning(f"      Tab {tab_id+1}: No redirect found within {max_wait}s")
-        return None
+    def _resolve_from_cache(
+        self,
+        cache: ResolutionCache,
+        google_news_urls: List[str],
+        resolved_urls: List[str]
+    ) -> List[str]:
+        """Serve cached article IDs, returning the URLs that still need a browser.
 
-    def _update_timing_stats(self, redirect_times: List[float], successful: int, total: int):
-        """Update adaptive timing statistics based on current batch performance."""
-        if not redirect_times:
-            return
+        Cache hits are appended to resolved_urls. IDs cached as failures are
+        dropped until their negative TTL expires.
+        """
+        lookup = cache.get_many(
+            article_id for article_id in map(extract_article_id, google_news_urls) if article_id
+        )
 
-        # Calculate current batch metrics
-        avg_redirect_time = sum(redirect_times) / len(redirect_times)
-        success_rate = successful / total if total > 0 else 0
+        pending_urls = []
+        negative_hits = 0
+        for url in google_news_urls:
+            cached = lookup.get(extract_article_id(url))
+            if cached:
+                resolved_urls.append(cached)
+                self._link_resolved(url, cached)
+            elif cached == NEGATIVE_ENTRY:
+                negative_hits += 1
+            else:
+                pending_urls.append(url)
 
-        # Update running averages with decay factor
-        decay = 0.8  # Weight current data higher than historical
-        self._timing_stats["avg_redirect_time"] = (
-            decay * avg_redirect_time +
-            (1 - decay) * self._timing_stats["avg_redirect_time"]
+        hits = len(google_news_urls) - len(pending_urls) - negative_hits
+        self.logger.info(
+            f"Resolution cache: {hits} hits, {negative_hits} known failures, "
+            f"{len(pending_urls)} misses ({cache.backend})"
         )
+        return pending_urls
+
+    def _store_in_cache(self, cache: ResolutionCache, batch_results: Dict[str, Optional[str]]):
+        """Cache resolved article IDs and negatively cache the ones that failed."""
+        resolved = {}
+        failed = []
+        for google_url, resolved_url in batch_results.items():
+            article_id = extract_article_id(google_url)
+            if not article_id:
+                continue
+            if resolved_url:
+                resolved[article_id] = resolved_url
+            else:
+                failed.append(article_id)
 
-        # Adjust max wait time based on success rate
-        if success_rate > 0.8:  # >80% success rate
-            self._timing_stats["max_wait"] = max(
-                self._timing_stats["avg_redirect_time"] + 2.0,  # Give 2s buffer
-                6.0  # Minimum of 6s
-            )
-        elif success_rate < 0.4:  # <40% success rate
-            self._timing_stats["max_wait"] = min(
-                self._timing_stats["max_wait"] + 2.0,  # Increase wait time
-                15.0  # Maximum of 15s
-            )
+        cache.set_resolved(resolved)
+        cache.set_failed(failed)
 
-        # Store recent performance for analysis
-        self._timing_stats["success_history"].append({
-            "timestamp": time.time(),
-            "avg_time": avg_redirect_time,
-            "success_rate": success_rate,
-            "batch_size": total
-        })
+    def _resolve_batch_with_single_browser(self, urls_batch: List[str]) -> Dict[str, Optional[str]]:
+        """Resolve a batch of URLs in concurrent tabs with event-driven redirect detection.
 
-        # Keep only last 10 batches for learning
-        if len(self._timing_stats["success_history"]) > 10:
-            self._timing_stats["success_history"] = self._timing_stats["success_history"][-10:]
+        Tabs are opened in a warm browser context leased from the per-worker
+        browser pool, and each one completes as soon as its redirect fires.
+        Several batches may run at once from the resolution executor's threads.
+        Each tab's deadline comes from the redirect timing model for its
+        publisher; tabs that miss a tight deadline are retried once with the
+        longest one.
+
+        Returns:
+            Mapping of each attempted Google News URL to its resolved URL, or None if it failed
+        """
+        uncharged = self._take_uncharged_urls(urls_batch)
+        if uncharged:
+            self._wait_for_resolve_slot(uncharged)
+        pool = get_browser_pool(self.settings, self.logger)
+        resolver = RedirectResolver(pool, self.logger, intercept=self.settings.BROWSER_INTERCEPT_REDIRECTS)
+        timing_model = self._get_redirect_timing_model()
+
+        domains = [self._publisher_hints.get(url) for url in urls_batch]
+        if timing_model:
+            deadlines = timing_model.deadlines(domains)
+        else:
+            deadlines = [self.settings.REDIRECT_TIMING_DEFAULT_WAIT] * len(urls_batch)
 
         self.logger.info(
-            f"    Adaptive timing updated: avg={self._timing_stats['avg_redirect_time']:.1f}s, "
-            f"max={self._timing_stats['max_wait']:.1f}s, success_rate={success_rate:.1%}"
+            f"    Resolving {len(urls_batch)} tabs "
+            f"(deadlines {min(deadlines):.1f}-{max(deadlines):.1f}s per tab)..."
         )
+        outcomes = resolver.resolve_batch(urls_batch, deadlines)
+
+        # Tabs that gave up early on a tight deadline get one attempt with the longest one
+        retry_indexes = [
+            index for index, outcome in enumerate(outcomes)
+            if outcome.timed_out and timing_model and timing_model.should_retry(deadlines[index])
+        ]
+        samples = [
+            (domains[index], outcome.elapsed, False)
+            for index, outcome in enumerate(outcomes)
+            if outcome.timed_out
+        ]
+        if retry_indexes:
+            try:
+                self._wait_for_resolve_slot(len(retry_indexes))
+            except RateLimitExceededError as e:
+                self.logger.warning(f"    Skipping tab retries: {e}")
+                retry_indexes = []
+        if retry_indexes:
+            self.logger.info(f"    Retrying {len(retry_indexes)} tabs with {timing_model.max_wait:.1f}s deadline...")
+            retried = resolver.resolve_batch([urls_batch[index] for index in retry_indexes], timing_model.max_wait)
+            for index, outcome in zip(retry_indexes, retried):
+                outcomes[index] = outcome
+
+        results = {}
+        resolved = 0
+        for tab_id, outcome in enumerate(outcomes):
+            results[outcome.google_url] = outcome.resolved_url
+            if outcome.resolved:
+                resolved += 1
+                # Learn under the domain the redirect actually went to
+                samples.append((publisher_domain(outcome.resolved_url), outcome.elapsed, True))
+                self.logger.info(f"      Tab {tab_id+1}: Redirect at {outcome.elapsed:.1f}s -> {outcome.resolved_url[:60]}...")
+            else:
+                if outcome.timed_out and tab_id in retry_indexes:
+                    samples.append((domains[tab_id], outcome.elapsed, False))
+                self.logger.warning(f"      Tab {tab_id+1}: Not resolved: {outcome.error}")
+            self._publisher_hints.pop(outcome.google_url, None)
+
+        if timing_model:
+            self._record_redirect_timing(timing_model, samples)
+        self.logger.info(f"    Batch resolved: {resolved}/{len(outcomes)} URLs")
+        return results
+
+    def _get_redirect_timing_model(self) -> Optional[RedirectTimingModel]:
+        """Get the shared redirect timing model, or None if it cannot be set up."""
+        try:
+            return get_redirect_timing_model(self.settings, self.logger)
+        except Exception as e:
+            self.logger.warning(f"Redirect timing model unavailable: {e}")
+            return None
 
+    def _record_redirect_timing(self, timing_model: RedirectTimingModel, samples: List[Tuple[Optional[str], float, bool]]):
+        """Feed tab outcomes back into the redirect timing model."""
+        try:
+            timing_model.record(samples)
+        except Exception as e:
+            self.logger.warning(f"Failed to record redirect timing: {e}")
 
     def _follow_redirect_with_requests(self, google_url: str) -> Optional[str]:
         """Follow redirects using requests to get the final URL.
@@ -878,69 +904,364 @@ class SyncCrawlerEngine:
         Returns:
             List of resolved article URLs (not Google News URLs)
 
+        Raises:
+            GoogleNewsUnavailableError: If search fails
+        """
+        return [
+            url
+            for batch in self.iter_search_google_news(
+                keywords, exclude_keywords, max_results, language, country, start_date, end_date, period
+            )
+            for url in batch
+        ]
+
+    def iter_search_google_news(
+        self,
+        keywords: List[str],
+        exclude_keywords: List[str] = None,
+        max_results: int = 100,
+        language: str = "en",
+        country: str = "US",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None
+    ) -> Iterator[List[str]]:
+        """Search Google News, yielding resolved article URLs batch by batch.
+
+        URLs resolved without a browser are yielded first, then each browser
+        batch as it completes.
+
+        Args:
+            keywords: List of keywords to search for (OR logic)
+            exclude_keywords: List of keywords to exclude from results
+            max_results: Maximum number of results to return
+            language: Language code for search results
+            country: Country code for search results
+            start_date: Optional start date for filtering (datetime object)
+            end_date: Optional end date for filtering (datetime object)
+            period: Optional time period for search (e.g., '1h', '7d', '1m'). Mutually exclusive with start_date/end_date.
+
+        Yields:
+            Lists of resolved article URLs (not Google News URLs)
+
+        Raises:
+            GoogleNewsUnavailableError: If search fails
+        """
+        resolved_urls, google_news_urls = self.collect_google_news_results(
+            keywords, exclude_keywords, max_results, language, country, start_date, end_date, period
+        )
+        yield from self._iter_resolved_results(resolved_urls, google_news_urls)
+
+    def iter_search_results(self, search_results: List[Dict[str, Any]]) -> Iterator[List[str]]:
+        """Resolve results of a search made elsewhere (e.g. a coalesced scheduler search), batch by batch.
+
+        Args:
+            search_results: gnews-style result dicts
+
+        Yields:
+            Lists of resolved article URLs (not Google News URLs)
+        """
+        self.logger.info(f"Using {len(search_results)} prefetched Google News results")
+        resolved_urls, google_news_urls = self._partition_search_results(search_results)
+        yield from self._iter_resolved_results(resolved_urls, google_news_urls)
+
+    def _iter_resolved_results(self, resolved_urls: List[str], google_news_urls: List[str]) -> Iterator[List[str]]:
+        """Yield URLs resolved without a browser, then each browser batch as it completes."""
+        resolved_count = len(resolved_urls)
+        if resolved_urls:
+            yield resolved_urls
+
+        # For remaining URLs, use traditional resolution methods
+        if google_news_urls:
+            self.logger.info(f"Attempting traditional resolution for {len(google_news_urls)} URLs")
+            try:
+                for batch in self.iter_resolved_google_news_urls(google_news_urls):
+                    resolved_count += len(batch)
+                    yield batch
+            except Exception as e:
+                error_msg = f"Failed to search Google News: {str(e)}"
+                self.logger.error(error_msg)
+                raise GoogleNewsUnavailableError(error_msg) from e
+
+        self.logger.info(
+            f"Total resolved URLs: {resolved_count} from {len(resolved_urls) + len(google_news_urls)} Google News results"
+        )
+
+    def collect_google_news_results(
+        self,
+        keywords: List[str],
+        exclude_keywords: List[str] = None,
+        max_results: int = 100,
+        language: str = "en",
+        country: str = "US",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        period: Optional[str] = None
+    ) -> Tuple[List[str], List[str]]:
+        """Search Google News and resolve what can be resolved without a browser.
+
+        Article URLs are decoded offline from the article ID or taken from
+        gnews where possible; the remaining Google News URLs are returned for
+        browser resolution. Keyword lists too long for one query are split
+        into shards that are searched concurrently and merged by article ID.
+
+        Args:
+            keywords: List of keywords to search for (OR logic)
+            exclude_keywords: List of keywords to exclude from results
+            max_results: Maximum number of results to return per query shard
+            language: Language code for search results
+            country: Country code for search results
+            start_date: Optional start date for filtering (datetime object)
+            end_date: Optional end date for filtering (datetime object)
+            period: Optional time period for search (e.g., '1h', '7d', '1m'). Mutually exclusive with start_date/end_date.
+
+        Returns:
+            Tuple of (resolved article URLs, Google News URLs that still need resolution)
+
         Raises:
             GoogleNewsUnavailableError: If search fails
         """
         if not keywords:
             raise GoogleNewsUnavailableError("Keywords list cannot be empty")
 
+        # Long keyword lists are split into queries Google answers in full
+        shards = QueryPlanner.from_settings(self.settings).plan(keywords, exclude_keywords)
+        if len(shards) == 1:
+            resolved_urls, google_news_urls, _ = self._search_shard(
+                shards[0], max_results, language, country, start_date, end_date, period
+            )
+            return resolved_urls, google_news_urls
+
+        return self._collect_sharded_results(
+            shards, max_results, language, country, start_date, end_date, period
+        )
+
+    def _collect_sharded_results(
+        self,
+        shards: List[QueryShard],
+        max_results: int,
+        language: str,
+        country: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        period: Optional[str]
+    ) -> Tuple[List[str], List[str]]:
+        """Search query shards concurrently and merge their results by article ID.
+
+        Every shard waits for the shared search rate limiter. Failed shards
+        are logged and skipped; the search only fails if every shard failed.
+        """
+        workers = max(1, min(self.settings.QUERY_SHARD_CONCURRENCY, len(shards)))
+        self.logger.info(f"Searching {len(shards)} query shards ({workers} at a time)")
+
+        def _run(shard: QueryShard):
+            try:
+                return self._search_shard(shard, max_results, language, country, start_date, end_date, period)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="query-shard") as executor:
+            outcomes = list(executor.map(_run, shards))
+
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if len(errors) == len(outcomes):
+            raise errors[0]
+
+        resolved_urls: List[str] = []
+        google_news_urls: List[str] = []
+        seen_resolved = set()
+        seen_ids = set()
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                continue
+            shard_resolved, shard_pending, _ = outcome
+            for url in shard_resolved:
+                if url not in seen_resolved:
+                    seen_resolved.add(url)
+                    resolved_urls.append(url)
+            for url in shard_pending:
+                article_id = extract_article_id(url) or url
+                if article_id not in seen_ids:
+                    seen_ids.add(article_id)
+                    google_news_urls.append(url)
+
+        self.logger.info(
+            f"Merged {len(shards) - len(errors)}/{len(shards)} query shards: "
+            f"{len(resolved_urls)} resolved and {len(google_news_urls)} pending unique URLs"
+        )
+        return resolved_urls, google_news_urls
+
+    def search_coalesced(
+        self,
+        search: CoalescedSearch,
+        max_results: int = 100,
+        timeout: Optional[float] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the shared searches of a group of scheduled categories.
+
+        Shards are searched concurrently under the shared search rate
+        limiter, then the items are fanned out to the categories.
+
+        Args:
+            search: Coalesced search planned by the scheduler
+            max_results: Maximum results per shard
+            timeout: Seconds the whole search may take; shards not done by then count as failed
+
+        Returns:
+            Mapping of category ID (as a string) to its search items. Categories
+            behind a failed shard are left out and search on their own.
+
+        Raises:
+            GoogleNewsUnavailableError: If every shard failed
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        def _run(shard: QueryShard):
+            shard_yield = ShardYield(shard, max_results=max_results)
+            start = time.monotonic()
+            try:
+                max_wait = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                self._wait_for_search_slot(shard.query, max_wait=max_wait)
+                response = get_search_client(self.settings, self.logger).search(
+                    shard.query,
+                    language=search.language,
+                    country=search.country,
+                    max_results=max_results,
+                    period=search.period
+                )
+                shard_yield.results = len(response.items)
+                return response.items
+            except Exception as e:
+                shard_yield.error = str(e)
+                return e
+            finally:
+                shard_yield.elapsed = time.monotonic() - start
+                self._record_shard_yield(shard_yield)
+
+        workers = max(1, min(self.settings.QUERY_SHARD_CONCURRENCY, len(search.shards)))
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="coalesced-search")
         try:
-            # Build search query with OR logic for keywords
-            search_query = " OR ".join(keywords)
+            futures = [executor.submit(_run, shard) for shard in search.shards]
+            done, _ = wait(futures, timeout=timeout)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        outcomes = [
+            future.result() if future in done
+            else TimeoutError(f"Shard search did not finish within {timeout:.0f}s")
+            for future in futures
+        ]
+
+        errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+        if errors and len(errors) == len(outcomes):
+            raise GoogleNewsUnavailableError(f"Coalesced Google News search failed: {errors[0]}") from errors[0]
+
+        items_by_shard = {
+            shard.index: outcome for shard, outcome in zip(search.shards, outcomes)
+            if not isinstance(outcome, Exception)
+        }
+        results = fan_out(search, items_by_shard)
+        self.logger.info(
+            f"Coalesced {len(search.categories)} categories ({search.language}/{search.country}, "
+            f"period={search.period}) into {len(search.shards)} searches, saving {search.searches_saved}"
+        )
+        if errors:
+            self.logger.warning(
+                f"{len(errors)}/{len(outcomes)} coalesced searches failed; "
+                f"{len(search.categories) - len(results)} categories will search on their own"
+            )
+        return results
 
-            # Add exclusions if provided
-            if exclude_keywords:
-                exclusions = " ".join(f'-{keyword}' for keyword in exclude_keywords)
-                search_query = f"{search_query} {exclusions}"
+    def _search_shard(
+        self,
+        shard: QueryShard,
+        max_results: int,
+        language: str,
+        country: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        period: Optional[str]
+    ) -> Tuple[List[str], List[str], ShardYield]:
+        """Search one shard, recording its yield."""
+        shard_yield = ShardYield(shard, max_results=max_results)
+        start = time.monotonic()
+        try:
+            resolved_urls, google_news_urls, shard_yield.results = self._collect_query_results(
+                shard, max_results, language, country, start_date, end_date, period
+            )
+        except Exception as e:
+            shard_yield.error = str(e)
+            raise
+        finally:
+            shard_yield.elapsed = time.monotonic() - start
+            self._record_shard_yield(shard_yield)
+        return resolved_urls, google_news_urls, shard_yield
+
+    def _record_shard_yield(self, shard_yield: ShardYield):
+        self._shard_yields.append(shard_yield)
+        if shard_yield.saturated:
+            self.logger.warning(
+                f"Query shard {shard_yield.shard.index + 1} is saturated: {shard_yield.results} results for "
+                f"{len(shard_yield.shard.keywords)} keywords - lower QUERY_SHARD_MAX_KEYWORDS to search it in full"
+            )
+        else:
+            self.logger.info(
+                f"Query shard {shard_yield.shard.index + 1}: {shard_yield.results} results for "
+                f"{len(shard_yield.shard.keywords)} keywords in {shard_yield.elapsed:.2f}s"
+            )
 
-            self.logger.info(f"Searching Google News with query: {search_query}")
+    def get_shard_stats(self) -> List[Dict[str, Any]]:
+        """Get the yield of every query shard searched by this engine, for monitoring."""
+        return [shard_yield.to_dict() for shard_yield in self._shard_yields]
+
+    def _collect_query_results(
+        self,
+        shard: QueryShard,
+        max_results: int,
+        language: str,
+        country: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        period: Optional[str]
+    ) -> Tuple[List[str], List[str], int]:
+        """Search one query and resolve what can be resolved without a browser.
 
-            # URL encode the search query to handle spaces and special characters
-            from urllib.parse import quote_plus
-            encoded_query = quote_plus(search_query)
+        Returns:
+            Tuple of (resolved article URLs, Google News URLs that still need resolution, items in the feed)
+        """
+        keywords = shard.keywords
+        try:
+            search_query = shard.query
 
-            # Use GNews with enhanced URL resolution strategy
-            import gnews
+            self.logger.info(f"Searching Google News with query: {search_query}")
 
-            # Period and dates are mutually exclusive in GNews
+            # Period and dates are mutually exclusive in Google News queries
             # Period takes precedence for scheduled jobs, dates for on-demand jobs
             if period and (start_date or end_date):
                 self.logger.warning(
                     f"Both period ({period}) and dates provided. Period will be used for scheduled crawls."
                 )
 
-            # Initialize GNews with period if provided (for scheduled jobs)
-            if period:
-                gn = gnews.GNews(
-                    language=language.lower(),
-                    country=country,
-                    max_results=max_results,
-                    period=period
+            # Share the search budget with concurrent searches in this worker
+            self._wait_for_search_slot(search_query)
+
+            gn = None
+            if self.settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED:
+                # Pooled async RSS client returning parsed items directly
+                search_results, feed_size = self._search_rss_feed(
+                    search_query, language.lower(), country, max_results, start_date, end_date, period
                 )
-                self.logger.info(f"Using period '{period}' for scheduled crawl")
             else:
-                # Initialize without period (for on-demand jobs with date ranges)
-                gn = gnews.GNews(
-                    language=language.lower(),
-                    country=country,
-                    max_results=max_results
-                )
+                gn = self._build_gnews_client(language, country, max_results, start_date, end_date, period)
 
-                # Apply date filtering if provided
-                if start_date:
-                    gn.start_date = start_date
-                    self.logger.info(f"Applied start_date filter: {start_date}")
-                if end_date:
-                    gn.end_date = end_date
-                    self.logger.info(f"Applied end_date filter: {end_date}")
-
-            # Search using GNews directly with encoded query
-            search_results = gn.get_news(encoded_query)
+                # URL encode the search query to handle spaces and special characters
+                from urllib.parse import quote_plus
+                search_results = gn.get_news(quote_plus(search_query))
+                feed_size = len(search_results or [])
 
             # Rate Limit Detection: If 0 articles returned, might be rate limited
             # CRITICAL: Raise exception instead of blocking worker with time.sleep()
             # This allows Celery to handle the retry properly without blocking other tasks
-            if not search_results or len(search_results) == 0:
+            if not feed_size:
                 self.logger.warning(
                     f"Rate limit suspected: 0 articles returned for query '{search_query}'. "
                     f"Raising RateLimitExceededError to trigger Celery retry after 5 minutes..."
@@ -954,6 +1275,11 @@ class SyncCrawlerEngine:
                     details={"query": search_query, "keywords": keywords}
                 )
 
+            # Nothing new since the last completed crawl of this feed
+            if not search_results:
+                self.logger.info(f"No new Google News items for query '{search_query}' since the last run")
+                return [], [], feed_size
+
             # URL Statistics: Print how many URLs were found from Google News search
             self.logger.info(f"GOOGLE NEWS SEARCH STATISTICS: Found {len(search_results)} URLs from search query")
             print(f"Google News Search Results: {len(search_results)} URLs found for query: '{search_query}'")  # For console visibility
@@ -964,45 +1290,332 @@ class SyncCrawlerEngine:
                 self.logger.info(f"Sample result: {sample.get('title', 'No title')}")
                 self.logger.info(f"Sample Google URL: {sample.get('url', 'No URL')[:100]}...")
 
-            # Enhanced approach: Try to get full article details first
-            all_resolved_urls = []
-            google_news_urls = []
+            all_resolved_urls, google_news_urls = self._partition_search_results(search_results, gn)
+            return all_resolved_urls, google_news_urls, feed_size
 
-            for i, result in enumerate(search_results):
-                google_url = result.get('url')
-                if not google_url:
-                    continue
+        except Exception as e:
+            error_msg = f"Failed to search Google News: {str(e)}"
+            self.logger.error(error_msg)
+            raise GoogleNewsUnavailableError(error_msg) from e
+
+    def _partition_search_results(
+        self,
+        search_results: List[Dict[str, Any]],
+        gn: Any = None
+    ) -> Tuple[List[str], List[str]]:
+        """Split search results into article URLs resolved without a browser and Google News URLs.
 
+        Args:
+            search_results: gnews-style result dicts
+            gn: gnews client that produced the results, tried for full article details
+
+        Returns:
+            Tuple of (resolved article URLs, Google News URLs that still need resolution)
+        """
+        # Incremental crawls skip what earlier runs of the category already processed
+        search_results = self._filter_by_watermark(search_results)
+
+        # Enhanced approach: Try to get full article details first
+        all_resolved_urls = []
+        google_news_urls = []
+
+        for i, result in enumerate(search_results):
+            google_url = result.get('url')
+            if not google_url:
+                continue
+            self._result_item_ids[google_url] = item_id(result)
+
+            # Strategy 0: Decode the publisher URL from the article ID without network access
+            decoded_url = decode_google_news_url(google_url)
+            if decoded_url:
+                all_resolved_urls.append(decoded_url)
+                self._link_resolved(google_url, decoded_url)
+                continue
+
+            # Strategy 1: Try to get full article details from gnews (gnews searches only)
+            # This sometimes provides the actual article URL
+            if gn is not None:
                 try:
-                    # Strategy 1: Try to get full article details from gnews
-                    # This sometimes provides the actual article URL
                     full_article = gn.get_full_article(google_url)
                     if full_article and hasattr(full_article, 'url') and full_article.url:
                         actual_url = full_article.url
                         if actual_url.startswith('http') and 'google.com' not in actual_url:
                             all_resolved_urls.append(actual_url)
+                            self._link_resolved(google_url, actual_url)
                             self.logger.info(f"Resolved via gnews full article: {actual_url}")
                             continue
 
                 except Exception as e:
                     self.logger.debug(f"gnews full article failed for URL {i+1}: {e}")
 
-                # Strategy 2: Add to list for traditional resolution methods
-                google_news_urls.append(google_url)
+            # Strategy 2: Add to list for traditional resolution methods
+            google_news_urls.append(google_url)
 
-            # For remaining URLs, use traditional resolution methods
-            if google_news_urls:
-                self.logger.info(f"Attempting traditional resolution for {len(google_news_urls)} URLs")
-                traditional_resolved = self.resolve_google_news_urls(google_news_urls)
-                all_resolved_urls.extend(traditional_resolved)
+            # The publisher's domain picks the redirect deadline for this URL
+            publisher = result.get('publisher')
+            domain = publisher_domain(publisher.get('href')) if isinstance(publisher, dict) else None
+            if domain:
+                self._publisher_hints[google_url] = domain
 
-            self.logger.info(f"Total resolved URLs: {len(all_resolved_urls)} from {len(search_results)} Google News results")
-            return all_resolved_urls
+        self.logger.info(
+            f"Resolved {len(all_resolved_urls)}/{len(search_results)} Google News results without a browser"
+        )
+        return all_resolved_urls, google_news_urls
+
+    def _search_rss_feed(
+        self,
+        search_query: str,
+        language: str,
+        country: str,
+        max_results: int,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        period: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Search the RSS endpoint, returning (items to process, items in the feed).
+
+        Period searches from scheduled crawls go through the feed cache: an
+        unchanged feed yields no items, and a changed one only the items not
+        seen in the last completed crawl.
+        """
+        feed_cache = self._get_feed_cache() if period else None
+        key = feed_cache_key(search_query, language, country, period, self._crawl_category_id) if feed_cache else None
+        entry = feed_cache.get(key) if feed_cache else None
+
+        response = get_search_client(self.settings, self.logger).search(
+            search_query,
+            language=language,
+            country=country,
+            max_results=max_results,
+            start_date=start_date,
+            end_date=end_date,
+            period=period,
+            etag=entry.etag if entry else None,
+            last_modified=entry.last_modified if entry else None,
+            # Without validators of its own the cache needs the full feed, not the client's 304
+            conditional=not feed_cache or bool(entry and (entry.etag or entry.last_modified))
+        )
 
+        if entry is None:
+            if feed_cache:
+                self._pending_feed_entries[key] = FeedCacheEntry(response.etag, response.last_modified, response.items)
+            return response.items, len(response.items)
+
+        if response.not_modified:
+            self.logger.info(f"Google News feed unchanged since last run ({len(entry.items)} items)")
+            return [], len(entry.items)
+
+        known_ids = entry.item_ids()
+        new_items = [item for item in response.items if item_id(item) not in known_ids]
+        self._pending_feed_entries[key] = FeedCacheEntry(response.etag, response.last_modified, response.items)
+        self.logger.info(f"Google News feed changed: {len(new_items)}/{len(response.items)} items are new")
+        return new_items, len(response.items)
+
+    def _get_feed_cache(self) -> Optional[FeedCache]:
+        """Get the shared feed cache, or None if disabled or unavailable."""
+        if not self.settings.FEED_CACHE_ENABLED:
+            return None
+        try:
+            return get_feed_cache(self.settings, self.logger)
         except Exception as e:
-            error_msg = f"Failed to search Google News: {str(e)}"
-            self.logger.error(error_msg)
-            raise GoogleNewsUnavailableError(error_msg) from e
+            self.logger.warning(f"Feed cache unavailable: {e}")
+            return None
+
+    def _link_resolved(self, google_url: str, resolved_url: str):
+        """Attribute a resolved article URL to the feed item of its Google News URL."""
+        identity = self._result_item_ids.get(google_url)
+        if identity is not None:
+            self._result_item_ids[resolved_url] = identity
+
+    def _unprocessed_item_ids(self, extracted: List[Dict[str, Any]], known_urls: List[str]) -> Set[str]:
+        """IDs of feed items passed on by this crawl that were neither extracted nor found stored."""
+        passed_on = set(self._result_item_ids.values())
+        processed = {
+            self._result_item_ids[url]
+            for url in [article.get('url') for article in extracted] + list(known_urls)
+            if url in self._result_item_ids
+        }
+        return passed_on - processed
+
+    def commit_feed_cache(self, unprocessed_ids: Collection[str] = ()):
+        """Remember the feeds searched by this crawl so the next run only sees new items.
+
+        Items in unprocessed_ids (cut by the URL cap, unresolved, or not
+        extracted) are left out of the stored entries, and an entry missing
+        any of its feed's items drops its validators: the next search is a
+        full request, so those items come back in its delta instead of being
+        hidden behind a 304.
+
+        Args:
+            unprocessed_ids: Feed item IDs this crawl passed on but did not process
+        """
+        pending, self._pending_feed_entries = self._pending_feed_entries, {}
+        feed_cache = self._get_feed_cache() if pending else None
+        if not feed_cache:
+            return
+        for key, entry in pending.items():
+            if unprocessed_ids:
+                processed = [item for item in entry.items if item_id(item) not in unprocessed_ids]
+                if len(processed) < len(entry.items):
+                    self.logger.info(
+                        f"{len(entry.items) - len(processed)} feed items were not processed, "
+                        f"searching the feed in full next run"
+                    )
+                    entry = FeedCacheEntry(etag=None, last_modified=None, items=processed)
+            try:
+                feed_cache.put(key, entry)
+            except Exception as e:
+                self.logger.warning(f"Failed to update feed cache: {e}")
+
+    def _begin_incremental_crawl(self, category: Any):
+        """Load the category's high-water mark so only newer, unseen items are processed."""
+        if not self.settings.INCREMENTAL_CRAWL_ENABLED:
+            return
+        try:
+            mark = get_watermark_store(self.settings, self.logger).get(str(category.id))
+        except Exception as e:
+            self.logger.warning(f"Watermark store unavailable, crawling in full: {e}")
+            return
+        self._watermark = (str(category.id), mark or CrawlWatermark())
+        self._watermark_items = {}
+
+    def _filter_by_watermark(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop items at or below the high-water mark of an incremental crawl."""
+        if self._watermark is None:
+            return search_results
+
+        _, mark = self._watermark
+        overlap = self.settings.INCREMENTAL_CRAWL_OVERLAP
+        new_items = [item for item in search_results if mark.is_new(item, overlap)]
+        for item in new_items:
+            self._watermark_items[item_id(item)] = item
+
+        self.logger.info(
+            f"Incremental crawl: {len(new_items)}/{len(search_results)} items are newer than the last run"
+        )
+        return new_items
+
+    def commit_watermark(self, unprocessed_ids: Collection[str] = ()):
+        """Advance the category's high-water mark past the items this crawl processed.
+
+        Items in unprocessed_ids are not marked as seen, and the mark's
+        publish time stays at or below the oldest of them, so the next
+        incremental run of the category offers them again.
+
+        Args:
+            unprocessed_ids: Feed item IDs this crawl passed on but did not process
+        """
+        watermark, self._watermark = self._watermark, None
+        items, self._watermark_items = self._watermark_items, {}
+        if watermark is None:
+            return
+
+        category_id, mark = watermark
+        processed = [item for identity, item in items.items() if identity not in unprocessed_ids]
+        pending = [item for identity, item in items.items() if identity in unprocessed_ids]
+        if pending:
+            self.logger.info(f"Incremental crawl: {len(pending)} items were not processed and stay pending")
+        try:
+            get_watermark_store(self.settings, self.logger).put(
+                category_id,
+                mark.advance(
+                    processed,
+                    overlap=self.settings.INCREMENTAL_CRAWL_OVERLAP,
+                    max_ids=self.settings.INCREMENTAL_CRAWL_MAX_IDS,
+                    pending=pending
+                )
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to update watermark: {e}")
+
+    def _build_gnews_client(
+        self,
+        language: str,
+        country: str,
+        max_results: int,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        period: Optional[str]
+    ) -> Any:
+        """Configure a gnews client for one search (used when the RSS client is disabled)."""
+        import gnews
+
+        # Initialize GNews with period if provided (for scheduled jobs)
+        if period:
+            gn = gnews.GNews(
+                language=language.lower(),
+                country=country,
+                max_results=max_results,
+                period=period
+            )
+            self.logger.info(f"Using period '{period}' for scheduled crawl")
+        else:
+            # Initialize without period (for on-demand jobs with date ranges)
+            gn = gnews.GNews(
+                language=language.lower(),
+                country=country,
+                max_results=max_results
+            )
+
+            # Apply date filtering if provided
+            if start_date:
+                gn.start_date = start_date
+                self.logger.info(f"Applied start_date filter: {start_date}")
+            if end_date:
+                gn.end_date = end_date
+                self.logger.info(f"Applied end_date filter: {end_date}")
+
+        return gn
+
+    def _wait_for_search_slot(self, search_query: str, max_wait: Optional[float] = None):
+        """Block until the global Google News search rate limiter allows another call.
+
+        Args:
+            search_query: Query about to be searched, for the error details
+            max_wait: Seconds to wait at most, if shorter than GOOGLE_NEWS_SEARCH_MAX_WAIT
+
+        Raises:
+            RateLimitExceededError: If no slot frees up in time
+        """
+        limiter = get_search_rate_limiter(self.settings)
+        timeout = self.settings.GOOGLE_NEWS_SEARCH_MAX_WAIT
+        if max_wait is not None:
+            timeout = min(timeout, max_wait)
+        if not limiter.acquire(timeout=timeout):
+            from src.shared.exceptions import RateLimitExceededError
+            raise RateLimitExceededError(
+                message=f"Timed out waiting for Google News search budget for query '{search_query}'",
+                retry_after=60,
+                details={"query": search_query, "limiter": limiter.get_metrics()}
+            )
+
+    def _take_uncharged_urls(self, urls: List[str]) -> int:
+        """Count the URLs not charged to the resolve budget yet; charged ones use up their charge."""
+        with self._charged_resolve_lock:
+            charged = self._charged_resolve_urls.intersection(urls)
+            self._charged_resolve_urls.difference_update(charged)
+        return len(urls) - len(charged)
+
+    def _wait_for_resolve_slot(self, url_count: int):
+        """Block until the global resolution rate limiter allows opening url_count Google News URLs.
+
+        Raises:
+            RateLimitExceededError: If the budget does not free up within GOOGLE_NEWS_RESOLVE_MAX_WAIT
+        """
+        limiter = get_resolve_rate_limiter(self.settings)
+        deadline = time.monotonic() + self.settings.GOOGLE_NEWS_RESOLVE_MAX_WAIT
+        remaining = url_count
+        while remaining > 0:
+            # A bucket never holds more than its capacity, so large batches take it in chunks
+            tokens = min(remaining, limiter.capacity)
+            if not limiter.acquire(tokens, timeout=max(0.0, deadline - time.monotonic())):
+                from src.shared.exceptions import RateLimitExceededError
+                raise RateLimitExceededError(
+                    message=f"Timed out waiting for Google News resolution budget for {url_count} URLs",
+                    retry_after=60,
+                    details={"limiter": limiter.get_metrics()}
+                )
+            remaining -= tokens
 
     def search_google_news_with_cloudscraper(
         self,
@@ -1125,48 +1738,34 @@ class SyncCrawlerEngine:
         Returns:
             List of Google News article URLs
         """
-        google_news_urls = []
-
         try:
-            import re
-
-            # Enhanced regex patterns for Google News URLs
-            patterns = [
-                # Current Google News format
-                r'href="(\./articles/[^"]*)"',
-                r'href="(https://news\.google\.com/articles/[^"]*)"',
-                # Alternative patterns
-                r'<a[^>]*href="([^"]*articles/[^"]*)"[^>]*>',
-                r'data-url="([^"]*articles/[^"]*)"',
-            ]
+            google_news_urls = extract_article_links(html_content, max_results)
+            self.logger.info(f"Extracted {len(google_news_urls)} Google News URLs from HTML")
+            return google_news_urls
 
-            for pattern in patterns:
-                matches = re.findall(pattern, html_content)
-                for match in matches:
-                    # Clean and normalize URL
-                    if match.startswith('./'):
-                        url = f"https://news.google.com{match[1:]}"
-                    elif match.startswith('https://'):
-                        url = match
-                    else:
-                        url = f"https://news.google.com{match}"
+        except Exception as e:
+            self.logger.error(f"Failed to parse Google News HTML: {e}")
+            return []
 
-                    # Validate URL format and avoid duplicates
-                    if 'articles/' in url and url not in google_news_urls:
-                        google_news_urls.append(url)
+    def _fetch_and_parse_articles(self, articles: List[Any]) -> List[Any]:
+        """Download pages with the async fetcher, then parse them on the parse executor.
 
-                        if len(google_news_urls) >= max_results:
-                            break
+        Pages that could not be downloaded or parsed are left out.
 
-                if len(google_news_urls) >= max_results:
-                    break
+        Returns:
+            ParsedArticle results, which read like newspaper Articles
+        """
+        pages = get_article_fetcher(self.settings, self.logger).fetch_batch([article.url for article in articles])
 
-            self.logger.info(f"Extracted {len(google_news_urls)} Google News URLs from HTML")
-            return google_news_urls[:max_results]
+        fetched = [page for page in pages if page.ok]
+        if len(fetched) < len(articles):
+            self.logger.info(f"Downloaded {len(fetched)}/{len(articles)} article pages")
 
-        except Exception as e:
-            self.logger.error(f"Failed to parse Google News HTML: {e}")
-            return []
+        parsed = get_parse_executor(self.settings, self.logger).parse_many([(page.url, page.text) for page in fetched])
+        for result in parsed:
+            if not result.ok:
+                self.logger.warning(f"Failed to parse article {result.url}: {result.error}")
+        return [result for result in parsed if result.ok]
 
     def extract_articles_with_threading(
         self,
@@ -1191,13 +1790,29 @@ class SyncCrawlerEngine:
         try:
             self.logger.info(f"Extracting {len(urls)} articles with {threads} threads")
 
+            # Spread downloads across publishers instead of hitting one host at a time
+            urls = interleave_by_host(urls)
+
             # Create Article objects for URLs
-            articles = [Article(url) for url in urls]
+            articles = [
+                Article(url, trust_html_domains=self.settings.NEWSPAPER_TRUST_HTML_DOMAINS)
+                for url in urls
+            ]
 
-            # Use newspaper4k threading to download and parse with error handling
+            # Download and parse with error handling
             try:
-                processed_articles = fetch_news(articles, threads=threads)
+                if self.settings.ARTICLE_FETCH_ASYNC_ENABLED:
+                    processed_articles = self._fetch_and_parse_articles(articles)
+                else:
+                    processed_articles = fetch_news(articles, threads=threads)
             except Exception as fetch_error:
+                if self.settings.ARTICLE_FETCH_ASYNC_ENABLED:
+                    # Slow and failed pages are already reported per page; an error here
+                    # means the fetch loop is unusable. Re-downloading serially would skip
+                    # the per-host limits and Retry-After pauses, so the batch counts as failed.
+                    self.logger.warning(f"Async article fetch failed ({fetch_error}), skipping batch of {len(articles)}")
+                    return []
+
                 # If fetch_news fails completely, try individual processing
                 self.logger.warning(f"Batch fetch failed ({fetch_error}), falling back to individual processing")
                 processed_articles = []
@@ -1290,6 +1905,46 @@ class SyncCrawlerEngine:
         Returns:
             List of deduplicated article URLs from all daily crawls
         """
+        return [
+            url
+            for batch in self.iter_daily_sliding_window(
+                keywords, exclude_keywords, start_date, end_date, max_results_total, language, country
+            )
+            for url in batch
+        ]
+
+    def iter_daily_sliding_window(
+        self,
+        keywords: List[str],
+        exclude_keywords: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        max_results_total: int,
+        language: str,
+        country: str
+    ) -> Iterator[List[str]]:
+        """Crawl a date range day by day, yielding deduplicated article URLs batch by batch.
+
+        Days are searched concurrently by up to SLIDING_WINDOW_CONCURRENCY
+        workers; the global search rate limiter keeps the combined request rate
+        within budget. Results are merged in day order.
+
+        Google News items that show up on several days are deduplicated by
+        article ID before resolution, and all items that need a browser are
+        resolved in one pass once every day has been searched.
+
+        Args:
+            keywords: List of keywords to search for
+            exclude_keywords: List of keywords to exclude
+            start_date: Start of date range (datetime object)
+            end_date: End of date range (datetime object)
+            max_results_total: Total maximum results to fetch across all days
+            language: Language code
+            country: Country code
+
+        Yields:
+            Lists of article URLs not yielded before
+        """
         from datetime import timedelta
 
         # Calculate total days in range
@@ -1297,68 +1952,117 @@ class SyncCrawlerEngine:
 
         if total_days <= 0:
             self.logger.warning("Invalid date range: end_date must be after start_date")
-            return []
+            return
 
         # Calculate max results per day (distribute evenly)
         max_results_per_day = max(1, max_results_total // total_days)
+        workers = max(1, min(self.settings.SLIDING_WINDOW_CONCURRENCY, total_days))
 
         self.logger.info(
             f"Starting daily sliding window crawl: {total_days} days, "
-            f"{max_results_per_day} results/day (total target: {max_results_total})"
+            f"{max_results_per_day} results/day (total target: {max_results_total}), "
+            f"{workers} concurrent searches"
         )
 
-        all_urls = []
-        seen_urls = set()
-
-        # Iterate through each day
-        for day_offset in range(total_days):
+        def crawl_day(day_offset: int) -> Tuple[List[str], List[str]]:
             current_day_start = start_date + timedelta(days=day_offset)
 
             # Set end to next day minus 1 second (GNews needs ≥1 day gap)
             current_day_end = current_day_start + timedelta(days=1, seconds=-1)
 
-            day_str = current_day_start.strftime('%Y-%m-%d')
             self.logger.info(
-                f"Day {day_offset + 1}/{total_days}: Crawling {day_str}"
+                f"Day {day_offset + 1}/{total_days}: Crawling {current_day_start.strftime('%Y-%m-%d')}"
             )
 
-            try:
-                # Crawl this single day
-                day_urls = self.search_google_news(
-                    keywords=keywords,
-                    exclude_keywords=exclude_keywords,
-                    max_results=max_results_per_day,
-                    language=language,
-                    country=country,
-                    start_date=current_day_start,
-                    end_date=current_day_end,
-                    period=None  # Don't use period for date-specific crawls
-                )
+            # Search this single day; browser resolution happens once for the whole window
+            return self.collect_google_news_results(
+                keywords=keywords,
+                exclude_keywords=exclude_keywords,
+                max_results=max_results_per_day,
+                language=language,
+                country=country,
+                start_date=current_day_start,
+                end_date=current_day_end,
+                period=None  # Don't use period for date-specific crawls
+            )
+
+        seen_urls = set()
+        seen_article_ids = set()
+        pending_google_urls = []
+        duplicate_items = 0
+        total_urls = 0
+
+        def take_new(urls: List[str]) -> List[str]:
+            new_urls = [url for url in dict.fromkeys(urls) if url not in seen_urls]
+            seen_urls.update(new_urls)
+            return new_urls
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sliding-window")
+        try:
+            futures = [executor.submit(crawl_day, day_offset) for day_offset in range(total_days)]
+
+            # Merge in day order so the result matches a serial crawl
+            for day_offset, future in enumerate(futures):
+                if self._crawl_stop.is_set():
+                    self.logger.info(f"Daily sliding window stopped after {day_offset}/{total_days} days")
+                    return
+                day_str = (start_date + timedelta(days=day_offset)).strftime('%Y-%m-%d')
+                try:
+                    day_urls, day_google_urls = future.result()
+                except Exception as e:
+                    self.logger.warning(
+                        f"Day {day_offset + 1}/{total_days}: Failed to crawl {day_str}: {e}"
+                    )
+                    continue
+
+                # Deduplicate Google News items across days on their article ID
+                new_google_urls = 0
+                for google_url in day_google_urls:
+                    article_id = extract_article_id(google_url) or google_url
+                    if article_id in seen_article_ids:
+                        duplicate_items += 1
+                        continue
+                    seen_article_ids.add(article_id)
+                    pending_google_urls.append(google_url)
+                    new_google_urls += 1
 
                 # Deduplicate URLs
-                new_urls = [url for url in day_urls if url not in seen_urls]
-                for url in new_urls:
-                    seen_urls.add(url)
-                    all_urls.append(url)
+                new_urls = take_new(day_urls)
+                total_urls += len(new_urls)
 
                 self.logger.info(
                     f"Day {day_offset + 1}/{total_days}: Found {len(day_urls)} articles "
-                    f"({len(new_urls)} new) for {day_str}"
+                    f"({len(new_urls)} new) and {len(day_google_urls)} items to resolve "
+                    f"({new_google_urls} new) for {day_str}"
                 )
+                if new_urls:
+                    yield new_urls
+        finally:
+            # Closing the generator early must not wait for the days still queued
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if self._crawl_stop.is_set():
+            self.logger.info("Daily sliding window stopped before resolution")
+            return
 
-            except Exception as e:
-                self.logger.warning(
-                    f"Day {day_offset + 1}/{total_days}: Failed to crawl {day_str}: {e}"
-                )
-                continue
+        if pending_google_urls:
+            self.logger.info(
+                f"Resolving {len(pending_google_urls)} Google News items for the whole window "
+                f"({duplicate_items} cross-day duplicates skipped)"
+            )
+            # Keep the aggregate browser budget of one resolution pass per day
+            max_urls = self.settings.MAX_URLS_TO_PROCESS * total_days
+            for batch in self.iter_resolved_google_news_urls(pending_google_urls, max_urls=max_urls):
+                new_urls = take_new(batch)
+                total_urls += len(new_urls)
+                if new_urls:
+                    yield new_urls
 
         self.logger.info(
-            f"Daily sliding window complete: {len(all_urls)} unique URLs "
+            f"Daily sliding window complete: {total_urls} unique URLs "
             f"from {total_days} days"
         )
 
-        return all_urls
-
     def crawl_category_sync(
         self,
         category: Any,
@@ -1366,10 +2070,16 @@ class SyncCrawlerEngine:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         max_results: Optional[int] = None,
-        period: Optional[str] = None
+        period: Optional[str] = None,
+        search_results: Optional[List[Dict[str, Any]]] = None,
+        incremental: bool = False
     ) -> List[Dict[str, Any]]:
         """Crawl articles for a category using sync operations.
 
+        Search, resolution, extraction and saving run as a streaming pipeline:
+        resolved URLs are extracted while later batches are still resolving,
+        and articles are saved in micro-batches as they arrive.
+
         Args:
             category: Category model instance with keywords
             job_id: Optional job ID for tracking
@@ -1377,6 +2087,8 @@ class SyncCrawlerEngine:
             end_date: Optional end date for filtering articles
             max_results: Optional maximum number of articles to crawl (uses settings default if None)
             period: Optional time period for scheduled crawls (e.g., '1h', '7d', '1m')
+            search_results: Optional prefetched search items (coalesced scheduler searches); skips the search
+            incremental: Only process items newer than the category's high-water mark (scheduled crawls)
 
         Returns:
             List of extracted article data
@@ -1396,122 +2108,208 @@ class SyncCrawlerEngine:
             else:
                 self.logger.info(f"Using default max_results from settings: {effective_max_results}")
 
-            # Use category-specific language and country, fallback to defaults
-            language = getattr(category, 'language', 'vi')
-            country = getattr(category, 'country', 'VN')
-
-            self.logger.info(f"Searching with language='{language}', country='{country}' for category: {category.name}")
+            self._watermark = None
+            self._crawl_category_id = str(category.id)
+            self._crawl_stop = threading.Event()
+            self._result_item_ids = {}
+            if incremental and not (start_date or end_date):
+                self._begin_incremental_crawl(category)
 
-            # Get resolved article URLs (not Google News URLs)
-            # Use period from category if available and no dates provided (for scheduled jobs)
-            # Use dates for on-demand jobs
-            crawl_period = period or getattr(category, 'crawl_period', None)
-
-            # Decision: Use daily sliding window if BOTH start_date AND end_date are provided
-            # This avoids GNews 7-day chunking behavior for date range crawls
-            if start_date and end_date:
-                self.logger.info(
-                    f"Using daily sliding window for date range: {start_date.strftime('%Y-%m-%d')} "
-                    f"to {end_date.strftime('%Y-%m-%d')}"
-                )
-                article_urls = self.crawl_with_daily_sliding_window(
-                    keywords=category.keywords,
-                    exclude_keywords=category.exclude_keywords or [],
-                    start_date=start_date,
-                    end_date=end_date,
-                    max_results_total=effective_max_results,
-                    language=language,
-                    country=country
-                )
+            if search_results is not None:
+                url_batches = self.iter_search_results(search_results)
             else:
-                # Use normal search (with period or single date)
-                article_urls = self.search_google_news(
-                    keywords=category.keywords,
-                    exclude_keywords=category.exclude_keywords or [],
-                    max_results=effective_max_results,
-                    language=language,
-                    country=country,
-                    start_date=start_date,
-                    end_date=end_date,
-                    period=crawl_period if not (start_date or end_date) else None  # Only use period if no dates
+                url_batches = self._iter_category_url_batches(
+                    category, start_date, end_date, effective_max_results, period
                 )
 
-            if not article_urls:
-                self.logger.warning(f"No resolved article URLs found for category: {category.name}")
-                return {
-                    'articles_found': 0,
-                    'articles_saved': 0,
-                    'extracted_articles': []
-                }
+            # Articles stored by earlier crawls are refreshed without downloading them again
+            known_articles = []
+            if self.settings.KNOWN_URL_PREFILTER_ENABLED:
+                url_batches = self._skip_known_articles(url_batches, category, known_articles)
 
-            # Step 2: Extract articles using threading
+            # Steps 2-3: Extract and save while URLs are still being resolved
             threads = getattr(self.settings, 'EXTRACTION_THREADS', 5)
-            extracted_articles = self.extract_articles_with_threading(
-                urls=article_urls,
-                threads=threads
+            pipeline = StreamingCrawlPipeline(
+                extract=lambda urls: self.extract_articles_with_threading(urls=urls, threads=threads),
+                save=lambda articles: self._save_category_articles(articles, category, job_id),
+                config=PipelineConfig.from_settings(self.settings, time_budget=self._pipeline_time_budget()),
+                logger=self.logger
             )
+            result = pipeline.run(url_batches, stop=self._crawl_stop)
 
-            # Step 3: Save articles to database
-            if extracted_articles:
-                from src.database.repositories.sync_article_repo import SyncArticleRepository
-                from src.core.crawler.keyword_matcher import enhance_articles_with_matched_keywords
+            if not result.partial:
+                unprocessed_ids = self._unprocessed_item_ids(result.extracted_articles, known_articles)
+                self.commit_feed_cache(unprocessed_ids)
+                self.commit_watermark(unprocessed_ids)
 
-                # Step 3a: Enhance with keyword matching
-                enhanced_articles = enhance_articles_with_matched_keywords(
-                    extracted_articles,
-                    category.keywords or []
-                )
+            if not result.urls_received:
+                self.logger.warning(f"No resolved article URLs found for category: {category.name}")
+            elif not result.articles_extracted and not known_articles:
+                self.logger.warning(f"No articles extracted for category: {category.name}")
+            else:
+                self.logger.info(f"Crawled {result.articles_extracted} articles, saved {result.articles_saved} to database for category: {category.name}")
+
+            # Return results with saved count information
+            return {
+                'articles_found': result.articles_extracted,
+                'articles_saved': result.articles_saved,
+                'articles_known': len(known_articles),
+                'extracted_articles': result.extracted_articles,
+                'partial': result.partial
+            }
 
-                # Step 3b: Add relevance scoring (Binary: 50% title + 50% content)
-                scored_articles = []
-                for article in enhanced_articles:
-                    keywords = category.keywords or []
-                    matched = article.get('keywords_matched', [])
+        except Exception as e:
+            error_msg = f"Failed to crawl category {category.name}: {str(e)}"
+            self.logger.error(error_msg)
+            raise CrawlerError(error_msg) from e
 
-                    if not keywords or not matched:
-                        article['relevance_score'] = 0.0
-                        scored_articles.append(article)
-                        continue
+    def _skip_known_articles(
+        self,
+        url_batches: Iterator[List[str]],
+        category: Any,
+        known_articles: List[str]
+    ) -> Iterator[List[str]]:
+        """Pass on only URLs not stored yet; stored ones are touched and linked to the category.
+
+        Known URLs are appended to known_articles. With the known-URL index,
+        only URLs the Bloom filter reports as possibly stored are looked up
+        in Postgres; the rest go straight to extraction. If the lookup fails
+        the whole batch goes on to extraction, as before.
+        """
+        from src.database.repositories.sync_article_repo import SyncArticleRepository
+
+        article_repo = SyncArticleRepository()
+        index = self._get_known_url_index()
+        # New links to stored articles are scored for this category, like newly saved articles
+        def score_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            return self._score_articles(articles, category.keywords or [])
+
+        for batch in url_batches:
+            candidates = batch
+            try:
+                if index is not None:
+                    candidates = index.filter_possibly_known(batch)
+                known = article_repo.touch_known_articles(
+                    candidates, category.id, score_articles=score_articles
+                ) if candidates else set()
+            except Exception as e:
+                self.logger.warning(f"Known-URL prefilter failed, extracting the whole batch: {e}")
+                known = set()
+            if index is not None:
+                index.record_confirmed(len(candidates), len(known))
+
+            if known:
+                known_articles.extend(url for url in batch if url in known)
+                self.logger.info(f"Skipped extraction of {len(known)}/{len(batch)} already stored articles")
+            unknown = [url for url in batch if url not in known]
+            if unknown:
+                yield unknown
+
+    def _iter_category_url_batches(
+        self,
+        category: Any,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        max_results: int,
+        period: Optional[str]
+    ) -> Iterator[List[str]]:
+        """Yield batches of resolved article URLs for a category crawl."""
+        # Use category-specific language and country, fallback to defaults
+        language = getattr(category, 'language', 'vi')
+        country = getattr(category, 'country', 'VN')
+
+        self.logger.info(f"Searching with language='{language}', country='{country}' for category: {category.name}")
+
+        # Get resolved article URLs (not Google News URLs)
+        # Use period from category if available and no dates provided (for scheduled jobs)
+        # Use dates for on-demand jobs
+        crawl_period = period or getattr(category, 'crawl_period', None)
+
+        # Decision: Use daily sliding window if BOTH start_date AND end_date are provided
+        # This avoids GNews 7-day chunking behavior for date range crawls
+        if start_date and end_date:
+            self.logger.info(
+                f"Using daily sliding window for date range: {start_date.strftime('%Y-%m-%d')} "
+                f"to {end_date.strftime('%Y-%m-%d')}"
+            )
+            yield from self.iter_daily_sliding_window(
+                keywords=category.keywords,
+                exclude_keywords=category.exclude_keywords or [],
+                start_date=start_date,
+                end_date=end_date,
+                max_results_total=max_results,
+                language=language,
+                country=country
+            )
+        else:
+            # Use normal search (with period or single date)
+            yield from self.iter_search_google_news(
+                keywords=category.keywords,
+                exclude_keywords=category.exclude_keywords or [],
+                max_results=max_results,
+                language=language,
+                country=country,
+                start_date=start_date,
+                end_date=end_date,
+                period=crawl_period if not (start_date or end_date) else None  # Only use period if no dates
+            )
 
-                    # Get title and content
-                    title = (article.get('title', '') or '').lower()
-                    content = (article.get('content', '') or '').lower()
+    def _pipeline_time_budget(self) -> Optional[float]:
+        """Seconds the crawl pipeline may run before saving what it has and stopping.
 
-                    # Check if ANY keyword appears in title or content
-                    has_title_match = any(kw.lower() in title for kw in matched)
-                    has_content_match = any(kw.lower() in content for kw in matched)
+        Stops 30s ahead of Celery's soft time limit (one minute before the hard one).
+        """
+        job_timeout = getattr(self.settings, 'JOB_EXECUTION_TIMEOUT', None)
+        if not isinstance(job_timeout, (int, float)) or job_timeout <= 120:
+            return None
+        return job_timeout - 90
+
+    def _score_articles(self, articles: List[Dict[str, Any]], keywords: List[str]) -> List[Dict[str, Any]]:
+        """Attach matched keywords and a relevance score to extracted articles."""
+        from src.core.crawler.keyword_matcher import enhance_articles_with_matched_keywords
+
+        # Enhance with keyword matching
+        enhanced_articles = enhance_articles_with_matched_keywords(articles, keywords)
+
+        # Add relevance scoring (Binary: 50% title + 50% content)
+        scored_articles = []
+        for article in enhanced_articles:
+            matched = article.get('keywords_matched', [])
+
+            if not keywords or not matched:
+                article['relevance_score'] = 0.0
+                scored_articles.append(article)
+                continue
 
-                    # Binary scoring: 50% if matched in title, 50% if matched in content
-                    title_score = 0.5 if has_title_match else 0.0
-                    content_score = 0.5 if has_content_match else 0.0
+            # Get title and content
+            title = (article.get('title', '') or '').lower()
+            content = (article.get('content', '') or '').lower()
 
-                    relevance = title_score + content_score
-                    article['relevance_score'] = relevance
-                    scored_articles.append(article)
+            # Check if ANY keyword appears in title or content
+            has_title_match = any(kw.lower() in title for kw in matched)
+            has_content_match = any(kw.lower() in content for kw in matched)
 
-                # Step 3c: Save enhanced articles
-                article_repo = SyncArticleRepository()
-                saved_count = article_repo.save_articles_with_deduplication(
-                    scored_articles, category.id, job_id
-                )
+            # Binary scoring: 50% if matched in title, 50% if matched in content
+            title_score = 0.5 if has_title_match else 0.0
+            content_score = 0.5 if has_content_match else 0.0
 
-                self.logger.info(f"Crawled {len(extracted_articles)} articles, saved {saved_count} to database for category: {category.name}")
+            article['relevance_score'] = title_score + content_score
+            scored_articles.append(article)
 
-                # Return results with saved count information
-                return {
-                    'articles_found': len(extracted_articles),
-                    'articles_saved': saved_count,
-                    'extracted_articles': extracted_articles
-                }
-            else:
-                self.logger.warning(f"No articles extracted for category: {category.name}")
-                return {
-                    'articles_found': 0,
-                    'articles_saved': 0,
-                    'extracted_articles': []
-                }
+        return scored_articles
 
-        except Exception as e:
-            error_msg = f"Failed to crawl category {category.name}: {str(e)}"
-            self.logger.error(error_msg)
-            raise CrawlerError(error_msg) from e
\ No newline at end of file
+    def _save_category_articles(self, articles: List[Dict[str, Any]], category: Any, job_id: Optional[str]) -> int:
+        """Score and save one micro-batch of extracted articles for a category."""
+        from src.database.repositories.sync_article_repo import SyncArticleRepository
+
+        scored_articles = self._score_articles(articles, category.keywords or [])
+        article_repo = SyncArticleRepository()
+        stored_urls: List[str] = []
+        saved = article_repo.save_articles_with_deduplication(
+            scored_articles, category.id, job_id, stored_urls=stored_urls
+        )
+
+        index = self._get_known_url_index()
+        if index is not None:
+            index.add_urls(stored_urls)
+        return saved
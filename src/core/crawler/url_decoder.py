@@ -0,0 +1,236 @@
+"""Offline decoder for Google News article URLs.
+
+Google News links (``news.google.com/rss/articles/<id>``, ``/articles/<id>``,
+``/read/<id>``) carry a base64url encoded protobuf message as the article ID.
+Depending on the generation of the ID the publisher URL is embedded in it:
+
+- Legacy IDs (``CBMi...``): field 1 is ``19`` and field 4 holds the publisher
+  URL, optionally followed by field 26 holding the AMP URL. These can be
+  decoded without any network call.
+- Opaque IDs (``CAIi...``): field 4 holds a binary identifier only.
+- Current IDs (``CBMi...AU_yqL...``): field 4 holds a signed token that can
+  only be exchanged for the URL through Google's servers.
+
+Only the first kind is decoded here; everything else is reported as
+undecodable so callers can fall back to network based resolution.
+
+Example:
+    ```python
+    from src.core.crawler.url_decoder import decode_google_news_url
+
+    url = decode_google_news_url(
+        "https://news.google.com/rss/articles/CBMiWWh0dHBzOi8v...?oc=5"
+    )
+    if url is None:
+        ...  # fall back to browser resolution
+    ```
+"""
+
+import base64
+import binascii
+import re
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+# Path segments that precede the article ID in Google News URLs
+_ARTICLE_PATH_RE = re.compile(r'/(?:rss/)?(?:articles|read)/(?P<article_id>[A-Za-z0-9_-]+)')
+
+# Fallback for IDs whose protobuf length prefixes do not add up
+_LEGACY_URL_RE = re.compile(rb'^\x08\x13".+?(?P<primary_url>http[^\xd2]+)(?:\xd2\x01|$)', re.DOTALL)
+
+# Prefix of the signed tokens used by current-generation IDs
+_SIGNED_TOKEN_PREFIX = b'AU_yqL'
+
+_PRIMARY_URL_FIELD = 4
+_AMP_URL_FIELD = 26
+_LEGACY_ID_TYPE = 19
+
+_GOOGLE_HOST_SUFFIXES = ('google.com', 'googleusercontent.com', 'gstatic.com')
+
+
+def extract_article_id(url: str) -> Optional[str]:
+    """Extract the Google News article ID from a Google News URL.
+
+    Handles RSS, web and relative (``./articles/...``) links as well as
+    links wrapped in a ``consent.google.com`` redirect.
+
+    Args:
+        url: Google News URL
+
+    Returns:
+        The base64url article ID, or None if the URL is not a Google News article link
+    """
+    if not url:
+        return None
+
+    parsed = urlparse(url)
+    if parsed.netloc.endswith('consent.google.com'):
+        continue_url = parse_qs(parsed.query).get('continue')
+        if not continue_url:
+            return None
+        parsed = urlparse(unquote(continue_url[0]))
+
+    if parsed.netloc and parsed.netloc != 'news.google.com':
+        return None
+
+    match = _ARTICLE_PATH_RE.search(parsed.path)
+    if not match:
+        return None
+    return match.group('article_id')
+
+
+def _b64decode(article_id: str) -> Optional[bytes]:
+    try:
+        return base64.urlsafe_b64decode(article_id + '=' * (-len(article_id) % 4))
+    except (binascii.Error, ValueError):
+        return None
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read a protobuf varint, returning (value, new_position)."""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise ValueError("Truncated varint")
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def _parse_fields(data: bytes) -> List[Tuple[int, object]]:
+    """Parse the top-level fields of a protobuf message.
+
+    Only varint and length-delimited wire types occur in Google News IDs;
+    anything else is treated as malformed input.
+    """
+    fields = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 2:
+            length, pos = _read_varint(data, pos)
+            if pos + length > len(data):
+                raise ValueError("Truncated length-delimited field")
+            value = data[pos:pos + length]
+            pos += length
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}")
+        fields.append((field_number, value))
+    return fields
+
+
+def is_publisher_url(url: str) -> bool:
+    """Check whether a URL points at a publisher rather than at Google.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        True for http(s) URLs on a non-Google host
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or '.' not in parsed.netloc:
+        return False
+
+    host = parsed.netloc.lower().split(':')[0]
+    return not any(host == suffix or host.endswith('.' + suffix) for suffix in _GOOGLE_HOST_SUFFIXES)
+
+
+def _clean_url(raw: bytes) -> Optional[str]:
+    """Decode and validate a publisher URL candidate."""
+    try:
+        url = raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+
+    if any(ch.isspace() or ord(ch) < 32 for ch in url):
+        return None
+
+    return url if is_publisher_url(url) else None
+
+
+def decode_article_id(article_id: str, prefer_amp: bool = False) -> Optional[str]:
+    """Decode a Google News article ID into the publisher URL without network access.
+
+    Args:
+        article_id: base64url encoded article ID
+        prefer_amp: Return the AMP URL instead of the canonical one when both are present
+
+    Returns:
+        Publisher URL, or None if the ID does not embed a URL
+    """
+    data = _b64decode(article_id)
+    if not data:
+        return None
+
+    try:
+        fields = _parse_fields(data)
+    except ValueError:
+        fields = None
+
+    if fields is not None:
+        values = dict(fields)
+        if values.get(1) != _LEGACY_ID_TYPE:
+            return None
+
+        primary = values.get(_PRIMARY_URL_FIELD)
+        amp = values.get(_AMP_URL_FIELD)
+        if not isinstance(primary, bytes) or primary.startswith(_SIGNED_TOKEN_PREFIX):
+            return None
+
+        candidates = [amp, primary] if prefer_amp else [primary, amp]
+        for candidate in candidates:
+            if isinstance(candidate, bytes):
+                url = _clean_url(candidate)
+                if url:
+                    return url
+        return None
+
+    # Malformed length prefixes: fall back to the historic newspaper4k pattern
+    match = _LEGACY_URL_RE.match(data)
+    if match:
+        return _clean_url(match.group('primary_url'))
+    return None
+
+
+def decode_google_news_url(url: str, prefer_amp: bool = False) -> Optional[str]:
+    """Decode a Google News article URL into the publisher URL without network access.
+
+    Args:
+        url: Google News article URL
+        prefer_amp: Return the AMP URL instead of the canonical one when both are present
+
+    Returns:
+        Publisher URL, or None if the URL has to be resolved over the network
+    """
+    article_id = extract_article_id(url)
+    if not article_id:
+        return None
+    return decode_article_id(article_id, prefer_amp=prefer_amp)
+
+
+def partition_decodable(urls: List[str]) -> Tuple[List[str], List[str]]:
+    """Split Google News URLs into offline-decoded publisher URLs and the rest.
+
+    Args:
+        urls: Google News URLs
+
+    Returns:
+        Tuple of (decoded publisher URLs, Google News URLs that still need resolution)
+    """
+    decoded = []
+    remaining = []
+    for url in urls:
+        publisher_url = decode_google_news_url(url)
+        if publisher_url:
+            decoded.append(publisher_url)
+        else:
+            remaining.append(url)
+    return decoded, remaining
@@ -0,0 +1,422 @@
+"""Probabilistic index of stored article URLs.
+
+The known-URL prefilter asks Postgres which resolved URLs are already
+stored, one ``url_hash IN (...)`` query per batch. On recurring schedules
+that query mostly answers "yes" for URLs the worker has seen many times, and
+the articles table keeps growing. This index is a Bloom filter over every
+stored ``Article.url_hash``:
+
+- a negative answer is definite (up to staleness, see below), so the URL
+  goes straight to extraction without a database round trip
+- a positive answer may be a false positive (``KNOWN_URL_INDEX_ERROR_RATE``),
+  so positives are confirmed against Postgres before an article is skipped
+
+The filter lives in Redis when available, so all workers share one copy and
+see each other's saves immediately. While Redis is failing every worker
+process keeps its own in-memory filter, and goes back to the shared one after
+REDIS_RETRY_INTERVAL; articles saved by other processes are missing from a
+memory filter until its next rebuild. A missed article is only extracted again and
+deduplicated on save, so staleness costs work, never correctness.
+
+The filter is built from Postgres at worker startup and rebuilt in the
+background every ``KNOWN_URL_INDEX_REBUILD_INTERVAL`` seconds, which also
+resizes it as the table grows. Until the first build finished the index is
+not ready and callers fall back to querying Postgres for every URL.
+
+Example:
+    ```python
+    from src.core.crawler.url_index import get_known_url_index
+
+    index = get_known_url_index(settings)
+    index.refresh()                           # build or rebuild if stale
+    if index.ready:
+        candidates = index.filter_possibly_known(urls)
+    index.add_urls(saved_urls)
+    ```
+"""
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+import redis
+
+from src.shared.redis_client import REDIS_RETRY_INTERVAL, RedisFailover, get_redis_client, is_redis_available
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "gns:known_urls:bloom"
+REDIS_META_KEY = "gns:known_urls:meta"
+REDIS_LOCK_KEY = "gns:known_urls:lock"
+
+# Longest a rebuild may hold the Redis build lock
+REBUILD_LOCK_TTL = 1800
+
+
+def url_hash(url: str) -> str:
+    """Hash of a URL as stored in ``Article.url_hash``."""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def bloom_parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """Bit count and hash count for a Bloom filter of the given capacity and error rate."""
+    capacity = max(1, capacity)
+    size = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    hashes = max(1, round(size / capacity * math.log(2)))
+    return size, hashes
+
+
+class BloomFilter:
+    """Bloom filter over SHA-256 hex digests.
+
+    The digests are already uniform, so bit positions are derived from them
+    by double hashing instead of hashing again.
+    """
+
+    def __init__(self, size: int, hashes: int, bits: Optional[bytearray] = None):
+        self.size = size
+        self.hashes = hashes
+        self.bits = bits if bits is not None else bytearray((size + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> "BloomFilter":
+        return cls(*bloom_parameters(capacity, error_rate))
+
+    def positions(self, digest: str) -> List[int]:
+        h1 = int(digest[:16], 16)
+        h2 = int(digest[16:32], 16) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, digest: str):
+        for position in self.positions(digest):
+            # Big-endian bit order within a byte, matching Redis SETBIT/GETBIT
+            self.bits[position >> 3] |= 0x80 >> (position & 7)
+
+    def __contains__(self, digest: str) -> bool:
+        return all(self.bits[position >> 3] & (0x80 >> (position & 7)) for position in self.positions(digest))
+
+
+@dataclass
+class BloomMeta:
+    """Shape and build time of a stored filter."""
+    size: int
+    hashes: int
+    built_at: float
+
+
+class MemoryBloomStore:
+    """Filter held in this worker process."""
+
+    name = "memory"
+
+    def __init__(self):
+        self.filter: Optional[BloomFilter] = None
+        self.meta: Optional[BloomMeta] = None
+
+    def get_meta(self) -> Optional[BloomMeta]:
+        return self.meta
+
+    def replace(self, bloom: BloomFilter):
+        self.filter = bloom
+        self.meta = BloomMeta(size=bloom.size, hashes=bloom.hashes, built_at=time.time())
+
+    def contains_many(self, shape: BloomFilter, digests: List[str]) -> List[bool]:
+        bloom = self.filter
+        if bloom is None:
+            # Not built yet: nothing can be ruled out
+            return [True] * len(digests)
+        return [digest in bloom for digest in digests]
+
+    def add_many(self, shape: BloomFilter, digests: List[str]):
+        bloom = self.filter
+        if bloom is None:
+            return
+        for digest in digests:
+            bloom.add(digest)
+
+    def try_lock(self) -> bool:
+        return True
+
+    def unlock(self):
+        pass
+
+
+class RedisBloomStore:
+    """Filter stored as one Redis bit string shared by all workers."""
+
+    name = "redis"
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+
+    def get_meta(self) -> Optional[BloomMeta]:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.exists(REDIS_KEY)
+        pipe.hgetall(REDIS_META_KEY)
+        exists, meta = pipe.execute()
+        if not exists or not meta:
+            return None
+        return BloomMeta(size=int(meta["size"]), hashes=int(meta["hashes"]), built_at=float(meta["built_at"]))
+
+    def replace(self, bloom: BloomFilter):
+        # Build under a staging key and swap it in, so readers never see a partial filter
+        staging = f"{REDIS_KEY}:staging"
+        self.client.set(staging, bytes(bloom.bits))
+        pipe = self.client.pipeline(transaction=True)
+        pipe.rename(staging, REDIS_KEY)
+        pipe.hset(REDIS_META_KEY, mapping={"size": bloom.size, "hashes": bloom.hashes, "built_at": time.time()})
+        pipe.execute()
+
+    def contains_many(self, shape: BloomFilter, digests: List[str]) -> List[bool]:
+        pipe = self.client.pipeline(transaction=False)
+        for digest in digests:
+            for position in shape.positions(digest):
+                pipe.getbit(REDIS_KEY, position)
+        bits = pipe.execute()
+        k = shape.hashes
+        return [all(bits[i * k:(i + 1) * k]) for i in range(len(digests))]
+
+    def add_many(self, shape: BloomFilter, digests: List[str]):
+        pipe = self.client.pipeline(transaction=False)
+        for digest in digests:
+            for position in shape.positions(digest):
+                pipe.setbit(REDIS_KEY, position, 1)
+        pipe.execute()
+
+    def try_lock(self) -> bool:
+        return bool(self.client.set(REDIS_LOCK_KEY, "1", nx=True, ex=REBUILD_LOCK_TTL))
+
+    def unlock(self):
+        self.client.delete(REDIS_LOCK_KEY)
+
+
+@dataclass
+class KnownUrlIndexStats:
+    """Counters for the known-URL index."""
+    lookups: int = 0
+    positives: int = 0
+    confirmed: int = 0
+    false_positives: int = 0
+    adds: int = 0
+    rebuilds: int = 0
+    errors: int = 0
+
+
+class KnownUrlIndex:
+    """Bloom filter of stored article URL hashes, shared through Redis when available.
+
+    ``store`` is the primary filter; a process-local memory filter stands in
+    for it while Redis is failing.
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        load_hashes: Callable[[], Iterable[str]],
+        count_hashes: Callable[[], int],
+        min_capacity: int = 1000000,
+        error_rate: float = 0.01,
+        rebuild_interval: float = 3600.0,
+        logger: Optional[logging.Logger] = None,
+        redis_retry_interval: float = REDIS_RETRY_INTERVAL
+    ):
+        self.store = store
+        self.fallback = MemoryBloomStore()
+        self.load_hashes = load_hashes
+        self.count_hashes = count_hashes
+        self.min_capacity = min_capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.failover = RedisFailover("Known-URL index", retry_interval=redis_retry_interval, logger=self.logger)
+        self.stats = KnownUrlIndexStats()
+        # Size and hash count of the stored filter; bit positions depend on both
+        self.shape = BloomFilter(*bloom_parameters(min_capacity, error_rate), bits=bytearray())
+        self._ready = False
+        self._rebuilding = False
+        self._lock = threading.Lock()
+        self._active = store
+
+    @property
+    def backend(self) -> str:
+        return self._current_store().name
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def _current_store(self) -> Any:
+        """The primary store, or the memory filter while Redis is failing.
+
+        Switching stores leaves the index unready until ``refresh`` finds or
+        builds the new store's filter.
+        """
+        store = self.store if self.failover.up else self.fallback
+        if store is not self._active:
+            with self._lock:
+                if store is not self._active:
+                    self._active = store
+                    self._ready = False
+        return store
+
+    def _fall_back(self, error: Exception):
+        """Use the process-local filter until Redis is tried again."""
+        self.failover.mark_down(error)
+        self._current_store()
+
+    def refresh(self, wait: bool = False):
+        """Build the filter if missing, or rebuild it in the background if stale.
+
+        Args:
+            wait: Build in the calling thread (worker startup) instead of a background thread
+        """
+        store = self._current_store()
+        try:
+            meta = store.get_meta()
+        except redis.RedisError as e:
+            self._fall_back(e)
+            meta = None
+
+        if meta is not None:
+            self.shape = BloomFilter(meta.size, meta.hashes, bits=bytearray())
+            self._ready = True
+            if time.time() - meta.built_at < self.rebuild_interval:
+                return
+
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+
+        if wait:
+            self._rebuild()
+        else:
+            threading.Thread(target=self._rebuild, name="known-url-index-rebuild", daemon=True).start()
+
+    def _rebuild(self):
+        store = self._current_store()
+        try:
+            if not store.try_lock():
+                # Another worker is rebuilding the shared filter
+                return
+            try:
+                start = time.monotonic()
+                # Headroom so the filter stays near its error rate until the next rebuild
+                capacity = max(self.min_capacity, int(self.count_hashes() * 1.5))
+                bloom = BloomFilter.for_capacity(capacity, self.error_rate)
+                count = 0
+                for digest in self.load_hashes():
+                    bloom.add(digest)
+                    count += 1
+                store.replace(bloom)
+                # The index may have switched stores while this one was building
+                if store is self._active:
+                    self.shape = BloomFilter(bloom.size, bloom.hashes, bits=bytearray())
+                    self._ready = True
+                self.stats.rebuilds += 1
+                self.logger.info(
+                    f"Built known-URL index ({store.name}) with {count} URLs, "
+                    f"{bloom.size // 8 // 1024} KiB, in {time.monotonic() - start:.1f}s"
+                )
+            finally:
+                store.unlock()
+        except redis.RedisError as e:
+            self._fall_back(e)
+        except Exception as e:
+            self.stats.errors += 1
+            self.logger.warning(f"Failed to build known-URL index: {e}")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    def filter_possibly_known(self, urls: List[str]) -> List[str]:
+        """URLs the filter reports as possibly stored; all others are definitely new.
+
+        Every URL is reported while the filter is not ready, e.g. after a
+        Redis error switched to a memory filter that is still being built.
+        """
+        if not urls:
+            return []
+        store = self._current_store()
+        if not self._ready:
+            return list(urls)
+        try:
+            hits = store.contains_many(self.shape, [url_hash(url) for url in urls])
+        except redis.RedisError as e:
+            self._fall_back(e)
+            return list(urls)
+
+        positives = [url for url, hit in zip(urls, hits) if hit]
+        with self._lock:
+            self.stats.lookups += len(urls)
+            self.stats.positives += len(positives)
+        return positives
+
+    def record_confirmed(self, positives: int, confirmed: int):
+        """Record how many positives Postgres confirmed as stored."""
+        with self._lock:
+            self.stats.confirmed += confirmed
+            self.stats.false_positives += positives - confirmed
+
+    def add_urls(self, urls: Iterable[str]):
+        """Add saved article URLs to the filter."""
+        digests = [url_hash(url) for url in urls if url]
+        store = self._current_store()
+        if not digests or not self._ready:
+            return
+        try:
+            store.add_many(self.shape, digests)
+        except redis.RedisError as e:
+            self._fall_back(e)
+            return
+        with self._lock:
+            self.stats.adds += len(digests)
+
+    def get_stats(self) -> dict:
+        """Get index statistics for monitoring."""
+        stats = asdict(self.stats)
+        positives = stats["confirmed"] + stats["false_positives"]
+        return {
+            "backend": self.backend,
+            "ready": self._ready,
+            "size_bits": self.shape.size,
+            "hashes": self.shape.hashes,
+            **stats,
+            "errors": stats["errors"] + self.failover.errors,
+            "false_positive_rate": stats["false_positives"] / positives if positives else 0.0,
+        }
+
+
+# Global known-URL index instance
+_known_url_index: Optional[KnownUrlIndex] = None
+_known_url_index_lock = threading.Lock()
+
+
+def get_known_url_index(settings: Any, logger: Optional[logging.Logger] = None) -> KnownUrlIndex:
+    """Get the global known-URL index instance (not built until ``refresh`` is called)."""
+    global _known_url_index
+
+    with _known_url_index_lock:
+        if _known_url_index is None:
+            from src.database.repositories.sync_article_repo import SyncArticleRepository
+
+            client = get_redis_client(settings)
+            repo = SyncArticleRepository()
+            _known_url_index = KnownUrlIndex(
+                store=RedisBloomStore(client),
+                load_hashes=repo.iter_url_hashes,
+                count_hashes=lambda: repo.count() or 0,
+                min_capacity=settings.KNOWN_URL_INDEX_CAPACITY,
+                error_rate=settings.KNOWN_URL_INDEX_ERROR_RATE,
+                rebuild_interval=settings.KNOWN_URL_INDEX_REBUILD_INTERVAL,
+                logger=logger
+            )
+            # Start on the memory filter if Redis is down; it is tried again after the retry interval
+            if not is_redis_available(client):
+                _known_url_index.failover.mark_down()
+
+        return _known_url_index
@@ -1,7 +1,7 @@
 import logging
 import asyncio
 from celery import Celery
-from celery.signals import worker_init, worker_shutdown
+from celery.signals import worker_init, worker_shutdown, worker_process_init, worker_process_shutdown
 from kombu import Queue
 from kombu.serialization import register
 
@@ -73,6 +73,34 @@ def shutdown_worker(**kwargs):
         # No event loop to close
         pass
 
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Load the known-URL index before this worker process takes crawl jobs."""
+    if not settings.KNOWN_URL_INDEX_ENABLED:
+        return
+    try:
+        from src.core.crawler.url_index import get_known_url_index
+        get_known_url_index(settings, logger).refresh(wait=True)
+    except Exception as e:
+        logger.warning(f"Failed to load known-URL index: {e}")
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """Close the warm resolver browsers and parse processes owned by this worker process."""
+    try:
+        from src.core.crawler.browser_pool import shutdown_browser_pool
+        shutdown_browser_pool()
+    except Exception as e:
+        logger.warning(f"Failed to shut down browser pool: {e}")
+    try:
+        from src.core.crawler.parse_executor import shutdown_parse_executor
+        shutdown_parse_executor()
+    except Exception as e:
+        logger.warning(f"Failed to shut down parse executor: {e}")
+
+
 celery_app = Celery(
     "google_news_scraper",
     broker=settings.CELERY_BROKER_URL,
@@ -112,6 +140,7 @@ celery_app.conf.update(
         "src.core.scheduler.tasks.cleanup_old_jobs_task": {"queue": "maintenance_queue"},
         "src.core.scheduler.tasks.monitor_job_health_task": {"queue": "maintenance_queue"},
         "src.core.scheduler.tasks.scan_scheduled_categories_task": {"queue": "maintenance_queue"},
+        "src.core.scheduler.tasks.coalesced_search_task": {"queue": "crawl_queue"},
     },
     
     # Default queue settings
@@ -161,6 +190,11 @@ celery_app.conf.update(
         'src.core.scheduler.tasks.cleanup_old_jobs_task': {
             'rate_limit': '1/h',    # Max 1 cleanup task per hour
         },
+        'src.core.scheduler.tasks.coalesced_search_task': {
+            # Past the search timeout the crawls start anyway and search on their own
+            'soft_time_limit': settings.SCHEDULER_COALESCED_SEARCH_TIMEOUT + 30,
+            'time_limit': settings.SCHEDULER_COALESCED_SEARCH_TIMEOUT + 90,
+        },
     },
 )
 
@@ -28,8 +28,9 @@ Example:
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from celery import current_task
@@ -59,7 +60,7 @@ logger = get_task_logger(__name__)
 
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=300)
-def crawl_category_task(self, category_id: str, job_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None, max_results: Optional[int] = None) -> Dict[str, Any]:
+def crawl_category_task(self, category_id: str, job_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None, max_results: Optional[int] = None, search_results: Optional[List[Dict[str, Any]]] = None, incremental: bool = False, search_results_key: Optional[str] = None) -> Dict[str, Any]:
     """Execute crawl for specific category with comprehensive error handling.
 
     This is the main background task for crawling articles from a category.
@@ -71,6 +72,9 @@ def crawl_category_task(self, category_id: str, job_id: str, start_date: Optiona
         start_date: Optional start date for filtering (ISO format string)
         end_date: Optional end date for filtering (ISO format string)
         max_results: Optional maximum number of articles to crawl (uses settings default if None)
+        search_results: Optional search items prefetched by a coalesced scheduler search
+        incremental: Only process items newer than the category's last scheduled run
+        search_results_key: Key of the items a coalesced search stored for this crawl
 
     Returns:
         Dictionary containing execution results and metrics
@@ -90,12 +94,32 @@ def crawl_category_task(self, category_id: str, job_id: str, start_date: Optiona
         "retry_count": self.request.retries
     })
 
+    if search_results is None and search_results_key:
+        search_results = _load_coalesced_results(search_results_key, settings, correlation_id)
+
     # Use sync operations - no more async/await conflicts!
     return _sync_crawl_category_task(
-        self, category_id, job_id, correlation_id, settings, start_date, end_date, max_results
+        self, category_id, job_id, correlation_id, settings, start_date, end_date, max_results, search_results, incremental
     )
 
 
+def _load_coalesced_results(key: str, settings, correlation_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Get the items a coalesced search stored for a crawl, or None to search on its own."""
+    from src.core.crawler.search_coalescer import get_coalesced_results
+
+    try:
+        items = get_coalesced_results(settings, logger).get(key)
+    except Exception as e:
+        logger.warning(f"Coalesced search results unavailable: {e}", extra={"correlation_id": correlation_id})
+        return None
+    if items is None:
+        logger.warning(
+            f"Coalesced search results {key} expired or lost, searching on our own",
+            extra={"correlation_id": correlation_id}
+        )
+    return items
+
+
 def _sync_crawl_category_task(
     task_instance,
     category_id: str,
@@ -104,7 +128,9 @@ def _sync_crawl_category_task(
     settings,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    max_results: Optional[int] = None
+    max_results: Optional[int] = None,
+    search_results: Optional[List[Dict[str, Any]]] = None,
+    incremental: bool = False
 ) -> Dict[str, Any]:
     """Sync implementation of the category crawl task.
 
@@ -120,6 +146,8 @@ def _sync_crawl_category_task(
         start_date: Optional start date for filtering (ISO format string)
         end_date: Optional end date for filtering (ISO format string)
         max_results: Optional maximum number of articles to crawl
+        search_results: Optional prefetched search items; the crawl skips its own search
+        incremental: Only process items newer than the category's high-water mark
 
     Returns:
         Task execution results
@@ -196,7 +224,8 @@ def _sync_crawl_category_task(
 
         # Execute crawl using sync operations with date filtering and max results
         crawl_result = sync_crawler.crawl_category_sync(
-            category, job_id, start_date_obj, end_date_obj, max_results
+            category, job_id, start_date_obj, end_date_obj, max_results,
+            search_results=search_results, incremental=incremental
         )
 
         # Handle both old list format and new dict format for backward compatibility
@@ -1179,6 +1208,11 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
     # Find categories due for scheduled crawl
     due_categories = category_repo.get_due_scheduled_categories(current_time)
 
+    # Categories sharing language/country/period search once, in a coalesced search task
+    groups, coalescing = _plan_coalesced_searches(due_categories, get_settings(), correlation_id)
+    group_of = {str(category.id): index for index, group in enumerate(groups) for category in group}
+    group_jobs: List[Dict[str, str]] = [{} for _ in groups]
+
     triggered_jobs = []
     errors = []
 
@@ -1198,13 +1232,7 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
                 job_type=JobType.SCHEDULED
             )
 
-            # Trigger crawl task
-            crawl_result = crawl_category_task.delay(
-                category_id=str(category.id),
-                job_id=str(job.id)
-            )
-
-            # Update category schedule timing
+            # Update category schedule timing before anything slow, so the next scan cannot fire this run again
             next_run = current_time + timedelta(minutes=category.schedule_interval_minutes)
             category_repo.update_schedule_timing(
                 category_id=category.id,
@@ -1212,11 +1240,19 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
                 next_run=next_run
             )
 
+            # Trigger crawl task, or leave it to the group's coalesced search task
+            group = group_of.get(str(category.id))
+            if group is not None:
+                group_jobs[group][str(category.id)] = str(job.id)
+                celery_task_id = None
+            else:
+                celery_task_id = _start_scheduled_crawls({str(category.id): str(job.id)})[str(category.id)]
+
             triggered_jobs.append({
                 "category_id": str(category.id),
                 "category_name": category.name,
                 "job_id": str(job.id),
-                "celery_task_id": crawl_result.id,
+                "celery_task_id": celery_task_id,
                 "next_run": next_run.isoformat()
             })
 
@@ -1239,6 +1275,23 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
                 "error": str(e)
             })
 
+    task_ids = {}
+    for jobs in group_jobs:
+        if not jobs:
+            continue
+        try:
+            search_task = coalesced_search_task.delay(jobs=jobs)
+            task_ids.update({category_id: search_task.id for category_id in jobs})
+        except Exception as e:
+            logger.warning(
+                f"Could not start coalesced search, {len(jobs)} categories will search on their own: {e}",
+                extra={"correlation_id": correlation_id}
+            )
+            task_ids.update(_start_scheduled_crawls(jobs))
+    for triggered in triggered_jobs:
+        if triggered["category_id"] in task_ids:
+            triggered["celery_task_id"] = task_ids[triggered["category_id"]]
+
     result = {
         "status": "completed",
         "correlation_id": correlation_id,
@@ -1247,7 +1300,8 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
         "jobs_triggered": len(triggered_jobs),
         "errors": len(errors),
         "triggered_jobs": triggered_jobs,
-        "error_details": errors
+        "error_details": errors,
+        "search_coalescing": coalescing
     }
 
     logger.info("Scheduled categories scan completed", extra=result)
@@ -1255,11 +1309,185 @@ def scan_scheduled_categories_task(self) -> Dict[str, Any]:
     return result
 
 
+@celery_app.task(bind=True, max_retries=0)
+def coalesced_search_task(self, jobs: Dict[str, str]) -> Dict[str, Any]:
+    """Search once for a group of scheduled categories, then start their crawl tasks.
+
+    Runs on the crawl queue so the scanner never waits on Google News. The
+    search gets SCHEDULER_COALESCED_SEARCH_TIMEOUT seconds; categories it
+    did not cover by then search on their own. Each category's items are
+    stored under its job ID and only that key goes through the broker.
+
+    Args:
+        jobs: Crawl job ID by category ID, both as strings, created by the scanner
+
+    Returns:
+        Dictionary with the started crawl tasks and coalescing counters
+    """
+    from src.database.repositories.sync_category_repo import SyncCategoryRepository
+    from src.core.crawler.search_coalescer import get_coalesced_results
+
+    correlation_id = f"coalesced_search_{self.request.id}"
+    settings = get_settings()
+    stats = {"groups": 0, "categories": 0, "searches": 0, "searches_saved": 0}
+    search_results_keys = {}
+
+    try:
+        category_repo = SyncCategoryRepository()
+        categories = [
+            category for category in (category_repo.get_by_id(UUID(category_id)) for category_id in jobs)
+            if category is not None
+        ]
+        prefetched, stats = _coalesce_scheduled_searches(categories, settings, correlation_id)
+        results_store = get_coalesced_results(settings, logger)
+        for category_id, items in prefetched.items():
+            if category_id in jobs:
+                results_store.put(jobs[category_id], items)
+                search_results_keys[category_id] = jobs[category_id]
+    except Exception as e:
+        # Includes the soft time limit: the crawls still start and search on their own
+        logger.warning(
+            f"Coalesced search failed, {len(jobs) - len(search_results_keys)} categories will search on their own: {e}",
+            extra={"correlation_id": correlation_id}
+        )
+
+    task_ids = _start_scheduled_crawls(jobs, search_results_keys)
+    return {
+        "status": "completed",
+        "correlation_id": correlation_id,
+        "categories": len(jobs),
+        "prefetched": len(search_results_keys),
+        "crawl_tasks": task_ids,
+        "search_coalescing": stats
+    }
+
+
+def _start_scheduled_crawls(jobs: Dict[str, str], search_results_keys: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Start the incremental crawl task of each scheduled job.
+
+    Args:
+        jobs: Crawl job ID by category ID
+        search_results_keys: Key of the coalesced search items stored for some of the categories
+
+    Returns:
+        Celery task ID by category ID
+    """
+    task_ids = {}
+    for category_id, job_id in jobs.items():
+        # Scheduled runs only process what is new since the category's last run
+        task_kwargs = {"category_id": category_id, "job_id": job_id, "incremental": True}
+        if search_results_keys and category_id in search_results_keys:
+            task_kwargs["search_results_key"] = search_results_keys[category_id]
+        task_ids[category_id] = crawl_category_task.delay(**task_kwargs).id
+    return task_ids
+
+
+def _plan_coalesced_searches(
+    categories: List[Any],
+    settings,
+    correlation_id: str
+) -> Tuple[List[List[Any]], Dict[str, int]]:
+    """Group due categories whose searches can be shared, without searching.
+
+    Args:
+        categories: Categories due for a scheduled crawl
+        settings: Application settings
+        correlation_id: Correlation ID of the scan
+
+    Returns:
+        Tuple of (groups of categories searching together, planned coalescing counters)
+    """
+    stats = {"groups": 0, "categories": 0, "searches": 0, "searches_saved": 0}
+    if not (settings.SCHEDULER_COALESCE_SEARCHES and settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED):
+        return [], stats
+
+    from src.core.crawler.query_planner import QueryPlanner
+    from src.core.crawler.search_coalescer import group_categories
+
+    try:
+        searches = group_categories(categories, QueryPlanner.from_settings(settings))
+    except Exception as e:
+        logger.warning(f"Search coalescing unavailable: {e}", extra={"correlation_id": correlation_id})
+        return [], stats
+
+    for search in searches:
+        stats["groups"] += 1
+        stats["categories"] += len(search.categories)
+        stats["searches"] += len(search.shards)
+        stats["searches_saved"] += search.searches_saved
+    return [search.categories for search in searches], stats
+
+
+def _coalesce_scheduled_searches(
+    categories: List[Any],
+    settings,
+    correlation_id: str
+) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, int]]:
+    """Search once for groups of categories with the same language, country and period.
+
+    All searches together get SCHEDULER_COALESCED_SEARCH_TIMEOUT seconds.
+    Categories left out (alone in their group, or whose group search or one
+    of their shards failed or timed out) are not in the returned mapping and
+    search on their own as before.
+
+    Args:
+        categories: Categories of one coalesced search task
+        settings: Application settings
+        correlation_id: Correlation ID of the search task
+
+    Returns:
+        Tuple of (search items by category ID string, coalescing counters)
+    """
+    stats = {"groups": 0, "categories": 0, "searches": 0, "searches_saved": 0}
+    if not (settings.SCHEDULER_COALESCE_SEARCHES and settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED):
+        return {}, stats
+
+    from src.core.crawler.query_planner import QueryPlanner
+    from src.core.crawler.search_coalescer import group_categories
+    from src.core.crawler.sync_engine import SyncCrawlerEngine
+
+    deadline = time.monotonic() + settings.SCHEDULER_COALESCED_SEARCH_TIMEOUT
+    try:
+        searches = group_categories(categories, QueryPlanner.from_settings(settings))
+        if not searches:
+            return {}, stats
+        engine = SyncCrawlerEngine(settings=settings, logger=logger)
+    except Exception as e:
+        logger.warning(f"Search coalescing unavailable: {e}", extra={"correlation_id": correlation_id})
+        return {}, stats
+
+    prefetched = {}
+    for search in searches:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.warning(
+                f"Coalesced search timed out, {len(search.categories)} categories will search on their own",
+                extra={"correlation_id": correlation_id}
+            )
+            break
+        try:
+            results = engine.search_coalesced(search, settings.MAX_RESULTS_PER_SEARCH, timeout=remaining)
+        except Exception as e:
+            logger.warning(
+                f"Coalesced search failed, {len(search.categories)} categories will search on their own: {e}",
+                extra={"correlation_id": correlation_id}
+            )
+            continue
+        prefetched.update(results)
+        stats["groups"] += 1
+        stats["categories"] += len(results)
+        stats["searches"] += len(search.shards)
+        stats["searches_saved"] += search.searches_saved
+
+    return prefetched, stats
+
+
 # Task registration with Celery
 __all__ = [
     "crawl_category_task",
     "cleanup_old_jobs_task",
     "monitor_job_health_task",
     "trigger_category_crawl_task",
-    "scan_scheduled_categories_task"
+    "scan_scheduled_categories_task",
+    "coalesced_search_task"
 ]
\ No newline at end of file
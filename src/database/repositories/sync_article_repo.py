@@ -2,10 +2,10 @@
 
 import logging
 import hashlib
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, Iterator, List, Dict, Any, Set, Tuple, Callable
 from uuid import UUID
 from datetime import datetime, timezone
-from sqlalchemy import select, and_, or_, exists, func
+from sqlalchemy import select, update, and_, or_, exists, func
 from sqlalchemy.orm import selectinload
 
 from src.database.repositories.sync_base import SyncBaseRepository
@@ -31,13 +31,16 @@ class SyncArticleRepository(SyncBaseRepository[Article]):
         self,
         articles_data: List[Dict[str, Any]],
         category_id: UUID,
-        job_id: str = None
+        job_id: str = None,
+        stored_urls: Optional[List[str]] = None
     ) -> int:
         """Save articles with deduplication logic.
 
         Args:
             articles_data: List of article data dictionaries
             category_id: Category to associate articles with
+            stored_urls: If given, receives the URL of every article that was
+                saved or matched an existing one
 
         Returns:
             Number of articles successfully saved
@@ -77,6 +80,8 @@ class SyncArticleRepository(SyncBaseRepository[Article]):
                                 existing_article.keywords_matched = merged_keywords
 
                             session.commit()
+                            if stored_urls is not None:
+                                stored_urls.append(source_url)
                             logger.debug(f"Updated existing article: {existing_article.title}")
                             continue
 
@@ -143,6 +148,8 @@ class SyncArticleRepository(SyncBaseRepository[Article]):
 
                         session.commit()
                         saved_count += 1
+                        if stored_urls is not None:
+                            stored_urls.append(source_url)
 
                         logger.debug(f"Saved new article: {new_article.title}")
 
@@ -172,6 +179,78 @@ class SyncArticleRepository(SyncBaseRepository[Article]):
 
             return list(articles)
 
+    def touch_known_articles(
+        self,
+        urls: List[str],
+        category_id: UUID,
+        score_articles: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None
+    ) -> Set[str]:
+        """Refresh stored articles for the given URLs without extracting them again.
+
+        The stored articles are found with get_existing_by_url_hashes; they get
+        last_seen updated and are linked to the category if not linked yet.
+
+        Args:
+            urls: Resolved article URLs
+            category_id: Category the URLs were found for
+            score_articles: Scores article dicts (title, content) against this
+                category's keywords, as done before saving new articles. Without
+                it new links are left without a relevance score.
+
+        Returns:
+            URLs that are already stored
+        """
+        if not urls:
+            return set()
+
+        url_by_hash = {self._generate_url_hash(url): url for url in urls}
+
+        with self.get_session() as session:
+            try:
+                known = self.get_existing_by_url_hashes(list(url_by_hash))
+                if not known:
+                    return set()
+
+                article_ids = [article.id for article in known]
+                session.execute(
+                    update(Article)
+                    .where(Article.id.in_(article_ids))
+                    .values(last_seen=datetime.now(timezone.utc))
+                )
+
+                linked = set(session.execute(
+                    select(ArticleCategory.article_id).where(
+                        and_(
+                            ArticleCategory.category_id == category_id,
+                            ArticleCategory.article_id.in_(article_ids)
+                        )
+                    )
+                ).scalars())
+                unlinked = [article for article in known if article.id not in linked]
+                scores: Dict[UUID, float] = {}
+                if unlinked and score_articles is not None:
+                    scored = score_articles([
+                        {'title': article.title, 'content': article.content or ''} for article in unlinked
+                    ])
+                    scores = {
+                        article.id: data.get('relevance_score', 0.0) for article, data in zip(unlinked, scored)
+                    }
+                for article in unlinked:
+                    session.add(ArticleCategory(
+                        article_id=article.id,
+                        category_id=category_id,
+                        relevance_score=scores.get(article.id)
+                    ))
+
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.warning(f"Failed to touch known articles, they will be extracted again: {e}")
+                return set()
+
+        logger.debug(f"Touched {len(known)} known articles out of {len(urls)} URLs for category {category_id}")
+        return {url_by_hash[article.url_hash] for article in known}
+
     def get_recent_articles(
         self,
         category_id: Optional[UUID] = None,
@@ -200,4 +279,13 @@ class SyncArticleRepository(SyncBaseRepository[Article]):
                 )
             ).scalar()
 
-            return count or 0
\ No newline at end of file
+            return count or 0
+
+    def iter_url_hashes(self, batch_size: int = 10000) -> Iterator[str]:
+        """Stream the url_hash of every stored article without loading them all at once."""
+        with self.get_session() as session:
+            result = session.execute(
+                select(Article.url_hash).execution_options(yield_per=batch_size)
+            )
+            for url_hash in result.scalars():
+                yield url_hash
@@ -127,6 +127,12 @@ class Settings(BaseSettings):
         env="NEWSPAPER_HTTP_SUCCESS_ONLY"
     )
 
+    NEWSPAPER_TRUST_HTML_DOMAINS: bool = Field(
+        default=True,
+        description="Skip newspaper4k's binary content probe for domains already seen serving HTML",
+        env="NEWSPAPER_TRUST_HTML_DOMAINS"
+    )
+
     # JavaScript rendering settings for sync_playwright integration
     ENABLE_JAVASCRIPT_RENDERING: bool = Field(
         default=True,
@@ -265,6 +271,188 @@ class Settings(BaseSettings):
         env="ARTICLE_EXTRACTION_BATCH_SIZE"
     )
 
+    # Google News search concurrency and rate limiting
+    GOOGLE_NEWS_RSS_CLIENT_ENABLED: bool = Field(
+        default=True,
+        description="Search with the pooled async RSS client instead of gnews",
+        env="GOOGLE_NEWS_RSS_CLIENT_ENABLED"
+    )
+
+    GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT: int = Field(
+        default=4,
+        description="Maximum concurrent Google News RSS requests per host and worker process",
+        env="GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT"
+    )
+
+    GOOGLE_NEWS_SEARCH_TIMEOUT: float = Field(
+        default=15.0,
+        description="Timeout in seconds for a Google News RSS search request",
+        env="GOOGLE_NEWS_SEARCH_TIMEOUT"
+    )
+
+    FEED_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Skip Google News items already seen by the last run of a scheduled (period) search",
+        env="FEED_CACHE_ENABLED"
+    )
+
+    FEED_CACHE_TTL: int = Field(
+        default=86400,  # 1 day
+        description="Time to keep the last processed response of a scheduled search in seconds",
+        env="FEED_CACHE_TTL"
+    )
+
+    QUERY_SHARD_MAX_LENGTH: int = Field(
+        default=256,
+        description="Maximum length of one Google News search query before a category's keywords are split into shards",
+        env="QUERY_SHARD_MAX_LENGTH"
+    )
+
+    QUERY_SHARD_MAX_KEYWORDS: int = Field(
+        default=8,
+        description="Maximum keywords in one Google News search query shard",
+        env="QUERY_SHARD_MAX_KEYWORDS"
+    )
+
+    QUERY_SHARD_CONCURRENCY: int = Field(
+        default=4,
+        description="Query shards of one category searched concurrently",
+        env="QUERY_SHARD_CONCURRENCY"
+    )
+
+    SCHEDULER_COALESCE_SEARCHES: bool = Field(
+        default=True,
+        description="Share Google News searches between scheduled categories with the same language, country and period",
+        env="SCHEDULER_COALESCE_SEARCHES"
+    )
+
+    SCHEDULER_COALESCED_SEARCH_TIMEOUT: float = Field(
+        default=60.0,
+        description="Seconds a coalesced scheduler search may take before its categories search on their own",
+        env="SCHEDULER_COALESCED_SEARCH_TIMEOUT"
+    )
+
+    KNOWN_URL_PREFILTER_ENABLED: bool = Field(
+        default=True,
+        description="Skip extraction of resolved URLs already stored; they are only touched and linked to the category",
+        env="KNOWN_URL_PREFILTER_ENABLED"
+    )
+
+    KNOWN_URL_INDEX_ENABLED: bool = Field(
+        default=True,
+        description="Check resolved URLs against a Bloom filter of stored articles; only positives are confirmed in Postgres",
+        env="KNOWN_URL_INDEX_ENABLED"
+    )
+
+    KNOWN_URL_INDEX_CAPACITY: int = Field(
+        default=1000000,
+        description="Minimum number of URLs the known-URL Bloom filter is sized for",
+        env="KNOWN_URL_INDEX_CAPACITY"
+    )
+
+    KNOWN_URL_INDEX_ERROR_RATE: float = Field(
+        default=0.01,
+        description="Target false positive rate of the known-URL Bloom filter",
+        env="KNOWN_URL_INDEX_ERROR_RATE"
+    )
+
+    KNOWN_URL_INDEX_REBUILD_INTERVAL: int = Field(
+        default=3600,
+        description="Seconds between rebuilds of the known-URL Bloom filter from Postgres",
+        env="KNOWN_URL_INDEX_REBUILD_INTERVAL"
+    )
+
+    INCREMENTAL_CRAWL_ENABLED: bool = Field(
+        default=True,
+        description="Scheduled crawls process only items newer than the category's high-water mark",
+        env="INCREMENTAL_CRAWL_ENABLED"
+    )
+
+    INCREMENTAL_CRAWL_OVERLAP: int = Field(
+        default=3600,  # 1 hour
+        description="Seconds before the high-water mark still searched, for articles Google indexes late",
+        env="INCREMENTAL_CRAWL_OVERLAP"
+    )
+
+    INCREMENTAL_CRAWL_MAX_IDS: int = Field(
+        default=5000,
+        description="Maximum Google News article IDs remembered per category for incremental crawls",
+        env="INCREMENTAL_CRAWL_MAX_IDS"
+    )
+
+    INCREMENTAL_CRAWL_TTL: int = Field(
+        default=604800,  # 7 days
+        description="Time to keep a category's high-water mark after its last incremental run in seconds",
+        env="INCREMENTAL_CRAWL_TTL"
+    )
+
+    SLIDING_WINDOW_CONCURRENCY: int = Field(
+        default=4,
+        description="Days searched concurrently by date-range (sliding window) crawls",
+        env="SLIDING_WINDOW_CONCURRENCY"
+    )
+
+    DISTRIBUTED_RATE_LIMIT_ENABLED: bool = Field(
+        default=True,
+        description="Share Google News rate limits across all workers through Redis (per process otherwise)",
+        env="DISTRIBUTED_RATE_LIMIT_ENABLED"
+    )
+
+    GOOGLE_NEWS_SEARCH_RATE: float = Field(
+        default=0.5,
+        description="Google News search calls per second (across all workers when the rate limit is distributed)",
+        env="GOOGLE_NEWS_SEARCH_RATE"
+    )
+
+    GOOGLE_NEWS_SEARCH_BURST: int = Field(
+        default=3,
+        description="Google News search calls allowed back-to-back before rate limiting applies",
+        env="GOOGLE_NEWS_SEARCH_BURST"
+    )
+
+    GOOGLE_NEWS_SEARCH_MAX_WAIT: float = Field(
+        default=300.0,
+        description="Seconds a search may wait for the rate limiter before failing",
+        env="GOOGLE_NEWS_SEARCH_MAX_WAIT"
+    )
+
+    GOOGLE_NEWS_RESOLVE_RATE: float = Field(
+        default=5.0,
+        description="Google News article URLs opened per second for resolution (HTTP tier and browser tabs)",
+        env="GOOGLE_NEWS_RESOLVE_RATE"
+    )
+
+    GOOGLE_NEWS_RESOLVE_BURST: int = Field(
+        default=20,
+        description="Google News article URLs that may be opened back-to-back before rate limiting applies",
+        env="GOOGLE_NEWS_RESOLVE_BURST"
+    )
+
+    GOOGLE_NEWS_RESOLVE_MAX_WAIT: float = Field(
+        default=120.0,
+        description="Seconds a resolution batch may wait for the rate limiter before failing",
+        env="GOOGLE_NEWS_RESOLVE_MAX_WAIT"
+    )
+
+    # Streaming crawl pipeline (search -> resolve -> extract -> save)
+    PIPELINE_EXTRACT_WORKERS: int = Field(
+        default=2,
+        description="Extraction batches run concurrently while URLs are still resolving",
+        env="PIPELINE_EXTRACT_WORKERS"
+    )
+
+    PIPELINE_SAVE_BATCH_SIZE: int = Field(
+        default=20,
+        description="Articles saved to the database per micro-batch",
+        env="PIPELINE_SAVE_BATCH_SIZE"
+    )
+
+    PIPELINE_QUEUE_SIZE: int = Field(
+        default=20,
+        description="Bound on URL chunks and article batches queued between pipeline stages",
+        env="PIPELINE_QUEUE_SIZE"
+    )
+
     # URL Processing Limits (Story 2.5 - Worker Queue and URL Limits Fix)
     MAX_URLS_TO_PROCESS: int = Field(
         default=100,
@@ -283,6 +471,202 @@ class Settings(BaseSettings):
         description="Maximum tabs per browser instance (increased from 10)",
         env="MAX_TABS_PER_BROWSER"
     )
+
+    # Browser pool settings for Google News URL resolution
+    BROWSER_POOL_ENABLED: bool = Field(
+        default=True,
+        description="Keep resolver browsers warm across batches and tasks (False launches a browser per batch)",
+        env="BROWSER_POOL_ENABLED"
+    )
+
+    BROWSER_POOL_SIZE: int = Field(
+        default=4,
+        description="Maximum warm browsers kept per worker process, one per concurrent resolution batch",
+        env="BROWSER_POOL_SIZE"
+    )
+
+    BROWSER_POOL_MAX_AGE: int = Field(
+        default=1800,
+        description="Recycle pooled browsers older than this many seconds",
+        env="BROWSER_POOL_MAX_AGE"
+    )
+
+    BROWSER_POOL_MAX_PAGES: int = Field(
+        default=500,
+        description="Recycle pooled browsers after serving this many tabs",
+        env="BROWSER_POOL_MAX_PAGES"
+    )
+
+    BROWSER_POOL_MAX_MEMORY_MB: int = Field(
+        default=1024,
+        description="Recycle pooled browsers whose process tree exceeds this RSS in MB",
+        env="BROWSER_POOL_MAX_MEMORY_MB"
+    )
+
+    BROWSER_INTERCEPT_REDIRECTS: bool = Field(
+        default=True,
+        description="Abort the publisher page load once a Google News redirect target is known",
+        env="BROWSER_INTERCEPT_REDIRECTS"
+    )
+
+    # HTTP resolution tier tried before the browser
+    HTTP_RESOLVER_ENABLED: bool = Field(
+        default=True,
+        description="Resolve Google News URLs with pooled HTTP requests before using a browser",
+        env="HTTP_RESOLVER_ENABLED"
+    )
+
+    HTTP_RESOLVER_CONCURRENCY: int = Field(
+        default=20,
+        description="Maximum HTTP resolution requests in flight per worker process",
+        env="HTTP_RESOLVER_CONCURRENCY"
+    )
+
+    HTTP_RESOLVER_TIMEOUT: float = Field(
+        default=5.0,
+        description="Timeout in seconds for each HTTP resolution request",
+        env="HTTP_RESOLVER_TIMEOUT"
+    )
+
+    HTTP_RESOLVER_HTTP2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for the HTTP resolution tier when the h2 package is installed",
+        env="HTTP_RESOLVER_HTTP2"
+    )
+
+    ARTICLE_FETCH_ASYNC_ENABLED: bool = Field(
+        default=True,
+        description="Download article pages with the pooled async fetcher instead of newspaper threads",
+        env="ARTICLE_FETCH_ASYNC_ENABLED"
+    )
+
+    ARTICLE_FETCH_CONCURRENCY: int = Field(
+        default=32,
+        description="Maximum article downloads in flight per worker process",
+        env="ARTICLE_FETCH_CONCURRENCY"
+    )
+
+    ARTICLE_FETCH_PER_HOST_LIMIT: int = Field(
+        default=4,
+        description="Maximum article downloads in flight per publisher host and worker process",
+        env="ARTICLE_FETCH_PER_HOST_LIMIT"
+    )
+
+    ARTICLE_FETCH_TIMEOUT: float = Field(
+        default=15.0,
+        description="Timeout in seconds for downloading one article page, body included",
+        env="ARTICLE_FETCH_TIMEOUT"
+    )
+
+    ARTICLE_FETCH_MAX_BYTES: int = Field(
+        default=5 * 1024 * 1024,
+        description="Article pages larger than this many bytes are truncated",
+        env="ARTICLE_FETCH_MAX_BYTES"
+    )
+
+    ARTICLE_FETCH_CRAWL_DELAY: float = Field(
+        default=0.5,
+        description="Minimum seconds between article download starts to one publisher host",
+        env="ARTICLE_FETCH_CRAWL_DELAY"
+    )
+
+    ARTICLE_FETCH_MAX_RETRY_AFTER: float = Field(
+        default=120.0,
+        description="Longest Retry-After pause in seconds honoured for a throttling publisher host",
+        env="ARTICLE_FETCH_MAX_RETRY_AFTER"
+    )
+
+    PARSE_PROCESS_WORKERS: int = Field(
+        default=2,
+        description="Processes parsing downloaded article HTML per worker process (0 parses in threads)",
+        env="PARSE_PROCESS_WORKERS"
+    )
+
+    PARSE_TIMEOUT: float = Field(
+        default=60.0,
+        description="Timeout in seconds for parsing one article page",
+        env="PARSE_TIMEOUT"
+    )
+
+    RESOLUTION_CPUS_PER_BROWSER: float = Field(
+        default=1.0,
+        description="CPU cores budgeted per concurrently resolving browser",
+        env="RESOLUTION_CPUS_PER_BROWSER"
+    )
+
+    RESOLUTION_MEMORY_RESERVE_MB: int = Field(
+        default=1024,
+        description="Memory in MB kept free for non-browser work when sizing concurrent resolution",
+        env="RESOLUTION_MEMORY_RESERVE_MB"
+    )
+
+    # Per-publisher redirect timing model
+    REDIRECT_TIMING_DEFAULT_WAIT: float = Field(
+        default=10.0,
+        description="Redirect deadline in seconds used until enough timing samples exist",
+        env="REDIRECT_TIMING_DEFAULT_WAIT"
+    )
+
+    REDIRECT_TIMING_MIN_WAIT: float = Field(
+        default=3.0,
+        description="Shortest per-tab redirect deadline in seconds",
+        env="REDIRECT_TIMING_MIN_WAIT"
+    )
+
+    REDIRECT_TIMING_MAX_WAIT: float = Field(
+        default=15.0,
+        description="Longest per-tab redirect deadline in seconds, also used for retries",
+        env="REDIRECT_TIMING_MAX_WAIT"
+    )
+
+    REDIRECT_TIMING_MARGIN: float = Field(
+        default=1.5,
+        description="Multiplier applied to a domain's p95 redirect time to get its deadline",
+        env="REDIRECT_TIMING_MARGIN"
+    )
+
+    REDIRECT_TIMING_MIN_SAMPLES: int = Field(
+        default=5,
+        description="Redirect samples needed before a domain gets its own deadline",
+        env="REDIRECT_TIMING_MIN_SAMPLES"
+    )
+
+    REDIRECT_TIMING_WINDOW: int = Field(
+        default=200,
+        description="Number of recent redirect times kept per domain",
+        env="REDIRECT_TIMING_WINDOW"
+    )
+
+    # Shared crawler state (resolution cache, timing model, rate limits)
+    CRAWLER_REDIS_URL: Optional[str] = Field(
+        default=None,
+        description="Redis URL for shared crawler state (defaults to CELERY_BROKER_URL)",
+        env="CRAWLER_REDIS_URL"
+    )
+
+    RESOLUTION_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache resolved Google News article IDs across jobs and workers",
+        env="RESOLUTION_CACHE_ENABLED"
+    )
+
+    RESOLUTION_CACHE_TTL: int = Field(
+        default=604800,  # 7 days
+        description="Time to keep resolved Google News URLs in seconds",
+        env="RESOLUTION_CACHE_TTL"
+    )
+
+    RESOLUTION_CACHE_NEGATIVE_TTL: int = Field(
+        default=1800,  # 30 minutes
+        description="Time to remember Google News URLs that failed to resolve in seconds",
+        env="RESOLUTION_CACHE_NEGATIVE_TTL"
+    )
+
+    RESOLUTION_CACHE_SQLITE_PATH: str = Field(
+        default="data/resolution_cache.sqlite3",
+        description="SQLite fallback file used when Redis is unavailable",
+        env="RESOLUTION_CACHE_SQLITE_PATH"
+    )
     
     @field_validator("DATABASE_URL")
     @classmethod
@@ -959,6 +1343,110 @@ class Settings(BaseSettings):
             raise ValueError("API_PORT must be between 1 and 65535")
         return v
 
+    @field_validator("GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT")
+    @classmethod
+    def validate_google_news_search_per_host_limit(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT must be positive")
+        if v > 32:
+            raise ValueError("GOOGLE_NEWS_SEARCH_PER_HOST_LIMIT must not exceed 32")
+        return v
+
+    @field_validator("GOOGLE_NEWS_SEARCH_TIMEOUT")
+    @classmethod
+    def validate_google_news_search_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("GOOGLE_NEWS_SEARCH_TIMEOUT must be positive")
+        return v
+
+    @field_validator("FEED_CACHE_TTL")
+    @classmethod
+    def validate_feed_cache_ttl(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("FEED_CACHE_TTL must be positive")
+        return v
+
+    @field_validator("QUERY_SHARD_MAX_LENGTH")
+    @classmethod
+    def validate_query_shard_max_length(cls, v: int) -> int:
+        if v < 32:
+            raise ValueError("QUERY_SHARD_MAX_LENGTH must be at least 32")
+        if v > 2000:
+            raise ValueError("QUERY_SHARD_MAX_LENGTH must not exceed 2000")
+        return v
+
+    @field_validator("QUERY_SHARD_MAX_KEYWORDS")
+    @classmethod
+    def validate_query_shard_max_keywords(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("QUERY_SHARD_MAX_KEYWORDS must be positive")
+        return v
+
+    @field_validator("QUERY_SHARD_CONCURRENCY")
+    @classmethod
+    def validate_query_shard_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("QUERY_SHARD_CONCURRENCY must be positive")
+        if v > 16:
+            raise ValueError("QUERY_SHARD_CONCURRENCY must not exceed 16")
+        return v
+
+    @field_validator("INCREMENTAL_CRAWL_OVERLAP")
+    @classmethod
+    def validate_incremental_crawl_overlap(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("INCREMENTAL_CRAWL_OVERLAP must not be negative")
+        return v
+
+    @field_validator("INCREMENTAL_CRAWL_MAX_IDS", "INCREMENTAL_CRAWL_TTL")
+    @classmethod
+    def validate_incremental_crawl_limits(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("INCREMENTAL_CRAWL_MAX_IDS and INCREMENTAL_CRAWL_TTL must be positive")
+        return v
+
+    @field_validator("SLIDING_WINDOW_CONCURRENCY")
+    @classmethod
+    def validate_sliding_window_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("SLIDING_WINDOW_CONCURRENCY must be positive")
+        if v > 16:
+            raise ValueError("SLIDING_WINDOW_CONCURRENCY must not exceed 16")
+        return v
+
+    @field_validator(
+        "GOOGLE_NEWS_SEARCH_RATE", "GOOGLE_NEWS_SEARCH_MAX_WAIT",
+        "GOOGLE_NEWS_RESOLVE_RATE", "GOOGLE_NEWS_RESOLVE_MAX_WAIT"
+    )
+    @classmethod
+    def validate_google_news_search_rate(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("Google News rates and max waits must be positive")
+        return v
+
+    @field_validator("GOOGLE_NEWS_SEARCH_BURST", "GOOGLE_NEWS_RESOLVE_BURST")
+    @classmethod
+    def validate_google_news_search_burst(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Google News burst sizes must be positive")
+        return v
+
+    @field_validator("PIPELINE_EXTRACT_WORKERS")
+    @classmethod
+    def validate_pipeline_extract_workers(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("PIPELINE_EXTRACT_WORKERS must be positive")
+        if v > 16:
+            raise ValueError("PIPELINE_EXTRACT_WORKERS must not exceed 16")
+        return v
+
+    @field_validator("PIPELINE_SAVE_BATCH_SIZE", "PIPELINE_QUEUE_SIZE")
+    @classmethod
+    def validate_pipeline_sizes(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Pipeline batch and queue sizes must be positive")
+        return v
+
     @field_validator("MAX_URLS_TO_PROCESS")
     @classmethod
     def validate_max_urls_to_process(cls, v: int) -> int:
@@ -986,6 +1474,147 @@ class Settings(BaseSettings):
             raise ValueError("MAX_TABS_PER_BROWSER must not exceed 50 (memory limit)")
         return v
 
+    @field_validator("BROWSER_POOL_SIZE")
+    @classmethod
+    def validate_browser_pool_size(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("BROWSER_POOL_SIZE must be positive")
+        if v > 8:
+            raise ValueError("BROWSER_POOL_SIZE must not exceed 8 (memory limit)")
+        return v
+
+    @field_validator("BROWSER_POOL_MAX_AGE", "BROWSER_POOL_MAX_PAGES", "BROWSER_POOL_MAX_MEMORY_MB")
+    @classmethod
+    def validate_browser_pool_limits(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Browser pool limits must be positive")
+        return v
+
+    @field_validator("ARTICLE_FETCH_CONCURRENCY", "ARTICLE_FETCH_PER_HOST_LIMIT")
+    @classmethod
+    def validate_article_fetch_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Article fetch concurrency limits must be positive")
+        if v > 256:
+            raise ValueError("Article fetch concurrency limits must not exceed 256")
+        return v
+
+    @field_validator("ARTICLE_FETCH_TIMEOUT", "ARTICLE_FETCH_MAX_BYTES")
+    @classmethod
+    def validate_article_fetch_limits(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("ARTICLE_FETCH_TIMEOUT and ARTICLE_FETCH_MAX_BYTES must be positive")
+        return v
+
+    @field_validator("ARTICLE_FETCH_CRAWL_DELAY")
+    @classmethod
+    def validate_article_fetch_crawl_delay(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("ARTICLE_FETCH_CRAWL_DELAY must not be negative")
+        if v > 60:
+            raise ValueError("ARTICLE_FETCH_CRAWL_DELAY must not exceed 60 seconds")
+        return v
+
+    @field_validator("ARTICLE_FETCH_MAX_RETRY_AFTER")
+    @classmethod
+    def validate_article_fetch_max_retry_after(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("ARTICLE_FETCH_MAX_RETRY_AFTER must not be negative")
+        if v > 3600:
+            raise ValueError("ARTICLE_FETCH_MAX_RETRY_AFTER must not exceed 3600 seconds")
+        return v
+
+    @field_validator("PARSE_PROCESS_WORKERS")
+    @classmethod
+    def validate_parse_process_workers(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("PARSE_PROCESS_WORKERS must not be negative")
+        if v > 64:
+            raise ValueError("PARSE_PROCESS_WORKERS must not exceed 64")
+        return v
+
+    @field_validator("PARSE_TIMEOUT")
+    @classmethod
+    def validate_parse_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("PARSE_TIMEOUT must be positive")
+        return v
+
+    @field_validator("HTTP_RESOLVER_CONCURRENCY")
+    @classmethod
+    def validate_http_resolver_concurrency(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("HTTP_RESOLVER_CONCURRENCY must be positive")
+        if v > 100:
+            raise ValueError("HTTP_RESOLVER_CONCURRENCY must not exceed 100")
+        return v
+
+    @field_validator("HTTP_RESOLVER_TIMEOUT")
+    @classmethod
+    def validate_http_resolver_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("HTTP_RESOLVER_TIMEOUT must be positive")
+        return v
+
+    @field_validator("RESOLUTION_CPUS_PER_BROWSER")
+    @classmethod
+    def validate_resolution_cpus_per_browser(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("RESOLUTION_CPUS_PER_BROWSER must be positive")
+        return v
+
+    @field_validator("RESOLUTION_MEMORY_RESERVE_MB")
+    @classmethod
+    def validate_resolution_memory_reserve(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("RESOLUTION_MEMORY_RESERVE_MB must not be negative")
+        return v
+
+    @field_validator(
+        "REDIRECT_TIMING_DEFAULT_WAIT", "REDIRECT_TIMING_MIN_WAIT", "REDIRECT_TIMING_MAX_WAIT",
+        "REDIRECT_TIMING_MIN_SAMPLES", "REDIRECT_TIMING_WINDOW"
+    )
+    @classmethod
+    def validate_redirect_timing_limits(cls, v):
+        if v <= 0:
+            raise ValueError("Redirect timing limits must be positive")
+        return v
+
+    @field_validator("REDIRECT_TIMING_MARGIN")
+    @classmethod
+    def validate_redirect_timing_margin(cls, v: float) -> float:
+        if v < 1.0:
+            raise ValueError("REDIRECT_TIMING_MARGIN must be at least 1.0")
+        return v
+
+    @field_validator("RESOLUTION_CACHE_TTL", "RESOLUTION_CACHE_NEGATIVE_TTL")
+    @classmethod
+    def validate_resolution_cache_ttl(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Resolution cache TTLs must be positive")
+        return v
+
+    @field_validator("KNOWN_URL_INDEX_ERROR_RATE")
+    @classmethod
+    def validate_known_url_index_error_rate(cls, v: float) -> float:
+        if not 0 < v < 1:
+            raise ValueError("KNOWN_URL_INDEX_ERROR_RATE must be between 0 and 1")
+        return v
+
+    @field_validator("KNOWN_URL_INDEX_CAPACITY", "KNOWN_URL_INDEX_REBUILD_INTERVAL")
+    @classmethod
+    def validate_known_url_index_limits(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Known-URL index capacity and rebuild interval must be positive")
+        return v
+
+    @field_validator("CRAWLER_REDIS_URL")
+    @classmethod
+    def validate_crawler_redis_url(cls, v: Optional[str]) -> Optional[str]:
+        if v and not v.startswith(("redis://", "rediss://")):
+            raise ValueError("CRAWLER_REDIS_URL must start with redis:// or rediss://")
+        return v
+
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -0,0 +1,207 @@
+"""Shared synchronous Redis client for crawler state.
+
+Crawler components running inside Celery workers (resolution cache, timing
+model, rate limiter, ...) share one connection pool per worker process.
+The client connects to CRAWLER_REDIS_URL, falling back to the Celery broker.
+
+Components keeping a local fallback (memory, SQLite) track Redis with a
+``RedisFailover``: after an error they serve from the fallback and try Redis
+again once ``REDIS_RETRY_INTERVAL`` has passed, instead of staying on the
+fallback for the life of the process. ``RedisJsonStore`` keeps small JSON
+documents (feed cache entries, crawl watermarks) this way, with a bounded
+in-memory fallback.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import redis
+
+from src.shared.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a component uses its local fallback after a Redis error before trying Redis again
+REDIS_RETRY_INTERVAL = 60.0
+
+T = TypeVar("T")
+
+# Global client instances keyed by URL
+_redis_clients: Dict[str, redis.Redis] = {}
+
+
+def get_redis_url(settings: Optional[Settings] = None) -> str:
+    """Get the Redis URL used for crawler state."""
+    settings = settings or get_settings()
+    return settings.CRAWLER_REDIS_URL or settings.CELERY_BROKER_URL
+
+
+def get_redis_client(settings: Optional[Settings] = None) -> redis.Redis:
+    """Get the shared Redis client for crawler state.
+
+    redis-py connection pools detect forks and reconnect in the child, so the
+    same client object is safe to use across Celery prefork workers.
+    """
+    url = get_redis_url(settings)
+    client = _redis_clients.get(url)
+    if client is None:
+        client = redis.Redis.from_url(
+            url,
+            decode_responses=True,
+            socket_timeout=2.0,
+            socket_connect_timeout=2.0,
+            health_check_interval=30
+        )
+        _redis_clients[url] = client
+    return client
+
+
+def is_redis_available(client: redis.Redis) -> bool:
+    """Check whether Redis answers a PING."""
+    try:
+        return bool(client.ping())
+    except redis.RedisError as e:
+        logger.warning(f"Redis unavailable for crawler state: {e}")
+        return False
+
+
+class RedisFailover:
+    """Whether Redis may be used, pausing it for a retry interval after each error."""
+
+    def __init__(
+        self,
+        name: str,
+        fallback: str = "memory",
+        retry_interval: float = REDIS_RETRY_INTERVAL,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.name = name
+        self.fallback = fallback
+        self.retry_interval = retry_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.errors = 0
+        self._down_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def up(self) -> bool:
+        """False while the fallback is in use after a recent error."""
+        return time.monotonic() >= self._down_until
+
+    def mark_down(self, error: Optional[Exception] = None):
+        """Use the fallback until the retry interval has passed.
+
+        Called without an error when Redis is found unavailable at startup.
+        """
+        with self._lock:
+            self._down_until = time.monotonic() + self.retry_interval
+            if error is not None:
+                self.errors += 1
+        if error is not None:
+            self.logger.warning(
+                f"{self.name} Redis error, using {self.fallback} for {self.retry_interval:.0f}s: {error}"
+            )
+
+
+@dataclass
+class StoreStats:
+    """Counters for a JSON store."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+
+class RedisJsonStore:
+    """JSON documents in Redis with a bounded process-local fallback.
+
+    After a Redis error the store serves from memory and tries Redis again
+    once ``retry_interval`` has passed. Keys missing from Redis are also
+    looked up in memory, which holds what was written during the outage.
+    """
+
+    def __init__(
+        self,
+        client: Optional[redis.Redis],
+        prefix: str,
+        ttl: int,
+        fallback_size: int = 512,
+        retry_interval: float = REDIS_RETRY_INTERVAL,
+        name: str = "Redis store",
+        logger: Optional[logging.Logger] = None
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.fallback_size = fallback_size
+        self.name = name
+        self.logger = logger or logging.getLogger(__name__)
+        self.failover = RedisFailover(name, retry_interval=retry_interval, logger=self.logger)
+        self.stats = StoreStats()
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> str:
+        return "redis" if self._redis_usable() else "memory"
+
+    def _redis_usable(self) -> bool:
+        return self.client is not None and self.failover.up
+
+    def _read(self, key: str) -> Optional[str]:
+        if self._redis_usable():
+            try:
+                value = self.client.get(self.prefix + key)
+                if value is not None:
+                    return value
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        with self._lock:
+            return self._local.get(key)
+
+    def _write(self, key: str, value: str):
+        if self._redis_usable():
+            try:
+                self.client.set(self.prefix + key, value, ex=self.ttl)
+                return
+            except redis.RedisError as e:
+                self.failover.mark_down(e)
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.fallback_size:
+                self._local.popitem(last=False)
+
+    def get(self, key: str, load: Callable[[Dict[str, Any]], T]) -> Optional[T]:
+        """Get the document stored under a key, built with ``load``, or None.
+
+        Unreadable documents are logged and treated as missing.
+        """
+        raw = self._read(key)
+        value = None
+        if raw is not None:
+            try:
+                value = load(json.loads(raw))
+            except (TypeError, ValueError) as e:
+                self.logger.warning(f"Discarding unreadable {self.name.lower()} entry: {e}")
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def put(self, key: str, document: Dict[str, Any]):
+        """Store a document under a key."""
+        self._write(key, json.dumps(document, default=str))
+        with self._lock:
+            self.stats.writes += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics for monitoring."""
+        with self._lock:
+            return {"backend": self.backend, **asdict(self.stats), "errors": self.failover.errors}
@@ -50,6 +50,7 @@ class TestCrawlerIntegration:
         settings.NEWSPAPER_KEEP_ARTICLE_HTML = True
         settings.NEWSPAPER_FETCH_IMAGES = True
         settings.NEWSPAPER_HTTP_SUCCESS_ONLY = True
+        settings.NEWSPAPER_TRUST_HTML_DOMAINS = True
         return settings
     
     @pytest.fixture
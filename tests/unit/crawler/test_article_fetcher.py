@@ -0,0 +1,147 @@
+"""Unit tests for the async article fetcher."""
+import asyncio
+import httpx
+import pytest
+from unittest.mock import Mock
+
+from src.core.crawler.article_fetcher import ArticleFetcherConfig, AsyncArticleFetcher, FetchedPage
+
+PAGE = "<html><head><title>Tin tức</title></head><body><p>Nội dung bài viết</p></body></html>"
+
+
+def _fetcher(handler, **config):
+    config.setdefault("crawl_delay", 0.0)
+    fetcher = AsyncArticleFetcher(pool=Mock(), config=ArticleFetcherConfig(**config))
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+class TestAsyncArticleFetcher:
+    """Test suite for AsyncArticleFetcher."""
+
+    @pytest.mark.asyncio
+    async def test_html_page_is_downloaded_and_decoded(self):
+        fetcher = _fetcher(lambda request: httpx.Response(
+            200, content=PAGE.encode("utf-8"), headers={"Content-Type": "text/html; charset=utf-8"}
+        ))
+
+        page = await fetcher.fetch("https://vnexpress.net/a")
+
+        assert page.ok
+        assert page.text == PAGE
+
+    @pytest.mark.asyncio
+    async def test_charset_detected_without_header(self):
+        fetcher = _fetcher(lambda request: httpx.Response(
+            200, content=PAGE.encode("utf-8"), headers={"Content-Type": "text/html"}
+        ))
+
+        page = await fetcher.fetch("https://vnexpress.net/a")
+
+        assert "Nội dung" in page.text
+
+    @pytest.mark.asyncio
+    async def test_non_html_is_dropped_from_headers(self):
+        fetcher = _fetcher(lambda request: httpx.Response(
+            200, content=b"%PDF-1.4", headers={"Content-Type": "application/pdf"}
+        ))
+
+        page = await fetcher.fetch("https://vnexpress.net/report.pdf")
+
+        assert not page.ok
+        assert page.content == b""
+        assert fetcher.get_metrics()["non_html"] == 1
+
+    @pytest.mark.asyncio
+    async def test_http_error_status_is_reported(self):
+        fetcher = _fetcher(lambda request: httpx.Response(404, content=b"missing"))
+
+        page = await fetcher.fetch("https://vnexpress.net/gone")
+
+        assert not page.ok
+        assert page.error == "HTTP 404"
+
+    @pytest.mark.asyncio
+    async def test_large_body_is_truncated(self):
+        fetcher = _fetcher(
+            lambda request: httpx.Response(200, content=b"<p>" + b"x" * 5000, headers={"Content-Type": "text/html"}),
+            max_bytes=1000
+        )
+
+        page = await fetcher.fetch("https://vnexpress.net/long")
+
+        assert page.truncated
+        assert len(page.content) == 1000
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_reported_not_raised(self):
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        page = await _fetcher(handler).fetch("https://vnexpress.net/a")
+
+        assert not page.ok
+        assert "ConnectError" in page.error
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit_bounds_concurrency(self):
+        in_flight = {"now": 0, "max": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, content=PAGE.encode(), headers={"Content-Type": "text/html"})
+
+        fetcher = _fetcher(handler, per_host_limit=2, concurrency=10)
+        pages = await fetcher.fetch_batch_async([f"https://vnexpress.net/{i}" for i in range(6)])
+
+        assert all(page.ok for page in pages)
+        assert in_flight["max"] == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_page_is_retried_after_retry_after(self):
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, content=PAGE.encode(), headers={"Content-Type": "text/html"}),
+        ]
+        fetcher = _fetcher(lambda request: responses.pop(0))
+
+        page = await fetcher.fetch("https://vnexpress.net/a")
+
+        assert page.ok
+        metrics = fetcher.get_metrics()
+        assert metrics["throttled"] == 1
+        assert metrics["hosts"]["vnexpress.net"]["throttled"] == 1
+        assert metrics["hosts"]["vnexpress.net"]["requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_starts_round_robin_and_returns_input_order(self):
+        started = []
+
+        def handler(request):
+            started.append(request.url.host)
+            return httpx.Response(200, content=PAGE.encode(), headers={"Content-Type": "text/html"})
+
+        fetcher = _fetcher(handler, concurrency=1)
+        urls = ["https://vnexpress.net/1", "https://vnexpress.net/2", "https://tuoitre.vn/1"]
+        pages = await fetcher.fetch_batch_async(urls)
+
+        assert [page.url for page in pages] == urls
+        assert started == ["vnexpress.net", "tuoitre.vn", "vnexpress.net"]
+
+    @pytest.mark.asyncio
+    async def test_batch_deadline_keeps_finished_pages(self):
+        async def handler(request):
+            if request.url.host == "slow.vn":
+                await asyncio.sleep(5)
+            return httpx.Response(200, content=PAGE.encode(), headers={"Content-Type": "text/html"})
+
+        fetcher = _fetcher(handler)
+        urls = ["https://slow.vn/1", "https://vnexpress.net/1"]
+        pages = await fetcher.fetch_batch_async(urls, deadline=0.2)
+
+        assert [page.url for page in pages] == urls
+        assert "batch timed out" in pages[0].error
+        assert pages[1].ok
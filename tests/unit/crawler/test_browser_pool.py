@@ -0,0 +1,187 @@
+"""Unit tests for the persistent Playwright browser pool."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.crawler import browser_pool
+from src.core.crawler.browser_pool import BrowserPool, BrowserPoolConfig
+
+
+@pytest.fixture
+def mock_playwright():
+    """Patch async_playwright with a driver that launches mock browsers."""
+    driver = AsyncMock()
+
+    async def launch(**kwargs):
+        browser = AsyncMock()
+        browser.is_connected = MagicMock(return_value=True)
+        context = AsyncMock()
+        context.on = MagicMock()
+        context.pages = []
+        browser.new_context.return_value = context
+        return browser
+
+    driver.chromium.launch.side_effect = launch
+
+    with patch.object(browser_pool, 'async_playwright') as mock_async_playwright, \
+         patch.object(browser_pool, 'psutil', None):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=driver)
+        yield driver
+
+
+class TestBrowserPool:
+    """Test suite for BrowserPool lifecycle management."""
+
+    @pytest.mark.asyncio
+    async def test_browser_reused_across_leases(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1))
+
+        async with pool.acquire() as first_context:
+            pass
+        async with pool.acquire() as second_context:
+            pass
+
+        assert first_context is second_context
+        assert mock_playwright.chromium.launch.call_count == 1
+        metrics = pool.get_metrics()
+        assert metrics["launches"] == 1
+        assert metrics["leases"] == 2
+        assert metrics["reuses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_is_replaced(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1))
+
+        async with pool.acquire():
+            pass
+        pool.browsers[0].browser.is_connected.return_value = False
+
+        async with pool.acquire():
+            pass
+
+        assert mock_playwright.chromium.launch.call_count == 2
+        assert pool.get_metrics()["recycles"] == {"disconnected": 1}
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_age(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1, max_age_seconds=60))
+
+        async with pool.acquire():
+            pass
+        pool.browsers[0].launched_at -= 120
+
+        async with pool.acquire():
+            pass
+
+        assert mock_playwright.chromium.launch.call_count == 2
+        assert pool.get_metrics()["recycles"] == {"max_age": 1}
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_after_max_pages(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1, max_pages_per_browser=5))
+
+        async with pool.acquire():
+            pass
+        pool.browsers[0].pages_served = 5
+
+        async with pool.acquire():
+            pass
+
+        assert pool.get_metrics()["recycles"] == {"max_pages": 1}
+
+    @pytest.mark.asyncio
+    async def test_browser_recycled_when_over_memory_cap(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1, max_memory_mb=100))
+
+        async with pool.acquire():
+            pass
+
+        with patch.object(pool, '_memory_mb', return_value=250.0):
+            assert pool.check_health(pool.browsers[0]) == "max_memory"
+
+    @pytest.mark.asyncio
+    async def test_busy_browser_not_recycled_during_lease(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1, max_age_seconds=60))
+
+        async with pool.acquire() as first_context:
+            pool.browsers[0].launched_at -= 120
+            async with pool.acquire() as second_context:
+                assert second_context is first_context
+
+        assert mock_playwright.chromium.launch.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_non_persistent_pool_closes_browser_after_lease(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1, persistent=False))
+
+        async with pool.acquire() as context:
+            pass
+
+        assert pool.browsers == []
+        context.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_pool_round_robins_over_browsers(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=2))
+
+        contexts = []
+        for _ in range(4):
+            async with pool.acquire() as context:
+                contexts.append(context)
+
+        assert mock_playwright.chromium.launch.call_count == 2
+        assert contexts[0] is not contexts[1]
+        assert {id(c) for c in contexts} == {id(contexts[0]), id(contexts[1])}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_leases_prefer_idle_browsers(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=2))
+        async with pool.acquire():
+            pass
+        async with pool.acquire():
+            pass
+
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            async with pool.acquire():
+                # With every browser busy the leases are shared evenly
+                assert sorted(p.active_leases for p in pool.browsers) == [1, 2]
+
+        assert mock_playwright.chromium.launch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_leftover_pages_closed_after_lease(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1))
+        page = AsyncMock()
+
+        async with pool.acquire() as context:
+            context.pages = [page]
+
+        page.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_driver(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1))
+        async with pool.acquire():
+            pass
+
+        await pool.aclose()
+
+        assert pool.browsers == []
+        mock_playwright.stop.assert_awaited_once()
+
+    def test_run_executes_on_background_loop(self, mock_playwright):
+        pool = BrowserPool(BrowserPoolConfig(size=1))
+
+        async def lease():
+            async with pool.acquire() as context:
+                return context
+
+        try:
+            first = pool.run(lease(), timeout=5)
+            second = pool.run(lease(), timeout=5)
+        finally:
+            pool.close()
+
+        assert first is second
+        assert pool.browsers == []
+        mock_playwright.stop.assert_awaited_once()
@@ -0,0 +1,125 @@
+"""Unit tests for incremental crawls against per-category high-water marks."""
+import logging
+import pytest
+import redis
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.crawler.crawl_watermark import CrawlWatermark, WatermarkStore, item_published_at
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+def _item(article_id, published="Mon, 06 Jan 2025 10:00:00 GMT"):
+    return {"url": f"https://news.google.com/rss/articles/{article_id}", "published date": published}
+
+
+class TestCrawlWatermark:
+    """Test suite for CrawlWatermark."""
+
+    def test_published_at(self):
+        assert item_published_at(_item("CBMiA")) == 1736157600.0
+        assert item_published_at(_item("CBMiA", published="yesterday")) is None
+        assert item_published_at({"url": "u"}) is None
+
+    def test_new_items_are_unseen_and_recent(self):
+        mark = CrawlWatermark().advance([_item("CBMiA")], overlap=3600, max_ids=100)
+
+        assert mark.published_at == 1736157600.0
+        assert not mark.is_new(_item("CBMiA"), overlap=3600)
+        # Within the overlap window: late-indexed articles still go on
+        assert mark.is_new(_item("CBMiB", published="Mon, 06 Jan 2025 09:30:00 GMT"), overlap=3600)
+        assert not mark.is_new(_item("CBMiC", published="Mon, 06 Jan 2025 08:00:00 GMT"), overlap=3600)
+        assert mark.is_new(_item("CBMiD", published=""), overlap=3600)
+
+    def test_advance_prunes_old_and_excess_ids(self):
+        mark = CrawlWatermark().advance(
+            [_item("CBMiA", "Mon, 06 Jan 2025 08:00:00 GMT"), _item("CBMiB", "Mon, 06 Jan 2025 09:30:00 GMT")],
+            overlap=3600, max_ids=100
+        )
+        mark = mark.advance([_item("CBMiC", "Mon, 06 Jan 2025 10:00:00 GMT")], overlap=3600, max_ids=1)
+
+        # CBMiA fell out of the overlap window, CBMiB out of the ID budget
+        assert list(mark.seen) == ["CBMiC"]
+
+    def test_store_falls_back_to_memory(self):
+        client = MagicMock()
+        client.set.side_effect = redis.ConnectionError("down")
+        store = WatermarkStore(client=client)
+
+        store.put("cat-1", CrawlWatermark(published_at=1.0, seen={"CBMiA": 1.0}))
+
+        assert store.backend == "memory"
+        assert store.get("cat-1") == CrawlWatermark(published_at=1.0, seen={"CBMiA": 1.0})
+        assert store.get("cat-2") is None
+
+
+class TestEngineIncrementalCrawl:
+    """Test incremental category crawls in the engine."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.INCREMENTAL_CRAWL_ENABLED = True
+        settings.INCREMENTAL_CRAWL_OVERLAP = 3600
+        settings.INCREMENTAL_CRAWL_MAX_IDS = 100
+        settings.FEED_CACHE_ENABLED = False
+        settings.KNOWN_URL_PREFILTER_ENABLED = False
+        settings.PIPELINE_EXTRACT_WORKERS = 1
+        settings.ARTICLE_EXTRACTION_BATCH_SIZE = 10
+        settings.PIPELINE_SAVE_BATCH_SIZE = 20
+        settings.PIPELINE_QUEUE_SIZE = 20
+        settings.JOB_EXECUTION_TIMEOUT = 1800
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def _crawl(self, engine, store, items, incremental=True, failing=()):
+        category = Mock(id="cat-1", keywords=["AI"], exclude_keywords=[], crawl_period="1d")
+        category.name = "Tech"
+        pending = []
+
+        def resolve(resolved_urls, google_news_urls):
+            pending.extend(google_news_urls)
+            yield list(google_news_urls)
+
+        def extract(urls, threads):
+            return [{'url': url} for url in urls if url not in failing]
+
+        with patch('src.core.crawler.sync_engine.get_watermark_store', return_value=store), \
+             patch.object(engine, '_iter_resolved_results', side_effect=resolve), \
+             patch('src.core.crawler.sync_engine.decode_google_news_url', return_value=None), \
+             patch.object(engine, 'extract_articles_with_threading', side_effect=extract), \
+             patch.object(engine, '_save_category_articles', side_effect=lambda articles, *args: len(articles)):
+            engine.crawl_category_sync(category, search_results=items, incremental=incremental)
+        return pending
+
+    def test_second_run_only_processes_new_items(self, crawler_engine):
+        store = WatermarkStore(client=None)
+
+        first = self._crawl(crawler_engine, store, [_item("CBMiA"), _item("CBMiB")])
+        second = self._crawl(crawler_engine, store, [
+            _item("CBMiA"), _item("CBMiB"), _item("CBMiC", "Mon, 06 Jan 2025 11:00:00 GMT")
+        ])
+
+        assert len(first) == 2
+        assert second == [_item("CBMiC")["url"]]
+        assert store.get("cat-1").published_at == 1736161200.0
+
+    def test_unprocessed_items_stay_new(self, crawler_engine):
+        store = WatermarkStore(client=None)
+        older = _item("CBMiA", "Mon, 06 Jan 2025 08:00:00 GMT")
+        newer = _item("CBMiB", "Mon, 06 Jan 2025 11:00:00 GMT")
+
+        self._crawl(crawler_engine, store, [older, newer], failing=(older["url"],))
+        second = self._crawl(crawler_engine, store, [older, newer])
+
+        # The failed download is offered again, although a newer item was processed
+        assert second == [older["url"]]
+        assert store.get("cat-1").published_at == 1736150400.0
+
+    def test_on_demand_crawls_ignore_the_mark(self, crawler_engine):
+        store = WatermarkStore(client=None)
+        self._crawl(crawler_engine, store, [_item("CBMiA")])
+
+        assert len(self._crawl(crawler_engine, store, [_item("CBMiA")], incremental=False)) == 1
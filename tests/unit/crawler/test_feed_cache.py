@@ -0,0 +1,140 @@
+"""Unit tests for the conditional-GET feed cache."""
+import logging
+import pytest
+import redis
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.crawler.feed_cache import FeedCache, FeedCacheEntry, feed_cache_key, normalize_query
+from src.core.crawler.search_client import FeedResponse
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+def _item(article_id):
+    return {"url": f"https://news.google.com/rss/articles/{article_id}?oc=5", "title": article_id}
+
+
+class TestFeedCache:
+    """Test suite for FeedCache."""
+
+    def test_equivalent_queries_share_a_key(self):
+        assert normalize_query("Blockchain OR  AI -crypto -scam") == "ai OR blockchain -crypto -scam"
+        assert feed_cache_key("AI OR Blockchain -scam -crypto", "vi", "VN", "1h") == \
+            feed_cache_key("blockchain or ai -crypto -scam", "VI", "vn", "1h")
+        assert feed_cache_key("AI", "vi", "VN", "1h") != feed_cache_key("AI", "vi", "VN", "1d")
+        assert feed_cache_key("AI", "vi", "VN", "1h", "cat-1") != feed_cache_key("AI", "vi", "VN", "1h", "cat-2")
+
+    def test_entry_round_trip_and_item_ids(self):
+        cache = FeedCache(client=None)
+        cache.put("k", FeedCacheEntry(etag='"v1"', last_modified=None, items=[_item("CBMiAAA"), _item("CBMiBBB")]))
+
+        entry = cache.get("k")
+
+        assert entry.etag == '"v1"'
+        assert entry.item_ids() == {"CBMiAAA", "CBMiBBB"}
+        assert cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1
+
+    def test_falls_back_to_memory_when_redis_fails(self):
+        client = MagicMock()
+        client.set.side_effect = redis.ConnectionError("down")
+        cache = FeedCache(client=client, ttl=60)
+
+        cache.put("k", FeedCacheEntry(etag=None, last_modified="Mon", items=[]))
+
+        assert cache.backend == "memory"
+        assert cache.get("k").last_modified == "Mon"
+
+
+class TestEngineFeedDelta:
+    """Test scheduled searches against the feed cache."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED = True
+        settings.QUERY_SHARD_MAX_LENGTH = 256
+        settings.QUERY_SHARD_MAX_KEYWORDS = 8
+        settings.FEED_CACHE_ENABLED = True
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def _search(self, engine, cache, response):
+        client = Mock()
+        client.search.return_value = response
+        with patch('src.core.crawler.sync_engine.get_feed_cache', return_value=cache), \
+             patch('src.core.crawler.sync_engine.get_search_client', return_value=client), \
+             patch.object(engine, '_wait_for_search_slot'):
+            result = engine.collect_google_news_results(keywords=["AI"], language="vi", country="VN", period="1h")
+        return result, client.search.call_args.kwargs
+
+    def test_unchanged_and_changed_feeds(self, crawler_engine):
+        cache = FeedCache(client=None)
+        first_items = [_item("CBMiAAA"), _item("CBMiBBB")]
+
+        (_, pending), _ = self._search(
+            crawler_engine, cache, FeedResponse(url="u", status=200, items=first_items, etag='"v1"')
+        )
+        assert len(pending) == 2
+        # Nothing is remembered until the crawl has consumed the items
+        assert cache.get(feed_cache_key("AI", "vi", "VN", "1h")) is None
+        with patch('src.core.crawler.sync_engine.get_feed_cache', return_value=cache):
+            crawler_engine.commit_feed_cache()
+
+        # Unchanged feed: conditional GET answered 304, nothing to do
+        result, kwargs = self._search(
+            crawler_engine, cache, FeedResponse(url="u", status=304, not_modified=True, etag='"v1"')
+        )
+        assert kwargs["etag"] == '"v1"' and kwargs["conditional"]
+        assert result == ([], [])
+
+        # Changed feed: only the new article goes on
+        (_, pending), _ = self._search(
+            crawler_engine, cache,
+            FeedResponse(url="u", status=200, items=first_items + [_item("CBMiCCC")], etag='"v2"')
+        )
+        assert pending == [_item("CBMiCCC")["url"]]
+
+    def test_unprocessed_items_are_offered_again(self, crawler_engine):
+        cache = FeedCache(client=None)
+        items = [_item("CBMiAAA"), _item("CBMiBBB")]
+        self._search(crawler_engine, cache, FeedResponse(url="u", status=200, items=items, etag='"v1"'))
+
+        # Only the first item was resolved and extracted
+        crawler_engine._link_resolved(items[0]["url"], "https://vnexpress.net/a")
+        unprocessed = crawler_engine._unprocessed_item_ids([{"url": "https://vnexpress.net/a"}], [])
+        assert unprocessed == {"CBMiBBB"}
+        with patch('src.core.crawler.sync_engine.get_feed_cache', return_value=cache):
+            crawler_engine.commit_feed_cache(unprocessed)
+
+        # No validators are sent, so the feed cannot answer 304 over the pending item
+        (_, pending), kwargs = self._search(
+            crawler_engine, cache, FeedResponse(url="u", status=200, items=items, etag='"v1"')
+        )
+        assert kwargs["etag"] is None
+        assert kwargs["conditional"] is False
+        assert pending == [items[1]["url"]]
+
+    def test_partial_crawl_does_not_commit(self, crawler_engine):
+        crawler_engine._pending_feed_entries = {"k": FeedCacheEntry(etag=None, last_modified=None)}
+        category = Mock(name="category", keywords=["AI"], exclude_keywords=[], language="vi", country="VN", crawl_period="1h")
+        crawler_engine.settings.PIPELINE_EXTRACT_WORKERS = 1
+        crawler_engine.settings.ARTICLE_EXTRACTION_BATCH_SIZE = 10
+        crawler_engine.settings.PIPELINE_SAVE_BATCH_SIZE = 20
+        crawler_engine.settings.PIPELINE_QUEUE_SIZE = 20
+        crawler_engine.settings.JOB_EXECUTION_TIMEOUT = 1800
+        crawler_engine.settings.KNOWN_URL_PREFILTER_ENABLED = False
+
+        def url_batches(**kwargs):
+            yield ["u1"]
+            raise RuntimeError("browser crashed")
+
+        with patch.object(crawler_engine, 'iter_search_google_news', side_effect=url_batches), \
+             patch.object(crawler_engine, 'extract_articles_with_threading', return_value=[]), \
+             patch.object(crawler_engine, 'commit_feed_cache') as mock_commit:
+            result = crawler_engine.crawl_category_sync(category)
+
+        assert result['partial']
+        mock_commit.assert_not_called()
@@ -0,0 +1,97 @@
+"""Unit tests and micro-benchmark for Google News HTML link extraction."""
+import re
+import time
+import pytest
+from unittest.mock import patch
+
+from src.core.crawler.google_news_html import extract_article_links, iter_article_links
+
+
+def _page(link_count: int, duplicates: int = 2) -> str:
+    """A search page with each article linked `duplicates` times, like Google News cards."""
+    cards = []
+    for i in range(link_count):
+        for _ in range(duplicates):
+            cards.append(f'<article><a href="./articles/CBMi{i:06d}?hl=vi" class="JtKRv">Title {i}</a></article>')
+    return "<html><body>" + "".join(cards) + "</body></html>"
+
+
+def _legacy_extract(html_content: str, max_results: int):
+    """The previous implementation: four full findall passes and list membership checks."""
+    urls = []
+    patterns = [
+        r'href="(\./articles/[^"]*)"',
+        r'href="(https://news\.google\.com/articles/[^"]*)"',
+        r'<a[^>]*href="([^"]*articles/[^"]*)"[^>]*>',
+        r'data-url="([^"]*articles/[^"]*)"',
+    ]
+    for pattern in patterns:
+        for match in re.findall(pattern, html_content):
+            if match.startswith('./'):
+                url = f"https://news.google.com{match[1:]}"
+            elif match.startswith('https://'):
+                url = match
+            else:
+                url = f"https://news.google.com{match}"
+            if 'articles/' in url and url not in urls:
+                urls.append(url)
+                if len(urls) >= max_results:
+                    return urls
+    return urls
+
+
+class TestGoogleNewsHtml:
+    """Test suite for single-pass link extraction."""
+
+    def test_extracts_and_normalizes_links_in_document_order(self):
+        html = (
+            '<a href="./articles/CBMiA">A</a>'
+            '<div data-url="/articles/CBMiB"></div>'
+            '<a href="https://news.google.com/articles/CBMiC">C</a>'
+            '<a href="./articles/CBMiA">A again</a>'
+            '<a href="./topics/CAAq">Topic</a>'
+        )
+
+        assert extract_article_links(html) == [
+            "https://news.google.com/articles/CBMiA",
+            "https://news.google.com/articles/CBMiB",
+            "https://news.google.com/articles/CBMiC",
+        ]
+
+    def test_matches_previous_implementation_as_a_set(self):
+        html = _page(50) + '<a data-id="x" href="https://news.google.com/articles/CBMiZ">Z</a>'
+
+        assert set(extract_article_links(html, 1000)) == set(_legacy_extract(html, 1000))
+
+    def test_stops_at_max_results(self):
+        consumed = []
+
+        def counting(html_content):
+            for link in iter_article_links(html_content):
+                consumed.append(link)
+                yield link
+
+        with patch('src.core.crawler.google_news_html.iter_article_links', side_effect=counting):
+            urls = extract_article_links(_page(1000), max_results=10)
+
+        assert len(urls) == 10
+        # Each article is linked twice: the scan stops at the 19th of 2000 links
+        assert len(consumed) == 19
+        assert extract_article_links(_page(5), max_results=0) == []
+
+    @pytest.mark.slow
+    def test_benchmark_thousands_of_links(self):
+        html = _page(5000)
+
+        start = time.perf_counter()
+        urls = extract_article_links(html, max_results=5000)
+        single_pass = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy_urls = _legacy_extract(html, max_results=5000)
+        legacy = time.perf_counter() - start
+
+        print(f"\n5000 unique / 10000 links: single pass {single_pass * 1000:.1f}ms, legacy {legacy * 1000:.1f}ms")
+        assert urls == legacy_urls
+        assert single_pass < legacy
+        assert single_pass < 1.0
@@ -0,0 +1,107 @@
+"""Unit tests for the per-host download scheduler."""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.core.crawler.host_scheduler import (
+    HostScheduler,
+    HostSchedulerConfig,
+    interleave_by_host,
+    parse_retry_after,
+)
+
+
+class TestInterleaveByHost:
+    """Test suite for interleave_by_host."""
+
+    def test_round_robin_keeps_per_host_order(self):
+        urls = [
+            "https://vnexpress.net/1", "https://vnexpress.net/2", "https://vnexpress.net/3",
+            "https://tuoitre.vn/1", "https://thanhnien.vn/1", "https://tuoitre.vn/2",
+        ]
+
+        assert interleave_by_host(urls) == [
+            "https://vnexpress.net/1", "https://tuoitre.vn/1", "https://thanhnien.vn/1",
+            "https://vnexpress.net/2", "https://tuoitre.vn/2",
+            "https://vnexpress.net/3",
+        ]
+
+    def test_empty_batch(self):
+        assert interleave_by_host([]) == []
+
+
+class TestParseRetryAfter:
+    """Test suite for parse_retry_after."""
+
+    def test_delay_seconds(self):
+        assert parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        value = format_datetime(now + timedelta(seconds=30), usegmt=True)
+
+        assert parse_retry_after(value, now=now) == 30.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestHostScheduler:
+    """Test suite for HostScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_crawl_delay_spaces_request_starts(self):
+        scheduler = HostScheduler(HostSchedulerConfig(per_host_limit=4, crawl_delay=0.05))
+        starts = []
+
+        async def download():
+            async with scheduler.slot("vnexpress.net"):
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(download() for _ in range(3)))
+
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    @pytest.mark.asyncio
+    async def test_throttled_host_is_paused_and_others_are_not(self):
+        scheduler = HostScheduler(HostSchedulerConfig(crawl_delay=0.0, max_retry_after=0.1))
+
+        pause = scheduler.record_response("vnexpress.net", 429, 0.2, retry_after="3600")
+        assert pause == 0.1
+
+        start = time.monotonic()
+        async with scheduler.slot("tuoitre.vn"):
+            assert time.monotonic() - start < 0.05
+        async with scheduler.slot("vnexpress.net"):
+            assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_stats_report_queue_depth_and_latency(self):
+        scheduler = HostScheduler(HostSchedulerConfig(per_host_limit=1, crawl_delay=0.0))
+        release = asyncio.Event()
+
+        async def download():
+            async with scheduler.slot("vnexpress.net"):
+                await release.wait()
+
+        tasks = [asyncio.create_task(download()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        stats = scheduler.get_stats()["vnexpress.net"]
+        assert stats["in_flight"] == 1
+        assert stats["queued"] == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        scheduler.record_response("vnexpress.net", 200, 0.5)
+        scheduler.record_response("vnexpress.net", 200, 1.5)
+
+        stats = scheduler.get_stats()["vnexpress.net"]
+        assert stats["queued"] == 0
+        assert stats["avg_latency"] == 1.0
+        assert stats["max_latency"] == 1.5
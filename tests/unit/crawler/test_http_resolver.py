@@ -0,0 +1,165 @@
+"""Unit tests for the HTTP Google News resolution tier."""
+import logging
+import httpx
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.crawler.http_resolver import (
+    HttpRedirectResolver,
+    HttpResolverConfig,
+    extract_redirect_target,
+)
+from src.core.crawler.rate_limiter import TokenBucket
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+INTERSTITIAL = '<c-wiz jsrenderer="x" data-n-au="https://vnexpress.net/a.html?x=1&amp;y=2" data-p="y"></c-wiz>'
+META_REFRESH = '<html><head><meta http-equiv="refresh" content="0;url=https://dantri.com.vn/b.htm"></head></html>'
+
+
+def _resolver(handler, **config):
+    resolver = HttpRedirectResolver(pool=Mock(), config=HttpResolverConfig(**config))
+    resolver._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=False)
+    return resolver
+
+
+class TestExtractRedirectTarget:
+    """Test parsing of Google News interstitial pages."""
+
+    def test_data_n_au_and_meta_refresh(self):
+        assert extract_redirect_target(INTERSTITIAL) == "https://vnexpress.net/a.html?x=1&y=2"
+        assert extract_redirect_target(META_REFRESH) == "https://dantri.com.vn/b.htm"
+
+    def test_google_targets_ignored(self):
+        assert extract_redirect_target('<div data-n-au="https://news.google.com/x"></div>') is None
+        assert extract_redirect_target("<html></html>") is None
+
+
+class TestHttpRedirectResolver:
+    """Test suite for HttpRedirectResolver."""
+
+    @pytest.mark.asyncio
+    async def test_tiers_within_http(self):
+        requested = []
+
+        def handler(request):
+            url = str(request.url)
+            requested.append(url)
+            if url.endswith("/redirect"):
+                return httpx.Response(302, headers={"Location": "/hop"})
+            if url.endswith("/hop"):
+                return httpx.Response(301, headers={"Location": "https://thanhnien.vn/c.htm"})
+            if url.endswith("/page"):
+                return httpx.Response(200, text=INTERSTITIAL)
+            return httpx.Response(200, text="<html>consent</html>")
+
+        resolver = _resolver(handler)
+        results = await resolver.resolve_batch_async([
+            "https://news.google.com/redirect",
+            "https://news.google.com/page",
+            "https://news.google.com/unknown",
+        ])
+
+        assert results == {
+            "https://news.google.com/redirect": "https://thanhnien.vn/c.htm",
+            "https://news.google.com/page": "https://vnexpress.net/a.html?x=1&y=2",
+            "https://news.google.com/unknown": None,
+        }
+        # The publisher page itself is never fetched
+        assert "https://thanhnien.vn/c.htm" not in requested
+
+    @pytest.mark.asyncio
+    async def test_errors_and_redirect_loops_return_none(self):
+        def handler(request):
+            if request.url.path == "/error":
+                raise httpx.ConnectError("refused")
+            return httpx.Response(302, headers={"Location": "/loop"})
+
+        resolver = _resolver(handler, max_redirects=3)
+        results = await resolver.resolve_batch_async(["https://news.google.com/error", "https://news.google.com/loop"])
+
+        assert results == {"https://news.google.com/error": None, "https://news.google.com/loop": None}
+
+    @pytest.mark.asyncio
+    async def test_urls_take_tokens_as_they_are_requested(self):
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(302, headers={"Location": "https://vnexpress.net/a.html"})
+
+        resolver = _resolver(handler, concurrency=1)
+        limiter = TokenBucket(rate=0.01, capacity=2)
+        urls = [f"https://news.google.com/{i}" for i in range(4)]
+        results = await resolver.resolve_batch_async(urls, limiter=limiter, max_wait=0.1)
+
+        # URLs the budget did not cover are neither requested nor returned
+        assert list(results) == urls[:2]
+        assert requested == urls[:2]
+        assert limiter.get_metrics()["acquired"] == 2
+
+
+class TestEngineHttpTier:
+    """Test the HTTP tier in the engine's resolution order."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.MAX_URLS_TO_PROCESS = 100
+        settings.RESOLUTION_CACHE_ENABLED = False
+        settings.HTTP_RESOLVER_ENABLED = True
+        settings.GOOGLE_NEWS_RESOLVE_MAX_WAIT = 120.0
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_browser_only_sees_http_failures(self, crawler_engine):
+        urls = ["https://news.google.com/rss/articles/g1", "https://news.google.com/rss/articles/g2"]
+        http_resolver = Mock()
+        http_resolver.resolve_batch.return_value = {urls[0]: "https://vnexpress.net/a.html", urls[1]: None}
+        executor = Mock()
+        executor.iter_resolve.return_value = iter([{urls[1]: "https://dantri.com.vn/b.htm"}])
+
+        with patch('src.core.crawler.sync_engine.get_http_redirect_resolver', return_value=http_resolver), \
+             patch('src.core.crawler.sync_engine.ResolutionExecutor', return_value=executor), \
+             patch('src.core.crawler.sync_engine.ResolutionExecutorConfig'), \
+             patch('src.core.crawler.sync_engine.get_resolve_rate_limiter') as mock_limiter:
+            batches = list(crawler_engine.iter_resolved_google_news_urls(urls))
+
+        assert batches == [["https://vnexpress.net/a.html"], ["https://dantri.com.vn/b.htm"]]
+        executor.iter_resolve.assert_called_once_with([urls[1]], stop=crawler_engine._crawl_stop)
+        # Opening Google News URLs draws on the shared resolution budget, one URL at a time
+        http_resolver.resolve_batch.assert_called_once_with(
+            urls, limiter=mock_limiter.return_value, max_wait=120.0
+        )
+        stats = crawler_engine.get_resolution_stats()
+        assert (stats["http"], stats["browser"]) == (1, 1)
+        assert stats["browser_avoided_rate"] == 0.5
+
+    def test_http_tier_failures_are_not_charged_again_by_browser(self, crawler_engine):
+        urls = ["https://news.google.com/rss/articles/g1", "https://news.google.com/rss/articles/g2"]
+        http_resolver = Mock()
+        http_resolver.resolve_batch.return_value = {urls[0]: "https://vnexpress.net/a.html", urls[1]: None}
+
+        with patch('src.core.crawler.sync_engine.get_http_redirect_resolver', return_value=http_resolver), \
+             patch('src.core.crawler.sync_engine.get_resolve_rate_limiter'):
+            _, pending = crawler_engine._resolve_with_http_tier(urls, None)
+
+        other = "https://news.google.com/rss/articles/g3"
+        # Only the URL that did not go through the HTTP tier is charged by the browser batch
+        assert crawler_engine._take_uncharged_urls(pending + [other]) == 1
+        assert crawler_engine._take_uncharged_urls(pending) == 1
+
+    def test_urls_the_http_tier_did_not_request_are_charged_by_browser(self, crawler_engine):
+        urls = ["https://news.google.com/rss/articles/g1", "https://news.google.com/rss/articles/g2"]
+        http_resolver = Mock()
+        # The budget ran out before g2 was requested
+        http_resolver.resolve_batch.return_value = {urls[0]: None}
+
+        with patch('src.core.crawler.sync_engine.get_http_redirect_resolver', return_value=http_resolver), \
+             patch('src.core.crawler.sync_engine.get_resolve_rate_limiter'):
+            _, pending = crawler_engine._resolve_with_http_tier(urls, None)
+
+        assert pending == urls
+        assert crawler_engine._take_uncharged_urls(pending) == 1
@@ -0,0 +1,154 @@
+"""Unit tests for skipping extraction of URLs already stored."""
+import logging
+import pytest
+from unittest.mock import ANY, MagicMock, Mock, patch
+
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.database.repositories.sync_article_repo import SyncArticleRepository
+from src.shared.config import Settings
+
+REPO_PATH = 'src.database.repositories.sync_article_repo.SyncArticleRepository'
+
+
+class TestKnownUrlPrefilter:
+    """Test the known-URL prefilter in the engine."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.KNOWN_URL_PREFILTER_ENABLED = True
+        settings.KNOWN_URL_INDEX_ENABLED = False
+        settings.FEED_CACHE_ENABLED = False
+        settings.PIPELINE_EXTRACT_WORKERS = 1
+        settings.ARTICLE_EXTRACTION_BATCH_SIZE = 10
+        settings.PIPELINE_SAVE_BATCH_SIZE = 20
+        settings.PIPELINE_QUEUE_SIZE = 20
+        settings.JOB_EXECUTION_TIMEOUT = 1800
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_known_urls_are_touched_not_extracted(self, crawler_engine):
+        category = Mock(id="cat-1")
+        batches = [["https://a.com/1", "https://a.com/2"], ["https://a.com/3"]]
+
+        with patch(REPO_PATH) as repo_cls:
+            repo_cls.return_value.touch_known_articles.side_effect = [{"https://a.com/1"}, {"https://a.com/3"}]
+            known = []
+            unknown = list(crawler_engine._skip_known_articles(iter(batches), category, known))
+
+        assert unknown == [["https://a.com/2"]]
+        assert known == ["https://a.com/1", "https://a.com/3"]
+        repo_cls.return_value.touch_known_articles.assert_any_call(batches[0], "cat-1", score_articles=ANY)
+
+    def test_known_articles_are_scored_for_the_current_category(self, crawler_engine):
+        category = Mock(id="cat-1", keywords=["AI"])
+
+        with patch(REPO_PATH) as repo_cls:
+            repo_cls.return_value.touch_known_articles.return_value = set()
+            list(crawler_engine._skip_known_articles(iter([["https://a.com/1"]]), category, []))
+
+        score_articles = repo_cls.return_value.touch_known_articles.call_args.kwargs["score_articles"]
+        scored = score_articles([{"title": "AI in 2024", "content": "Markets"}, {"title": "Sports", "content": ""}])
+        assert [article["relevance_score"] for article in scored] == [0.5, 0.0]
+
+    def test_lookup_failure_extracts_whole_batch(self, crawler_engine):
+        with patch(REPO_PATH) as repo_cls:
+            repo_cls.return_value.touch_known_articles.side_effect = RuntimeError("db down")
+            known = []
+            unknown = list(crawler_engine._skip_known_articles(iter([["https://a.com/1"]]), Mock(id="c"), known))
+
+        assert unknown == [["https://a.com/1"]]
+        assert known == []
+
+    def test_crawl_reports_known_articles(self, crawler_engine):
+        category = Mock(id="cat-1", keywords=["AI"], exclude_keywords=[], crawl_period="1d")
+        category.name = "Tech"
+        items = [{"url": "https://a.com/1"}, {"url": "https://a.com/2"}]
+
+        def resolve(resolved_urls, google_news_urls):
+            yield ["https://a.com/1", "https://a.com/2"]
+
+        with patch(REPO_PATH) as repo_cls, \
+             patch.object(crawler_engine, '_partition_search_results', return_value=([], [])), \
+             patch.object(crawler_engine, '_iter_resolved_results', side_effect=resolve), \
+             patch.object(crawler_engine, 'extract_articles_with_threading', return_value=[]) as extract:
+            repo_cls.return_value.touch_known_articles.return_value = {"https://a.com/1", "https://a.com/2"}
+            result = crawler_engine.crawl_category_sync(category, search_results=items)
+
+        assert result['articles_known'] == 2
+        extract.assert_not_called()
+
+    def test_index_negatives_skip_the_lookup(self, crawler_engine):
+        crawler_engine.settings.KNOWN_URL_INDEX_ENABLED = True
+        index = Mock(ready=True)
+        index.filter_possibly_known.return_value = ["https://a.com/1", "https://a.com/2"]
+
+        with patch(REPO_PATH) as repo_cls, \
+             patch('src.core.crawler.sync_engine.get_known_url_index', return_value=index):
+            repo_cls.return_value.touch_known_articles.return_value = {"https://a.com/1"}
+            known = []
+            batch = ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+            unknown = list(crawler_engine._skip_known_articles(iter([batch]), Mock(id="c"), known))
+
+        repo_cls.return_value.touch_known_articles.assert_called_once_with(
+            ["https://a.com/1", "https://a.com/2"], "c", score_articles=ANY
+        )
+        assert unknown == [["https://a.com/2", "https://a.com/3"]]
+        assert known == ["https://a.com/1"]
+        index.record_confirmed.assert_called_once_with(2, 1)
+
+    def test_only_stored_articles_are_added_to_index(self, crawler_engine):
+        crawler_engine.settings.KNOWN_URL_INDEX_ENABLED = True
+        index = Mock(ready=True)
+        articles = [{"url": "https://a.com/1"}, {"url": "https://a.com/2"}]
+
+        def save(articles_data, category_id, job_id, stored_urls):
+            stored_urls.append("https://a.com/1")
+            return 1
+
+        with patch(REPO_PATH) as repo_cls, \
+             patch('src.core.crawler.sync_engine.get_known_url_index', return_value=index), \
+             patch.object(crawler_engine, '_score_articles', side_effect=lambda articles, keywords: articles):
+            repo_cls.return_value.save_articles_with_deduplication.side_effect = save
+            saved = crawler_engine._save_category_articles(articles, Mock(id="c", keywords=[]), None)
+
+        assert saved == 1
+        index.add_urls.assert_called_once_with(["https://a.com/1"])
+
+
+class TestTouchKnownArticles:
+    """Test linking stored articles to the category that found them again."""
+
+    def test_new_links_use_the_current_category_score(self):
+        repo = SyncArticleRepository.__new__(SyncArticleRepository)
+        url = "https://a.com/1"
+        stored = Mock(id="a1", url_hash=repo._generate_url_hash(url), title="AI", content="", relevance_score=0.9)
+        session = MagicMock()
+        session.__enter__.return_value = session
+
+        with patch.object(repo, 'get_session', return_value=session), \
+             patch.object(repo, 'get_existing_by_url_hashes', return_value=[stored]) as lookup:
+            known = repo.touch_known_articles(
+                [url], "cat-2", score_articles=lambda articles: [dict(a, relevance_score=0.5) for a in articles]
+            )
+
+        assert known == {url}
+        lookup.assert_called_once_with([stored.url_hash])
+        link = session.add.call_args.args[0]
+        # Not the 0.9 the article was stored with for another category
+        assert (link.category_id, link.relevance_score) == ("cat-2", 0.5)
+
+    def test_new_links_are_unscored_without_a_scorer(self):
+        repo = SyncArticleRepository.__new__(SyncArticleRepository)
+        url = "https://a.com/1"
+        stored = Mock(id="a1", url_hash=repo._generate_url_hash(url), relevance_score=0.9)
+        session = MagicMock()
+        session.__enter__.return_value = session
+
+        with patch.object(repo, 'get_session', return_value=session), \
+             patch.object(repo, 'get_existing_by_url_hashes', return_value=[stored]):
+            repo.touch_known_articles([url], "cat-2")
+
+        assert session.add.call_args.args[0].relevance_score is None
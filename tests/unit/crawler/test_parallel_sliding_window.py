@@ -0,0 +1,107 @@
+"""Unit tests for concurrent per-day searches in the daily sliding window."""
+import logging
+import threading
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+@pytest.fixture
+def crawler_engine():
+    settings = Mock(spec=Settings)
+    settings.SLIDING_WINDOW_CONCURRENCY = 3
+    settings.MAX_URLS_TO_PROCESS = 20
+    with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+         patch('src.core.crawler.sync_engine.fetch_news'), \
+         patch('src.core.crawler.sync_engine.Article'):
+        return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+
+def _crawl(engine, days=3):
+    return engine.crawl_with_daily_sliding_window(
+        keywords=['AI'],
+        exclude_keywords=[],
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, days),
+        max_results_total=90,
+        language='vi',
+        country='VN'
+    )
+
+
+class TestParallelSlidingWindow:
+    """Test suite for concurrent sliding window crawls."""
+
+    def test_days_are_searched_concurrently(self, crawler_engine):
+        # Every day blocks until all three are in flight at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(**kwargs):
+            barrier.wait()
+            return [f"https://vnexpress.net/{kwargs['start_date'].day}.html"], []
+
+        with patch.object(crawler_engine, 'collect_google_news_results', side_effect=search) as mock_search:
+            urls = _crawl(crawler_engine)
+
+        assert mock_search.call_count == 3
+        assert urls == [f"https://vnexpress.net/{day}.html" for day in (1, 2, 3)]
+
+    def test_results_merged_in_day_order_with_dedup(self, crawler_engine):
+        day_urls = {1: ["a", "b"], 2: ["b", "c"], 3: ["a", "d"]}
+
+        with patch.object(crawler_engine, 'collect_google_news_results',
+                          side_effect=lambda **kwargs: (day_urls[kwargs['start_date'].day], [])):
+            urls = _crawl(crawler_engine)
+
+        assert urls == ["a", "b", "c", "d"]
+
+    def test_failed_day_is_skipped(self, crawler_engine):
+        def search(**kwargs):
+            if kwargs['start_date'].day == 2:
+                raise RuntimeError("rate limited")
+            return [f"u{kwargs['start_date'].day}"], []
+
+        with patch.object(crawler_engine, 'collect_google_news_results', side_effect=search):
+            urls = _crawl(crawler_engine)
+
+        assert urls == ["u1", "u3"]
+
+    def test_duplicate_items_resolved_once_after_all_days(self, crawler_engine):
+        article = "https://news.google.com/rss/articles/CBMiSWh0dHBzOi8vdm5leHByZXNzLm5ldC9h0gEA"
+        day_items = {
+            1: (["a"], [f"{article}?oc=5", "https://news.google.com/rss/articles/g1"]),
+            # Same article ID seen again with different query parameters
+            2: (["b"], [f"{article}?hl=vi&gl=VN", "https://news.google.com/rss/articles/g2"]),
+            3: (["a"], ["https://news.google.com/rss/articles/g1"]),
+        }
+        resolved_batches = []
+
+        def resolve(google_urls, max_urls=None):
+            resolved_batches.append((list(google_urls), max_urls))
+            yield ["r1", "b"]
+
+        with patch.object(crawler_engine, 'collect_google_news_results',
+                          side_effect=lambda **kwargs: day_items[kwargs['start_date'].day]), \
+             patch.object(crawler_engine, 'iter_resolved_google_news_urls', side_effect=resolve):
+            urls = _crawl(crawler_engine)
+
+        assert resolved_batches == [([
+            f"{article}?oc=5",
+            "https://news.google.com/rss/articles/g1",
+            "https://news.google.com/rss/articles/g2",
+        ], 60)]
+        assert urls == ["a", "b", "r1"]
+
+    def test_search_calls_wait_for_rate_limiter(self, crawler_engine):
+        limiter = Mock()
+        limiter.acquire.return_value = False
+        crawler_engine.settings.GOOGLE_NEWS_SEARCH_MAX_WAIT = 1.0
+
+        with patch('src.core.crawler.sync_engine.get_search_rate_limiter', return_value=limiter):
+            with pytest.raises(Exception, match="search budget"):
+                crawler_engine._wait_for_search_slot("AI")
+
+        limiter.acquire.assert_called_once_with(timeout=1.0)
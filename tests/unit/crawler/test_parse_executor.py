@@ -0,0 +1,148 @@
+"""Unit tests for the process-pool parse executor."""
+import logging
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.crawler.article_fetcher import FetchedPage
+from src.core.crawler.parse_executor import ParsedArticle, ParseExecutor, ParseExecutorConfig, parse_article_html
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+from src.shared.exceptions import CrawlerError
+
+PAGE = """<html><head><title>Gold prices rise sharply</title></head>
+<body><article><h1>Gold prices rise sharply</h1>
+<p>Domestic gold prices rose sharply this morning, following the upward trend of the world market, and
+the trading companies adjusted their listed prices at the same time as they have done in the past.</p>
+<p>According to experts, the demand for buying gold as a store of value is increasing while savings
+interest rates are falling and the stock market has been very volatile over the last few weeks.</p>
+</article></body></html>"""
+
+
+class TestParseArticleHtml:
+    """Test the function that runs in parse processes."""
+
+    def test_extracts_fields(self):
+        parsed = parse_article_html("https://vnexpress.net/gia-vang.html", PAGE)
+
+        assert parsed.ok
+        assert parsed.title == "Gold prices rise sharply"
+        assert "store of value" in parsed.text
+
+    def test_result_is_picklable(self):
+        parsed = parse_article_html("https://vnexpress.net/gia-vang.html", PAGE)
+
+        assert pickle.loads(pickle.dumps(parsed)) == parsed
+
+    def test_errors_are_returned(self):
+        with patch('newspaper.Article', side_effect=ValueError("bad page")):
+            parsed = parse_article_html("https://vnexpress.net/x", PAGE)
+
+        assert not parsed.ok
+        assert "bad page" in parsed.error
+
+
+class TestParseExecutor:
+    """Test suite for ParseExecutor."""
+
+    def test_thread_mode_when_processes_disabled(self):
+        executor = ParseExecutor(ParseExecutorConfig(processes=0, threads=2))
+        try:
+            results = executor.parse_many([("https://a.com/1", PAGE), ("https://a.com/2", PAGE)])
+        finally:
+            executor.shutdown()
+
+        assert executor.mode == "threads"
+        assert [result.url for result in results] == ["https://a.com/1", "https://a.com/2"]
+        assert executor.get_metrics()["parsed"] == 2
+
+    def test_process_mode_parses_across_processes(self):
+        executor = ParseExecutor(ParseExecutorConfig(processes=2))
+        try:
+            results = executor.parse_many([("https://a.com/1", PAGE), ("https://a.com/2", PAGE)])
+        finally:
+            executor.shutdown()
+
+        assert executor.mode == "processes"
+        assert all(result.ok for result in results)
+
+    def test_falls_back_to_threads_when_pool_cannot_start(self):
+        executor = ParseExecutor(ParseExecutorConfig(processes=2), logger=Mock(spec=logging.Logger))
+        with patch('src.core.crawler.parse_executor.ProcessPoolExecutor', side_effect=OSError("no fork")):
+            results = executor.parse_many([("https://a.com/1", PAGE)])
+        executor.shutdown()
+
+        assert executor.mode == "threads"
+        assert results[0].ok
+
+    def test_pages_queued_behind_other_batches_do_not_time_out(self):
+        def slow_parse(url, html):
+            time.sleep(0.15)
+            return ParsedArticle(url=url, title="t")
+
+        executor = ParseExecutor(ParseExecutorConfig(processes=0, threads=1, timeout=0.2))
+        batches = [[(f"https://a.com/{i}", PAGE), (f"https://b.com/{i}", PAGE)] for i in range(2)]
+        with patch('src.core.crawler.parse_executor.parse_article_html', side_effect=slow_parse), \
+             ThreadPoolExecutor(max_workers=2) as callers:
+            results = list(callers.map(executor.parse_many, batches))
+        executor.shutdown()
+
+        assert all(result.ok for batch in results for result in batch)
+        assert executor.get_metrics()["timed_out"] == 0
+
+    def test_batch_past_its_deadline_times_out(self):
+        def stuck_parse(url, html):
+            time.sleep(0.3)
+            return ParsedArticle(url=url)
+
+        executor = ParseExecutor(ParseExecutorConfig(processes=0, threads=1, timeout=0.05))
+        with patch('src.core.crawler.parse_executor.parse_article_html', side_effect=stuck_parse):
+            results = executor.parse_many([("https://a.com/1", PAGE)])
+        executor.shutdown()
+
+        assert "timed out" in results[0].error
+        assert executor.get_metrics()["timed_out"] == 1
+
+
+class TestEngineParseStage:
+    """Test that the engine hands downloaded pages to the parse executor."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.ARTICLE_FETCH_ASYNC_ENABLED = True
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_only_downloaded_pages_are_parsed(self, crawler_engine):
+        fetcher = Mock()
+        fetcher.fetch_batch.return_value = [
+            FetchedPage(url="https://a.com/1", status=200, content=PAGE.encode(), encoding="utf-8"),
+            FetchedPage(url="https://a.com/2", error="HTTP 404", status=404),
+        ]
+        executor = Mock()
+        executor.parse_many.return_value = [ParsedArticle(url="https://a.com/1", title="T", text="x")]
+
+        with patch('src.core.crawler.sync_engine.get_article_fetcher', return_value=fetcher), \
+             patch('src.core.crawler.sync_engine.get_parse_executor', return_value=executor):
+            parsed = crawler_engine._fetch_and_parse_articles([Mock(url="https://a.com/1"), Mock(url="https://a.com/2")])
+
+        executor.parse_many.assert_called_once_with([("https://a.com/1", PAGE)])
+        assert [article.url for article in parsed] == ["https://a.com/1"]
+
+    def test_failed_async_batch_is_not_downloaded_again(self, crawler_engine):
+        crawler_engine.settings.NEWSPAPER_TRUST_HTML_DOMAINS = True
+        fetcher = Mock()
+        fetcher.fetch_batch.side_effect = CrawlerError("Browser pool operation timed out after 60s")
+
+        with patch('src.core.crawler.sync_engine.get_article_fetcher', return_value=fetcher), \
+             patch('src.core.crawler.sync_engine.Article') as article_cls:
+            extracted = crawler_engine.extract_articles_with_threading(["https://a.com/1", "https://b.com/1"])
+
+        assert extracted == []
+        article_cls.return_value.download.assert_not_called()
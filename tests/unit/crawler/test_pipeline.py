@@ -0,0 +1,236 @@
+"""Unit tests for the streaming crawl pipeline."""
+import logging
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.crawler.pipeline import PipelineConfig, StreamingCrawlPipeline
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+from src.shared.exceptions import CrawlerError, GoogleNewsUnavailableError
+
+
+def _extract(urls):
+    return [{'url': url, 'title': url} for url in urls]
+
+
+class Recorder:
+    """Save callback that records every micro-batch."""
+
+    def __init__(self):
+        self.batches = []
+        self.first_save = threading.Event()
+
+    def __call__(self, articles):
+        self.batches.append([a['url'] for a in articles])
+        self.first_save.set()
+        return len(articles)
+
+
+class TestStreamingCrawlPipeline:
+    """Test suite for StreamingCrawlPipeline."""
+
+    def test_first_batch_saved_before_resolution_finishes(self):
+        save = Recorder()
+
+        def url_batches():
+            yield ["https://a.vn/1", "https://a.vn/2"]
+            # The second resolution batch waits until the first articles are saved
+            assert save.first_save.wait(timeout=5)
+            yield ["https://a.vn/3"]
+
+        pipeline = StreamingCrawlPipeline(_extract, save, PipelineConfig(save_batch_size=2, extract_workers=1))
+        result = pipeline.run(url_batches())
+
+        assert save.batches == [["https://a.vn/1", "https://a.vn/2"], ["https://a.vn/3"]]
+        assert result.articles_saved == 3
+        assert result.save_batches == 2
+        assert result.time_to_first_save is not None
+        assert not result.partial
+
+    def test_urls_deduplicated_and_chunked(self):
+        chunks = []
+
+        def extract(urls):
+            chunks.append(list(urls))
+            return _extract(urls)
+
+        pipeline = StreamingCrawlPipeline(
+            extract, Recorder(), PipelineConfig(extract_batch_size=2, extract_workers=1)
+        )
+        result = pipeline.run(iter([["u1", "u2", "u3"], ["u2", "u4"]]))
+
+        assert chunks == [["u1", "u2"], ["u3"], ["u4"]]
+        assert result.urls_received == 4
+        assert result.articles_saved == 4
+
+    def test_extraction_failure_does_not_stop_other_chunks(self):
+        def extract(urls):
+            if "bad" in urls:
+                raise RuntimeError("download failed")
+            return _extract(urls)
+
+        pipeline = StreamingCrawlPipeline(extract, Recorder(), PipelineConfig(extract_batch_size=1))
+        result = pipeline.run(iter([["bad", "good-1", "good-2"]]))
+
+        assert result.extract_errors == 1
+        assert result.articles_saved == 2
+
+    def test_producer_error_before_any_url_is_raised(self):
+        def url_batches():
+            raise GoogleNewsUnavailableError("rate limited")
+            yield  # pragma: no cover
+
+        pipeline = StreamingCrawlPipeline(_extract, Recorder())
+
+        with pytest.raises(GoogleNewsUnavailableError):
+            pipeline.run(url_batches())
+
+    def test_producer_error_after_urls_keeps_partial_results(self):
+        def url_batches():
+            yield ["u1"]
+            raise RuntimeError("browser crashed")
+
+        save = Recorder()
+        result = StreamingCrawlPipeline(_extract, save).run(url_batches())
+
+        assert result.partial
+        assert save.batches == [["u1"]]
+
+    def test_time_budget_saves_partial_results(self):
+        release = threading.Event()
+
+        def url_batches():
+            yield ["u1", "u2"]
+            release.wait(timeout=10)  # Resolution that never finishes in time
+            yield ["u3"]
+
+        save = Recorder()
+        pipeline = StreamingCrawlPipeline(
+            _extract, save, PipelineConfig(save_batch_size=50, time_budget=1.0, shutdown_timeout=1.0)
+        )
+        try:
+            result = pipeline.run(url_batches())
+        finally:
+            release.set()
+
+        assert result.partial
+        assert result.articles_saved == 2
+        assert save.batches == [["u1", "u2"]]
+
+    def test_producer_stops_between_batches_once_the_pipeline_stops(self):
+        stop = threading.Event()
+        produced = []
+        closed = threading.Event()
+
+        def url_batches():
+            try:
+                for i in range(100):
+                    if stop.is_set():
+                        return
+                    produced.append(i)
+                    yield [f"u{i}"]
+                    time.sleep(0.1)
+            finally:
+                closed.set()
+
+        pipeline = StreamingCrawlPipeline(
+            _extract, Recorder(), PipelineConfig(save_batch_size=50, time_budget=0.5, shutdown_timeout=1.0)
+        )
+        result = pipeline.run(url_batches(), stop=stop)
+
+        assert result.partial
+        assert closed.wait(timeout=1)
+        assert len(produced) < 10
+
+    def test_extraction_finishing_after_time_budget_is_saved(self):
+        def slow_extract(urls):
+            time.sleep(1.5)
+            return _extract(urls)
+
+        save = Recorder()
+        pipeline = StreamingCrawlPipeline(
+            slow_extract, save, PipelineConfig(save_batch_size=50, time_budget=0.5, shutdown_timeout=5.0)
+        )
+        result = pipeline.run(iter([["u1", "u2"]]))
+
+        assert result.partial
+        assert result.articles_saved == 2
+        assert not [t for t in threading.enumerate() if t.name.startswith("crawl-pipeline-")]
+
+
+class TestEngineStreamingCrawl:
+    """Test crawl_category_sync on top of the pipeline."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.MAX_RESULTS_PER_SEARCH = 100
+        settings.PIPELINE_EXTRACT_WORKERS = 2
+        settings.KNOWN_URL_PREFILTER_ENABLED = False
+        settings.ARTICLE_EXTRACTION_BATCH_SIZE = 10
+        settings.PIPELINE_SAVE_BATCH_SIZE = 20
+        settings.PIPELINE_QUEUE_SIZE = 20
+        settings.JOB_EXECUTION_TIMEOUT = 1800
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    @pytest.fixture
+    def category(self):
+        return Mock(name="category", keywords=["AI"], exclude_keywords=[], language="vi", country="VN", crawl_period=None)
+
+    def test_crawl_streams_search_batches_into_saves(self, crawler_engine, category):
+        with patch.object(crawler_engine, 'iter_search_google_news', return_value=iter([["u1"], ["u2"]])), \
+             patch.object(crawler_engine, 'extract_articles_with_threading', side_effect=lambda urls, threads: _extract(urls)), \
+             patch.object(crawler_engine, '_save_category_articles', side_effect=lambda articles, *_: len(articles)) as mock_save:
+            result = crawler_engine.crawl_category_sync(category, job_id="job-1")
+
+        assert result['articles_found'] == 2
+        assert result['articles_saved'] == 2
+        assert not result['partial']
+        assert all(call.args[1] is category and call.args[2] == "job-1" for call in mock_save.call_args_list)
+
+    def test_closing_sliding_window_does_not_wait_for_queued_days(self, crawler_engine):
+        from datetime import datetime
+
+        crawler_engine.settings.SLIDING_WINDOW_CONCURRENCY = 1
+        searched = []
+
+        def slow_day(**kwargs):
+            searched.append(kwargs["start_date"])
+            time.sleep(0.1)
+            return [f"https://vnexpress.net/{len(searched)}"], []
+
+        with patch.object(crawler_engine, 'collect_google_news_results', side_effect=slow_day):
+            batches = crawler_engine.iter_daily_sliding_window(
+                keywords=["AI"], exclude_keywords=[], start_date=datetime(2024, 1, 1),
+                end_date=datetime(2024, 1, 30), max_results_total=300, language="vi", country="VN"
+            )
+            next(batches)
+            start = time.monotonic()
+            batches.close()
+
+        assert time.monotonic() - start < 1.0
+        time.sleep(0.2)
+        assert len(searched) < 30
+
+    def test_search_failure_is_wrapped(self, crawler_engine, category):
+        def failing_search(**kwargs):
+            raise GoogleNewsUnavailableError("rate limited")
+            yield  # pragma: no cover
+
+        with patch.object(crawler_engine, 'iter_search_google_news', side_effect=failing_search):
+            with pytest.raises(CrawlerError):
+                crawler_engine.crawl_category_sync(category)
+
+    def test_scoring_splits_title_and_content(self, crawler_engine):
+        articles = [{'url': 'u1', 'title': 'AI news', 'content': 'nothing here'}]
+
+        with patch('src.core.crawler.keyword_matcher.enhance_articles_with_matched_keywords',
+                   side_effect=lambda articles, keywords: [dict(a, keywords_matched=['AI']) for a in articles]):
+            scored = crawler_engine._score_articles(articles, ['AI'])
+
+        assert scored[0]['relevance_score'] == 0.5
@@ -0,0 +1,117 @@
+"""Unit tests for query sharding of large keyword lists."""
+import logging
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.crawler.query_planner import QueryPlanner, QueryShard, ShardYield, build_query
+from src.core.crawler.search_client import FeedResponse
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+from src.shared.exceptions import GoogleNewsUnavailableError
+
+
+class TestQueryPlanner:
+    """Test suite for QueryPlanner."""
+
+    def test_build_query(self):
+        assert build_query(["AI", "blockchain"], ["crypto"]) == "AI OR blockchain -crypto"
+        assert build_query(["AI"]) == "AI"
+
+    def test_splits_by_keyword_count(self):
+        keywords = [f"kw{i}" for i in range(7)]
+
+        shards = QueryPlanner(max_query_length=1000, max_keywords_per_shard=3).plan(keywords, ["spam"])
+
+        assert [shard.keywords for shard in shards] == [keywords[0:3], keywords[3:6], keywords[6:7]]
+        assert all(shard.exclude_keywords == ["spam"] for shard in shards)
+        assert shards[2].query == "kw6 -spam"
+
+    def test_splits_by_query_length_and_drops_duplicates(self):
+        keywords = ["artificial intelligence", "AI", "machine learning", "ai", "x" * 80]
+
+        shards = QueryPlanner(max_query_length=50, max_keywords_per_shard=10).plan(keywords, ["ads"])
+
+        assert [shard.keywords for shard in shards] == [
+            ["artificial intelligence", "AI"], ["machine learning"], ["x" * 80]
+        ]
+        # Only an oversized single keyword may exceed the budget
+        assert all(len(shard.query) <= 50 for shard in shards[:2])
+
+    def test_saturation(self):
+        shard = QueryShard(0, ["AI"])
+
+        assert ShardYield(shard, results=100, max_results=100).saturated
+        assert not ShardYield(shard, results=40, max_results=100).saturated
+        assert not ShardYield(shard, results=0, max_results=100, error="boom").saturated
+
+
+def _item(article_id):
+    return {"url": f"https://news.google.com/rss/articles/{article_id}", "publisher": " "}
+
+
+class TestEngineQuerySharding:
+    """Test sharded searches in the engine."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED = True
+        settings.FEED_CACHE_ENABLED = False
+        settings.QUERY_SHARD_MAX_LENGTH = 1000
+        settings.QUERY_SHARD_MAX_KEYWORDS = 2
+        settings.QUERY_SHARD_CONCURRENCY = 2
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_shards_searched_and_merged_by_article_id(self, crawler_engine):
+        feeds = {
+            "a OR b": [_item("CBMiAAA"), _item("CBMiBBB")],
+            "c OR d": [_item("CBMiBBB"), _item("CBMiCCC")],
+        }
+        search_client = Mock()
+        search_client.search.side_effect = lambda query, **kwargs: FeedResponse(
+            url=query, status=200, items=feeds[query]
+        )
+
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch('src.core.crawler.sync_engine.decode_google_news_url', return_value=None), \
+             patch.object(crawler_engine, '_wait_for_search_slot') as mock_wait:
+            resolved, pending = crawler_engine.collect_google_news_results(
+                keywords=["a", "b", "c", "d"], max_results=2
+            )
+
+        assert resolved == []
+        assert pending == [
+            "https://news.google.com/rss/articles/CBMiAAA",
+            "https://news.google.com/rss/articles/CBMiBBB",
+            "https://news.google.com/rss/articles/CBMiCCC",
+        ]
+        # Every shard waits for the shared search budget
+        assert mock_wait.call_count == 2
+
+        stats = crawler_engine.get_shard_stats()
+        assert sorted(stat["results"] for stat in stats) == [2, 2]
+        assert all(stat["saturated"] for stat in stats)
+
+    def test_failed_shard_is_skipped_unless_all_fail(self, crawler_engine):
+        def search(query, **kwargs):
+            if query == "c OR d":
+                raise GoogleNewsUnavailableError("HTTP 503")
+            return FeedResponse(url=query, status=200, items=[_item("CBMiAAA")])
+
+        search_client = Mock()
+        search_client.search.side_effect = search
+
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch('src.core.crawler.sync_engine.decode_google_news_url', return_value=None), \
+             patch.object(crawler_engine, '_wait_for_search_slot'):
+            _, pending = crawler_engine.collect_google_news_results(keywords=["a", "b", "c", "d"])
+
+            assert pending == ["https://news.google.com/rss/articles/CBMiAAA"]
+            assert [stat["error"] is not None for stat in crawler_engine.get_shard_stats()].count(True) == 1
+
+            search_client.search.side_effect = GoogleNewsUnavailableError("HTTP 503")
+            with pytest.raises(GoogleNewsUnavailableError):
+                crawler_engine.collect_google_news_results(keywords=["a", "b", "c", "d"])
@@ -0,0 +1,168 @@
+"""Unit tests for the Google News token-bucket rate limiter."""
+import threading
+import time
+import pytest
+import redis
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.crawler.rate_limiter import (
+    RedisTokenBucket,
+    TokenBucket,
+    get_resolve_rate_limiter,
+    get_search_rate_limiter,
+)
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_refill(self):
+        bucket = TokenBucket(rate=10.0, capacity=2)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == pytest.approx(0.1, abs=0.02)
+
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        assert bucket.acquire(timeout=1.0)
+
+        assert time.monotonic() - start >= 0.04
+        metrics = bucket.get_metrics()
+        assert metrics["acquired"] == 2
+        assert metrics["waited"] == 1
+
+    def test_acquire_times_out(self):
+        bucket = TokenBucket(rate=0.1, capacity=1)
+        bucket.acquire()
+
+        assert bucket.acquire(timeout=0.5) is False
+        assert bucket.get_metrics()["timeouts"] == 1
+
+    def test_threads_share_budget(self):
+        bucket = TokenBucket(rate=50.0, capacity=1)
+        stamps = []
+        lock = threading.Lock()
+
+        def worker():
+            bucket.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Five calls at 50/s with no burst span at least four refill intervals
+        assert max(stamps) - min(stamps) >= 4 / 50 * 0.9
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+
+class TestRedisTokenBucket:
+    """Test suite for the Redis-backed token bucket."""
+
+    def test_takes_tokens_through_script(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = ["0", "1.5"]
+        bucket = RedisTokenBucket(client, rate=2.0, capacity=4, name="google_news_search")
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire(2) == 1.5
+
+        script = client.register_script.return_value
+        script.assert_called_with(keys=["gns:ratelimit:google_news_search"], args=[2.0, 4, 2, 62])
+
+    def test_wait_queue_is_tracked_across_processes(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = ["0.01", "0"]
+        client.get.return_value = "0"
+        bucket = RedisTokenBucket(client, rate=100.0, capacity=1, name="google_news_resolve")
+
+        assert bucket.acquire(timeout=1.0)
+
+        client.pipeline.return_value.incr.assert_called_once_with("gns:ratelimit:google_news_resolve:waiting")
+        client.decr.assert_called_once_with("gns:ratelimit:google_news_resolve:waiting")
+        metrics = bucket.get_metrics()
+        assert (metrics["waited"], metrics["waiting"], metrics["max_waiting"]) == (1, 0, 1)
+        assert metrics["backend"] == "redis"
+
+    def test_falls_back_to_local_bucket(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+        bucket = RedisTokenBucket(client, rate=10.0, capacity=1)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() > 0.0
+        assert bucket.get_metrics()["backend"] == "memory"
+
+    def test_local_fallback_gets_a_share_of_the_budget(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = redis.ConnectionError("down")
+        bucket = RedisTokenBucket(client, rate=8.0, capacity=8, local_share=4)
+
+        assert [bucket.try_acquire() for _ in range(2)] == [0.0, 0.0]
+        assert bucket.try_acquire() == pytest.approx(0.5, abs=0.01)
+
+    def test_redis_is_retried_after_interval(self):
+        client = MagicMock()
+        script = client.register_script.return_value
+        script.side_effect = [redis.ConnectionError("down"), "0"]
+        bucket = RedisTokenBucket(client, rate=10.0, capacity=5, redis_retry_interval=0.05)
+
+        assert bucket.try_acquire() == 0.0
+        assert bucket.try_acquire() == 0.0
+        assert script.call_count == 1
+        assert bucket.backend == "memory"
+
+        time.sleep(0.06)
+        assert bucket.try_acquire() == 0.0
+        assert script.call_count == 2
+        assert bucket.backend == "redis"
+
+    def test_wait_queue_is_left_after_falling_back_mid_wait(self):
+        client = MagicMock()
+        client.register_script.return_value.side_effect = ["0.01", redis.ConnectionError("down")]
+        bucket = RedisTokenBucket(client, rate=100.0, capacity=1)
+
+        assert bucket.acquire(timeout=1.0)
+
+        client.pipeline.return_value.incr.assert_called_once_with("gns:ratelimit:default:waiting")
+        client.decr.assert_called_once_with("gns:ratelimit:default:waiting")
+
+    def test_starts_on_fallback_when_redis_is_down(self):
+        settings = Mock(
+            DISTRIBUTED_RATE_LIMIT_ENABLED=True, CELERY_WORKER_CONCURRENCY=4,
+            GOOGLE_NEWS_RESOLVE_RATE=5.0, GOOGLE_NEWS_RESOLVE_BURST=20,
+        )
+
+        with patch.dict('src.core.crawler.rate_limiter._rate_limiters', clear=True), \
+                patch('src.core.crawler.rate_limiter.get_redis_client'), \
+                patch('src.core.crawler.rate_limiter.is_redis_available', return_value=False):
+            resolve = get_resolve_rate_limiter(settings)
+
+        assert isinstance(resolve, RedisTokenBucket)
+        assert resolve.backend == "memory"
+        assert (resolve.fallback.rate, resolve.fallback.capacity) == (1.25, 5)
+
+    def test_endpoints_have_their_own_budgets(self):
+        settings = Mock(
+            DISTRIBUTED_RATE_LIMIT_ENABLED=False,
+            GOOGLE_NEWS_SEARCH_RATE=0.5, GOOGLE_NEWS_SEARCH_BURST=3,
+            GOOGLE_NEWS_RESOLVE_RATE=5.0, GOOGLE_NEWS_RESOLVE_BURST=20,
+        )
+
+        with patch.dict('src.core.crawler.rate_limiter._rate_limiters', clear=True):
+            search = get_search_rate_limiter(settings)
+            resolve = get_resolve_rate_limiter(settings)
+
+            assert (search.rate, search.capacity) == (0.5, 3)
+            assert (resolve.rate, resolve.capacity) == (5.0, 20)
+            assert get_search_rate_limiter(settings) is search
@@ -0,0 +1,193 @@
+"""Unit tests for the event-driven Google News redirect resolver."""
+import asyncio
+import logging
+import time
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.core.crawler.redirect_resolver import RedirectResolver, TabResolution
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+class FakePage:
+    """Page double that emits Playwright events and routes navigations."""
+
+    def __init__(self, redirects=(), goto_error=None):
+        # redirects: (delay, url) navigations fired after the Google page commits
+        self.redirects = redirects
+        self.goto_error = goto_error
+        self.main_frame = SimpleNamespace(url="about:blank")
+        self.handlers = {}
+        self.route_handler = None
+        self.aborted = []
+        self.fallbacks = []
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    async def route(self, pattern, handler):
+        self.route_handler = handler
+
+    async def _navigate(self, url):
+        request = SimpleNamespace(url=url, frame=self.main_frame, is_navigation_request=lambda: True)
+        for handler in self.handlers.get("request", []):
+            handler(request)
+        if self.route_handler:
+            route = SimpleNamespace(
+                abort=AsyncMock(side_effect=lambda: self.aborted.append(url)),
+                fallback=AsyncMock(side_effect=lambda: self.fallbacks.append(url)),
+            )
+            await self.route_handler(route, request)
+            if url in self.aborted:
+                return
+        self.main_frame.url = url
+        for handler in self.handlers.get("framenavigated", []):
+            handler(self.main_frame)
+
+    async def goto(self, url, **kwargs):
+        if self.goto_error:
+            raise self.goto_error
+        await self._navigate(url)
+        loop = asyncio.get_running_loop()
+        for delay, target in self.redirects:
+            loop.call_later(delay, lambda target=target: asyncio.ensure_future(self._navigate(target)))
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePool:
+    """Browser pool double leasing a context that hands out FakePages."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.context = SimpleNamespace(new_page=self._new_page)
+
+    async def _new_page(self):
+        return self.pages.pop(0)
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.context
+
+
+GOOGLE_URL = "https://news.google.com/rss/articles/CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+
+
+class TestRedirectResolver:
+    """Test suite for RedirectResolver."""
+
+    @pytest.mark.asyncio
+    async def test_tabs_complete_independently(self):
+        pages = [
+            FakePage(redirects=[(0.2, "https://vnexpress.net/a.html")]),
+            FakePage(redirects=[(0.3, "https://dantri.com.vn/b.htm")]),
+            FakePage(),  # never redirects
+        ]
+        resolver = RedirectResolver(FakePool(pages), tab_stagger=0, intercept=False)
+
+        start = time.monotonic()
+        outcomes = await resolver.resolve_batch_async([f"{GOOGLE_URL}{i}" for i in range(3)], max_wait=1.0)
+        total = time.monotonic() - start
+
+        assert [o.resolved_url for o in outcomes] == [
+            "https://vnexpress.net/a.html", "https://dantri.com.vn/b.htm", None
+        ]
+        assert outcomes[0].elapsed < 0.5
+        assert outcomes[2].error.startswith("no redirect")
+        # The batch is bounded by the slowest tab, not the sum of the waits
+        assert total < 1.5
+        assert all(page.closed for page in pages)
+
+    @pytest.mark.asyncio
+    async def test_per_tab_deadlines(self):
+        pages = [
+            FakePage(redirects=[(0.3, "https://vnexpress.net/a.html")]),
+            FakePage(redirects=[(0.3, "https://dantri.com.vn/b.htm")]),
+        ]
+        resolver = RedirectResolver(FakePool(pages), tab_stagger=0, intercept=False)
+
+        outcomes = await resolver.resolve_batch_async([GOOGLE_URL, f"{GOOGLE_URL}1"], max_wait=[0.1, 1.0])
+
+        assert outcomes[0].timed_out and outcomes[0].resolved_url is None
+        assert outcomes[1].resolved_url == "https://dantri.com.vn/b.htm"
+        assert not outcomes[1].timed_out
+
+    @pytest.mark.asyncio
+    async def test_google_hops_are_ignored(self):
+        page = FakePage(redirects=[
+            (0.05, "https://consent.google.com/ml?continue=x"),
+            (0.1, "https://thanhnien.vn/d.htm"),
+        ])
+        resolver = RedirectResolver(FakePool([page]), tab_stagger=0, intercept=False)
+
+        outcomes = await resolver.resolve_batch_async([GOOGLE_URL], max_wait=1.0)
+
+        assert outcomes[0].resolved_url == "https://thanhnien.vn/d.htm"
+        assert page.main_frame.url == "https://thanhnien.vn/d.htm"
+
+    @pytest.mark.asyncio
+    async def test_intercept_aborts_publisher_navigation(self):
+        page = FakePage(redirects=[
+            (0.05, "https://consent.google.com/ml?continue=x"),
+            (0.1, "https://vtv.vn/c.htm"),
+        ])
+        resolver = RedirectResolver(FakePool([page]), tab_stagger=0)
+
+        outcomes = await resolver.resolve_batch_async([GOOGLE_URL], max_wait=1.0)
+
+        assert outcomes[0].resolved_url == "https://vtv.vn/c.htm"
+        assert page.aborted == ["https://vtv.vn/c.htm"]
+        # Google's own navigations are left to the context routes
+        assert page.fallbacks == [GOOGLE_URL, "https://consent.google.com/ml?continue=x"]
+        # The publisher page never loaded in the tab
+        assert page.main_frame.url == "https://consent.google.com/ml?continue=x"
+
+    @pytest.mark.asyncio
+    async def test_failed_navigation_returns_immediately(self):
+        page = FakePage(goto_error=RuntimeError("net::ERR_NAME_NOT_RESOLVED"))
+        resolver = RedirectResolver(FakePool([page]), tab_stagger=0)
+
+        outcomes = await resolver.resolve_batch_async([GOOGLE_URL], max_wait=5.0)
+
+        assert outcomes[0].resolved_url is None
+        assert "ERR_NAME_NOT_RESOLVED" in outcomes[0].error
+        assert outcomes[0].elapsed < 1.0
+        assert page.closed
+
+
+class TestEngineBatchResolution:
+    """Test the engine's use of the redirect resolver."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.BROWSER_INTERCEPT_REDIRECTS = True
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_batch_maps_urls_to_resolutions(self, crawler_engine):
+        outcomes = [
+            TabResolution("g1", "https://vnexpress.net/a.html", elapsed=2.0),
+            TabResolution("g2", error="navigation failed: net::ERR_ABORTED", elapsed=1.0),
+        ]
+        timing_model = Mock()
+        timing_model.deadlines.return_value = [10.0, 10.0]
+
+        with patch('src.core.crawler.sync_engine.get_browser_pool'), \
+             patch('src.core.crawler.sync_engine.get_redirect_timing_model', return_value=timing_model), \
+             patch('src.core.crawler.sync_engine.RedirectResolver') as mock_resolver, \
+             patch.object(crawler_engine, '_wait_for_resolve_slot'):
+            mock_resolver.return_value.resolve_batch.return_value = outcomes
+            results = crawler_engine._resolve_batch_with_single_browser(["g1", "g2"])
+
+        assert results == {"g1": "https://vnexpress.net/a.html", "g2": None}
+        assert mock_resolver.call_args.kwargs["intercept"] is True
+        mock_resolver.return_value.resolve_batch.assert_called_once_with(["g1", "g2"], [10.0, 10.0])
+        timing_model.record.assert_called_once_with([("vnexpress.net", 2.0, True)])
@@ -0,0 +1,145 @@
+"""Unit tests for the per-publisher redirect timing model."""
+import logging
+import pytest
+import redis
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.crawler.redirect_resolver import TabResolution
+from src.core.crawler.redirect_timing import (
+    MemoryTimingStore,
+    RedirectTimingModel,
+    RedisTimingStore,
+    percentile,
+    publisher_domain,
+)
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+@pytest.fixture
+def model():
+    return RedirectTimingModel(
+        primary=None, fallback=MemoryTimingStore(),
+        default_wait=10.0, min_wait=3.0, max_wait=15.0, margin=1.5, min_samples=3
+    )
+
+
+class TestRedirectTimingModel:
+    """Test suite for RedirectTimingModel."""
+
+    def test_helpers(self):
+        assert publisher_domain("https://www.VnExpress.net/a.html") == "vnexpress.net"
+        assert publisher_domain("dantri.com.vn") == "dantri.com.vn"
+        assert publisher_domain(None) is None
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+        assert percentile([1.0, 2.0], 95) == pytest.approx(1.95)
+        assert percentile([], 50) is None
+
+    def test_deadlines_follow_domain_percentiles(self, model):
+        model.record([("fast.vn", 1.0, True)] * 5 + [("slow.vn", 8.0, True)] * 5)
+
+        fast, slow, unseen, unknown = model.deadlines(["fast.vn", "slow.vn", "new.vn", None])
+
+        # Fast publishers are clamped to the minimum, slow ones get p95 * margin
+        assert fast == 3.0
+        assert slow == 12.0
+        # Domains without history use the global window (p95 of all samples)
+        assert unseen == unknown == 12.0
+
+    def test_default_wait_until_enough_samples(self, model):
+        model.record([("fast.vn", 1.0, True)])
+
+        assert model.deadlines(["fast.vn"]) == [10.0]
+        assert model.should_retry(10.0)
+        assert not model.should_retry(15.0)
+
+    def test_timeouts_count_without_samples(self, model):
+        model.record([("slow.vn", 4.0, False), ("slow.vn", 2.0, True)])
+
+        stats = model.get_stats()["domains"]
+
+        assert stats["slow.vn"]["samples"] == 1
+        assert stats["slow.vn"]["timeouts"] == 1
+        assert stats["slow.vn"]["timeout_rate"] == 0.5
+        assert stats["*"]["resolved"] == 1
+        assert stats["slow.vn"]["p50"] == 2.0
+
+    def test_redis_store_caps_window(self):
+        client = MagicMock()
+        model = RedirectTimingModel(primary=RedisTimingStore(client), fallback=MemoryTimingStore(), window=50)
+
+        model.record([("vnexpress.net", 1.25, True)])
+
+        pipe = client.pipeline.return_value
+        pipe.lpush.assert_any_call("gns:timing:vnexpress.net:samples", "1.250")
+        pipe.ltrim.assert_any_call("gns:timing:vnexpress.net:samples", 0, 49)
+        pipe.hincrby.assert_any_call("gns:timing:*:outcomes", "resolved", 1)
+
+    def test_falls_back_to_memory_when_redis_fails(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        model = RedirectTimingModel(primary=RedisTimingStore(client), fallback=MemoryTimingStore(), min_samples=1)
+
+        model.record([("vnexpress.net", 2.0, True)])
+
+        assert model.backend == "memory"
+        assert model.deadlines(["vnexpress.net"]) == [3.0]
+
+    def test_redis_is_retried_after_interval(self):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = [redis.ConnectionError("down"), [1, 1, 1, 1]]
+        model = RedirectTimingModel(
+            primary=RedisTimingStore(client), fallback=MemoryTimingStore(), redis_retry_interval=30
+        )
+
+        with patch("src.shared.redis_client.time.monotonic", return_value=100.0):
+            model.record([("vnexpress.net", 2.0, True)])
+            assert model.backend == "memory"
+
+        with patch("src.shared.redis_client.time.monotonic", return_value=131.0):
+            assert model.backend == "redis"
+            model.record([("vnexpress.net", 2.0, True)])
+
+        assert client.pipeline.return_value.execute.call_count == 2
+        assert model.errors == 1
+
+
+class TestEngineRedirectTiming:
+    """Test per-tab deadlines and retries in the engine."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.BROWSER_INTERCEPT_REDIRECTS = True
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_tight_deadline_timeouts_retried_with_max_wait(self, crawler_engine, model):
+        model.record([("fast.vn", 1.0, True)] * 3)
+        crawler_engine._publisher_hints = {"g1": "fast.vn"}
+        first_round = [
+            TabResolution("g1", error="no redirect within 3.0s", elapsed=3.0, timed_out=True),
+            TabResolution("g2", "https://slow.vn/b.html", elapsed=6.0),
+        ]
+        retry_round = [TabResolution("g1", "https://fast.vn/a.html", elapsed=5.0)]
+
+        with patch('src.core.crawler.sync_engine.get_browser_pool'), \
+             patch('src.core.crawler.sync_engine.get_redirect_timing_model', return_value=model), \
+             patch('src.core.crawler.sync_engine.RedirectResolver') as mock_resolver, \
+             patch.object(crawler_engine, '_wait_for_resolve_slot'):
+            mock_resolver.return_value.resolve_batch.side_effect = [first_round, retry_round]
+            results = crawler_engine._resolve_batch_with_single_browser(["g1", "g2"])
+
+        assert results == {"g1": "https://fast.vn/a.html", "g2": "https://slow.vn/b.html"}
+        calls = mock_resolver.return_value.resolve_batch.call_args_list
+        # fast.vn has its own tight deadline, g2 falls back to the global window
+        assert calls[0].args == (["g1", "g2"], [3.0, 3.0])
+        assert calls[1].args == (["g1"], 15.0)
+
+        stats = model.get_stats()["domains"]
+        assert stats["fast.vn"]["timeouts"] == 1
+        assert stats["fast.vn"]["samples"] == 4
+        assert stats["slow.vn"]["samples"] == 1
+        assert crawler_engine._publisher_hints == {}
@@ -0,0 +1,173 @@
+"""Unit tests for the shared Google News resolution cache."""
+import logging
+import pytest
+import redis
+from unittest.mock import MagicMock, Mock, patch
+
+from src.core.crawler.resolution_cache import (
+    NEGATIVE_ENTRY,
+    RedisResolutionStore,
+    ResolutionCache,
+    SqliteResolutionStore,
+)
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+OPAQUE_URL = "https://news.google.com/articles/CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+OPAQUE_ID = "CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    store = SqliteResolutionStore(str(tmp_path / "cache" / "resolved.sqlite3"))
+    return ResolutionCache(primary=None, fallback=store, ttl=60, negative_ttl=10)
+
+
+class TestResolutionCache:
+    """Test suite for ResolutionCache behavior."""
+
+    def test_hit_miss_and_negative_lookups(self, sqlite_cache):
+        sqlite_cache.set_resolved({"id-1": "https://vnexpress.net/1.html"})
+        sqlite_cache.set_failed(["id-2"])
+
+        lookup = sqlite_cache.get_many(["id-1", "id-2", "id-3"])
+
+        assert lookup == {
+            "id-1": "https://vnexpress.net/1.html",
+            "id-2": NEGATIVE_ENTRY,
+            "id-3": None,
+        }
+        stats = sqlite_cache.get_stats()
+        assert stats["backend"] == "sqlite"
+        assert (stats["hits"], stats["negative_hits"], stats["misses"]) == (1, 1, 1)
+        assert stats["writes"] == 1
+        assert stats["negative_writes"] == 1
+
+    def test_expired_entries_are_misses(self, sqlite_cache):
+        with patch("src.core.crawler.resolution_cache.time.time", return_value=1000.0):
+            sqlite_cache.set_resolved({"id-1": "https://vnexpress.net/1.html"})
+            sqlite_cache.set_failed(["id-2"])
+
+        with patch("src.core.crawler.resolution_cache.time.time", return_value=1030.0):
+            lookup = sqlite_cache.get_many(["id-1", "id-2"])
+
+        # Positive TTL is 60s, negative TTL is 10s
+        assert lookup == {"id-1": "https://vnexpress.net/1.html", "id-2": None}
+
+    def test_redis_store_uses_ttls(self):
+        client = MagicMock()
+        cache = ResolutionCache(primary=RedisResolutionStore(client), fallback=None, ttl=60, negative_ttl=10)
+
+        cache.set_resolved({"id-1": "https://vnexpress.net/1.html"})
+        cache.set_failed(["id-2"])
+
+        pipe = client.pipeline.return_value
+        pipe.set.assert_any_call("gns:resolved:id-1", "https://vnexpress.net/1.html", ex=60)
+        pipe.set.assert_any_call("gns:resolved:id-2", NEGATIVE_ENTRY, ex=10)
+
+    def test_redis_counters_shared(self):
+        client = MagicMock()
+        client.mget.return_value = ["https://vnexpress.net/1.html", None]
+        cache = ResolutionCache(primary=RedisResolutionStore(client), fallback=None)
+
+        cache.get_many(["id-1", "id-2"])
+
+        pipe = client.pipeline.return_value
+        pipe.hincrby.assert_any_call("gns:resolved:stats", "hits", 1)
+        pipe.hincrby.assert_any_call("gns:resolved:stats", "misses", 1)
+
+    def test_falls_back_to_sqlite_when_redis_fails(self, tmp_path):
+        client = MagicMock()
+        client.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        client.mget.side_effect = redis.ConnectionError("down")
+        fallback = SqliteResolutionStore(str(tmp_path / "resolved.sqlite3"))
+        cache = ResolutionCache(primary=RedisResolutionStore(client), fallback=fallback)
+
+        cache.set_resolved({"id-1": "https://vnexpress.net/1.html"})
+
+        assert cache.backend == "sqlite"
+        assert cache.get_many(["id-1"]) == {"id-1": "https://vnexpress.net/1.html"}
+        assert cache.get_stats()["errors"] == 1
+
+    def test_redis_is_retried_after_interval(self, tmp_path):
+        client = MagicMock()
+        client.mget.side_effect = [redis.ConnectionError("down"), ["https://vnexpress.net/1.html"]]
+        fallback = SqliteResolutionStore(str(tmp_path / "resolved.sqlite3"))
+        cache = ResolutionCache(
+            primary=RedisResolutionStore(client), fallback=fallback, redis_retry_interval=30
+        )
+
+        with patch("src.core.crawler.resolution_cache.time.monotonic", return_value=100.0):
+            assert cache.get_many(["id-1"]) == {"id-1": None}
+            assert cache.backend == "sqlite"
+
+        with patch("src.core.crawler.resolution_cache.time.monotonic", return_value=131.0):
+            assert cache.backend == "redis"
+            assert cache.get_many(["id-1"]) == {"id-1": "https://vnexpress.net/1.html"}
+
+    def test_redis_miss_checks_sqlite(self, tmp_path):
+        client = MagicMock()
+        client.mget.return_value = [None, "https://vnexpress.net/2.html"]
+        fallback = SqliteResolutionStore(str(tmp_path / "resolved.sqlite3"))
+        fallback.set_many({"id-1": "https://vnexpress.net/1.html"}, ttl=60)
+        cache = ResolutionCache(primary=RedisResolutionStore(client), fallback=fallback)
+
+        lookup = cache.get_many(["id-1", "id-2"])
+
+        assert lookup == {"id-1": "https://vnexpress.net/1.html", "id-2": "https://vnexpress.net/2.html"}
+
+
+class TestEngineResolutionCache:
+    """Test that resolve_google_news_urls consults the cache before the browser."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.MAX_URLS_TO_PROCESS = 100
+        settings.MAX_TABS_PER_BROWSER = 10
+        settings.BROWSER_POOL_SIZE = 1
+        settings.CELERY_WORKER_CONCURRENCY = 1
+        settings.RESOLUTION_CPUS_PER_BROWSER = 1.0
+        settings.BROWSER_POOL_MAX_MEMORY_MB = 1024
+        settings.RESOLUTION_MEMORY_RESERVE_MB = 1024
+        settings.HTTP_RESOLVER_ENABLED = False
+        settings.RESOLUTION_CACHE_ENABLED = True
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_cache_hit_skips_browser(self, crawler_engine, sqlite_cache):
+        sqlite_cache.set_resolved({OPAQUE_ID: "https://dantri.com.vn/a.htm"})
+
+        with patch('src.core.crawler.sync_engine.get_resolution_cache', return_value=sqlite_cache), \
+             patch.object(crawler_engine, '_resolve_batch_with_single_browser') as mock_browser:
+            resolved = crawler_engine.resolve_google_news_urls([OPAQUE_URL])
+
+        mock_browser.assert_not_called()
+        assert resolved == ["https://dantri.com.vn/a.htm"]
+
+    def test_negative_hit_skips_browser(self, crawler_engine, sqlite_cache):
+        sqlite_cache.set_failed([OPAQUE_ID])
+
+        with patch('src.core.crawler.sync_engine.get_resolution_cache', return_value=sqlite_cache), \
+             patch.object(crawler_engine, '_resolve_batch_with_single_browser') as mock_browser:
+            resolved = crawler_engine.resolve_google_news_urls([OPAQUE_URL])
+
+        mock_browser.assert_not_called()
+        assert resolved == []
+
+    def test_browser_results_written_to_cache(self, crawler_engine, sqlite_cache):
+        other_url = OPAQUE_URL.replace("CAIi", "CAIj")
+
+        with patch('src.core.crawler.sync_engine.get_resolution_cache', return_value=sqlite_cache), \
+             patch('src.core.crawler.sync_engine.async_playwright', Mock()), \
+             patch.object(crawler_engine, '_resolve_batch_with_single_browser',
+                          return_value={OPAQUE_URL: "https://dantri.com.vn/a.htm", other_url: None}):
+            resolved = crawler_engine.resolve_google_news_urls([OPAQUE_URL, other_url])
+
+        assert resolved == ["https://dantri.com.vn/a.htm"]
+        assert sqlite_cache.get_many([OPAQUE_ID, OPAQUE_ID.replace("CAIi", "CAIj")]) == {
+            OPAQUE_ID: "https://dantri.com.vn/a.htm",
+            OPAQUE_ID.replace("CAIi", "CAIj"): NEGATIVE_ENTRY,
+        }
@@ -0,0 +1,89 @@
+"""Unit tests for concurrent batch resolution across browsers."""
+import threading
+import time
+import pytest
+
+from src.core.crawler.resolution_executor import (
+    ResolutionExecutor,
+    ResolutionExecutorConfig,
+    plan_browser_count,
+)
+
+
+class TestPlanBrowserCount:
+    """Test CPU- and memory-aware browser limits."""
+
+    def test_cpu_share_per_worker_process(self):
+        # 8 cores shared by 2 worker processes at 1 core per browser
+        assert plan_browser_count(8, cpu_count=8, available_mb=None, worker_processes=2) == 4
+
+    def test_memory_limit(self):
+        # (5120 - 1024) MB free / 1024 MB per browser
+        assert plan_browser_count(
+            8, cpu_count=16, available_mb=5120, memory_per_browser_mb=1024, memory_reserve_mb=1024
+        ) == 4
+
+    def test_configured_maximum_and_floor(self):
+        assert plan_browser_count(2, cpu_count=16, available_mb=None) == 2
+        assert plan_browser_count(4, cpu_count=1, available_mb=100, worker_processes=4) == 1
+
+
+class TestResolutionExecutor:
+    """Test suite for ResolutionExecutor."""
+
+    def test_batches_resolve_concurrently(self):
+        # Every batch blocks until all three are running at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def resolve_batch(urls):
+            barrier.wait()
+            return {url: f"https://vnexpress.net/{url}.html" for url in urls}
+
+        executor = ResolutionExecutor(resolve_batch, ResolutionExecutorConfig(browsers=3, tabs_per_browser=2))
+        results = list(executor.iter_resolve([f"g{i}" for i in range(6)]))
+
+        assert len(results) == 3
+        assert sorted(url for batch in results for url in batch) == [f"g{i}" for i in range(6)]
+        assert all(len(batch) == 2 for batch in results)
+
+    def test_fast_batch_not_queued_behind_slow_one(self):
+        release = threading.Event()
+
+        def resolve_batch(urls):
+            if urls == ["slow"]:
+                assert release.wait(timeout=5)
+            return {url: None for url in urls}
+
+        executor = ResolutionExecutor(resolve_batch, ResolutionExecutorConfig(browsers=2, tabs_per_browser=1))
+        batches = executor.iter_resolve(["slow", "fast"])
+
+        assert next(batches) == {"fast": None}
+        release.set()
+        assert next(batches) == {"slow": None}
+
+    def test_failed_batch_is_skipped(self):
+        def resolve_batch(urls):
+            if urls == ["bad"]:
+                raise RuntimeError("browser crashed")
+            return {url: url for url in urls}
+
+        executor = ResolutionExecutor(resolve_batch, ResolutionExecutorConfig(browsers=2, tabs_per_browser=1))
+
+        assert list(executor.iter_resolve(["bad", "good"])) == [{"good": "good"}]
+
+    def test_stop_cancels_batches_not_started(self):
+        started = []
+        stop = threading.Event()
+
+        def resolve_batch(urls):
+            started.append(urls[0])
+            time.sleep(0.02)
+            return {url: None for url in urls}
+
+        executor = ResolutionExecutor(resolve_batch, ResolutionExecutorConfig(browsers=1, tabs_per_browser=1))
+        batches = executor.iter_resolve([f"g{i}" for i in range(50)], stop=stop)
+
+        next(batches)
+        stop.set()
+        assert list(batches) == []
+        assert len(started) < 50
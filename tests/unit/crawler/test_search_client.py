@@ -0,0 +1,159 @@
+"""Unit tests for the async Google News RSS search client."""
+import logging
+import httpx
+import pytest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from src.core.crawler.search_client import (
+    FeedResponse,
+    GoogleNewsSearchClient,
+    SearchClientConfig,
+    build_search_url,
+)
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+from src.shared.exceptions import RateLimitExceededError
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>AI - Google News</title>
+<item>
+  <title>AI news - VnExpress</title>
+  <link>https://news.google.com/rss/articles/CBMi1?oc=5</link>
+  <pubDate>Mon, 01 Jan 2024 08:00:00 GMT</pubDate>
+  <description>&lt;a href="x"&gt;AI news&lt;/a&gt;&amp;nbsp;VnExpress</description>
+  <source url="https://vnexpress.net">VnExpress</source>
+</item>
+<item>
+  <title>Blockchain - Dan Tri</title>
+  <link>https://news.google.com/rss/articles/CBMi2?oc=5</link>
+  <source url="https://dantri.com.vn">Dan Tri</source>
+</item>
+</channel></rss>"""
+
+
+def _client(handler):
+    client = GoogleNewsSearchClient(pool=Mock(), config=SearchClientConfig(per_host_limit=2))
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestBuildSearchUrl:
+    """Test RSS search URL construction."""
+
+    def test_period_and_locale(self):
+        url = build_search_url("AI OR blockchain -crypto", "vi", "VN", period="1d")
+
+        assert url == (
+            "https://news.google.com/rss/search?q=AI%20OR%20blockchain%20-crypto%20when%3A1d"
+            "&hl=vi&gl=VN&ceid=VN:vi"
+        )
+
+    def test_date_range(self):
+        url = build_search_url("AI", "en", "US", start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 2))
+
+        assert "q=AI%20before%3A2024-01-02%20after%3A2024-01-01&" in url
+
+
+class TestGoogleNewsSearchClient:
+    """Test suite for GoogleNewsSearchClient."""
+
+    @pytest.mark.asyncio
+    async def test_items_parsed_like_gnews(self):
+        client = _client(lambda request: httpx.Response(200, content=FEED))
+
+        response = await client.search_async("AI", language="vi", country="VN")
+
+        assert [item["url"] for item in response.items] == [
+            "https://news.google.com/rss/articles/CBMi1?oc=5",
+            "https://news.google.com/rss/articles/CBMi2?oc=5",
+        ]
+        first = response.items[0]
+        assert first["title"] == "AI news - VnExpress"
+        assert first["publisher"]["href"] == "https://vnexpress.net"
+        assert first["published date"] == "Mon, 01 Jan 2024 08:00:00 GMT"
+        assert "<a" not in first["description"]
+
+    @pytest.mark.asyncio
+    async def test_conditional_get_reuses_items(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FEED, headers={"ETag": '"v1"'})
+
+        client = _client(handler)
+        first = await client.search_async("AI")
+        second = await client.search_async("AI")
+
+        assert not first.not_modified and first.etag == '"v1"'
+        assert second.not_modified
+        assert second.items == first.items
+        assert "If-None-Match" not in requests[0].headers
+        assert client.get_metrics()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unconditional_get_ignores_remembered_validators(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=FEED, headers={"ETag": '"v1"'})
+
+        client = _client(handler)
+        await client.search_async("AI")
+        # The caller's feed cache has no validators although this client remembers an ETag
+        response = await client.search_async("AI", conditional=False)
+
+        assert not response.not_modified
+        assert len(response.items) == 2
+        assert "If-None-Match" not in requests[1].headers
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_raises(self):
+        client = _client(lambda request: httpx.Response(429, headers={"Retry-After": "120"}))
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await client.search_async("AI")
+
+        assert exc_info.value.retry_after == 120
+
+
+class TestEngineRssSearch:
+    """Test collect_google_news_results on top of the RSS client."""
+
+    def test_search_uses_rss_client(self):
+        settings = Mock(spec=Settings)
+        settings.GOOGLE_NEWS_RSS_CLIENT_ENABLED = True
+        settings.QUERY_SHARD_MAX_LENGTH = 256
+        settings.QUERY_SHARD_MAX_KEYWORDS = 8
+        settings.FEED_CACHE_ENABLED = False
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            engine = SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+        search_client = Mock()
+        search_client.search.return_value = FeedResponse(url="u", status=200, items=[
+            {"url": "https://news.google.com/rss/articles/g1", "publisher": {"href": "https://www.vnexpress.net"}},
+        ])
+
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch.object(engine, '_wait_for_search_slot'), \
+             patch('gnews.GNews') as mock_gnews:
+            resolved, pending = engine.collect_google_news_results(
+                keywords=["AI", "blockchain"], language="VI", country="VN", period="1d"
+            )
+
+        search_client.search.assert_called_once_with(
+            "AI OR blockchain", language="vi", country="VN", max_results=100,
+            start_date=None, end_date=None, period="1d", etag=None, last_modified=None,
+            conditional=True
+        )
+        mock_gnews.assert_not_called()
+        assert (resolved, pending) == ([], ["https://news.google.com/rss/articles/g1"])
+        assert engine._publisher_hints == {"https://news.google.com/rss/articles/g1": "vnexpress.net"}
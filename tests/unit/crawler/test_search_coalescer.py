@@ -0,0 +1,164 @@
+"""Unit tests for coalesced scheduler searches."""
+import logging
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from src.core.crawler.query_planner import QueryPlanner
+from src.core.crawler.search_client import FeedResponse
+from src.core.crawler.search_coalescer import CoalescedResults, fan_out, group_categories
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.shared.config import Settings
+
+
+def _category(keywords, exclude_keywords=None, language="vi", country="VN", crawl_period="1h"):
+    return Mock(
+        id=uuid4(), keywords=keywords, exclude_keywords=exclude_keywords or [],
+        language=language, country=country, crawl_period=crawl_period
+    )
+
+
+def _item(article_id, title):
+    return {"url": f"https://news.google.com/rss/articles/{article_id}", "title": title, "description": ""}
+
+
+class TestSearchCoalescer:
+    """Test suite for grouping and fan-out."""
+
+    def test_groups_by_language_country_and_period(self):
+        tech = _category(["AI", "blockchain"])
+        finance = _category(["blockchain", "stocks"])
+        english = _category(["AI"], language="en", country="US")
+
+        searches = group_categories([tech, finance, english], QueryPlanner(max_keywords_per_shard=8))
+
+        # A category alone in its group keeps searching on its own
+        assert len(searches) == 1
+        search = searches[0]
+        assert (search.language, search.country, search.period) == ("vi", "VN", "1h")
+        assert [shard.query for shard in search.shards] == ["AI OR blockchain OR stocks"]
+        assert search.searches_saved == 1
+
+    def test_fan_out_filters_shared_shards_and_exclusions(self):
+        tech = _category(["AI", "blockchain"], exclude_keywords=["scam"])
+        finance = _category(["stocks"])
+        search = group_categories([tech, finance], QueryPlanner(max_keywords_per_shard=2))[0]
+        assert [shard.keywords for shard in search.shards] == [["AI", "blockchain"], ["stocks"]]
+
+        results = fan_out(search, {
+            0: [_item("CBMiA", "AI chips"), _item("CBMiB", "Blockchain scam"), _item("CBMiC", "Weather")],
+            1: [_item("CBMiD", "Stocks rally on AI"), _item("CBMiA", "AI chips")],
+        })
+
+        # Shard 0 holds only tech keywords: kept without a text match, exclusions still apply
+        assert [item["title"] for item in results[str(tech.id)]] == ["AI chips", "Weather"]
+        assert [item["title"] for item in results[str(finance.id)]] == ["Stocks rally on AI", "AI chips"]
+
+    def test_fan_out_requires_mention_when_shard_is_shared(self):
+        tech = _category(["AI"])
+        finance = _category(["stocks"])
+        search = group_categories([tech, finance], QueryPlanner(max_keywords_per_shard=8))[0]
+
+        results = fan_out(search, {0: [_item("CBMiA", "AI chips"), _item("CBMiB", "Stocks fall")]})
+
+        assert [item["title"] for item in results[str(tech.id)]] == ["AI chips"]
+        assert [item["title"] for item in results[str(finance.id)]] == ["Stocks fall"]
+
+
+class TestCoalescedResults:
+    """Test handing coalesced items to crawl tasks by key."""
+
+    def test_items_round_trip_by_job_key(self):
+        results = CoalescedResults(client=None)
+        results.put("job-1", [_item("CBMiA", "AI chips")])
+
+        assert results.get("job-1") == [_item("CBMiA", "AI chips")]
+        assert results.get("job-2") is None
+
+
+class TestEngineCoalescedSearch:
+    """Test coalesced searches and prefetched results in the engine."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.QUERY_SHARD_CONCURRENCY = 2
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_search_coalesced_searches_each_shard_once(self, crawler_engine):
+        tech = _category(["AI"])
+        finance = _category(["stocks"])
+        search = group_categories([tech, finance], QueryPlanner())[0]
+        search_client = Mock()
+        search_client.search.return_value = FeedResponse(
+            url="u", status=200, items=[_item("CBMiA", "AI chips"), _item("CBMiB", "Stocks fall")]
+        )
+
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch.object(crawler_engine, '_wait_for_search_slot') as mock_wait:
+            results = crawler_engine.search_coalesced(search, max_results=50)
+
+        search_client.search.assert_called_once_with(
+            "AI OR stocks", language="vi", country="VN", max_results=50, period="1h"
+        )
+        mock_wait.assert_called_once()
+        assert len(results[str(tech.id)]) == len(results[str(finance.id)]) == 1
+        assert crawler_engine.get_shard_stats()[0]["results"] == 2
+
+    def test_prefetched_results_skip_search(self, crawler_engine):
+        with patch('src.core.crawler.sync_engine.decode_google_news_url', side_effect=lambda url: url + "/decoded"), \
+             patch.object(crawler_engine, 'collect_google_news_results') as mock_search:
+            batches = list(crawler_engine.iter_search_results([_item("CBMiA", "AI chips")]))
+
+        assert batches == [["https://news.google.com/rss/articles/CBMiA/decoded"]]
+        mock_search.assert_not_called()
+
+    def test_categories_behind_failed_shard_search_on_their_own(self, crawler_engine):
+        tech = _category(["AI"])
+        finance = _category(["stocks"])
+        search = group_categories([tech, finance], QueryPlanner(max_keywords_per_shard=1))[0]
+
+        def search_shard(query, **kwargs):
+            if query != "AI":
+                raise ConnectionError("reset")
+            return FeedResponse(url="u", status=200, items=[_item("CBMiA", "AI chips")])
+
+        search_client = Mock()
+        search_client.search.side_effect = search_shard
+
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch.object(crawler_engine, '_wait_for_search_slot'):
+            results = crawler_engine.search_coalesced(search, max_results=50)
+
+        assert [item["title"] for item in results[str(tech.id)]] == ["AI chips"]
+        assert str(finance.id) not in results
+
+    def test_shards_not_done_by_the_timeout_count_as_failed(self, crawler_engine):
+        tech = _category(["AI"])
+        finance = _category(["stocks"])
+        search = group_categories([tech, finance], QueryPlanner(max_keywords_per_shard=1))[0]
+        release = threading.Event()
+
+        def search_shard(query, **kwargs):
+            if query != "AI":
+                release.wait(timeout=5)
+            return FeedResponse(url="u", status=200, items=[_item("CBMiA", "AI chips")])
+
+        search_client = Mock()
+        search_client.search.side_effect = search_shard
+
+        start = time.monotonic()
+        with patch('src.core.crawler.sync_engine.get_search_client', return_value=search_client), \
+             patch.object(crawler_engine, '_wait_for_search_slot') as mock_wait:
+            results = crawler_engine.search_coalesced(search, max_results=50, timeout=0.3)
+        release.set()
+
+        assert time.monotonic() - start < 2
+        assert list(results) == [str(tech.id)]
+        # Shards wait for the rate limiter no longer than the search may take
+        assert all(call.kwargs["max_wait"] <= 0.3 for call in mock_wait.call_args_list)
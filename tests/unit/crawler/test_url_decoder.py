@@ -0,0 +1,145 @@
+"""Unit tests for the offline Google News URL decoder."""
+import base64
+import logging
+import pytest
+from unittest.mock import Mock, patch
+
+from src.core.crawler.sync_engine import SyncCrawlerEngine
+from src.core.crawler.url_decoder import (
+    decode_article_id,
+    decode_google_news_url,
+    extract_article_id,
+    partition_decodable,
+)
+from src.shared.config import Settings
+
+
+def _varint(value: int) -> bytes:
+    out = b''
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out += bytes([byte | 0x80])
+        else:
+            return out + bytes([byte])
+
+
+def _encode_id(url: str, amp_url: str = None) -> str:
+    """Build a legacy article ID the way Google News encodes it."""
+    payload = b'\x08\x13"' + _varint(len(url.encode())) + url.encode()
+    if amp_url:
+        payload += b'\xd2\x01' + _varint(len(amp_url.encode())) + amp_url.encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+class TestExtractArticleId:
+    """Test suite for article ID extraction."""
+
+    @pytest.mark.parametrize("url", [
+        "https://news.google.com/rss/articles/ABC_def-1?oc=5",
+        "https://news.google.com/articles/ABC_def-1?hl=vi&gl=VN",
+        "https://news.google.com/read/ABC_def-1",
+        "./articles/ABC_def-1?hl=en",
+        "https://consent.google.com/m?continue=https://news.google.com/rss/articles/ABC_def-1%3Foc%3D5",
+    ])
+    def test_extracts_id_from_all_link_forms(self, url):
+        assert extract_article_id(url) == "ABC_def-1"
+
+    def test_non_google_news_url_has_no_id(self):
+        assert extract_article_id("https://vnexpress.net/articles/ABC") is None
+        assert extract_article_id("") is None
+
+
+class TestDecodeGoogleNewsUrl:
+    """Test suite for offline decoding of article IDs."""
+
+    def test_decodes_legacy_id(self):
+        article_id = _encode_id("https://vnexpress.net/tin-tuc-123.html")
+        url = f"https://news.google.com/rss/articles/{article_id}?oc=5"
+
+        assert decode_google_news_url(url) == "https://vnexpress.net/tin-tuc-123.html"
+
+    def test_decodes_long_url_with_multibyte_length(self):
+        long_url = "https://thanhnien.vn/" + "a" * 300 + ".htm"
+        assert decode_article_id(_encode_id(long_url)) == long_url
+
+    def test_amp_url_used_only_when_preferred(self):
+        article_id = _encode_id("https://vnexpress.net/a.html", "https://vnexpress.net/amp/a.html")
+
+        assert decode_article_id(article_id) == "https://vnexpress.net/a.html"
+        assert decode_article_id(article_id, prefer_amp=True) == "https://vnexpress.net/amp/a.html"
+
+    def test_opaque_id_is_not_decodable(self):
+        url = "https://news.google.com/articles/CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+        assert decode_google_news_url(url) is None
+
+    def test_signed_token_id_is_not_decodable(self):
+        payload = b'\x08\x13"\x14AU_yqLNabcdefghijklm'
+        article_id = base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+        assert decode_article_id(article_id) is None
+
+    def test_truncated_legacy_payload_falls_back_to_pattern(self):
+        url = "https://news.google.com/rss/articles/CBMiWWh0dHBzOi8vdnRjLnZuL2R1LWxpY2gtdGhhbmgtcGhvLXRyaWV1LXBob-KBqWkhODk2NDI1"
+        assert decode_google_news_url(url).startswith("https://vtc.vn/du-lich-thanh-pho-trieu-pho")
+
+    def test_google_hosted_url_is_rejected(self):
+        article_id = _encode_id("https://news.google.com/stories/abc")
+        assert decode_article_id(article_id) is None
+
+    def test_invalid_base64_is_not_decodable(self):
+        assert decode_article_id("!!!") is None
+
+    def test_partition_decodable(self):
+        decodable = f"https://news.google.com/rss/articles/{_encode_id('https://vtv.vn/a.htm')}"
+        opaque = "https://news.google.com/articles/CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+
+        decoded, remaining = partition_decodable([decodable, opaque])
+
+        assert decoded == ["https://vtv.vn/a.htm"]
+        assert remaining == [opaque]
+
+
+class TestEngineOfflineResolution:
+    """Test that the crawler engine skips the browser for decodable URLs."""
+
+    @pytest.fixture
+    def crawler_engine(self):
+        settings = Mock(spec=Settings)
+        settings.MAX_URLS_TO_PROCESS = 100
+        settings.MAX_TABS_PER_BROWSER = 10
+        settings.BROWSER_POOL_SIZE = 1
+        settings.CELERY_WORKER_CONCURRENCY = 1
+        settings.RESOLUTION_CPUS_PER_BROWSER = 1.0
+        settings.BROWSER_POOL_MAX_MEMORY_MB = 1024
+        settings.RESOLUTION_MEMORY_RESERVE_MB = 1024
+        settings.HTTP_RESOLVER_ENABLED = False
+        settings.RESOLUTION_CACHE_ENABLED = False
+        with patch('src.core.crawler.sync_engine.GoogleNewsSource'), \
+             patch('src.core.crawler.sync_engine.fetch_news'), \
+             patch('src.core.crawler.sync_engine.Article'):
+            return SyncCrawlerEngine(settings, Mock(spec=logging.Logger))
+
+    def test_decodable_urls_never_reach_browser(self, crawler_engine):
+        urls = [
+            f"https://news.google.com/rss/articles/{_encode_id(f'https://vnexpress.net/{i}.html')}"
+            for i in range(3)
+        ]
+
+        with patch.object(crawler_engine, '_resolve_batch_with_single_browser') as mock_browser:
+            resolved = crawler_engine.resolve_google_news_urls(urls)
+
+        mock_browser.assert_not_called()
+        assert resolved == [f"https://vnexpress.net/{i}.html" for i in range(3)]
+
+    def test_only_undecodable_urls_reach_browser(self, crawler_engine):
+        opaque = "https://news.google.com/articles/CAIiEDZm5ZKPk4m0jCRp4EhVKjgqGQgEKhAIACoHCAowl5fQAzCUoYcDMLDw_QM"
+        decodable = f"https://news.google.com/rss/articles/{_encode_id('https://vtv.vn/a.htm')}"
+
+        with patch.object(crawler_engine, '_resolve_batch_with_single_browser',
+                          return_value={opaque: "https://dantri.com.vn/b.htm"}) as mock_browser:
+            resolved = crawler_engine.resolve_google_news_urls([decodable, opaque])
+
+        mock_browser.assert_called_once_with([opaque])
+        assert resolved == ["https://vtv.vn/a.htm", "https://dantri.com.vn/b.htm"]
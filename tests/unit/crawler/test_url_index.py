@@ -0,0 +1,165 @@
+"""Unit tests for the known-URL Bloom filter index."""
+import time
+
+import pytest
+from unittest.mock import Mock, patch
+
+import redis
+
+from src.core.crawler.url_index import (
+    BloomFilter,
+    KnownUrlIndex,
+    MemoryBloomStore,
+    bloom_parameters,
+    BloomMeta,
+    url_hash,
+)
+
+
+def _index(stored_urls, **kwargs):
+    return KnownUrlIndex(
+        store=MemoryBloomStore(),
+        load_hashes=lambda: (url_hash(url) for url in stored_urls),
+        count_hashes=lambda: len(stored_urls),
+        min_capacity=1000,
+        **kwargs
+    )
+
+
+class TestBloomFilter:
+    """Test the Bloom filter itself."""
+
+    def test_parameters_match_error_rate(self):
+        size, hashes = bloom_parameters(1000000, 0.01)
+        assert 9000000 < size < 10000000
+        assert hashes == 7
+
+    def test_added_digests_are_members(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        digests = [url_hash(f"https://a.com/{i}") for i in range(500)]
+        for digest in digests:
+            bloom.add(digest)
+
+        assert all(digest in bloom for digest in digests)
+
+    def test_false_positive_rate_stays_near_target(self):
+        bloom = BloomFilter.for_capacity(1000, 0.01)
+        for i in range(1000):
+            bloom.add(url_hash(f"https://a.com/{i}"))
+
+        false_positives = sum(url_hash(f"https://b.com/{i}") in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestKnownUrlIndex:
+    """Test building, querying and updating the index."""
+
+    def test_not_ready_until_built(self):
+        index = _index(["https://a.com/1"])
+        assert not index.ready
+
+        index.refresh(wait=True)
+        assert index.ready
+        assert index.get_stats()["rebuilds"] == 1
+
+    def test_filters_definitely_new_urls(self):
+        index = _index(["https://a.com/1", "https://a.com/2"])
+        index.refresh(wait=True)
+
+        positives = index.filter_possibly_known(["https://a.com/1", "https://a.com/2", "https://a.com/new"])
+
+        assert "https://a.com/1" in positives
+        assert "https://a.com/2" in positives
+        assert index.get_stats()["lookups"] == 3
+
+    def test_saved_urls_are_added(self):
+        index = _index([])
+        index.refresh(wait=True)
+        assert index.filter_possibly_known(["https://a.com/new"]) == []
+
+        index.add_urls(["https://a.com/new", None])
+
+        assert index.filter_possibly_known(["https://a.com/new"]) == ["https://a.com/new"]
+        assert index.get_stats()["adds"] == 1
+
+    def test_fresh_index_is_not_rebuilt(self):
+        load_hashes = Mock(return_value=[])
+        index = KnownUrlIndex(MemoryBloomStore(), load_hashes, lambda: 0, min_capacity=100)
+        index.refresh(wait=True)
+        index.refresh(wait=True)
+
+        load_hashes.assert_called_once()
+
+    def test_stale_index_is_rebuilt(self):
+        load_hashes = Mock(return_value=[])
+        index = KnownUrlIndex(MemoryBloomStore(), load_hashes, lambda: 0, min_capacity=100, rebuild_interval=0)
+        index.refresh(wait=True)
+        index.refresh(wait=True)
+
+        assert load_hashes.call_count == 2
+
+    def test_false_positive_accounting(self):
+        index = _index([])
+        index.record_confirmed(positives=4, confirmed=3)
+
+        stats = index.get_stats()
+        assert stats["false_positives"] == 1
+        assert stats["false_positive_rate"] == pytest.approx(0.25)
+
+    def test_build_failure_leaves_index_unready(self):
+        index = KnownUrlIndex(MemoryBloomStore(), Mock(side_effect=RuntimeError("db down")), lambda: 0)
+        index.refresh(wait=True)
+
+        assert not index.ready
+        assert index.get_stats()["errors"] == 1
+
+    def test_redis_error_falls_back_to_memory(self):
+        store = Mock(name="redis")
+        store.name = "redis"
+        store.get_meta.side_effect = redis.ConnectionError("down")
+        index = KnownUrlIndex(store, lambda: [url_hash("https://a.com/1")], lambda: 1, min_capacity=100)
+
+        index.refresh(wait=True)
+
+        assert index.backend == "memory"
+        assert index.ready
+        assert index.filter_possibly_known(["https://a.com/1"]) == ["https://a.com/1"]
+
+    def test_lookup_after_redis_error_reports_every_url(self):
+        store = Mock(name="redis")
+        store.name = "redis"
+        store.get_meta.return_value = None
+        store.try_lock.return_value = True
+        index = KnownUrlIndex(store, lambda: [], lambda: 0, min_capacity=100)
+        index.refresh(wait=True)
+        store.contains_many.side_effect = redis.ConnectionError("down")
+
+        urls = ["https://a.com/1", "https://a.com/2"]
+        assert index.filter_possibly_known(urls) == urls
+        # The memory filter replacing Redis is not built yet
+        assert index.backend == "memory"
+        assert index.filter_possibly_known(urls) == urls
+
+    def test_redis_is_retried_after_interval(self):
+        store = Mock(name="redis")
+        store.name = "redis"
+        store.get_meta.side_effect = [
+            redis.ConnectionError("down"),
+            BloomMeta(size=1000, hashes=3, built_at=time.time()),
+        ]
+        store.contains_many.return_value = [False]
+        index = KnownUrlIndex(store, lambda: [], lambda: 0, min_capacity=100, redis_retry_interval=30)
+
+        with patch("src.shared.redis_client.time.monotonic", return_value=100.0):
+            index.refresh(wait=True)
+            assert index.backend == "memory"
+            assert index.ready
+
+        with patch("src.shared.redis_client.time.monotonic", return_value=131.0):
+            # Back on the shared filter, which is ready as soon as its meta is read
+            assert index.backend == "redis"
+            assert not index.ready
+            index.refresh(wait=True)
+            assert index.ready
+            assert index.filter_possibly_known(["https://a.com/1"]) == []
+        assert index.shape.size == 1000
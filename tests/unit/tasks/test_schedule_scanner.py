@@ -9,7 +9,7 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch, MagicMock
 from uuid import uuid4
 
-from src.core.scheduler.tasks import scan_scheduled_categories_task
+from src.core.scheduler.tasks import coalesced_search_task, scan_scheduled_categories_task
 from src.database.models.crawl_job import JobType, CrawlJobStatus
 
 
@@ -80,7 +80,8 @@ def test_scan_scheduled_categories_triggers_jobs():
         # Verify crawl task was scheduled
         mock_crawl_task.delay.assert_called_once_with(
             category_id=str(category_id),
-            job_id=str(mock_job.id)
+            job_id=str(mock_job.id),
+            incremental=True
         )
 
         # Verify category schedule timing was updated
@@ -178,3 +179,97 @@ def test_scan_scheduled_categories_skips_non_due_categories():
         # Verify create was never called
         mock_job_repo = MockJobRepo.return_value
         mock_job_repo.create.assert_not_called()
+
+
+@pytest.mark.unit
+def test_scan_scheduled_categories_leaves_coalesced_search_to_its_own_task():
+    """Test that the scanner schedules grouped categories without searching itself."""
+
+    category1 = Mock(id=uuid4(), name="Tech", schedule_interval_minutes=30)
+    category2 = Mock(id=uuid4(), name="Finance", schedule_interval_minutes=30)
+    category3 = Mock(id=uuid4(), name="Sports", schedule_interval_minutes=30)
+    jobs = {category.id: Mock(id=uuid4()) for category in (category1, category2, category3)}
+
+    with patch('src.database.repositories.sync_category_repo.SyncCategoryRepository') as MockCategoryRepo, \
+         patch('src.database.repositories.sync_job_repo.SyncCrawlJobRepository') as MockJobRepo, \
+         patch('src.core.scheduler.tasks._plan_coalesced_searches') as mock_plan, \
+         patch('src.core.scheduler.tasks._coalesce_scheduled_searches') as mock_search, \
+         patch('src.core.scheduler.tasks.coalesced_search_task') as mock_search_task, \
+         patch('src.core.scheduler.tasks.crawl_category_task') as mock_crawl_task:
+
+        MockCategoryRepo.return_value.get_due_scheduled_categories.return_value = [category1, category2, category3]
+        MockJobRepo.return_value.create.side_effect = lambda category_id, **kwargs: jobs[category_id]
+        mock_plan.return_value = (
+            [[category1, category2]],
+            {"groups": 1, "categories": 2, "searches": 1, "searches_saved": 1}
+        )
+        mock_search_task.delay.return_value = Mock(id="celery-search")
+        mock_crawl_task.delay.return_value = Mock(id="celery-crawl")
+
+        result = scan_scheduled_categories_task.run()
+
+        assert result["jobs_triggered"] == 3
+        assert result["search_coalescing"]["searches_saved"] == 1
+        # Every schedule moves on, whatever the search does later
+        assert MockCategoryRepo.return_value.update_schedule_timing.call_count == 3
+        mock_search.assert_not_called()
+        mock_search_task.delay.assert_called_once_with(jobs={
+            str(category1.id): str(jobs[category1.id].id),
+            str(category2.id): str(jobs[category2.id].id),
+        })
+        # Only the category alone in its group starts crawling right away
+        mock_crawl_task.delay.assert_called_once_with(
+            category_id=str(category3.id), job_id=str(jobs[category3.id].id), incremental=True
+        )
+        task_ids = {job["category_id"]: job["celery_task_id"] for job in result["triggered_jobs"]}
+        assert task_ids == {
+            str(category1.id): "celery-search", str(category2.id): "celery-search", str(category3.id): "celery-crawl"
+        }
+
+
+@pytest.mark.unit
+def test_coalesced_search_task_hands_over_result_keys():
+    """Test that coalesced results reach the crawl tasks as keys, not item lists."""
+
+    category1 = Mock(id=uuid4())
+    category2 = Mock(id=uuid4())
+    jobs = {str(category1.id): "job-1", str(category2.id): "job-2"}
+    items = [{"url": "https://news.google.com/rss/articles/CBMiA", "title": "AI chips"}]
+
+    with patch('src.database.repositories.sync_category_repo.SyncCategoryRepository') as MockCategoryRepo, \
+         patch('src.core.scheduler.tasks._coalesce_scheduled_searches') as mock_search, \
+         patch('src.core.crawler.search_coalescer.get_coalesced_results') as mock_results, \
+         patch('src.core.scheduler.tasks.crawl_category_task') as mock_crawl_task:
+
+        MockCategoryRepo.return_value.get_by_id.side_effect = [category1, category2]
+        # The second category's shard failed
+        mock_search.return_value = ({str(category1.id): items}, {"groups": 1})
+        mock_crawl_task.delay.return_value = Mock(id="celery-crawl")
+
+        result = coalesced_search_task.run(jobs=jobs)
+
+        mock_results.return_value.put.assert_called_once_with("job-1", items)
+        first_call, second_call = mock_crawl_task.delay.call_args_list
+        assert first_call.kwargs == {
+            "category_id": str(category1.id), "job_id": "job-1", "incremental": True, "search_results_key": "job-1"
+        }
+        assert second_call.kwargs == {"category_id": str(category2.id), "job_id": "job-2", "incremental": True}
+        assert result["prefetched"] == 1
+
+
+@pytest.mark.unit
+def test_coalesced_search_task_failure_still_starts_crawls():
+    """Test that categories search on their own when the coalesced search fails or times out."""
+
+    jobs = {str(uuid4()): "job-1", str(uuid4()): "job-2"}
+
+    with patch('src.database.repositories.sync_category_repo.SyncCategoryRepository'), \
+         patch('src.core.scheduler.tasks._coalesce_scheduled_searches', side_effect=TimeoutError("soft limit")), \
+         patch('src.core.scheduler.tasks.crawl_category_task') as mock_crawl_task:
+
+        mock_crawl_task.delay.return_value = Mock(id="celery-crawl")
+        result = coalesced_search_task.run(jobs=jobs)
+
+        assert mock_crawl_task.delay.call_count == 2
+        assert all("search_results_key" not in call.kwargs for call in mock_crawl_task.delay.call_args_list)
+        assert result["prefetched"] == 0
@@ -36,6 +36,7 @@ class TestArticleExtractor:
         settings.NEWSPAPER_KEEP_ARTICLE_HTML = True
         settings.NEWSPAPER_FETCH_IMAGES = True
         settings.NEWSPAPER_HTTP_SUCCESS_ONLY = True
+        settings.NEWSPAPER_TRUST_HTML_DOMAINS = True
         # JavaScript rendering settings
         settings.ENABLE_JAVASCRIPT_RENDERING = True
         settings.PLAYWRIGHT_HEADLESS = True
@@ -312,6 +313,7 @@ class TestArticleExtractor:
         custom_settings.NEWSPAPER_KEEP_ARTICLE_HTML = False
         custom_settings.NEWSPAPER_FETCH_IMAGES = False
         custom_settings.NEWSPAPER_HTTP_SUCCESS_ONLY = False
+        custom_settings.NEWSPAPER_TRUST_HTML_DOMAINS = False
         
         extractor = ArticleExtractor(settings=custom_settings, logger=mock_logger)
         
@@ -321,6 +323,7 @@ class TestArticleExtractor:
         assert extractor.config.keep_article_html is False
         assert extractor.config.fetch_images is False
         assert extractor.config.http_success_only is False
+        assert extractor.config.trust_html_domains is False
         assert extractor.settings.EXTRACTION_MAX_RETRIES == 5
         assert extractor.settings.EXTRACTION_RETRY_BASE_DELAY == 0.5
         assert extractor.settings.EXTRACTION_RETRY_MULTIPLIER == 3.0
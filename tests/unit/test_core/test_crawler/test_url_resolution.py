@@ -23,6 +23,8 @@ class TestURLResolutionSuccessRate:
         settings = Mock(spec=Settings)
         settings.MAX_RESULTS_PER_SEARCH = 20
         settings.EXTRACTION_THREADS = 3
+        settings.ARTICLE_FETCH_ASYNC_ENABLED = False
+        settings.NEWSPAPER_TRUST_HTML_DOMAINS = True
         settings.ENABLE_JAVASCRIPT_RENDERING = True
         return settings
 
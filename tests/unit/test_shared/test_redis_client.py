@@ -0,0 +1,51 @@
+"""Tests for the Redis-backed JSON store with a local fallback."""
+
+import time
+
+import redis
+from unittest.mock import MagicMock
+
+from src.shared.redis_client import RedisJsonStore
+
+
+class TestRedisJsonStore:
+    """Test suite for RedisJsonStore."""
+
+    def test_documents_round_trip_through_redis(self):
+        data = {}
+        client = MagicMock()
+        client.set.side_effect = lambda key, value, ex: data.__setitem__(key, value)
+        client.get.side_effect = data.get
+        store = RedisJsonStore(client, "gns:test:", ttl=60)
+
+        store.put("k", {"a": 1})
+
+        assert "gns:test:k" in data
+        assert store.get("k", dict) == {"a": 1}
+        assert store.get("missing", dict) is None
+        assert store.get_stats() == {"backend": "redis", "hits": 1, "misses": 1, "writes": 1, "errors": 0}
+
+    def test_redis_is_retried_after_interval(self):
+        client = MagicMock()
+        client.set.side_effect = redis.ConnectionError("down")
+        store = RedisJsonStore(client, "gns:test:", ttl=60, retry_interval=0.05)
+
+        store.put("k", {"a": 1})
+        assert store.backend == "memory"
+        assert store.get("k", dict) == {"a": 1}
+        assert client.get.call_count == 0
+
+        time.sleep(0.06)
+        client.get.return_value = None
+        # Back on Redis; what was written during the outage is still found in memory
+        assert store.backend == "redis"
+        assert store.get("k", dict) == {"a": 1}
+        assert client.get.call_count == 1
+
+    def test_unreadable_documents_are_misses(self):
+        client = MagicMock()
+        client.get.return_value = "not json"
+        store = RedisJsonStore(client, "gns:test:", ttl=60)
+
+        assert store.get("k", dict) is None
+        assert store.get_stats()["misses"] == 1